@@ -10,6 +10,7 @@ import logging
 from contextvars import ContextVar
 from typing import Any
 
+from cara.container import Container
 from cara.exceptions import ConfigurationException
 from cara.http import current_request
 
@@ -22,8 +23,11 @@ from cara.http import current_request
 # leak that ``JWTGuard`` was already fixed for via a ContextVar.
 # This mirrors that fix one layer up so the wrapper API is safe even
 # if a future caller routes through ``auth_manager.user()`` instead
-# of going to ``auth_manager.guard("jwt").user()`` directly.
-_REQUEST_USER: ContextVar[Any] = ContextVar("auth_manager_user", default=None)
+# of going to ``auth_manager.guard("jwt").user()`` directly. Registered as
+# a scoped var so each request/connection/job scope starts with no user.
+_REQUEST_USER: ContextVar[Any] = Container.scoped_var(
+    ContextVar("auth_manager_user", default=None)
+)
 
 _logger = logging.getLogger("cara.auth")
 
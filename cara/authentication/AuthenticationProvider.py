@@ -66,6 +66,8 @@ class AuthenticationProvider(DeferredProvider):
             header_prefix=config("auth.guards.jwt.header_prefix", "Bearer"),
             issuer=config("auth.guards.jwt.issuer", "cara"),
             audience=config("auth.guards.jwt.audience", "cara-clients"),
+            verified_cache_ttl=config("auth.guards.jwt.verified_cache_ttl", 0),
+            user_cache_ttl=config("auth.guards.jwt.user_cache_ttl", 0),
         )
 
         auth_manager.add_guard("jwt", jwt_guard)
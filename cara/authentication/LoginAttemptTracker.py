@@ -27,10 +27,20 @@ fix layers an IP-distinctness gate on top of the email counter:
     (extreme single-source brute force). One IP at 5-19 failures is left to
     the per-IP throttle so a throwaway-IP attack can't lock the owner out.
 
-Storage is the ``Cache`` facade so the state survives restarts and is shared
-across workers without sticky sessions. The cache is the authority for this
-security gate: when it cannot answer, authentication stops with a retryable
-service-unavailable response instead of silently removing account protection.
+Storage is shared across workers without sticky sessions. On a Redis cache
+driver the state lives in a ``RedisLoginAttemptStore`` under the driver's
+key prefix, and each failed login is one atomic script call. An in-process
+cache driver (``driver_name = "memory"``, e.g. ``CacheFake``) gets its own
+``MemoryLoginAttemptStore``, and ``security.login_attempt_store = "memory"``
+selects a process-wide one; any other cache driver falls back to individual
+``Cache`` calls that apply the same rules. The store is the authority for
+this security gate: when it cannot answer, authentication stops with a
+retryable service-unavailable response instead of silently removing account
+protection.
+
+Lock sentinels written by the per-key path before the Redis store took over
+are still honoured (and cleared) for one lock duration after the process
+starts, so a deploy does not unlock every locked account.
 
 All thresholds are env-overridable via ``config("security.*")``.
 """
@@ -41,6 +51,8 @@ import hashlib
 import hmac
 import json
 import logging
+import time
+from typing import Any
 
 from cara.configuration import config
 from cara.exceptions import (
@@ -50,14 +62,23 @@ from cara.exceptions import (
 from cara.facades import Cache, Log
 from cara.support import email_mask, mask_ip
 
+from .contracts import LoginAttemptStore
 from .LoginLocked import LoginLocked
+from .MemoryLoginAttemptStore import MemoryLoginAttemptStore
+from .RedisLoginAttemptStore import RedisLoginAttemptStore
 
 # Maximum entries to keep in the per-email distinct-IP set. Bounds cache
 # footprint under a wide-fanout distributed attack — once we observe this
 # many distinct IPs against one email we're well past the multi-IP
 # threshold and adding more doesn't change the lock decision.
 _IP_SET_CAP = 10
+_STORES = ("cache", "memory")
 _logger = logging.getLogger("cara.authentication.login_attempts")
+_memory = MemoryLoginAttemptStore()
+# The store for the current cache driver, so a Redis script is registered
+# once rather than per login and an in-process driver keeps its state.
+_driver_store: tuple[Any, LoginAttemptStore] | None = None
+_started = time.monotonic()
 
 
 class LoginAttemptTracker:
@@ -139,6 +160,52 @@ class LoginAttemptTracker:
     def _per_ip_digest_key(email: str, ip_digest: str) -> str:
         return f"login_fails_ip:{LoginAttemptTracker._digest(email)}:{ip_digest}"
 
+    @staticmethod
+    def _store() -> LoginAttemptStore | None:
+        """The atomic store for the active backend; ``None`` means the
+        generic ``Cache`` calls."""
+        name = config("security.login_attempt_store", "cache")
+        if name not in _STORES:
+            raise AuthenticationConfigurationException(
+                f"security.login_attempt_store must be one of "
+                f"{', '.join(_STORES)}; got {name!r}"
+            )
+        if name == "memory":
+            return _memory
+        resolve_driver = getattr(Cache, "driver", None)
+        if not callable(resolve_driver):
+            return None
+        driver = resolve_driver()
+        global _driver_store
+        if _driver_store is not None and _driver_store[0] is driver:
+            return _driver_store[1]
+        connection = getattr(driver, "connection", None)
+        if getattr(driver, "driver_name", None) == "memory":
+            store: LoginAttemptStore = MemoryLoginAttemptStore()
+        elif callable(connection):
+            key_prefix = getattr(driver, "key_prefix", None)
+            store = RedisLoginAttemptStore(
+                connection(),
+                prefix=f"{key_prefix() if callable(key_prefix) else ''}login:",
+            )
+        else:
+            return None
+        _driver_store = (driver, store)
+        return store
+
+    @classmethod
+    def _legacy_lock_window(cls, store: LoginAttemptStore) -> bool:
+        """Whether ``login_locked:*`` sentinels from the per-key path may
+        still be live next to ``store``.
+
+        Only the Redis store replaced that path on a shared cache, and no
+        sentinel outlives one lock duration from when it was written.
+        """
+        return (
+            isinstance(store, RedisLoginAttemptStore)
+            and time.monotonic() - _started < cls._lock_duration_seconds()
+        )
+
     @staticmethod
     def _cache_unavailable(
         operation: str,
@@ -167,7 +234,16 @@ class LoginAttemptTracker:
         if not email:
             return
         try:
-            locked_until = Cache.get(cls._lock_key(email), strict=True)
+            store = cls._store()
+            if store is not None:
+                locked_until = store.is_locked(cls._digest(email)) or (
+                    cls._legacy_lock_window(store)
+                    and Cache.get(cls._lock_key(email), strict=True)
+                )
+            else:
+                locked_until = Cache.get(cls._lock_key(email), strict=True)
+        except AuthenticationConfigurationException:
+            raise
         except Exception as exc:
             raise cls._cache_unavailable("lock read", email, exc) from exc
         if locked_until:
@@ -206,14 +282,14 @@ class LoginAttemptTracker:
         return decoded
 
     @classmethod
-    def _write_ip_set(cls, email: str, ips: list[str]) -> None:
-        """Persist the distinct-IP list under the per-email key with the
-        failure-window TTL so it ages out with the counter."""
+    def _write_ip_set(cls, email: str, ips: list[str], ttl: int) -> None:
+        """Persist the distinct-IP list under the per-email key for what is
+        left of the failure window, so it ages out with the counter."""
         try:
             Cache.put(
                 cls._ip_set_key(email),
                 json.dumps(ips),
-                cls._failure_window_seconds(),
+                ttl,
                 strict=True,
             )
         except Exception as exc:
@@ -232,6 +308,27 @@ class LoginAttemptTracker:
         if not isinstance(ip, str) or not ip.strip():
             raise ValueError("Login failure tracking requires a source IP")
         ip = ip.strip()
+        try:
+            store = cls._store()
+            if store is not None:
+                count, per_ip_count, distinct_ips, locked = store.record_failure(
+                    cls._digest(email),
+                    cls._digest(ip),
+                    window_seconds=cls._failure_window_seconds(),
+                    lock_seconds=cls._lock_duration_seconds(),
+                    max_failures=cls._max_failures(),
+                    single_source_threshold=cls._single_ip_lock_threshold(),
+                    source_cap=_IP_SET_CAP,
+                )
+        except AuthenticationConfigurationException:
+            raise
+        except Exception as exc:
+            raise cls._cache_unavailable("failure record", email, exc) from exc
+        if store is not None:
+            if locked:
+                cls._log_lock(email, ip, count, per_ip_count, distinct_ips)
+            return count
+
         try:
             count = Cache.increment(
                 cls._failure_key(email),
@@ -242,33 +339,45 @@ class LoginAttemptTracker:
             raise cls._cache_unavailable("failure increment", email, exc) from exc
         count = int(v) if (v := count) is not None else 0
 
+        # The window starts at the account's first failure, as in the
+        # stores: the per-IP counters and the IP set created later in it
+        # expire with the account counter rather than a full window on.
+        window_left = cls._failure_window_seconds()
+        if count > 1:
+            try:
+                remaining = Cache.ttl(cls._failure_key(email))
+            except Exception as exc:
+                raise cls._cache_unavailable("failure TTL", email, exc) from exc
+            if isinstance(remaining, int) and 0 < remaining < window_left:
+                window_left = remaining
+
         # Track the per-IP failure count + add this IP to the per-email
         # distinct-IP set so the multi-IP gate below can decide whether to
-        # engage the account-wide lockout.
+        # engage the account-wide lockout. Past the cap a new source is
+        # neither tracked nor counted, like the stores.
         per_ip_count = 0
-        try:
-            per_ip_count = (
-                int(v)
-                if (
-                    v := Cache.increment(
-                        cls._per_ip_key(email, ip),
-                        1,
-                        cls._failure_window_seconds(),
-                    )
-                )
-                is not None
-                else 0
-            )
-        except Exception as exc:
-            raise cls._cache_unavailable("per-IP increment", email, exc) from exc
-
         ip_digest = cls._digest(ip)
         ips = cls._read_ip_set(email)
-        if ip_digest not in ips and len(ips) < _IP_SET_CAP:
-            ips.append(ip_digest)
-            cls._write_ip_set(email, ips)
-
-        distinct_ips = len(cls._read_ip_set(email))
+        if ip_digest in ips or len(ips) < _IP_SET_CAP:
+            try:
+                per_ip_count = (
+                    int(v)
+                    if (
+                        v := Cache.increment(
+                            cls._per_ip_key(email, ip),
+                            1,
+                            window_left,
+                        )
+                    )
+                    is not None
+                    else 0
+                )
+            except Exception as exc:
+                raise cls._cache_unavailable("per-IP increment", email, exc) from exc
+            if ip_digest not in ips:
+                ips.append(ip_digest)
+                cls._write_ip_set(email, ips, window_left)
+        distinct_ips = len(ips)
 
         # Lockout decision:
         #   * Multi-IP path: per-email failures past threshold AND >= 2
@@ -291,21 +400,25 @@ class LoginAttemptTracker:
                     cls._lock_duration_seconds(),
                     strict=True,
                 )
-                if should_lock_multi_ip:
-                    reason = f"multi_ip(distinct={distinct_ips},count={count})"
-                elif should_lock_single_ip:
-                    reason = (
-                        f"single_ip(ip={mask_ip(ip or '')},per_ip_count={per_ip_count})"
-                    )
-                Log.warning(
-                    f"LoginAttemptTracker: locking account {email_mask(email)} — "
-                    f"reason={reason}, window={cls._failure_window_seconds()}s",
-                    category="security.login",
-                )
+                cls._log_lock(email, ip, count, per_ip_count, distinct_ips)
             except Exception as exc:
                 raise cls._cache_unavailable("lock write", email, exc) from exc
         return count
 
+    @classmethod
+    def _log_lock(
+        cls, email: str, ip: str, count: int, per_ip_count: int, distinct_ips: int
+    ) -> None:
+        if count >= cls._max_failures() and distinct_ips >= 2:
+            reason = f"multi_ip(distinct={distinct_ips},count={count})"
+        else:
+            reason = f"single_ip(ip={mask_ip(ip or '')},per_ip_count={per_ip_count})"
+        Log.warning(
+            f"LoginAttemptTracker: locking account {email_mask(email)} — "
+            f"reason={reason}, window={cls._failure_window_seconds()}s",
+            category="security.login",
+        )
+
     @classmethod
     def record_success(cls, email: str | None) -> None:
         """Clear the failure counter after a successful login.
@@ -320,6 +433,8 @@ class LoginAttemptTracker:
         """
         if not email:
             return
+        if cls._clear_store(email, include_lock=False):
+            return
         try:
             Cache.forget(cls._failure_key(email))
         except Exception as exc:
@@ -356,6 +471,8 @@ class LoginAttemptTracker:
         """
         if not email:
             return
+        if cls._clear_store(email, include_lock=True):
+            return
         try:
             Cache.forget(cls._failure_key(email))
         except Exception as exc:
@@ -374,6 +491,21 @@ class LoginAttemptTracker:
         except Exception as exc:
             raise cls._cache_unavailable("IP-set clear", email, exc) from exc
 
+    @classmethod
+    def _clear_store(cls, email: str, *, include_lock: bool) -> bool:
+        """Clear through the atomic store; ``False`` when there is none."""
+        try:
+            store = cls._store()
+            if store is not None:
+                store.clear(cls._digest(email), include_lock=include_lock)
+                if include_lock and cls._legacy_lock_window(store):
+                    Cache.forget(cls._lock_key(email))
+        except AuthenticationConfigurationException:
+            raise
+        except Exception as exc:
+            raise cls._cache_unavailable("failure clear", email, exc) from exc
+        return store is not None
+
     @staticmethod
     def _digest(value: str) -> str:
         """HMAC identifiers before they enter shared cache keys/values."""
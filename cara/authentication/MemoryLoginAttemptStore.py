@@ -0,0 +1,90 @@
+"""
+In-process login attempt store for the Cara framework.
+
+Applies the same rules as ``RedisLoginAttemptStore`` — one window per
+account starting at its first failure, a capped set of tracked sources, the
+same lock decision — so the tracker behaves identically whichever store
+backs it. State lives in this process only: use it for tests and
+single-process deployments, never behind a load balancer.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from cara.authentication.contracts import LoginAttemptStore
+
+# Expired accounts are swept every this many failures so a spray across
+# many identities cannot grow the tables without bound.
+_SWEEP_EVERY = 1024
+
+
+class MemoryLoginAttemptStore(LoginAttemptStore):
+    """Thread-safe, process-local login brute-force state."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        # identity -> [expires_at, count, {source: count}]
+        self._failures: dict[str, list[Any]] = {}
+        # identity -> lock expires_at
+        self._locks: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._recorded = 0
+
+    def is_locked(self, identity: str) -> bool:
+        with self._lock:
+            expires_at = self._locks.get(identity)
+            if expires_at is None:
+                return False
+            if expires_at <= self._clock():
+                del self._locks[identity]
+                return False
+            return True
+
+    def record_failure(
+        self,
+        identity: str,
+        source: str,
+        *,
+        window_seconds: int,
+        lock_seconds: int,
+        max_failures: int,
+        single_source_threshold: int,
+        source_cap: int,
+    ) -> tuple[int, int, int, bool]:
+        with self._lock:
+            now = self._clock()
+            self._recorded += 1
+            if self._recorded % _SWEEP_EVERY == 0:
+                self._sweep(now)
+            state = self._failures.get(identity)
+            if state is None or state[0] <= now:
+                state = [now + window_seconds, 0, {}]
+                self._failures[identity] = state
+            state[1] += 1
+            count, sources = state[1], state[2]
+            source_count = 0
+            if source in sources or len(sources) < source_cap:
+                sources[source] = source_count = sources.get(source, 0) + 1
+            distinct = len(sources)
+            locked = (
+                count >= max_failures and distinct >= 2
+            ) or source_count >= single_source_threshold
+            if locked:
+                self._locks[identity] = now + lock_seconds
+            return count, source_count, distinct, locked
+
+    def clear(self, identity: str, *, include_lock: bool) -> None:
+        with self._lock:
+            self._failures.pop(identity, None)
+            if include_lock:
+                self._locks.pop(identity, None)
+
+    def _sweep(self, now: float) -> None:
+        for identity in [i for i, state in self._failures.items() if state[0] <= now]:
+            del self._failures[identity]
+        for identity in [i for i, expires_at in self._locks.items() if expires_at <= now]:
+            del self._locks[identity]
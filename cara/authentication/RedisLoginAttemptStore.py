@@ -0,0 +1,96 @@
+"""
+Redis-backed login attempt store for the Cara framework.
+
+A failed login is one Lua script run server-side — bump the account count
+and the source's count, age the state with the failure window, decide the
+lock and set it — so it costs exactly one round trip and is atomic across
+every worker sharing the Redis. Both keys of an account share a hash tag,
+which keeps the script valid on Redis Cluster.
+
+The state lives under its own raw keys rather than through ``Cache``: the
+cache driver signs every value, and a script cannot produce an envelope
+``Cache.get`` would accept.
+
+The decision mirrors ``MemoryLoginAttemptStore`` step for step; change both
+together.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from cara.authentication.contracts import LoginAttemptStore
+
+# KEYS[1] = state hash ({fails, src:<digest>...}); KEYS[2] = lock sentinel.
+# ARGV = source, window, lock seconds, max failures, single-source
+# threshold, source cap. Returns {count, source_count, distinct, locked}.
+_RECORD_FAILURE = (
+    "local count = redis.call('HINCRBY', KEYS[1], 'fails', 1) "
+    "local field = 'src:' .. ARGV[1] "
+    "local source_count = 0 "
+    "if redis.call('HEXISTS', KEYS[1], field) == 1 "
+    "  or redis.call('HLEN', KEYS[1]) - 1 < tonumber(ARGV[6]) then "
+    "  source_count = redis.call('HINCRBY', KEYS[1], field, 1) "
+    "end "
+    "if redis.call('TTL', KEYS[1]) < 0 then "
+    "  redis.call('EXPIRE', KEYS[1], ARGV[2]) "
+    "end "
+    "local distinct = redis.call('HLEN', KEYS[1]) - 1 "
+    "local locked = 0 "
+    "if (count >= tonumber(ARGV[4]) and distinct >= 2) "
+    "  or source_count >= tonumber(ARGV[5]) then "
+    "  redis.call('SET', KEYS[2], '1', 'EX', ARGV[3]) "
+    "  locked = 1 "
+    "end "
+    "return {count, source_count, distinct, locked}"
+)
+
+
+class RedisLoginAttemptStore(LoginAttemptStore):
+    """Atomic, single-round-trip login brute-force state on Redis."""
+
+    def __init__(self, connection: Any, prefix: str = "login:"):
+        """
+        Args:
+            connection: a redis-py client (``RedisCacheDriver.connection()``)
+            prefix: namespace for the state keys
+        """
+        self._connection = connection
+        self._prefix = prefix
+        self._record_failure = connection.register_script(_RECORD_FAILURE)
+
+    def is_locked(self, identity: str) -> bool:
+        return bool(self._connection.exists(self._key(identity, "lock")))
+
+    def record_failure(
+        self,
+        identity: str,
+        source: str,
+        *,
+        window_seconds: int,
+        lock_seconds: int,
+        max_failures: int,
+        single_source_threshold: int,
+        source_cap: int,
+    ) -> tuple[int, int, int, bool]:
+        count, source_count, distinct, locked = self._record_failure(
+            keys=[self._key(identity, "state"), self._key(identity, "lock")],
+            args=[
+                source,
+                window_seconds,
+                lock_seconds,
+                max_failures,
+                single_source_threshold,
+                source_cap,
+            ],
+        )
+        return int(count), int(source_count), int(distinct), bool(int(locked))
+
+    def clear(self, identity: str, *, include_lock: bool) -> None:
+        keys = [self._key(identity, "state")]
+        if include_lock:
+            keys.append(self._key(identity, "lock"))
+        self._connection.delete(*keys)
+
+    def _key(self, identity: str, kind: str) -> str:
+        return f"{self._prefix}{{{identity}}}:{kind}"
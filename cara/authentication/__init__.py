@@ -19,11 +19,14 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "DEFAULT_TTL_DAYS": (".SignInHint", "DEFAULT_TTL_DAYS"),
     "Guard": (".contracts", "Guard"),
     "JWTGuard": (".guards", "JWTGuard"),
+    "LoginAttemptStore": (".contracts", "LoginAttemptStore"),
     "LoginAttemptTracker": (".LoginAttemptTracker", "LoginAttemptTracker"),
     "LoginLocked": (".LoginLocked", "LoginLocked"),
     "MAX_PASSWORD_BYTES": (".PasswordPolicy", "MAX_PASSWORD_BYTES"),
     "MAX_TOKEN_LENGTH": (".SignInHint", "MAX_TOKEN_LENGTH"),
     "MIN_UNIQUE_CHARS": (".PasswordPolicy", "MIN_UNIQUE_CHARS"),
+    "MemoryLoginAttemptStore": (".MemoryLoginAttemptStore", "MemoryLoginAttemptStore"),
+    "RedisLoginAttemptStore": (".RedisLoginAttemptStore", "RedisLoginAttemptStore"),
     "SignInHint": (".SignInHint", "SignInHint"),
     "TOKEN_TYPE_ACCESS": (".guards", "TOKEN_TYPE_ACCESS"),
     "TOKEN_TYPE_REFRESH": (".guards", "TOKEN_TYPE_REFRESH"),
@@ -43,11 +46,14 @@ __all__ = [
     "DEFAULT_TTL_DAYS",
     "Guard",
     "JWTGuard",
+    "LoginAttemptStore",
     "LoginAttemptTracker",
     "LoginLocked",
     "MAX_PASSWORD_BYTES",
     "MAX_TOKEN_LENGTH",
     "MIN_UNIQUE_CHARS",
+    "MemoryLoginAttemptStore",
+    "RedisLoginAttemptStore",
     "SignInHint",
     "TOKEN_TYPE_ACCESS",
     "TOKEN_TYPE_REFRESH",
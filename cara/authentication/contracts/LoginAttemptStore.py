@@ -0,0 +1,53 @@
+"""
+Login Attempt Store Interface for the Cara framework.
+
+A store keeps the brute-force state of ``LoginAttemptTracker`` — the
+per-account failure count, the per-source-IP counts and the lock sentinel —
+and updates it in one atomic step per login attempt, so a credential-stuffing
+burst costs one backend round trip per attempt instead of one per key.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class LoginAttemptStore(ABC):
+    """Contract for atomic login brute-force state."""
+
+    @abstractmethod
+    def is_locked(self, identity: str) -> bool:
+        """Whether the account behind ``identity`` is locked."""
+        ...
+
+    @abstractmethod
+    def record_failure(
+        self,
+        identity: str,
+        source: str,
+        *,
+        window_seconds: int,
+        lock_seconds: int,
+        max_failures: int,
+        single_source_threshold: int,
+        source_cap: int,
+    ) -> tuple[int, int, int, bool]:
+        """
+        Count one failed login of ``identity`` from ``source`` and lock the
+        account if the attempt crosses a threshold.
+
+        Failure counts live for ``window_seconds`` from the first failure.
+        At most ``source_cap`` distinct sources are tracked per identity;
+        further sources still bump the account count. The account is locked
+        for ``lock_seconds`` when ``max_failures`` is reached from at least
+        two sources, or when one source reaches ``single_source_threshold``.
+
+        Returns ``(count, source_count, distinct_sources, locked)``;
+        ``locked`` is true when this attempt (re)engaged the lock.
+        """
+        ...
+
+    @abstractmethod
+    def clear(self, identity: str, *, include_lock: bool) -> None:
+        """Forget the failure state, and the lock too when asked."""
+        ...
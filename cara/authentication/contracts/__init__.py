@@ -7,11 +7,13 @@ from cara._LazyExports import _install_lazy_exports
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "Authenticatable": (".Authenticatable", "Authenticatable"),
     "Guard": (".Guard", "Guard"),
+    "LoginAttemptStore": (".LoginAttemptStore", "LoginAttemptStore"),
 }
 
 __all__ = [
     "Authenticatable",
     "Guard",
+    "LoginAttemptStore",
 ]
 
 _install_lazy_exports(__name__, _LAZY_EXPORTS)
@@ -16,6 +16,7 @@ from typing import Any
 
 from cara.authentication.contracts import Guard
 from cara.authentication.SessionPolicy import AUTH_SECURITY_MAX_WINDOW
+from cara.container import Container
 from cara.exceptions import (
     AuthenticationConfigurationException,
     ServiceUnavailableException,
@@ -28,6 +29,7 @@ from cara.facades import Cache
 from cara.http import current_request
 
 from . import _JWTTokenLifecycle
+from ._JWTVerifiedCache import _JWTVerifiedCache
 
 # Per-request cache for the resolved user / consumed token. Lives in a
 # ContextVar so each asyncio task (one per HTTP request / WS connection)
@@ -35,13 +37,21 @@ from . import _JWTTokenLifecycle
 # ContextVar isolation, ``self._user = userA`` from request A is still
 # truthy when request B arrives mid-await, and request B's call to
 # ``user()`` returns Alice instead of validating B's own Authorization
-# header (cross-request identity leak under concurrency).
-_REQUEST_USER: ContextVar[Any] = ContextVar("jwt_guard_user", default=None)
-_REQUEST_TOKEN: ContextVar[Any] = ContextVar("jwt_guard_token", default=None)
+# header (cross-request identity leak under concurrency). All three are
+# scoped vars: ``Container.scope()`` clears them for each request /
+# connection / job and restores them on exit, so no reset sweep is needed.
+_REQUEST_USER: ContextVar[Any] = Container.scoped_var(
+    ContextVar("jwt_guard_user", default=None)
+)
+_REQUEST_TOKEN: ContextVar[Any] = Container.scoped_var(
+    ContextVar("jwt_guard_token", default=None)
+)
 # Verified claims of the most recently resolved token. Same leak class as
 # _user/_token above — as a plain instance attribute on the singleton
 # guard, request B could read request A's claims mid-await.
-_REQUEST_PAYLOAD: ContextVar[Any] = ContextVar("jwt_guard_payload", default=None)
+_REQUEST_PAYLOAD: ContextVar[Any] = Container.scoped_var(
+    ContextVar("jwt_guard_payload", default=None)
+)
 
 _logger = logging.getLogger("cara.auth.jwt")
 
@@ -98,6 +108,8 @@ class JWTGuard(Guard):
         header_prefix: str = "Bearer",
         issuer: str = "cara",
         audience: str = "cara-clients",
+        verified_cache_ttl: float = 0,
+        user_cache_ttl: float = 0,
     ):
         # Validate PyJWT dependency
         try:
@@ -178,6 +190,9 @@ class JWTGuard(Guard):
             raise AuthenticationConfigurationException(
                 "JWT user model must implement authenticate_jwt(user_id, claims)"
             )
+        self._verified = _JWTVerifiedCache(
+            verified_cache_ttl, user_cache_ttl, self._user_class, application
+        )
         self._user = None
         self._token = None
         self._last_payload = None
@@ -557,9 +572,8 @@ class JWTGuard(Guard):
         without a ``typ`` claim are rejected.
         """
         try:
-            payload = self._decode_token(token)
+            payload = self._decode_access_token(token)
             user_id = payload.get("sub")
-
             if not user_id:
                 return None
 
@@ -591,8 +605,7 @@ class JWTGuard(Guard):
     ) -> Any | None:
         """Resolve user by ID with optional context - Generic JWT authentication."""
         try:
-            user = self._user_class.authenticate_jwt(user_id, context or {})
-
+            user = self._authenticate_user(user_id, context or {})
             if user is None:
                 return None
             token_version = (context or {}).get("ver")
@@ -659,6 +672,8 @@ class JWTGuard(Guard):
         return version
 
     _decode_token = _JWTTokenLifecycle._decode_token
+    _decode_access_token = _JWTTokenLifecycle._decode_access_token
+    _authenticate_user = _JWTTokenLifecycle._authenticate_user
     revoke_user_sessions = _JWTTokenLifecycle._revoke_user_sessions
     revoke_token_family = _JWTTokenLifecycle._revoke_token_family
     _is_family_revoked = _JWTTokenLifecycle._is_family_revoked
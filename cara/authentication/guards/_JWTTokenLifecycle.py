@@ -43,6 +43,54 @@ def _hash_token(token: str) -> str:
     return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
+def _pubsub_client() -> Any | None:
+    """The cache driver's Redis client, for revocation broadcasts."""
+    resolve_driver = getattr(Cache, "driver", None)
+    if not callable(resolve_driver):
+        return None
+    connection = getattr(resolve_driver(), "connection", None)
+    return connection() if callable(connection) else None
+
+
+def _broadcast_revocation(self, kind: str, value: str) -> None:
+    """Evict verified-cache entries for a revocation on every worker.
+
+    Runs after the revocation is durable. A broadcast that fails is
+    surfaced like the write itself: other workers could otherwise keep
+    answering the revoked credential from memory.
+    """
+    try:
+        self._verified.revoke(kind, value)
+    except Exception as exc:
+        raise _security_state_unavailable("revocation broadcast", exc) from exc
+
+
+def _decode_access_token(self, token: str) -> dict[str, Any]:
+    """``_decode_token``, answered from the verified-claims cache when warm."""
+    cache = self._verified
+    digest = _hash_token(token)
+    payload = cache.claims(digest)
+    if payload is None:
+        generation = cache.generation
+        payload = self._decode_token(token)
+        if payload.get("typ") == _TOKEN_TYPE_ACCESS:
+            cache.store_claims(digest, payload, generation)
+    return payload
+
+
+def _authenticate_user(self, user_id: Any, claims: dict[str, Any]) -> Any | None:
+    """``authenticate_jwt``, answered from the user cache when enabled."""
+    cache = self._verified
+    subject = str(user_id)
+    user = cache.user(subject)
+    if user is None:
+        generation = cache.generation
+        user = self._user_class.authenticate_jwt(user_id, claims)
+        if user is not None:
+            cache.store_user(subject, user, generation)
+    return user
+
+
 def _decode_token(
     self,
     token: str,
@@ -172,6 +220,7 @@ def _revoke_user_sessions(self, user_id: Any, ttl: int | None = None) -> None:
         cache_ttl,
         strict=True,
     )
+    _broadcast_revocation(self, "user", str(user_id))
 
 
 def _revoke_token_family(self, family_id: str, ttl: int | None = None) -> None:
@@ -185,6 +234,7 @@ def _revoke_token_family(self, family_id: str, ttl: int | None = None) -> None:
         cache_ttl,
         strict=True,
     )
+    _broadcast_revocation(self, "family", family_id)
 
 
 def _is_family_revoked(self, family_id: str) -> bool:
@@ -343,12 +393,9 @@ def _blacklist_token(self, token: str) -> None:
         # Security state writes are fail-closed. Callers must know when a
         # logout/revocation did not reach the backing store; reporting
         # success while a bearer token remains live is unsafe.
-        Cache.put(
-            f"jwt_blacklist:{_hash_token(token)}",
-            True,
-            ttl,
-            strict=True,
-        )
+        digest = _hash_token(token)
+        Cache.put(f"jwt_blacklist:{digest}", True, ttl, strict=True)
+        _broadcast_revocation(self, "token", digest)
 
 
 def _is_blacklisted(self, token: str) -> bool:
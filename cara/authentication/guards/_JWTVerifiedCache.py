@@ -0,0 +1,289 @@
+"""Per-worker cache of verified JWT claims and hydrated users.
+
+A cold access-token check verifies the signature, reads the token
+blacklist, the family tombstone and the user revocation cutoff from
+``Cache`` and loads the user from the database. With this cache a token
+that verified recently is answered from memory: claims are kept under the
+token's SHA-256 digest for ``claims_ttl`` seconds (never past ``exp``), and
+optionally the user's attributes for ``user_ttl`` seconds.
+
+Revocation stays immediate. Every blacklist, family-revoke and user-revoke
+write (and every user row change) evicts locally and publishes
+``<kind>:<value>`` on the
+``jwt_revocations`` channel; each worker's listener thread evicts the same
+entries. Nothing is cached until that listener is subscribed, and losing
+the subscription clears the cache, so a missed message can never leave a
+revoked token answering from memory. Cache drivers without pub/sub keep
+the cache off.
+
+The user cache assumes ``authenticate_jwt`` resolves the same user for a
+given subject whatever the other claims. It keeps column attributes only
+(relations are not cached) and is invalidated through model observers on
+``updated`` / ``deleted``.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from cara.exceptions import AuthenticationConfigurationException
+
+from ._JWTTokenLifecycle import _pubsub_client
+
+_logger = logging.getLogger("cara.auth.jwt")
+
+_CHANNEL = "jwt_revocations"
+_KINDS = ("token", "family", "user", "profile", "users")
+# Upper bound per map; the oldest entry is dropped beyond it.
+_MAX_ENTRIES = 10_000
+_MAX_TTL_SECONDS = 300
+_RECONNECT_MAX_SECONDS = 30.0
+
+
+class _JWTVerifiedCache:
+    """Verified-claims and user caches with broadcast revocation."""
+
+    def __init__(
+        self,
+        claims_ttl: float,
+        user_ttl: float,
+        user_class: Any = None,
+        application: Any = None,
+        client: Callable[[], Any | None] = _pubsub_client,
+    ):
+        """
+        Args:
+            claims_ttl: seconds verified claims are reused (``0`` disables)
+            user_ttl: seconds a hydrated user is reused (``0`` disables)
+            user_class: the guard's user model, observed for invalidation
+            application: registers the listener's shutdown on its
+                ``_shutdown_callbacks``
+            client: returns the Redis client used for pub/sub, or ``None``
+        """
+        for name, value in (
+            ("verified_cache_ttl", claims_ttl),
+            ("user_cache_ttl", user_ttl),
+        ):
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, (int, float))
+                or not 0 <= value <= _MAX_TTL_SECONDS
+            ):
+                raise AuthenticationConfigurationException(
+                    f"JWT {name} must be between 0 and {_MAX_TTL_SECONDS} seconds"
+                )
+        if user_ttl and not claims_ttl:
+            raise AuthenticationConfigurationException(
+                "JWT user_cache_ttl requires verified_cache_ttl"
+            )
+        observe = getattr(user_class, "observe", None)
+        if user_ttl and not callable(observe):
+            raise AuthenticationConfigurationException(
+                "JWT user_cache_ttl requires a user model that supports observers"
+            )
+        self.claims_ttl = float(claims_ttl)
+        self.user_ttl = float(user_ttl)
+        self._client = client
+        self._claims: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._users: dict[str, tuple[float, type, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._active = False
+        self._listener: threading.Thread | None = None
+        self._stopping = threading.Event()
+        if user_ttl:
+            observe(self)
+        if claims_ttl and application is not None:
+            if not hasattr(application, "_shutdown_callbacks"):
+                application._shutdown_callbacks = []
+            application._shutdown_callbacks.append(self._close)
+
+    @property
+    def generation(self) -> int:
+        """Bumped by every eviction; pass it back to the ``store_*`` calls."""
+        return self._generation
+
+    # ── Claims ───────────────────────────────────────────────────────
+
+    def claims(self, digest: str) -> dict[str, Any] | None:
+        if not self._ready():
+            return None
+        with self._lock:
+            entry = self._claims.get(digest)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._claims[digest]
+                return None
+            return dict(entry[1])
+
+    def store_claims(self, digest: str, payload: dict[str, Any], generation: int) -> None:
+        deadline = min(time.time() + self.claims_ttl, float(payload["exp"]))
+        self._store(self._claims, digest, (deadline, dict(payload)), generation)
+
+    # ── Users ────────────────────────────────────────────────────────
+
+    def user(self, subject: str) -> Any | None:
+        if not self.user_ttl or not self._ready():
+            return None
+        with self._lock:
+            entry = self._users.get(subject)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._users[subject]
+                return None
+            _, user_class, attributes = entry
+        return user_class.hydrate(copy.deepcopy(attributes))
+
+    def store_user(self, subject: str, user: Any, generation: int) -> None:
+        attributes = getattr(user, "__attributes__", None)
+        if (
+            not self.user_ttl
+            or not isinstance(attributes, dict)
+            or not callable(getattr(type(user), "hydrate", None))
+        ):
+            return
+        entry = (time.time() + self.user_ttl, type(user), copy.deepcopy(attributes))
+        self._store(self._users, subject, entry, generation)
+
+    # ── Revocation ───────────────────────────────────────────────────
+
+    def revoke(self, kind: str, value: str) -> None:
+        """Evict matching entries here and broadcast to every worker."""
+        self.evict(kind, value)
+        client = self._client()
+        if client is not None:
+            client.publish(_CHANNEL, f"{kind}:{value}")
+
+    def evict(self, kind: str, value: str) -> None:
+        """Drop the entries a revocation of ``kind`` / ``value`` covers."""
+        with self._lock:
+            self._generation += 1
+            if kind == "token":
+                self._claims.pop(value, None)
+            elif kind == "family":
+                self._drop_claims(lambda payload: payload.get("fid") == value)
+            elif kind == "user":
+                self._drop_claims(lambda payload: str(payload.get("sub")) == value)
+                self._users.pop(value, None)
+            elif kind == "profile":
+                self._users.pop(value, None)
+            elif kind == "users":
+                self._users.clear()
+            else:
+                # Unknown kind from a newer peer: be safe, forget everything.
+                self._claims.clear()
+                self._users.clear()
+
+    # Model observer hooks (``user_class.observe(self)``). A row change
+    # drops the cached user only — its tokens stay verified. A bulk update
+    # has no single subject, so it drops every cached user.
+    def updated(self, model: Any) -> None:
+        self._user_changed(model)
+
+    def deleted(self, model: Any) -> None:
+        self._user_changed(model)
+
+    def _user_changed(self, model: Any) -> None:
+        try:
+            subject = model.get_auth_id()
+        except Exception:
+            subject = None
+        if subject is None or subject == "":
+            self.revoke("users", "")
+        else:
+            self.revoke("profile", str(subject))
+
+    # ── Internals ────────────────────────────────────────────────────
+
+    def _store(
+        self, entries: dict[str, Any], key: str, entry: tuple, generation: int
+    ) -> None:
+        if not self._active:
+            return
+        with self._lock:
+            # An eviction since the caller began verifying may cover this
+            # very entry; storing it would resurrect a revoked credential.
+            if generation != self._generation or not self._active:
+                return
+            if key not in entries and len(entries) >= _MAX_ENTRIES:
+                del entries[next(iter(entries))]
+            entries[key] = entry
+
+    def _drop_claims(self, matches: Callable[[dict[str, Any]], bool]) -> None:
+        for digest in [d for d, (_, payload) in self._claims.items() if matches(payload)]:
+            del self._claims[digest]
+
+    def _ready(self) -> bool:
+        if not self.claims_ttl:
+            return False
+        if self._listener is None:
+            with self._lock:
+                if self._listener is None:
+                    self._listener = threading.Thread(
+                        target=self._listen, name="jwt-revocations", daemon=True
+                    )
+                    self._listener.start()
+        return self._active
+
+    def _listen(self) -> None:
+        delay = 1.0
+        while not self._stopping.is_set():
+            subscription = None
+            try:
+                client = self._client()
+                if client is None:
+                    _logger.warning(
+                        "JWT verified-token cache disabled: the cache driver "
+                        "has no pub/sub for revocation broadcasts"
+                    )
+                    return
+                subscription = client.pubsub(ignore_subscribe_messages=True)
+                subscription.subscribe(_CHANNEL)
+                with self._lock:
+                    self._generation += 1
+                    self._active = True
+                delay = 1.0
+                while not self._stopping.is_set():
+                    message = subscription.get_message(timeout=1.0)
+                    if message:
+                        self._on_message(message.get("data"))
+            except Exception:
+                _logger.warning(
+                    "JWT revocation listener lost its subscription; "
+                    "verified-token cache cleared until it reconnects",
+                    exc_info=True,
+                )
+                self._stopping.wait(delay)
+                delay = min(delay * 2, _RECONNECT_MAX_SECONDS)
+            finally:
+                with self._lock:
+                    self._active = False
+                    self._generation += 1
+                    self._claims.clear()
+                    self._users.clear()
+                if subscription is not None:
+                    try:
+                        subscription.close()
+                    except Exception:
+                        _logger.debug(
+                            "JWT revocation pub/sub close failed", exc_info=True
+                        )
+
+    def _on_message(self, data: Any) -> None:
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", "replace")
+        kind, _, value = str(data).partition(":")
+        self.evict(kind if kind in _KINDS else "", value)
+
+    def _close(self) -> None:
+        """Stop the listener thread; run on application shutdown."""
+        self._stopping.set()
+        if self._listener is not None and self._listener.is_alive():
+            self._listener.join(timeout=5.0)
@@ -18,22 +18,44 @@ Design
 * **Per-request scoping.** ``for_user(user)`` returns a lightweight view that
   shares the root gate's registries (registration happens once at boot) and
   only overrides the resolved user. Cheap enough to call per request.
+* **Batches.** ``check_many`` / ``inspect_many`` decide one ability for a list
+  of models. A policy may implement ``<ability>_many(user, models, *args)``
+  returning one result per model, so a listing that flags every row costs one
+  policy call (and one query) instead of one per row. When it exists it
+  decides every check of that ability, single checks included, so a verdict
+  never depends on batch size or memo hits.
+* **Memoized pure policies.** Decisions of a policy with ``pure = True`` depend
+  only on the user and the arguments, so they are reused for the rest of the
+  unit of work (``Container.scope``). Gate-level before/after callbacks still
+  run on every check.
 """
 
 from __future__ import annotations
 
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from contextvars import ContextVar
 from typing import Any
 
 from cara.authorization.AuthorizationResponse import AuthorizationResponse
 from cara.authorization.contracts import GateContract
+from cara.container import Container
 from cara.exceptions import AuthorizationFailedException
 from cara.facades import Log
 
 # Sentinel separating "no decision" (None) from an explicit deny when a
 # before/after callback or policy hook returns a value.
 _UNAUTHENTICATED = "Unauthenticated."
+_CHECK_FAILED = "Authorization check failed."
+
+# Pure-policy decisions for the current unit of work. Outside any scope the
+# var is ``None`` and nothing is memoized; each scope starts at ``_FRESH``
+# and gets its own dict on first use. Entries hold the user and arguments
+# they were keyed by, so the ``id()``s in a key cannot be reused mid-scope.
+_FRESH = object()
+_DECISIONS: ContextVar[Any] = Container.scoped_var(
+    ContextVar("cara.authorization.decisions", default=None), _FRESH
+)
 
 
 class Gate(GateContract):
@@ -138,6 +160,20 @@ class Gate(GateContract):
         """Return the full :class:`AuthorizationResponse` (with message)."""
         return self._resolve(self._resolve_user(), ability, *args)
 
+    def check_many(self, ability: str, models: Sequence[Any], *args: Any) -> list[bool]:
+        """``allows(ability, model, *args)`` for each of ``models``, in order."""
+        return [
+            response.allowed() for response in self.inspect_many(ability, models, *args)
+        ]
+
+    def inspect_many(
+        self, ability: str, models: Sequence[Any], *args: Any
+    ) -> list[AuthorizationResponse]:
+        """``inspect(ability, model, *args)`` for each of ``models``, in order."""
+        return self._resolve_many(
+            self._resolve_user(), ability, [(model, *args) for model in models]
+        )
+
     def authorize(self, ability: str, *args: Any) -> AuthorizationResponse:
         """Authorize or raise :class:`AuthorizationFailedException`."""
         user = self._resolve_user()
@@ -171,8 +207,44 @@ class Gate(GateContract):
     # -- resolution -------------------------------------------------------- #
 
     def _resolve(self, user: Any, ability: str, *args: Any) -> AuthorizationResponse:
-        """The single resolution path shared by every public check."""
-        # 1) before callbacks may short-circuit (e.g. a root-user bypass).
+        """Resolve one check (see :meth:`_resolve_many`)."""
+        return self._resolve_many(user, ability, [args])[0]
+
+    def _resolve_many(
+        self, user: Any, ability: str, arg_sets: list[tuple]
+    ) -> list[AuthorizationResponse]:
+        """The single resolution path shared by every public check.
+
+        Each entry of ``arg_sets`` is one check's arguments; in a batch they
+        differ only in the leading model.
+        """
+        responses: list[AuthorizationResponse | None] = []
+        pending: list[int] = []
+        for index, args in enumerate(arg_sets):
+            # 1) before callbacks may short-circuit (e.g. a root-user bypass).
+            response = self._run_before(user, ability, *args)
+            # 2) Guests are denied by default unless a before-callback allowed
+            #    them.
+            if response is None and user is None:
+                response = AuthorizationResponse(False, _UNAUTHENTICATED)
+            if response is None:
+                pending.append(index)
+            responses.append(response)
+
+        if pending:
+            evaluated = self._evaluate_many(user, ability, [arg_sets[i] for i in pending])
+            for index, response in zip(pending, evaluated, strict=True):
+                responses[index] = response
+
+        # 3) after callbacks may override the result.
+        return [
+            self._run_after(user, ability, response, *args)
+            for response, args in zip(responses, arg_sets, strict=True)
+        ]
+
+    def _run_before(
+        self, user: Any, ability: str, *args: Any
+    ) -> AuthorizationResponse | None:
         for callback in self._before_callbacks:
             try:
                 decision = callback(user, ability, *args)
@@ -182,36 +254,43 @@ class Gate(GateContract):
                 # the decision to the next hook — the root bypass — and WIDEN
                 # access. Deny instead.
                 self._log(f"before-callback failed for ability='{ability}': {exc}")
-                return self._run_after(
-                    user,
-                    ability,
-                    AuthorizationResponse(False, "Authorization check failed."),
-                    *args,
-                )
+                return AuthorizationResponse(False, _CHECK_FAILED)
             if decision is not None:
-                return self._run_after(user, ability, self._normalize(decision), *args)
-
-        # 2) Guests are denied by default unless a before-callback allowed them.
-        if user is None:
-            response = AuthorizationResponse(False, _UNAUTHENTICATED)
-        else:
-            response = self._evaluate(user, ability, *args)
-
-        # 3) after callbacks may override the result.
-        return self._run_after(user, ability, response, *args)
+                return self._normalize(decision)
+        return None
 
-    def _evaluate(self, user: Any, ability: str, *args: Any) -> AuthorizationResponse:
-        """Resolve a non-guest check against a defined ability or model policy."""
+    def _evaluate_many(
+        self, user: Any, ability: str, arg_sets: list[tuple]
+    ) -> list[AuthorizationResponse]:
+        """Resolve non-guest checks against a defined ability or model policy."""
         if ability in self._abilities:
-            return self._call_ability(self._abilities[ability], user, ability, *args)
-
-        model_name = self._model_name(args[0]) if args else None
-        if model_name and model_name in self._policies:
-            return self._call_policy(self._policies[model_name], ability, user, *args)
-
-        return AuthorizationResponse(
-            False, f"No ability or policy is registered for '{ability}'."
-        )
+            callback = self._abilities[ability]
+            return [
+                self._call_ability(callback, user, ability, *args) for args in arg_sets
+            ]
+
+        # A batch may mix model classes; each policy sees its own models.
+        groups: dict[str | None, list[int]] = {}
+        for index, args in enumerate(arg_sets):
+            model_name = self._model_name(args[0]) if args else None
+            groups.setdefault(model_name, []).append(index)
+        responses: dict[int, AuthorizationResponse] = {}
+        for model_name, indices in groups.items():
+            if model_name and model_name in self._policies:
+                results = self._call_policy_many(
+                    self._policies[model_name],
+                    ability,
+                    user,
+                    [arg_sets[i] for i in indices],
+                )
+            else:
+                results = [
+                    AuthorizationResponse(
+                        False, f"No ability or policy is registered for '{ability}'."
+                    )
+                ] * len(indices)
+            responses.update(zip(indices, results, strict=True))
+        return [responses[index] for index in range(len(arg_sets))]
 
     def _run_after(
         self, user: Any, ability: str, response: AuthorizationResponse, *args: Any
@@ -238,47 +317,114 @@ class Gate(GateContract):
             return self._normalize(callback(user, *args))
         except Exception as exc:  # noqa: BLE001 — fail closed
             self._log(f"ability '{ability}' evaluation failed: {exc}")
-            return AuthorizationResponse(False, "Authorization check failed.")
+            return AuthorizationResponse(False, _CHECK_FAILED)
 
     def _call_policy(
         self, policy_ref: Any, method: str, user: Any, *args: Any
     ) -> AuthorizationResponse:
+        return self._call_policy_many(policy_ref, method, user, [args])[0]
+
+    def _call_policy_many(
+        self, policy_ref: Any, method: str, user: Any, arg_sets: list[tuple]
+    ) -> list[AuthorizationResponse]:
         try:
             policy = self._instantiate_policy(policy_ref)
         except Exception as exc:  # noqa: BLE001 — fail closed
             self._log(f"policy {policy_ref!r} could not be instantiated: {exc}")
-            return AuthorizationResponse(False, "Authorization check failed.")
+            return [AuthorizationResponse(False, _CHECK_FAILED)] * len(arg_sets)
 
-        # policy.before hook may short-circuit.
+        decisions = self._decisions(policy)
+        keys = [(id(policy), method, id(user), *map(id, args)) for args in arg_sets]
+        responses: list[AuthorizationResponse | None] = []
+        pending: list[int] = []
         before = getattr(policy, "before", None)
-        if callable(before):
-            pre = self._safe_hook(before, policy, "before", user, method, *args)
-            if pre is not None:
-                return self._normalize(pre)
+        for index, args in enumerate(arg_sets):
+            memoized = decisions.get(keys[index]) if decisions is not None else None
+            if memoized is not None:
+                responses.append(memoized[0])
+                continue
+            # policy.before hook may short-circuit.
+            response = None
+            if callable(before):
+                pre = self._safe_hook(before, policy, "before", user, method, *args)
+                if pre is not None:
+                    response = self._normalize(pre)
+            if response is None:
+                pending.append(index)
+            responses.append(response)
+
+        if pending:
+            results = self._run_policy_method(
+                policy, method, user, [arg_sets[i] for i in pending]
+            )
+            after = getattr(policy, "after", None)
+            for index, response in zip(pending, results, strict=True):
+                # policy.after hook may override.
+                if callable(after):
+                    post = self._safe_hook(
+                        after,
+                        policy,
+                        "after",
+                        user,
+                        method,
+                        response.allowed(),
+                        *arg_sets[index],
+                    )
+                    if post is not None:
+                        response = self._normalize(post)
+                responses[index] = response
+
+        if decisions is not None:
+            for key, response, args in zip(keys, responses, arg_sets, strict=True):
+                decisions[key] = (response, policy, user, args)
+        return responses  # type: ignore[return-value]
+
+    def _run_policy_method(
+        self, policy: Any, method: str, user: Any, arg_sets: list[tuple]
+    ) -> list[AuthorizationResponse]:
+        """Call ``<method>_many`` once for all checks when the policy defines
+        it — whatever their number — otherwise the ability once per check."""
+        name = type(policy).__name__
+        batch = getattr(policy, f"{method}_many", None)
+        if callable(batch) and all(arg_sets):
+            models = [args[0] for args in arg_sets]
+            try:
+                results = list(batch(user, models, *arg_sets[0][1:]))
+                if len(results) != len(models):
+                    raise ValueError(
+                        f"returned {len(results)} results for {len(models)} models"
+                    )
+            except Exception as exc:  # noqa: BLE001 — fail closed
+                self._log(f"policy '{method}_many' on {name} raised: {exc}")
+                return [AuthorizationResponse(False, _CHECK_FAILED)] * len(arg_sets)
+            return [self._normalize(result) for result in results]
 
         handler = getattr(policy, method, None)
         if not callable(handler):
-            return AuthorizationResponse(
-                False, f"{type(policy).__name__} has no '{method}' ability."
-            )
+            return [
+                AuthorizationResponse(False, f"{name} has no '{method}' ability.")
+            ] * len(arg_sets)
 
-        try:
-            result = handler(user, *args)
-        except Exception as exc:  # noqa: BLE001 — fail closed
-            self._log(f"policy '{method}' on {type(policy).__name__} raised: {exc}")
-            return AuthorizationResponse(False, "Authorization check failed.")
-
-        response = self._normalize(result)
+        responses = []
+        for args in arg_sets:
+            try:
+                responses.append(self._normalize(handler(user, *args)))
+            except Exception as exc:  # noqa: BLE001 — fail closed
+                self._log(f"policy '{method}' on {name} raised: {exc}")
+                responses.append(AuthorizationResponse(False, _CHECK_FAILED))
+        return responses
 
-        # policy.after hook may override.
-        after = getattr(policy, "after", None)
-        if callable(after):
-            post = self._safe_hook(
-                after, policy, "after", user, method, response.allowed(), *args
-            )
-            if post is not None:
-                response = self._normalize(post)
-        return response
+    @staticmethod
+    def _decisions(policy: Any) -> dict | None:
+        """The memo for ``policy``'s decisions, or ``None`` when they are not
+        memoized (impure policy, or no unit of work in progress)."""
+        if getattr(policy, "pure", False) is not True:
+            return None
+        decisions = _DECISIONS.get()
+        if decisions is _FRESH:
+            decisions = {}
+            _DECISIONS.set(decisions)
+        return decisions
 
     def _safe_hook(self, hook: Callable, policy: Any, kind: str, *hook_args: Any) -> Any:
         try:
@@ -3,6 +3,12 @@
 Subclass this and override the abilities you support. Every ability may return
 a ``bool`` or an :class:`AuthorizationResponse` (to attach a denial message).
 Unoverridden abilities deny by default — policies fail closed.
+
+An ability may also have a vectorized form, ``<ability>_many(user, models,
+*args)``, returning one result per model in order; ``Gate.check_many`` calls it
+once for a whole batch instead of the ability once per model. When defined it
+decides every check of the ability, single ones included, so implementing
+only ``<ability>_many`` is enough.
 """
 
 from __future__ import annotations
@@ -19,6 +25,11 @@ PolicyResult = bool | AuthorizationResponse | None
 class Policy(PolicyContract):
     """Common functionality and safe defaults for all policies."""
 
+    #: ``True`` when every ability and hook depends only on the user and the
+    #: arguments (no clock, request or mutable model state), so the gate may
+    #: reuse a decision for the rest of the request.
+    pure: bool = False
+
     def before(self, user: Any, ability: str, *args: Any) -> PolicyResult:
         """Run before any ability check.
 
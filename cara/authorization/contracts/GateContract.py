@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from cara.authorization.AuthorizationResponse import AuthorizationResponse
@@ -52,6 +52,16 @@ class GateContract(ABC):
     def none(self, abilities: list[str], *args: Any) -> bool:
         """Whether the user has none of the abilities."""
 
+    @abstractmethod
+    def check_many(self, ability: str, models: Sequence[Any], *args: Any) -> list[bool]:
+        """Whether the current user may perform the ability on each model."""
+
+    @abstractmethod
+    def inspect_many(
+        self, ability: str, models: Sequence[Any], *args: Any
+    ) -> list[AuthorizationResponse]:
+        """Return the authorization response for each model, in order."""
+
     @abstractmethod
     def inspect(self, ability: str, *args: Any) -> AuthorizationResponse:
         """Return the full authorization response, including any message."""
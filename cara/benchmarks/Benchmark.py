@@ -0,0 +1,59 @@
+"""One registered micro-benchmark.
+
+A benchmark is a *factory*: called once, it does whatever setup the
+measurement needs (build a router, seed a container, write a template)
+and returns the zero-argument operation to time. The operation may be a
+plain callable or a coroutine function. A factory written as a generator
+yields the operation instead and runs its teardown after the measurement,
+pytest-fixture style:
+
+    @benchmark("catalog.price_lookup")
+    def price_lookup():
+        service = PriceService(CacheFake())
+        return lambda: service.lookup(42)
+
+    @benchmark("reports.render")
+    def render_report():
+        directory = tempfile.mkdtemp()
+        yield lambda: Report(directory).render()
+        shutil.rmtree(directory)
+"""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    """A named benchmark factory and the group it reports under."""
+
+    name: str
+    factory: Callable[[], Any]
+    group: str = "app"
+    description: str = ""
+
+    @contextmanager
+    def operation(self) -> Iterator[Callable[[], Any]]:
+        """Run the factory's setup, yield the operation, then tear down."""
+        if not inspect.isgeneratorfunction(self.factory):
+            yield self._checked(self.factory())
+            return
+        lifecycle = self.factory()
+        try:
+            yield self._checked(next(lifecycle))
+        finally:
+            # Exhaust the generator so the code after ``yield`` runs.
+            for _ in lifecycle:
+                raise RuntimeError(f"Benchmark {self.name!r} must yield exactly once")
+
+    def _checked(self, op: Any) -> Callable[[], Any]:
+        if not callable(op):
+            raise TypeError(
+                f"Benchmark {self.name!r} factory must return the operation to time"
+            )
+        return op
@@ -0,0 +1,96 @@
+"""Stored benchmark results and the regression check against them.
+
+A baseline is a JSON file mapping benchmark names to the
+``BenchmarkResult`` recorded when it was saved, plus the interpreter and
+platform it was measured on — numbers from another machine are noise, so
+the file is meant to be committed per CI runner class, not shared.
+
+Regressions are judged on the median per-operation latency (``p50``):
+throughput is a mean and moves with every outlier round, the median does
+not. A result regresses when its ``p50`` exceeds the baseline's by more
+than ``threshold`` (``0.1`` = 10% slower). Benchmarks missing from either
+side are ignored, so adding or retiring one never fails a run.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+from collections.abc import Iterable
+from pathlib import Path
+
+import pendulum
+
+from cara.exceptions import StorageException
+
+from .BenchmarkResult import BenchmarkResult
+
+_VERSION = 1
+
+
+class BenchmarkBaseline:
+    """Benchmark results keyed by name, loadable from and savable to JSON."""
+
+    def __init__(self, results: dict[str, BenchmarkResult] | None = None):
+        self.results: dict[str, BenchmarkResult] = dict(results or {})
+
+    @classmethod
+    def load(cls, path: str | Path) -> BenchmarkBaseline:
+        """Read a baseline file; a missing file is an empty baseline."""
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            results = {
+                name: BenchmarkResult.from_dict(entry)
+                for name, entry in data["results"].items()
+            }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            raise StorageException(
+                f"Benchmark baseline {path} is not a valid baseline file"
+            ) from exc
+        return cls(results)
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        document = {
+            "version": _VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "saved_at": pendulum.now("UTC").to_iso8601_string(),
+            "results": {
+                name: result.to_dict() for name, result in sorted(self.results.items())
+            },
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+        except OSError as exc:
+            raise StorageException(f"Failed to write benchmark baseline {path}") from exc
+
+    def update(self, results: Iterable[BenchmarkResult]) -> None:
+        for result in results:
+            self.results[result.name] = result
+
+    def change(self, result: BenchmarkResult) -> float | None:
+        """Relative ``p50`` change against the baseline (``0.25`` = 25% slower)."""
+        baseline = self.results.get(result.name)
+        if baseline is None or baseline.p50 <= 0:
+            return None
+        return result.p50 / baseline.p50 - 1.0
+
+    def regressions(
+        self, results: Iterable[BenchmarkResult], threshold: float
+    ) -> list[tuple[BenchmarkResult, float]]:
+        """Results slower than the baseline by more than ``threshold``."""
+        if isinstance(threshold, bool) or not isinstance(threshold, (int, float)):
+            raise TypeError("Regression threshold must be a number")
+        if threshold < 0:
+            raise ValueError("Regression threshold must not be negative")
+        slower: list[tuple[BenchmarkResult, float]] = []
+        for result in results:
+            change = self.change(result)
+            if change is not None and change > threshold:
+                slower.append((result, change))
+        return slower
@@ -0,0 +1,22 @@
+"""The queued job the serializer benchmark round-trips.
+
+Its own public module because the job wire format only resolves public
+classes from allowlisted modules — exactly like an application job.
+"""
+
+from __future__ import annotations
+
+from cara.queues import Queueable, ShouldQueue
+
+
+class BenchmarkJob(ShouldQueue, Queueable):
+    """A minimal queued job with one constructor argument."""
+
+    def __init__(self, product_id: int, *, priority: str = "default"):
+        self.product_id = product_id
+        super().__init__()
+        self.queue = "default"
+        self.priority = priority
+
+    async def handle(self):
+        return None
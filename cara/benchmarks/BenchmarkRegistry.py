@@ -0,0 +1,74 @@
+"""Process-wide benchmark registry and the ``@benchmark`` decorator.
+
+Cara's own benchmarks are always registered. Applications add theirs
+with the decorator in any module ``craft bench`` imports — by default the
+top-level ``benchmarks`` package and every module inside it (see
+``BenchCommand``):
+
+    # benchmarks/catalog.py
+    from cara.benchmarks import benchmark
+
+    @benchmark("catalog.search", description="Search, 3 facets")
+    def search():
+        index = build_index(fixtures.products())
+        return lambda: index.search("usb-c", facets=FACETS)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from ._CoreBenchmarks import _CORE_BENCHMARKS
+from .Benchmark import Benchmark
+
+
+class BenchmarkRegistry:
+    """Registered benchmarks, keyed by unique name."""
+
+    _benchmarks: dict[str, Benchmark] = {b.name: b for b in _CORE_BENCHMARKS}
+
+    @classmethod
+    def register(cls, benchmark: Benchmark) -> Benchmark:
+        existing = cls._benchmarks.get(benchmark.name)
+        if existing is not None and not _same_factory(existing, benchmark):
+            raise ValueError(f"Benchmark {benchmark.name!r} is already registered")
+        cls._benchmarks[benchmark.name] = benchmark
+        return benchmark
+
+    @classmethod
+    def all(cls) -> list[Benchmark]:
+        return sorted(cls._benchmarks.values(), key=lambda b: (b.group, b.name))
+
+    @classmethod
+    def get(cls, name: str) -> Benchmark | None:
+        return cls._benchmarks.get(name)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget application benchmarks; cara's own stay registered."""
+        cls._benchmarks = {b.name: b for b in _CORE_BENCHMARKS}
+
+
+def _same_factory(a: Benchmark, b: Benchmark) -> bool:
+    # A module re-imported (reload, a second discovery pass) registers a
+    # new function object for the same benchmark; only a different
+    # definition claiming the name is a conflict.
+    return (a.factory.__module__, a.factory.__qualname__) == (
+        b.factory.__module__,
+        b.factory.__qualname__,
+    )
+
+
+def benchmark(
+    name: str, *, group: str = "app", description: str = ""
+) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+    """Register the decorated factory as benchmark ``name``."""
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("Benchmark name must be a non-empty string")
+
+    def decorator(factory: Callable[[], Any]) -> Callable[[], Any]:
+        BenchmarkRegistry.register(Benchmark(name, factory, group, description))
+        return factory
+
+    return decorator
@@ -0,0 +1,34 @@
+"""The measurement of one benchmark run."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """Throughput and per-operation latency percentiles, in seconds."""
+
+    name: str
+    group: str
+    operations: int
+    ops_per_sec: float
+    p50: float
+    p95: float
+    p99: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BenchmarkResult:
+        return cls(
+            name=str(data["name"]),
+            group=str(data.get("group", "app")),
+            operations=int(data["operations"]),
+            ops_per_sec=float(data["ops_per_sec"]),
+            p50=float(data["p50"]),
+            p95=float(data["p95"]),
+            p99=float(data["p99"]),
+        )
@@ -0,0 +1,131 @@
+"""Time a benchmark's operation and summarise it as a ``BenchmarkResult``.
+
+The operation is run in *rounds*. A calibration pass doubles the number
+of calls per round until one round takes at least ``min_round_time``, so
+the timer's resolution never dominates a fast operation; ``warmup``
+rounds then run untimed (caches, lazy imports, compiled regexes) before
+``rounds`` timed rounds. Each timed round yields one per-operation
+latency sample — round time divided by calls — and the percentiles are
+taken over those samples. Throughput is total calls over total timed
+time.
+
+The garbage collector is paused while a round runs, as ``timeit`` does,
+so a collection triggered by earlier work is not billed to whichever
+operation happened to be running. Coroutine operations are awaited in a
+loop on a fresh event loop, so their numbers include the loop's own
+scheduling overhead, exactly as a real request would.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import inspect
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .Benchmark import Benchmark
+from .BenchmarkResult import BenchmarkResult
+
+# Calls per round never grow past this, whatever the calibration says.
+_MAX_CALLS_PER_ROUND = 1 << 20
+
+
+class BenchmarkRunner:
+    """Measure benchmarks with a fixed round/warmup budget."""
+
+    def __init__(
+        self,
+        *,
+        rounds: int = 30,
+        warmup: int = 3,
+        min_round_time: float = 0.01,
+    ):
+        if type(rounds) is not int or rounds < 2:
+            raise ValueError("Benchmark rounds must be an integer of at least 2")
+        if type(warmup) is not int or warmup < 0:
+            raise ValueError("Benchmark warmup must be a non-negative integer")
+        if (
+            isinstance(min_round_time, bool)
+            or not isinstance(min_round_time, (int, float))
+            or min_round_time <= 0
+        ):
+            raise ValueError("Benchmark min_round_time must be a positive number")
+        self.rounds = rounds
+        self.warmup = warmup
+        self.min_round_time = float(min_round_time)
+
+    def run(self, benchmark: Benchmark) -> BenchmarkResult:
+        with benchmark.operation() as op:
+            if inspect.iscoroutinefunction(op):
+                calls, samples = asyncio.run(self._measure_async(op))
+            else:
+                calls, samples = self._measure(op)
+        total_time = sum(samples) * calls
+        cuts = statistics.quantiles(samples, n=100, method="inclusive")
+        return BenchmarkResult(
+            name=benchmark.name,
+            group=benchmark.group,
+            operations=calls * len(samples),
+            ops_per_sec=(calls * len(samples)) / total_time if total_time else 0.0,
+            p50=cuts[49],
+            p95=cuts[94],
+            p99=cuts[98],
+        )
+
+    def _measure(self, op: Callable[[], Any]) -> tuple[int, list[float]]:
+        def timed_round(calls: int) -> float:
+            started = time.perf_counter()
+            for _ in range(calls):
+                op()
+            return time.perf_counter() - started
+
+        calls = 1
+        while timed_round(calls) < self.min_round_time and calls < _MAX_CALLS_PER_ROUND:
+            calls *= 2
+        for _ in range(self.warmup):
+            timed_round(calls)
+        return calls, self._timed(lambda: timed_round(calls), calls)
+
+    async def _measure_async(
+        self, op: Callable[[], Awaitable[Any]]
+    ) -> tuple[int, list[float]]:
+        async def timed_round(calls: int) -> float:
+            started = time.perf_counter()
+            for _ in range(calls):
+                await op()
+            return time.perf_counter() - started
+
+        calls = 1
+        while (
+            await timed_round(calls) < self.min_round_time
+            and calls < _MAX_CALLS_PER_ROUND
+        ):
+            calls *= 2
+        for _ in range(self.warmup):
+            await timed_round(calls)
+
+        samples: list[float] = []
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(self.rounds):
+                samples.append(await timed_round(calls) / calls)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return calls, samples
+
+    def _timed(self, timed_round: Callable[[], float], calls: int) -> list[float]:
+        samples: list[float] = []
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(self.rounds):
+                samples.append(timed_round() / calls)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return samples
@@ -0,0 +1,297 @@
+"""Cara's own hot paths, measured against in-process stand-ins.
+
+Every benchmark here builds its fixture from scratch — a router of a
+realistic size, a bare container, an in-memory SQLite ``DatabaseManager``
+swapped in behind the ``DB`` facade, a template in a temporary directory —
+so ``craft bench`` measures the framework code and never the
+application's configuration, database or network.
+"""
+
+from __future__ import annotations
+
+import datetime
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Iterator
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+
+from cara.container import Container
+from cara.eloquent import DatabaseManager, Model
+from cara.events import Event
+from cara.http.resources import JsonResource, ResourceField
+from cara.queues import SignedJsonJobSerializer
+from cara.routing import Route, Router
+from cara.support import json_dumps
+from cara.testing import facade_swap
+from cara.validation import Validation
+from cara.view import ViewEngine
+
+from .Benchmark import Benchmark
+from .BenchmarkJob import BenchmarkJob
+
+_SIGNING_KEYS = {"bench": "cara-benchmark-signing-key-" * 2}
+_JOB_PREFIXES = ("cara.benchmarks",)
+_ISSUED_AT = 1_800_000_000
+
+
+def _controller(_request=None, _response=None):
+    return None
+
+
+def _router_find() -> Callable[[], Any]:
+    routes = [Route.get("/", _controller), Route.get("/health", _controller)]
+    for resource in ("users", "products", "orders", "invoices", "carts", "reviews"):
+        routes += [
+            Route.get(f"/api/{resource}", _controller),
+            Route.post(f"/api/{resource}", _controller),
+            Route.get(f"/api/{resource}/@id:int", _controller),
+            Route.put(f"/api/{resource}/@id:int", _controller),
+            Route.delete(f"/api/{resource}/@id:int", _controller),
+            Route.get(f"/api/{resource}/@id:int/history/@page:int?", _controller),
+        ]
+    router = Router(None, *routes)
+    return lambda: router.find("/api/reviews/42/history/3", "GET")
+
+
+class _Clock:
+    pass
+
+
+class _Repository:
+    def __init__(self, clock: _Clock):
+        self.clock = clock
+
+
+def _container_make() -> Callable[[], Any]:
+    container = Container()
+    container.bind(_Clock, _Clock)
+    container.bind("repository", _Repository)
+    return lambda: container.make("repository")
+
+
+class _Product(Model):
+    __table__ = "products"
+    __connection__ = "bench"
+    __casts__ = {"price": "float", "active": "bool"}
+
+
+def _model_hydrate() -> Iterator[Callable[[], Any]]:
+    rows = [
+        {"id": i, "title": f"Product {i}", "price": "9.99", "active": 1}
+        for i in range(50)
+    ]
+    manager = DatabaseManager(
+        "bench", {"bench": {"driver": "sqlite", "database": ":memory:"}}
+    )
+    with facade_swap.swap("DB", manager):
+        yield lambda: _Product.hydrate(rows)
+
+
+def _json_dumps() -> Callable[[], Any]:
+    payload = {
+        "data": [
+            {
+                "id": i,
+                "title": f"Product {i}",
+                "price": Decimal("19.99"),
+                "tags": ["new", "sale"],
+                "updated_at": datetime.datetime(2026, 1, 1, 12, 30, tzinfo=datetime.UTC),
+            }
+            for i in range(20)
+        ],
+        "meta": {"page": 1, "per_page": 20, "total": 1000},
+    }
+    return lambda: json_dumps(payload)
+
+
+class _BrandResource(JsonResource):
+    fields = ("id", "name")
+
+
+class _PlannedProductResource(JsonResource):
+    fields = (
+        ResourceField("id", "public_id"),
+        "title",
+        ResourceField("score", convert=float),
+        "price",
+        ResourceField("updated_at", convert=datetime.datetime),
+        ResourceField("brand", resource=_BrandResource, loaded=True),
+    )
+
+
+class _PerItemProductResource(JsonResource):
+    """The same payload as ``_PlannedProductResource``, written by hand."""
+
+    def to_array(self, request=None) -> dict:
+        product = self.resource
+        return {
+            "id": product.public_id,
+            "title": product.title,
+            "score": self.opt_float(product.score),
+            "price": product.price,
+            "updated_at": self.opt_datetime(product.updated_at),
+            "brand": self.when_loaded(
+                product, "brand", lambda brand: _BrandResource(brand).to_array()
+            ),
+        }
+
+
+def _resource_page(resource_class: type[JsonResource]) -> Callable[[], Any]:
+    items = [
+        SimpleNamespace(
+            public_id=f"prd_{i}",
+            title=f"Product {i}",
+            score=i / 3,
+            price=Decimal("19.90"),
+            updated_at=datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.UTC),
+            brand=SimpleNamespace(id=i, name="Acme"),
+        )
+        for i in range(20)
+    ]
+    return lambda: resource_class.collection(items).resolve()
+
+
+def _resource_plan() -> Callable[[], Any]:
+    return _resource_page(_PlannedProductResource)
+
+
+def _resource_to_array() -> Callable[[], Any]:
+    return _resource_page(_PerItemProductResource)
+
+
+def _validation_make() -> Callable[[], Any]:
+    data = {
+        "email": "buyer@example.com",
+        "name": "Ada Lovelace",
+        "age": 36,
+        "tags": ["books", "math"],
+    }
+    rules = {
+        "email": "required|email",
+        "name": "required|string|max:255",
+        "age": "required|integer|min:18",
+        "tags.*": "string",
+    }
+    return lambda: Validation.make(data, rules).fails()
+
+
+def _view_render() -> Iterator[Callable[[], Any]]:
+    directory = tempfile.mkdtemp(prefix="cara-bench-")
+    with open(os.path.join(directory, "card.cara.html"), "w", encoding="utf-8") as f:
+        f.write(
+            "<h1>{{ title }}</h1>\n"
+            "@foreach(items as item)\n"
+            "<li>{{ item }}</li>\n"
+            "@endforeach\n"
+        )
+    engine = ViewEngine(view_paths=[directory], cache_path=directory)
+    data = {"title": "Sons & Co <b>", "items": [f"item {i}" for i in range(20)]}
+    try:
+        yield lambda: engine.render("card", data)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _job_serializer() -> Callable[[], Any]:
+    job = BenchmarkJob(42)
+    payload = {
+        "obj": job,
+        "args": (),
+        "callback": "handle",
+        "created": "2026-01-01T00:00:00Z",
+        "job_id": "11111111-1111-4111-8111-111111111111",
+        "db_job_id": 12,
+        "timeout_seconds": 300,
+        "attempts": 0,
+        "throttle_attempts": 0,
+        "_tenant": 7,
+        "_tenant_mode": "tenant",
+        "queue": job.queue,
+        "priority": job.priority,
+        "dispatched_at": "2026-01-01T00:00:00Z",
+        "replay_of": None,
+    }
+
+    def round_trip():
+        body = SignedJsonJobSerializer.serialize(
+            payload,
+            signing_key_id="bench",
+            signing_keys=_SIGNING_KEYS,
+            allowed_prefixes=_JOB_PREFIXES,
+            issued_at=_ISSUED_AT,
+        )
+        return SignedJsonJobSerializer.deserialize(
+            body,
+            signing_keys=_SIGNING_KEYS,
+            allowed_prefixes=_JOB_PREFIXES,
+            now=_ISSUED_AT + 1,
+        )
+
+    return round_trip
+
+
+class _OrderPlaced:
+    name = "order.placed"
+
+    def __init__(self, order_id: int):
+        self.order_id = order_id
+
+
+class _Listener:
+    def handle(self, event):
+        return event.order_id
+
+
+def _event_dispatch() -> Callable[[], Any]:
+    dispatcher = Event()
+    for _ in range(3):
+        dispatcher.subscribe("order.placed", _Listener())
+    dispatcher.subscribe("order.*", _Listener())
+    event = _OrderPlaced(7)
+
+    async def dispatch():
+        await dispatcher.dispatch(event)
+
+    return dispatch
+
+
+_CORE_BENCHMARKS: tuple[Benchmark, ...] = (
+    Benchmark(
+        "cara.router.find", _router_find, "cara", "Router.find, 38 routes, 2 params"
+    ),
+    Benchmark(
+        "cara.container.make", _container_make, "cara", "Container.make, autowired"
+    ),
+    Benchmark("cara.model.hydrate", _model_hydrate, "cara", "Model.hydrate, 50 rows"),
+    Benchmark("cara.json.dumps", _json_dumps, "cara", "json_dumps, 20-item page"),
+    Benchmark(
+        "cara.resource.plan",
+        _resource_plan,
+        "cara",
+        "ResourceCollection.resolve, compiled plan, 20 items",
+    ),
+    Benchmark(
+        "cara.resource.to_array",
+        _resource_to_array,
+        "cara",
+        "ResourceCollection.resolve, hand-written to_array, 20 items",
+    ),
+    Benchmark(
+        "cara.validation.make", _validation_make, "cara", "Validation.make, 4 rules"
+    ),
+    Benchmark(
+        "cara.view.render", _view_render, "cara", "ViewEngine.render, 20-item loop"
+    ),
+    Benchmark(
+        "cara.queue.serializer",
+        _job_serializer,
+        "cara",
+        "SignedJsonJobSerializer round trip",
+    ),
+    Benchmark(
+        "cara.event.dispatch", _event_dispatch, "cara", "Event.dispatch, 4 listeners"
+    ),
+)
@@ -0,0 +1,31 @@
+"""Benchmarks — registered micro-benchmarks, a runner and stored baselines.
+
+``craft bench`` runs every registered benchmark (cara's hot paths plus
+the application's own ``@benchmark`` factories), reports throughput and
+latency percentiles, and fails when one regresses past the threshold
+against the saved baseline.
+"""
+
+from cara._LazyExports import _install_lazy_exports
+
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "Benchmark": (".Benchmark", "Benchmark"),
+    "BenchmarkBaseline": (".BenchmarkBaseline", "BenchmarkBaseline"),
+    "BenchmarkJob": (".BenchmarkJob", "BenchmarkJob"),
+    "BenchmarkRegistry": (".BenchmarkRegistry", "BenchmarkRegistry"),
+    "BenchmarkResult": (".BenchmarkResult", "BenchmarkResult"),
+    "BenchmarkRunner": (".BenchmarkRunner", "BenchmarkRunner"),
+    "benchmark": (".BenchmarkRegistry", "benchmark"),
+}
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkBaseline",
+    "BenchmarkJob",
+    "BenchmarkRegistry",
+    "BenchmarkResult",
+    "BenchmarkRunner",
+    "benchmark",
+]
+
+_install_lazy_exports(__name__, _LAZY_EXPORTS)
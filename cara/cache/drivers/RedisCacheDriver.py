@@ -153,6 +153,21 @@ class RedisCacheDriver(CacheContract):
         """
         return self._client
 
+    def key_prefix(self) -> str:
+        """Namespace for keys a primitive writes straight through
+        :meth:`connection`.
+
+        Built from the configured ``prefix``, so applications sharing one
+        Redis database keep their script-managed state apart, and
+        :meth:`flush` clears it along with the rest of the cache.
+        """
+        return self._prefix
+
+    def counter_key(self, key: str) -> str:
+        """The Redis key :meth:`increment` counts ``key`` under, for a
+        script that must keep counting on the same plain integer."""
+        return self._counter_key(key)
+
     @staticmethod
     def _resolve_signing_key(explicit: str | bytes | None) -> str | bytes:
         if explicit:
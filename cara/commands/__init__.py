@@ -11,6 +11,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "ActiveJobCancellationRegistry": (".core", "ActiveJobCancellationRegistry"),
     "ArchBarrelsCommand": (".core", "ArchBarrelsCommand"),
     "ArchCheckCommand": (".core", "ArchCheckCommand"),
+    "BenchCommand": (".core", "BenchCommand"),
     "BootlessCommandSpec": (".BootlessCommandSpec", "BootlessCommandSpec"),
     "CacheClearCommand": (".core", "CacheClearCommand"),
     "CheckResult": (".core", "CheckResult"),
@@ -97,6 +98,7 @@ __all__ = [
     "ActiveJobCancellationRegistry",
     "ArchBarrelsCommand",
     "ArchCheckCommand",
+    "BenchCommand",
     "BootlessCommandSpec",
     "CacheClearCommand",
     "CheckResult",
@@ -0,0 +1,203 @@
+"""BenchCommand: run the registered benchmarks and gate on regressions.
+
+``craft bench`` imports the application's benchmark modules (by default
+the top-level ``benchmarks`` package and every module in it), runs cara's own hot-path benchmarks plus
+every ``@benchmark`` the application registered, and prints ops/s and
+p50/p95/p99 latency per benchmark next to its change against the stored
+baseline.
+
+Exit code is non-zero when any benchmark's median latency regressed past
+``--threshold`` (default 10%) against the baseline, so CI can gate on it
+directly. ``--save`` records this run as the new baseline instead.
+
+Configurable via ``config/benchmarks.py``:
+
+  - ``modules``: modules/packages holding application benchmarks
+    (default ``("benchmarks",)``; a missing one is skipped)
+  - ``baseline``: baseline file (default ``storage/benchmarks/baseline.json``)
+  - ``threshold``: allowed median slowdown before failing (default 0.1)
+  - ``rounds``: timed rounds per benchmark (default 30)
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import importlib
+import pkgutil
+from pathlib import Path
+
+from cara.benchmarks import BenchmarkBaseline, BenchmarkRegistry, BenchmarkRunner
+from cara.commands.CommandBase import CommandBase
+from cara.configuration import config
+from cara.decorators import command
+from cara.support import paths
+
+_DEFAULT_MODULES = ("benchmarks",)
+_DEFAULT_THRESHOLD = 0.1
+_DEFAULT_ROUNDS = 30
+
+
+@command(
+    name="bench",
+    help="Run the registered benchmarks and compare them against the stored baseline.",
+    options=[
+        {
+            "name": "--only",
+            "help": "Run only benchmarks matching these names or globs (comma-separated)",
+            "type": str,
+            "default": None,
+            "is_flag": False,
+        },
+        {
+            "name": "--rounds",
+            "help": "Timed rounds per benchmark (default: 30)",
+            "type": int,
+            "default": None,
+            "is_flag": False,
+        },
+        {
+            "name": "--threshold",
+            "help": "Allowed median slowdown against the baseline (default: 0.1 = 10%)",
+            "type": float,
+            "default": None,
+            "is_flag": False,
+        },
+        {
+            "name": "--baseline",
+            "help": "Baseline file (default: storage/benchmarks/baseline.json)",
+            "type": str,
+            "default": None,
+            "is_flag": False,
+        },
+        {
+            "name": "--save",
+            "help": "Store this run as the new baseline instead of comparing",
+            "type": bool,
+            "default": False,
+            "is_flag": True,
+        },
+        {
+            "name": "--list",
+            "help": "List the registered benchmarks without running them",
+            "type": bool,
+            "default": False,
+            "is_flag": True,
+        },
+    ],
+)
+class BenchCommand(CommandBase):
+    """Benchmark runner with JSON baselines and a regression gate."""
+
+    def handle(
+        self,
+        only: str | None = None,
+        rounds: int | None = None,
+        threshold: float | None = None,
+        baseline: str | None = None,
+    ) -> int:
+        self._load_application_benchmarks()
+        benchmarks = BenchmarkRegistry.all()
+        if only:
+            patterns = [p.strip() for p in only.split(",") if p.strip()]
+            benchmarks = [
+                b for b in benchmarks if any(fnmatch.fnmatch(b.name, p) for p in patterns)
+            ]
+        if not benchmarks:
+            self.error("no benchmarks matched")
+            return 1
+
+        if self.option("list"):
+            self.table(
+                ["Benchmark", "Group", "Description"],
+                [(b.name, b.group, b.description) for b in benchmarks],
+            )
+            return 0
+
+        try:
+            runner = BenchmarkRunner(
+                rounds=rounds
+                if rounds is not None
+                else config("benchmarks.rounds", _DEFAULT_ROUNDS)
+            )
+        except ValueError as exc:
+            self.error(str(exc))
+            return 1
+        threshold = (
+            threshold
+            if threshold is not None
+            else config("benchmarks.threshold", _DEFAULT_THRESHOLD)
+        )
+        baseline_path = Path(
+            baseline
+            or config("benchmarks.baseline", None)
+            or paths("storage", "benchmarks/baseline.json")
+        )
+        stored = BenchmarkBaseline.load(baseline_path)
+
+        results = []
+        for bench in self.progress(benchmarks, description="Benchmarking"):
+            results.append(runner.run(bench))
+
+        self.table(
+            ["Benchmark", "ops/s", "p50", "p95", "p99", "vs baseline"],
+            [
+                (
+                    r.name,
+                    f"{r.ops_per_sec:,.0f}",
+                    _duration(r.p50),
+                    _duration(r.p95),
+                    _duration(r.p99),
+                    _change(stored.change(r)),
+                )
+                for r in results
+            ],
+        )
+
+        if self.option("save"):
+            stored.update(results)
+            stored.save(baseline_path)
+            self.success(f"Baseline saved to {baseline_path}")
+            return 0
+
+        try:
+            regressions = stored.regressions(results, threshold)
+        except (TypeError, ValueError) as exc:
+            self.error(str(exc))
+            return 1
+        if regressions:
+            for result, change in regressions:
+                self.warning(f"{result.name}: median {change:+.1%} against the baseline")
+            self.error(
+                f"{len(regressions)} benchmark(s) regressed more than {threshold:.0%}"
+            )
+            return 1
+        self.success(
+            f"{len(results)} benchmark(s) within {threshold:.0%} of the baseline"
+        )
+        return 0
+
+    def _load_application_benchmarks(self) -> None:
+        """Import the configured modules so their ``@benchmark``s register."""
+        for name in config("benchmarks.modules", _DEFAULT_MODULES):
+            try:
+                module = importlib.import_module(name)
+            except ModuleNotFoundError as exc:
+                if exc.name != name:
+                    raise
+                continue
+            for info in pkgutil.walk_packages(
+                getattr(module, "__path__", ()), prefix=f"{name}."
+            ):
+                importlib.import_module(info.name)
+
+
+def _duration(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.2f}µs"
+
+
+def _change(change: float | None) -> str:
+    return "—" if change is None else f"{change:+.1%}"
@@ -140,6 +140,7 @@ def _process_message(
     delivery_store = None
     delivery_lease_token = None
     terminal_outcome = None
+    job_scope = contextlib.ExitStack()
 
     try:
         envelope = SignedJsonJobSerializer.inspect_envelope(
@@ -250,6 +251,12 @@ def _process_message(
                 (),
             ),
         )
+        # One container scope per job, entered before the job is built so
+        # its scoped constructor dependencies are the job's own. The async
+        # call inherits it (``asyncio.run`` copies the context), and the
+        # failure route below runs in it too.
+        if app_instance is not None:
+            job_scope.enter_context(app_instance.scope())
         instance = instantiate_job(
             app_instance,
             msg.get("obj"),
@@ -426,9 +433,12 @@ def _process_message(
                 try:
 
                     async def _call_with_middleware():
-                        return await run_through_middleware_async(
-                            instance, _async_handler
-                        )
+                        # Runs in the job's scope; loop stalls inside are
+                        # attributed to the job class.
+                        with observability.stall_origin(f"job:{_mx_job}"):
+                            return await run_through_middleware_async(
+                                instance, _async_handler
+                            )
 
                     JobProcessor._execute_async_job_with_timeout(
                         _call_with_middleware,
@@ -555,6 +565,9 @@ def _process_message(
         _mx_record("failed")
         return "failure"  # Still processed (failed gracefully)
 
+    finally:
+        job_scope.close()
+
 
 def _bind_job_processor(processor_class: type[Any]) -> None:
     """Bind the public processor facade without creating an import cycle."""
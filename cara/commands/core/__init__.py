@@ -10,6 +10,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     ),
     "ArchBarrelsCommand": (".ArchBarrelsCommand", "ArchBarrelsCommand"),
     "ArchCheckCommand": (".ArchCheckCommand", "ArchCheckCommand"),
+    "BenchCommand": (".BenchCommand", "BenchCommand"),
     "CacheClearCommand": (".CacheClearCommand", "CacheClearCommand"),
     "CheckResult": (".CheckResult", "CheckResult"),
     "DEFAULT_LOCK_TIMEOUT_MS": (".SchemaApplyCommand", "DEFAULT_LOCK_TIMEOUT_MS"),
@@ -89,6 +90,7 @@ __all__ = [
     "ActiveJobCancellationRegistry",
     "ArchBarrelsCommand",
     "ArchCheckCommand",
+    "BenchCommand",
     "CacheClearCommand",
     "CheckResult",
     "DEFAULT_LOCK_TIMEOUT_MS",
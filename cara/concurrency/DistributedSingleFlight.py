@@ -0,0 +1,251 @@
+"""Cross-worker request coalescing backed by ``CacheLock``.
+
+``SingleFlight`` collapses concurrent calls inside one worker; N workers
+still run the expensive query N times. ``DistributedSingleFlight`` elects
+one leader per key across every worker sharing the cache:
+
+1. Concurrent callers inside a worker first collapse onto one local
+   flight, so each worker contributes at most one contender.
+2. The contender that wins ``Cache.lock("singleflight:<key>")`` runs the
+   function, stores the result under ``singleflight:result:<key>`` for
+   ``result_ttl`` seconds, tagged with its lock owner, and publishes a
+   wake-up on the ``singleflight:<key>`` channel.
+3. The others note the owner of the flight they joined, subscribe to that
+   channel and read the stored result as soon as the leader publishes.
+   ``Cache.remember`` losers sleep-poll every 50ms; here a follower wakes
+   on the publish. Drivers without pub/sub (the file driver) fall back to
+   polling.
+4. A leader that fails stores nothing; its lock is released and the next
+   follower to wake claims it and runs the function itself, as
+   ``Cache.remember`` does. A follower that waits past ``wait`` seconds
+   runs the function rather than fail.
+
+A caller that finds no flight running starts one, even if a result from a
+finished flight is still stored: only the followers of a flight read its
+result, so nothing is cached past the flight.
+
+The result travels through the cache codec, so it must be a value the
+cache can store (JSON-like data, dates, decimals, bytes).
+
+    flight = DistributedSingleFlight(result_ttl=5)
+
+    async def homepage() -> dict:
+        return await flight.run("homepage", build_homepage)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from cara.facades import Cache
+
+from .SingleFlight import SingleFlight
+
+_MISSING = object()
+# Longest single wait between checks. A wake-up lost to a subscribe race
+# or a crashed leader costs at most this much.
+_WAIT_SLICE_S = 1.0
+# Poll interval when the driver offers no pub/sub (same as Cache.remember).
+_POLL_INTERVAL_S = 0.05
+
+
+class DistributedSingleFlight:
+    """Collapse concurrent calls sharing a key into one execution per cluster.
+
+    Args:
+        lock_seconds: Lifetime of the leader's lock; bounds how long a
+                      crashed leader blocks the key.
+        result_ttl: Seconds the leader's result stays readable for its
+                    followers that wake late.
+        wait: Seconds a follower waits before running the function itself.
+        driver_name: Cache driver to coordinate through (default driver
+                     when ``None``).
+    """
+
+    def __init__(
+        self,
+        *,
+        lock_seconds: int = 30,
+        result_ttl: int = 5,
+        wait: float = 30.0,
+        driver_name: str | None = None,
+    ):
+        if type(lock_seconds) is not int or lock_seconds <= 0:
+            raise ValueError("lock_seconds must be a positive integer")
+        if type(result_ttl) is not int or result_ttl <= 0:
+            raise ValueError("result_ttl must be a positive integer")
+        if wait <= 0:
+            raise ValueError("wait must be positive")
+        self._lock_seconds = lock_seconds
+        self._result_ttl = result_ttl
+        self._wait = wait
+        self._driver = driver_name
+        self._local = SingleFlight()
+
+    async def run(
+        self, key: str, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run ``fn(*args, **kwargs)`` once across every worker calling ``key``."""
+        return await self._local.run(key, self._run, key, fn, args, kwargs)
+
+    def run_sync(
+        self, key: str, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Blocking variant of :meth:`run`."""
+        return self._local.run_sync(key, self._run_blocking, key, fn, args, kwargs)
+
+    # ── Leader / follower loop ───────────────────────────────────────
+
+    async def _run(
+        self, key: str, fn: Callable[..., Any], args: tuple, kwargs: dict
+    ) -> Any:
+        deadline = time.monotonic() + self._wait
+        subscription = None
+        flight = None
+        try:
+            while True:
+                if flight is not None:
+                    found = self._stored_result(key, flight)
+                    if found is not _MISSING:
+                        return found
+                lock = self._claim(key)
+                if lock is not None:
+                    return await self._lead_async(key, lock, fn, args, kwargs)
+                flight = self._flight(key) or flight
+                if subscription is None:
+                    # Subscribe, then look again: a publish between the
+                    # first look and the subscribe would otherwise be lost.
+                    subscription = self._subscribe(key)
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                await self._await_wake(subscription, min(remaining, _WAIT_SLICE_S))
+        finally:
+            self._close(subscription)
+        return await SingleFlight._execute(fn, args, kwargs)
+
+    def _run_blocking(
+        self, key: str, fn: Callable[..., Any], args: tuple, kwargs: dict
+    ) -> Any:
+        deadline = time.monotonic() + self._wait
+        subscription = None
+        flight = None
+        try:
+            while True:
+                if flight is not None:
+                    found = self._stored_result(key, flight)
+                    if found is not _MISSING:
+                        return found
+                lock = self._claim(key)
+                if lock is not None:
+                    return self._lead_blocking(key, lock, fn, args, kwargs)
+                flight = self._flight(key) or flight
+                if subscription is None:
+                    subscription = self._subscribe(key)
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._block_for_wake(subscription, min(remaining, _WAIT_SLICE_S))
+        finally:
+            self._close(subscription)
+        return fn(*args, **kwargs)
+
+    async def _lead_async(
+        self, key: str, lock: Any, fn: Callable[..., Any], args: tuple, kwargs: dict
+    ) -> Any:
+        try:
+            value = await SingleFlight._execute(fn, args, kwargs)
+            self._store_result(key, lock, value)
+            return value
+        finally:
+            self._finish(key, lock)
+
+    def _lead_blocking(
+        self, key: str, lock: Any, fn: Callable[..., Any], args: tuple, kwargs: dict
+    ) -> Any:
+        try:
+            value = fn(*args, **kwargs)
+            self._store_result(key, lock, value)
+            return value
+        finally:
+            self._finish(key, lock)
+
+    # ── Cache coordination ───────────────────────────────────────────
+
+    def _claim(self, key: str) -> Any | None:
+        lock = Cache.lock(
+            f"singleflight:{key}", self._lock_seconds, driver_name=self._driver
+        )
+        return lock if lock.acquire() else None
+
+    def _flight(self, key: str) -> Any | None:
+        """The lock owner of the flight running ``key``, or ``None``."""
+        return Cache.get(f"lock:singleflight:{key}", None, self._driver)
+
+    def _stored_result(self, key: str, flight: Any) -> Any:
+        stored = Cache.get(f"singleflight:result:{key}", None, self._driver)
+        # Wrapped so a legitimate ``None`` result is not read as "absent",
+        # and tagged so only the flight's own followers read it.
+        if (
+            isinstance(stored, dict)
+            and "value" in stored
+            and stored.get("flight") == flight
+        ):
+            return stored["value"]
+        return _MISSING
+
+    def _store_result(self, key: str, lock: Any, value: Any) -> None:
+        Cache.put(
+            f"singleflight:result:{key}",
+            {"value": value, "flight": lock.owner},
+            self._result_ttl,
+            self._driver,
+        )
+
+    def _finish(self, key: str, lock: Any) -> None:
+        lock.release()
+        # Wake followers whether the leader succeeded or failed: on success
+        # they read the result, on failure one of them claims the lock.
+        client = self._pubsub_client()
+        if client is not None:
+            client.publish(f"singleflight:{key}", b"1")
+
+    # ── Wake-ups ─────────────────────────────────────────────────────
+
+    def _pubsub_client(self) -> Any | None:
+        connection = getattr(Cache.driver(self._driver), "connection", None)
+        return connection() if callable(connection) else None
+
+    def _subscribe(self, key: str) -> Any:
+        """A pub/sub subscription to ``key``'s channel, or ``False`` to poll."""
+        client = self._pubsub_client()
+        if client is None:
+            return False
+        subscription = client.pubsub(ignore_subscribe_messages=True)
+        subscription.subscribe(f"singleflight:{key}")
+        return subscription
+
+    @staticmethod
+    async def _await_wake(subscription: Any, timeout: float) -> None:
+        if not subscription:
+            await asyncio.sleep(_POLL_INTERVAL_S)
+            return
+        # redis-py's pub/sub read blocks; keep it off the event loop.
+        await asyncio.to_thread(subscription.get_message, timeout=timeout)
+
+    @staticmethod
+    def _block_for_wake(subscription: Any, timeout: float) -> None:
+        if not subscription:
+            time.sleep(_POLL_INTERVAL_S)
+            return
+        subscription.get_message(timeout=timeout)
+
+    @staticmethod
+    def _close(subscription: Any) -> None:
+        if subscription:
+            subscription.close()
@@ -0,0 +1,108 @@
+"""In-process request coalescing ("singleflight").
+
+When a hot cache key expires, every request on the worker that misses it
+runs the same expensive query at once. A ``SingleFlight`` collapses those
+calls: the first caller for a key runs the function, every concurrent
+caller with the same key awaits that one execution and receives its
+result (or its exception). Once the call finishes the key is free again —
+nothing is cached here; pair it with ``Cache`` for that.
+
+    flight = SingleFlight()
+
+    async def product_card(product_id: int) -> dict:
+        return await flight.run(f"product:{product_id}", load_card, product_id)
+
+Async callers share an ``asyncio`` task per event loop and key; a caller
+being cancelled (a client hanging up) cancels only its own wait, never
+the shared execution the others are waiting on. Thread-based code uses
+``run_sync``, which shares one execution per key across threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from collections.abc import Callable
+from typing import Any
+
+
+class _Call:
+    """One in-flight ``run_sync`` execution and its outcome."""
+
+    __slots__ = ("done", "error", "value")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Collapse concurrent calls sharing a key into one execution."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[tuple[int, str], asyncio.Task] = {}
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    async def run(
+        self, key: str, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run ``fn(*args, **kwargs)`` once for every concurrent caller of ``key``.
+
+        ``fn`` may be a coroutine function or a plain callable; a plain
+        callable runs on the loop, so keep blocking work out of it.
+        """
+        loop = asyncio.get_running_loop()
+        slot = (id(loop), key)
+        task = self._tasks.get(slot)
+        if task is None:
+            task = loop.create_task(self._execute(fn, args, kwargs))
+            self._tasks[slot] = task
+            task.add_done_callback(lambda done: self._settle(slot, done))
+        return await asyncio.shield(task)
+
+    def run_sync(
+        self, key: str, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Blocking variant of :meth:`run` for threads sharing this flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+        try:
+            call.value = fn(*args, **kwargs)
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def in_flight(self, key: str) -> bool:
+        """Whether a call for ``key`` is running (on any loop or thread)."""
+        return key in self._calls or any(slot[1] == key for slot in self._tasks)
+
+    @staticmethod
+    async def _execute(fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        result = fn(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def _settle(self, slot: tuple[int, str], task: asyncio.Task) -> None:
+        if self._tasks.get(slot) is task:
+            del self._tasks[slot]
+        # Every waiter may have been cancelled; retrieve the outcome so an
+        # exception nobody awaited is not reported as "never retrieved".
+        if not task.cancelled():
+            task.exception()
@@ -1,4 +1,4 @@
-"""Concurrency primitives — deduplicated background tasks (more to come).
+"""Concurrency primitives — request coalescing (singleflight).
 
 Generic, framework-level concurrency helpers. Apps pass their own
 cache keys and coroutine factories; cara owns the dedup + cleanup
@@ -7,8 +7,14 @@ plumbing.
 
 from cara._LazyExports import _install_lazy_exports
 
-_LAZY_EXPORTS: dict[str, tuple[str, str]] = {}
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "DistributedSingleFlight": (".DistributedSingleFlight", "DistributedSingleFlight"),
+    "SingleFlight": (".SingleFlight", "SingleFlight"),
+}
 
-__all__: list[str] = []
+__all__ = [
+    "DistributedSingleFlight",
+    "SingleFlight",
+]
 
 _install_lazy_exports(__name__, _LAZY_EXPORTS)
@@ -18,13 +18,34 @@ application reference and router (both immutable across requests).
 from __future__ import annotations
 
 import inspect
+from collections.abc import Awaitable, Callable
 from typing import Any
+from urllib.parse import parse_qsl, urlencode
 
-from cara.exceptions import MiddlewareNotFoundException
+from cara.concurrency import SingleFlight
 from cara.facades import Log
 from cara.http import Request, Response
-from cara.middleware.http import ResetHttpAuth
-from cara.support import Pipeline
+from cara.support import Pipeline, optional_user_id
+
+# One flight per worker for every ``Route.coalesce`` route.
+_coalesced_routes = SingleFlight()
+
+
+def _coalesce_key(request: Request) -> str:
+    """What makes two GETs identical for ``Route.coalesce``."""
+    query = urlencode(
+        sorted(parse_qsl(request.scope.get("query_string", b"").decode("latin-1")))
+    )
+    user_id = optional_user_id(request)
+    return "\x00".join(
+        (
+            request.path,
+            query,
+            "" if user_id is None else str(user_id),
+            request.header("Accept") or "",
+            request.header("Accept-Language") or "",
+        )
+    )
 
 
 class HttpConductor:
@@ -50,13 +71,17 @@ class HttpConductor:
 
         Creates per-request Request and Response objects as LOCAL variables
         (not self.*) so concurrent requests cannot interfere with each other.
+        The request runs in its own container scope: ``scoped`` bindings are
+        built lazily for it and the auth guards' identity vars start empty,
+        and both are dropped when the scope ends.
         """
-        request = self.application.make("request")
-        response = self.application.make("response")
-        # Router is already initialized at startup, just get it from application
-        if self.router is None:
-            self.router = self.application.router
-        await self._handle_request(scope, receive, send, request, response)
+        with self.application.scope():
+            request = self.application.make("request")
+            response = self.application.make("response")
+            # Router is already initialized at startup, just get it from application
+            if self.router is None:
+                self.router = self.application.router
+            await self._handle_request(scope, receive, send, request, response)
 
     async def _handle_request(
         self,
@@ -99,6 +124,12 @@ class HttpConductor:
                 raise
 
             async def route_dispatch(r: Request) -> Response:
+                """Dispatch to controller, collapsing concurrent twins if asked."""
+                if route.is_coalesced() and r.method == "GET":
+                    return await self._dispatch_coalesced(r, response, dispatch)
+                return await dispatch(r)
+
+            async def dispatch(r: Request) -> Response:
                 """Dispatch to controller and handle the result."""
                 result = await route.controller.handle((r, response))
                 if isinstance(result, type(response)):
@@ -135,10 +166,8 @@ class HttpConductor:
             # including the exception path. Previously the terminate
             # block lived after the try/except, so any exception in the
             # pipeline (auth guard rejecting a request, route not found,
-            # body parse error, ...) skipped terminate entirely. ResetHttpAuth
-            # is the most-impactful one — without it, the next request on
-            # the same worker observes the previous request's user state
-            # because the auth singleton's ``_user`` field is still set.
+            # body parse error, ...) skipped terminate entirely, so
+            # middleware holding per-request resources never released them.
             #
             # We still send the response in the success path below; this
             # finally block exists purely to guarantee terminate runs.
@@ -162,6 +191,45 @@ class HttpConductor:
             await resp(scope, receive, send)
             scope["response_sent"] = True
 
+    async def _dispatch_coalesced(
+        self,
+        request: Request,
+        response: Response,
+        dispatch: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        """Run ``dispatch`` once for identical concurrent GETs (``Route.coalesce``).
+
+        The leader dispatches into its own response; the flight shares a
+        snapshot of it taken before any outer middleware (compression,
+        response caching) touches it, and every follower rebuilds its own
+        response from that snapshot. A streamed or file body cannot be
+        shared, so followers then dispatch for themselves.
+        """
+        led = False
+
+        async def lead() -> tuple[int, dict[str, str], bytes] | None:
+            nonlocal led
+            led = True
+            result = await dispatch(request)
+            if result.has_deferred_body():
+                return None
+            return (
+                result.get_status_code(),
+                result.headers.all(),
+                result.to_bytes(),
+            )
+
+        snapshot = await _coalesced_routes.run(_coalesce_key(request), lead)
+        if led:
+            return response
+        if snapshot is None:
+            return await dispatch(request)
+        status, headers, body = snapshot
+        response.set_content(body)
+        response.status(status)
+        response.headers.merge(headers)
+        return response
+
     def get_global_middleware(self):
         """
         Returns global HTTP middleware.
@@ -174,26 +242,15 @@ class HttpConductor:
 
     def get_route_middleware(self, route):
         """
-        Returns resolved route-specific middleware.
+        Returns the route's resolved, priority-sorted middleware chain.
 
-        Sort order is left to ``MiddlewareCapsule.sort_by_priority`` so
-        global / route conflict resolution stays in the capsule's
-        contract, not duplicated here.
+        Resolution and ordering happen once per route in its
+        ``DispatchPlan`` (``MiddlewareCapsule.resolve_route_middleware``);
+        this only reads the plan, rebuilding it if the capsule's
+        registrations changed since.
         """
         capsule = self.application.make("middleware_http")
-        route_middleware = []
-
-        for mw in route.get_middleware():
-            resolved = capsule.resolve_middleware(mw)
-            if resolved is None:
-                raise MiddlewareNotFoundException(
-                    f"Middleware alias or group '{mw}' could not be resolved."
-                )
-            if isinstance(resolved, list):
-                route_middleware.extend(resolved)
-            else:
-                route_middleware.append(resolved)
-        return capsule.sort_by_priority(route_middleware)
+        return route.dispatch_plan(capsule).middleware
 
     async def _run_terminable_middleware(
         self,
@@ -212,14 +269,10 @@ class HttpConductor:
 
         Pipelines are passed as arguments (not read from self) to maintain
         per-request isolation.
-        """
-        # CRITICAL: Always run auth cache cleanup first
-        reset_auth_middleware = ResetHttpAuth(self.application)
-        try:
-            await reset_auth_middleware.terminate(request, response)
-        except Exception as e:
-            Log.error("Critical error in auth cache cleanup: %s", e, exc_info=True)
 
+        Auth identity no longer needs a sweep here: the guards keep it in
+        scoped vars that ``handle``'s container scope resets on exit.
+        """
         # Collect instances that actually executed during this request.
         executed: list = []
         if global_pipeline:
@@ -234,10 +287,6 @@ class HttpConductor:
                 continue
             seen_ids.add(id(instance))
 
-            # Skip ResetHttpAuth — already handled above.
-            if isinstance(instance, ResetHttpAuth):
-                continue
-
             terminate_fn = getattr(instance, "terminate", None)
             if terminate_fn is None or not callable(terminate_fn):
                 continue
@@ -12,13 +12,11 @@ import inspect
 from typing import Any
 
 from cara.exceptions import (
-    MiddlewareNotFoundException,
     RouteNotFoundException,
     WebSocketException,
 )
 from cara.facades import Log
 from cara.middleware import Middleware
-from cara.middleware.ws import ResetWebSocketAuth
 from cara.support import Pipeline
 from cara.websocket import Socket
 
@@ -47,10 +45,15 @@ class WebsocketConductor:
         Follows HttpConductor pattern:
         1. Initialize socket and router
         2. Let application-level exception handling work
+
+        The connection runs in its own container scope, so ``scoped``
+        bindings and the auth guards' identity vars live exactly as long as
+        the connection.
         """
-        self.router = self.application.router
-        self.socket = Socket(self.application, scope, receive, send)
-        await self.handle_request(scope, receive, send)
+        with self.application.scope():
+            self.router = self.application.router
+            self.socket = Socket(self.application, scope, receive, send)
+            await self.handle_request(scope, receive, send)
 
     async def handle_request(
         self, scope: dict[str, Any], receive: Any, send: Any
@@ -191,27 +194,15 @@ class WebsocketConductor:
 
     def get_route_middleware(self, route):
         """
-        Returns resolved route-specific middleware.
+        Returns the route's resolved, priority-sorted middleware chain.
 
-        If route middleware contains same class as global middleware,
-        the route middleware (with parameters) takes priority.
+        Resolution and ordering happen once per route in its
+        ``DispatchPlan`` (``MiddlewareCapsule.resolve_route_middleware``);
+        this only reads the plan, rebuilding it if the capsule's
+        registrations changed since.
         """
         capsule = self.application.make("middleware_ws")
-        route_middleware = []
-
-        for mw in route.get_middleware():
-            resolved = capsule.resolve_middleware(mw)
-            if resolved is None:
-                raise MiddlewareNotFoundException(
-                    f"Middleware alias or group '{mw}' could not be resolved."
-                )
-            if isinstance(resolved, list):
-                route_middleware.extend(resolved)
-            else:
-                route_middleware.append(resolved)
-
-        # Apply Laravel-style priority ordering
-        return capsule.sort_by_priority(route_middleware)
+        return route.dispatch_plan(capsule).middleware
 
     async def _run_terminable_middleware(
         self,
@@ -227,21 +218,9 @@ class WebsocketConductor:
         fresh middleware per terminate call, which (a) silently terminated
         middleware bound to other routes and (b) lost state any middleware
         accumulated during ``handle()``. Tracking the executed instances
-        on each Pipeline is the same fix we did on HTTP.
+        on each Pipeline is the same fix we did on HTTP. Auth identity is
+        reset by the connection's container scope, not swept here.
         """
-        # Always run auth cleanup first — even on the failure path
-        # where the auth middleware may not have completed. Mirrors
-        # HttpConductor's ResetHttpAuth handling.
-        try:
-            await ResetWebSocketAuth(self.application).terminate(self.socket)
-        except Exception as e:
-            Log.error(
-                "Critical error in WebSocket auth cache cleanup: %s",
-                e,
-                category="cara.websocket",
-                exc_info=True,
-            )
-
         # Collect the middleware instances that actually ran. The
         # Pipeline records each instance it walks through into
         # ``executed_instances`` — see Pipeline.through(...).
@@ -253,16 +232,13 @@ class WebsocketConductor:
 
         # Deduplicate by identity — the same instance (e.g. one that
         # appears in both global and route lists) must not terminate
-        # twice. Skip ResetWebSocketAuth, already handled above.
+        # twice.
         seen: set = set()
         for instance in executed:
             if id(instance) in seen:
                 continue
             seen.add(id(instance))
 
-            if isinstance(instance, ResetWebSocketAuth):
-                continue
-
             terminate_fn = getattr(instance, "terminate", None)
             if not callable(terminate_fn):
                 continue
@@ -11,11 +11,12 @@ container functionality.
 
 from __future__ import annotations
 
+import contextlib
 import inspect
 import threading
 import types
 import typing as _typing
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from contextvars import ContextVar
 from typing import Any, Union
 
@@ -26,6 +27,17 @@ from . import _ContainerResolution
 
 _resolving_stack_var: ContextVar[list[Any]] = ContextVar("cara.container.resolving_stack")
 
+# Instances of ``scoped`` bindings for the active unit of work (HTTP request,
+# WebSocket connection, queue job). ``Container.scope`` installs a fresh dict
+# and resets the var on exit, dropping everything created inside it.
+_scope_var: ContextVar[dict[Any, Any] | None] = ContextVar(
+    "cara.container.scope", default=None
+)
+
+# Per-request ContextVars (auth guard identity, ...) registered through
+# ``Container.scoped_var``: var → the value every scope starts with.
+_scoped_vars: dict[ContextVar[Any], Any] = {}
+
 
 class Container:
     """
@@ -81,6 +93,30 @@ class Container:
         # (9) List of instantiated provider objects (for optional tracking)
         self.providers: list[Any] = []
 
+        # (10) Resolution cache: requested key → (binding revision, dispatch
+        # kind, target, hooks to replay). ``make`` used to take
+        # ``_deferred_lock`` on every call and, on a direct-key miss, scan
+        # every binding with isinstance/issubclass — paid three times per
+        # ASGI call for the conductors and again per request for
+        # request/response/middleware. A hit now skips both the lock and the
+        # scan. Entries are stamped with ``_binding_revision``; every binding
+        # change bumps it, so an entry recorded against an older binding map
+        # is never served even if it lands after the bump.
+        self._resolutions: dict[Any, tuple[int, int, Any, tuple]] = {}
+        self._binding_revision: int = 0
+        self.resolution_hits: int = 0
+        self.resolution_misses: int = 0
+
+        # (11) Compiled constructor-injection plans per class, so
+        # ``resolve`` stops re-walking ``inspect.signature`` and re-deciding
+        # each parameter's source on every instantiation.
+        self._constructor_plans: dict[type, tuple] = {}
+
+        # (12) Instances of ``scoped`` bindings resolved outside any
+        # ``scope()`` (CLI commands, boot code): process-wide, like Laravel's
+        # scoped bindings outside a request.
+        self._root_scope: dict[Any, Any] = {}
+
     # -------------------------------------
     # Public Binding and Resolving Methods
     # -------------------------------------
@@ -113,6 +149,7 @@ class Container:
         if self.override or name not in self.objects:
             self.fire_hook("bind", name, class_obj)
             self.objects[name] = class_obj
+            self._invalidate_resolutions()
 
         return self
 
@@ -148,6 +185,71 @@ class Container:
             instance = self.resolve(class_obj)
             self.bind(name, instance)
 
+    def scoped(self, name: Any, class_obj: Any) -> None:
+        """
+        Register a scoped binding: one instance per unit of work.
+
+        The first make() inside a ``scope()`` builds the instance (resolving
+        a class with DI, or calling a factory); later make() calls in the
+        same scope return it, and it is dropped when the scope ends. HTTP
+        requests, WebSocket connections and queue jobs each run in their own
+        scope, so concurrent units of work on one worker never share it.
+        Outside any scope the instance is kept process-wide.
+        """
+        if not (inspect.isclass(class_obj) or callable(class_obj)):
+            (
+                GenericContainerException,
+                MissingContainerBindingException,
+                StrictContainerException,
+            ) = _ContainerResolution._get_container_exceptions()
+            raise StrictContainerException(
+                f"Scoped binding '{name}' needs a class or factory, not an instance."
+            )
+
+        def scoped_factory():
+            instances = _scope_var.get()
+            if instances is None:
+                instances = self._root_scope
+            instance = instances.get(scoped_factory)
+            if instance is None:
+                if inspect.isclass(class_obj):
+                    instance = self.resolve(class_obj)
+                else:
+                    instance = class_obj()
+                # Threads spawned with ``run_in_thread`` share the scope dict;
+                # the first writer wins so every caller sees one instance.
+                instance = instances.setdefault(scoped_factory, instance)
+            return instance
+
+        self.bind(name, scoped_factory)
+
+    @contextlib.contextmanager
+    def scope(self) -> Iterator[None]:
+        """
+        Run one unit of work in a fresh binding scope.
+
+        ``scoped`` bindings resolve to new instances inside the block, and
+        every ContextVar registered with ``scoped_var`` starts at its initial
+        value. On exit both are restored to what the enclosing context had,
+        which replaces the per-request reset sweeps singletons used to need.
+        Enter and exit must happen in the same task, as with any ContextVar.
+        """
+        token = _scope_var.set({})
+        var_tokens = [(var, var.set(initial)) for var, initial in _scoped_vars.items()]
+        try:
+            yield
+        finally:
+            for var, var_token in reversed(var_tokens):
+                var.reset(var_token)
+            _scope_var.reset(token)
+
+    @staticmethod
+    def scoped_var(var: ContextVar[Any], initial: Any = None) -> ContextVar[Any]:
+        """Register per-request ``var`` so every ``scope()`` starts it at
+        ``initial`` and restores it on exit. Returns ``var``."""
+        _scoped_vars[var] = initial
+        return var
+
     def unbind(self, name: Any) -> bool:
         """
         Unbind a previously bound name.
@@ -157,6 +259,7 @@ class Container:
         if name not in self.objects:
             return False
         del self.objects[name]
+        self._invalidate_resolutions()
         return True
 
     def simple(self, obj: Any) -> Container:
@@ -539,10 +642,34 @@ class Container:
     def swap(self, obj: Any, callback: Any) -> Container:
         """Temporarily override a binding for testing or mocking."""
         self.swaps[obj] = callback
+        self._invalidate_resolutions()
         return self
 
+    # ----------------------------
+    # Resolution Cache
+    # ----------------------------
+
+    def _invalidate_resolutions(self) -> None:
+        """Drop every cached resolution after a binding change.
+
+        The revision is bumped *after* the caller's write, so a concurrent
+        ``make`` that looked up the old map records its entry under the old
+        revision and that entry is rejected on its next read.
+        """
+        self._binding_revision += 1
+        self._resolutions.clear()
+
+    def resolution_stats(self) -> dict[str, int]:
+        """Hit/miss counters of the ``make`` resolution cache."""
+        return {
+            "hits": self.resolution_hits,
+            "misses": self.resolution_misses,
+            "entries": len(self._resolutions),
+        }
+
     def __contains__(self, obj: Any) -> bool:
         return self.has(obj)
 
     make = _ContainerResolution._container_make
+    _cached_make = _ContainerResolution._container_cached_make
     _do_resolve = _ContainerResolution._container_do_resolve
@@ -6,6 +6,22 @@ import inspect
 import types as _types
 from typing import Any, Union
 
+# Dispatch kinds recorded in the ``make`` resolution cache.
+_RESOLVE = 0  # construct ``target`` with DI
+_CALL = 1  # call the bound factory ``target()``
+_CALL_WITH_CONTAINER = 2  # call the bound factory ``target(container)``
+_VALUE = 3  # return ``target`` as-is (bound instance / swap)
+
+# Constructor-plan parameter sources, decided once per class.
+_OPTIONAL = 0  # ``X | None``: make(X), default on failure
+_ARGUMENT = 1  # primitive / ``Any``: passed argument or default
+_CLASS = 2  # make(X), passed argument on failure
+_SKIP = 3  # explicit ``self``
+_DEFAULT = 4  # signature default
+_POSITIONAL = 5  # passed argument or error
+
+_PRIMITIVES = (str, int, float, bool, dict, list, tuple)
+
 
 def _get_container_exceptions():
     """Lazy import container exceptions to avoid circular imports."""
@@ -59,6 +75,49 @@ def _extract_optional_class(ann: Any, module: Any) -> type | None:
     return None
 
 
+def _record_resolution(
+    self, name: Any, revision: int, kind: int, target: Any, hooks: tuple
+) -> None:
+    """Cache how ``name`` resolved against binding ``revision``."""
+    self._resolutions[name] = (revision, kind, target, hooks)
+
+
+def _container_cached_make(self, name: Any, arguments: tuple) -> tuple[bool, Any]:
+    """Serve ``make(name)`` from the resolution cache without any lock.
+
+    Returns ``(False, None)`` on a miss; the caller then takes the locked
+    slow path, which records the entry for next time. Hooks the slow path
+    would have fired are replayed in the same order.
+    """
+    entry = self._resolutions.get(name)
+    if entry is None or entry[0] != self._binding_revision:
+        return False, None
+    self.resolution_hits += 1
+    _, kind, target, hooks = entry
+    if hooks and (self._hooks["make"] or self._hooks["resolve"]):
+        for action, obj in hooks:
+            self.fire_hook(action, name, obj)
+    try:
+        if kind == _RESOLVE:
+            return True, self.resolve(target, *arguments)
+        if kind == _CALL:
+            return True, target()
+        if kind == _CALL_WITH_CONTAINER:
+            return True, target(self)
+        return True, target
+    except Exception as e:
+        # Same fallback as the locked class path: a binding that fails with
+        # a missing dependency gives way to constructing the class itself.
+        _, missing_container_binding_exception, _ = _get_container_exceptions()
+        if (
+            not isinstance(e, missing_container_binding_exception)
+            or not inspect.isclass(name)
+            or target is name
+        ):
+            raise
+        return True, self.resolve(name, *arguments)
+
+
 def _container_make(self, name: Any, *arguments: Any) -> Any:
     """
     Resolve an object from the container.
@@ -92,10 +151,17 @@ def _container_make(self, name: Any, *arguments: Any) -> Any:
     the same pattern — both must be under their respective locks
     for the serialization to hold end-to-end.
     """
+    is_class = inspect.isclass(name)
+    if is_class or isinstance(name, str):
+        hit, value = self._cached_make(name, arguments)
+        if hit:
+            return value
+        self.resolution_misses += 1
+
     # (1) If name is a class type — lock covers deferred fire-once
     # + object lookup + DI fallthrough so a racing make() can't see
     # the window between pop() and bind().
-    if inspect.isclass(name):
+    if is_class:
         with self._deferred_lock:
             (
                 generic_container_exception,
@@ -116,9 +182,13 @@ def _container_make(self, name: Any, *arguments: Any) -> Any:
                 if hasattr(provider, "boot"):
                     provider.boot()
 
+            # Registering a deferred provider above bound new keys; the
+            # entry recorded below must carry the post-registration revision.
+            revision = self._binding_revision
+
             # Try to find a previously bound value matching this class
             try:
-                found = self._find_obj(name)
+                bound = found = self._find_obj(name)
                 if inspect.isclass(found) and inspect.isabstract(found):
                     concrete = self._find_concrete_binding(name)
                     if concrete:
@@ -126,22 +196,30 @@ def _container_make(self, name: Any, *arguments: Any) -> Any:
                     else:
                         raise TypeError(f"No concrete implementation found for '{name}'")
                 self.fire_hook("make", name, found)
+                hooks = (("resolve", bound), ("make", found))
 
                 # If found is a class, resolve it (instantiate with DI)
                 if inspect.isclass(found):
+                    _record_resolution(self, name, revision, _RESOLVE, found, hooks)
                     instance = self.resolve(found, *arguments)
                     return instance
 
                 # If found is a callable factory, call it
                 if callable(found):
-                    result = found(self) if self._accepts_container(found) else found()
+                    kind = (
+                        _CALL_WITH_CONTAINER if self._accepts_container(found) else _CALL
+                    )
+                    _record_resolution(self, name, revision, kind, found, hooks)
+                    result = found(self) if kind == _CALL_WITH_CONTAINER else found()
                     return result
 
                 # Otherwise return the bound value (already an instance)
+                _record_resolution(self, name, revision, _VALUE, found, hooks)
                 return found
 
             except missing_container_binding_exception:
                 # If not found in bindings, try to instantiate directly
+                _record_resolution(self, name, revision, _RESOLVE, name, ())
                 return self.resolve(name, *arguments)
 
     # (2) String path — serialize deferred register + objects lookup.
@@ -158,9 +236,12 @@ def _container_make(self, name: Any, *arguments: Any) -> Any:
                 if hasattr(provider, "boot"):
                     provider.boot()
 
+            revision = self._binding_revision
+
             if name in self.objects:
                 bound = self.objects[name]
                 self.fire_hook("make", name, bound)
+                hooks = (("make", bound),)
 
                 # a) If the bound value is a class, resolve its constructor
                 if inspect.isclass(bound) and inspect.isabstract(bound):
@@ -170,17 +251,21 @@ def _container_make(self, name: Any, *arguments: Any) -> Any:
                     else:
                         raise TypeError(f"No concrete implementation found for '{name}'")
                 if inspect.isclass(bound):
+                    _record_resolution(self, name, revision, _RESOLVE, bound, hooks)
                     return self.resolve(bound, *arguments)
 
                 # b) If the bound value is a function or method (factory), call it
                 if inspect.isfunction(bound) or inspect.ismethod(bound):
+                    _record_resolution(self, name, revision, _CALL, bound, hooks)
                     return bound()
 
                 # c) Otherwise, assume it's already an instance
+                _record_resolution(self, name, revision, _VALUE, bound, hooks)
                 return bound
 
             # (3) If a swap (test/mock) exists, return that
             if name in self.swaps:
+                _record_resolution(self, name, revision, _VALUE, self.swaps[name], ())
                 return self.swaps[name]
 
             # (4) No binding found → raise an error
@@ -197,6 +282,70 @@ def _container_make(self, name: Any, *arguments: Any) -> Any:
     return self.resolve(name, *arguments)
 
 
+def _constructor_plan(self, obj: Any) -> tuple:
+    """Per-parameter injection sources for ``obj``, compiled once per class.
+
+    Each entry is ``(name, keyword_only, source, target, default)``; only
+    what can vary per call (passed arguments, container bindings) is left
+    for ``_container_do_resolve`` to decide.
+    """
+    cacheable = inspect.isclass(obj)
+    if cacheable:
+        plan = self._constructor_plans.get(obj)
+        if plan is not None:
+            return plan
+
+    module = inspect.getmodule(obj)
+    entries = []
+    for _, param in self.get_parameters(obj):
+        if param.kind in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        ):
+            continue
+        entries.append(
+            (
+                param.name,
+                param.kind == inspect.Parameter.KEYWORD_ONLY,
+                *_parameter_source(param, module),
+                param.default,
+            )
+        )
+    plan = tuple(entries)
+    if cacheable:
+        self._constructor_plans[obj] = plan
+    return plan
+
+
+def _parameter_source(param: inspect.Parameter, module: Any) -> tuple[int, Any]:
+    """Where one constructor parameter's value comes from: ``(source, target)``."""
+    ann = param.annotation
+
+    # Resolve postponed annotations (`from __future__ import annotations`)
+    # so contract strings become real classes for DI.
+    if isinstance(ann, str) and module is not None:
+        ann = module.__dict__.get(ann, ann)
+
+    optional_cls = _extract_optional_class(ann, module)
+    if optional_cls is not None:
+        return _OPTIONAL, optional_cls
+
+    # Treat typing.Any as an untyped slot, like primitives below.
+    if ann is Any:
+        return _ARGUMENT, None
+    if ann in _PRIMITIVES or (isinstance(ann, type) and ann.__module__ == "builtins"):
+        return _ARGUMENT, None
+    if ann is not inspect._empty and inspect.isclass(ann):
+        return _CLASS, ann
+
+    # Skip explicit "self" params when present in inspected signatures.
+    if param.name == "self":
+        return _SKIP, None
+    if param.default is not inspect._empty:
+        return _DEFAULT, None
+    return _POSITIONAL, None
+
+
 def _container_do_resolve(self, obj: Any, *resolving_arguments: Any) -> Any:
     """Internal resolve implementation."""
     objects: list[Any] = []
@@ -237,133 +386,56 @@ def _container_do_resolve(self, obj: Any, *resolving_arguments: Any) -> Any:
                     ) = _get_container_exceptions()
                     raise generic_container_exception(str(e)) from e
 
-    # Inspect constructor parameters
-    for _, param in self.get_parameters(obj):
-        if param.kind in (
-            inspect.Parameter.VAR_POSITIONAL,
-            inspect.Parameter.VAR_KEYWORD,
-        ):
+    for name, is_keyword_only, source, target, default in _constructor_plan(self, obj):
+        if source == _SKIP:
             continue
-        ann = param.annotation
-        is_keyword_only = param.kind == inspect.Parameter.KEYWORD_ONLY
-
-        # Resolve postponed annotations (`from __future__ import annotations`)
-        # so contract strings become real classes for DI.
-        if isinstance(ann, str):
-            module = inspect.getmodule(obj)
-            if module is not None:
-                ann = module.__dict__.get(ann, ann)
 
         # Optional[class] / `class | None`: resolve the wrapped class like a
         # plain class, but fail soft — if it isn't bindable, fall back to the
         # signature default (usually None) instead of raising, preserving the
         # "inject in prod, default in tests" contract these params encode.
-        optional_cls = _extract_optional_class(ann, inspect.getmodule(obj))
-        if optional_cls is not None:
+        if source == _OPTIONAL:
             try:
-                dep = self.make(optional_cls)
+                value = self.make(target)
             except Exception:
-                dep = param.default if param.default is not inspect._empty else None
-            if is_keyword_only:
-                keyword_objects[param.name] = dep
-            else:
-                objects.append(dep)
-            continue
+                value = default if default is not inspect._empty else None
 
-        # Treat typing.Any as an untyped slot: pull from passed args
-        # or fall back to None/default handling below.
-        if ann is Any:
-            value = (
-                passing_args.pop(0)
-                if passing_args
-                else (param.default if param.default is not inspect._empty else None)
-            )
-            if is_keyword_only:
-                keyword_objects[param.name] = value
-            else:
-                objects.append(value)
-            continue
-
-        # (1) Primitive types: expect passed argument or default
-        if ann in (
-            str,
-            int,
-            float,
-            bool,
-            dict,
-            list,
-            tuple,
-        ) or (isinstance(ann, type) and ann.__module__ == "builtins"):
+        # ``typing.Any`` and primitive types: expect a passed argument or
+        # fall back to the default (None when there is none).
+        elif source == _ARGUMENT:
             if passing_args:
                 value = passing_args.pop(0)
             else:
-                value = param.default if param.default is not inspect._empty else None
-            if is_keyword_only:
-                keyword_objects[param.name] = value
-            else:
-                objects.append(value)
-            continue
+                value = default if default is not inspect._empty else None
 
-        # (2) If annotation is a class, resolve via make() which handles
-        # deferred providers, lock serialization, and the full lookup
-        # chain. Previous code used _find_obj() + manual deferred
-        # fallback — a weaker path that missed edge cases (e.g. nested
-        # deps whose providers hadn't fired yet).
-        if ann is not inspect._empty and inspect.isclass(ann):
+        # Class annotations resolve via make(), which handles deferred
+        # providers, lock serialization, and the full lookup chain.
+        elif source == _CLASS:
             try:
-                dep = self.make(ann)
-                if is_keyword_only:
-                    keyword_objects[param.name] = dep
-                else:
-                    objects.append(dep)
-                continue
+                value = self.make(target)
             except Exception:
                 # If make() fails, try caller-supplied positional args
-                if passing_args:
-                    value = passing_args.pop(0)
-                    if is_keyword_only:
-                        keyword_objects[param.name] = value
-                    else:
-                        objects.append(value)
-                    continue
-                (
-                    generic_container_exception,
-                    missing_container_binding_exception,
-                    strict_container_exception,
-                ) = _get_container_exceptions()
-                raise generic_container_exception(
-                    f"Cannot resolve dependency '{param.name}' of {obj}"
-                )
-
-        # (3) Skip explicit "self" params when present in inspected signatures.
-        if param.name == "self":
-            continue
+                if not passing_args:
+                    raise generic_container_exception(
+                        f"Cannot resolve dependency '{name}' of {obj}"
+                    )
+                value = passing_args.pop(0)
 
-        # (4) If a default value is specified in signature, use it
-        if param.default is not inspect._empty:
-            if is_keyword_only:
-                keyword_objects[param.name] = param.default
-            else:
-                objects.append(param.default)
-            continue
+        elif source == _DEFAULT:
+            value = default
 
-        # (5) Last resort: use a passed argument if available
-        if passing_args:
+        # Last resort: use a passed argument if available
+        elif passing_args:
             value = passing_args.pop(0)
-            if is_keyword_only:
-                keyword_objects[param.name] = value
-            else:
-                objects.append(value)
-            continue
+        else:
+            raise generic_container_exception(
+                f"Not enough dependencies passed. Resolving '{obj}' needs parameter '{name}'."
+            )
 
-        (
-            generic_container_exception,
-            missing_container_binding_exception,
-            strict_container_exception,
-        ) = _get_container_exceptions()
-        raise generic_container_exception(
-            f"Not enough dependencies passed. Resolving '{obj}' needs parameter '{param.name}'."
-        )
+        if is_keyword_only:
+            keyword_objects[name] = value
+        else:
+            objects.append(value)
 
     # Cache constructor arguments if remember=True
     if self.remember:
@@ -0,0 +1,33 @@
+"""Handler-declared validator for conditional GETs.
+
+    @conditional(lambda request: products_version.read())
+    async def index(self, request): ...
+
+    @conditional(lambda request: Product.query().max("updated_at"))
+    async def index(self, request): ...
+
+The validator is stored on the handler and picked up by ``ConditionalGet``
+(through ``Route.get_conditional``), which evaluates it before dispatch
+and answers a matching ``If-None-Match`` / ``If-Modified-Since`` with a
+304 — the handler, its queries and its serialization never run. Routes
+declared without a controller can use ``Route.conditional`` instead.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+
+def conditional(validator: Callable[[Any], Any]) -> Callable:
+    """Attach ``validator(request)`` to the decorated handler.
+
+    The handler itself is returned unchanged (no wrapper), so its
+    signature and sync/async nature are untouched for injection.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func.__conditional__ = validator
+        return func
+
+    return decorator
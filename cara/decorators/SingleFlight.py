@@ -0,0 +1,70 @@
+"""Collapse concurrent calls to a controller or service method.
+
+    @singleflight("category:{category_id}")
+    async def top_products(self, category_id: int) -> list[dict]: ...
+
+    @singleflight(lambda self, user: f"feed:{user.id}", distributed=True)
+    def build_feed(self, user) -> list[dict]: ...
+
+Concurrent calls resolving to the same key share one execution and its
+result — the first caller runs, the rest wait for it. A string key is a
+``str.format`` template over the call's bound arguments; a callable key
+receives the call's arguments. Keys are namespaced by the function's
+qualified name, so two methods never share a flight by accident.
+
+``distributed=True`` coordinates across workers through
+``DistributedSingleFlight`` (extra keyword arguments configure it);
+otherwise the collapse is per worker.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from cara.concurrency import DistributedSingleFlight, SingleFlight
+
+# Per-worker flight shared by every decorated function; keys are
+# namespaced per function.
+_local_flight = SingleFlight()
+
+
+def singleflight(
+    key: str | Callable[..., str],
+    *,
+    distributed: bool = False,
+    **options: Any,
+) -> Callable:
+    """Share one execution of the decorated function per concurrent key."""
+    if options and not distributed:
+        raise TypeError("singleflight options only apply with distributed=True")
+    flight = DistributedSingleFlight(**options) if distributed else _local_flight
+
+    def decorator(func: Callable) -> Callable:
+        namespace = f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func)
+
+        def flight_key(args: tuple, kwargs: dict) -> str:
+            if callable(key):
+                return f"{namespace}:{key(*args, **kwargs)}"
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return f"{namespace}:{key.format(**bound.arguments)}"
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await flight.run(flight_key(args, kwargs), func, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return flight.run_sync(flight_key(args, kwargs), func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -20,6 +20,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "can_any": (".Authorization", "can_any"),
     "clear": (".route", "clear"),
     "command": (".Command", "command"),
+    "conditional": (".Conditional", "conditional"),
     "created": (".Events", "created"),
     "creating": (".Events", "creating"),
     "deleted": (".Events", "deleted"),
@@ -31,6 +32,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "saved": (".Events", "saved"),
     "saving": (".Events", "saving"),
     "scheduled": (".Schedule", "scheduled"),
+    "singleflight": (".SingleFlight", "singleflight"),
     "updated": (".Events", "updated"),
     "updating": (".Events", "updating"),
 }
@@ -49,6 +51,7 @@ __all__ = [
     "can_any",
     "clear",
     "command",
+    "conditional",
     "created",
     "creating",
     "deleted",
@@ -60,6 +63,7 @@ __all__ = [
     "saved",
     "saving",
     "scheduled",
+    "singleflight",
     "updated",
     "updating",
 ]
@@ -17,12 +17,17 @@ class EncryptedCast(BaseCast):
     Uses the :class:`cara.facades.Crypt` facade, which is backed by the
     framework's versioned AES-256-GCM keyring.
     Values are encrypted on write and decrypted on read.
+
+    Models read through :meth:`get_memoized`, which decrypts a stored value
+    once per model instance; ``Model.forget_decrypted`` drops the plaintexts.
     """
 
     def __init__(self, key: str | None = None):
         # ``key`` is accepted for Laravel parity (``__casts__ = {"field": "encrypted:my_key"}``)
         # and, when provided, creates an ad-hoc Crypt instance instead of the
         # container-bound default. When None, the bound Crypt facade is used.
+        # The AES-GCM context behind an explicit key is shared through
+        # Crypt's bounded cache, so building the Crypt per use costs a hash.
         self._explicit_key = key
 
     def _cipher(self):
@@ -35,7 +40,31 @@ class EncryptedCast(BaseCast):
         """Decrypt the stored value."""
         if value is None:
             return None
-        return self._cipher().decrypt(value)
+        return self._decode(self._cipher().decrypt(self._token(value)))
+
+    def get_memoized(
+        self, value: Any, memo: dict[str, tuple[Any, str]], attribute: str
+    ) -> Any:
+        """:meth:`get`, decrypting at most once while ``value`` is unchanged.
+
+        ``memo`` belongs to one model instance and maps ``attribute`` to the
+        stored value it last decrypted and the plaintext. Each read decodes
+        the plaintext afresh, so callers never share a mutable result.
+        """
+        if value is None:
+            return None
+        entry = memo.get(attribute)
+        if entry is None or entry[0] != value:
+            entry = (value, self._cipher().decrypt(self._token(value)))
+            memo[attribute] = entry
+        return self._decode(entry[1])
+
+    def _token(self, value: Any) -> str:
+        """The ciphertext inside a stored value."""
+        return value
+
+    def _decode(self, plaintext: str) -> Any:
+        return plaintext
 
     def set(self, value: Any) -> str | None:
         """Encrypt the value before persisting."""
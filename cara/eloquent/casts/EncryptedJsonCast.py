@@ -21,9 +21,7 @@ class EncryptedJsonCast(EncryptedCast):
 
     ENVELOPE_KEY = "$enc"
 
-    def get(self, value: Any) -> Any:
-        if value is None:
-            return None
+    def _token(self, value: Any) -> str:
         if isinstance(value, str):
             try:
                 value = json.loads(value)
@@ -33,7 +31,10 @@ class EncryptedJsonCast(EncryptedCast):
                 ) from exc
         if not isinstance(value, dict) or set(value) != {self.ENVELOPE_KEY}:
             raise EncryptionException("Encrypted JSON envelope is missing")
-        return json.loads(self._cipher().decrypt(value[self.ENVELOPE_KEY]))
+        return value[self.ENVELOPE_KEY]
+
+    def _decode(self, plaintext: str) -> Any:
+        return json.loads(plaintext)
 
     def set(self, value: Any) -> str | None:
         if value is None:
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from cara.facades import Log
 
 try:
@@ -9,6 +13,12 @@ except ImportError:  # Python <3.11
 
 from timeit import default_timer as timer
 
+# Statements collected by ``BaseConnection.record_queries``; ``None`` (the
+# default) costs ``statement`` a single ContextVar read.
+_recorded_queries: ContextVar[list[tuple[str, float]] | None] = ContextVar(
+    "cara_recorded_queries", default=None
+)
+
 
 class BaseConnection:
     """
@@ -118,11 +128,30 @@ class BaseConnection:
                 category="slow_query",
             )
 
+        recorded = _recorded_queries.get()
+        if recorded is not None:
+            recorded.append((self._normalize_query_for_log(query), round(elapsed_ms, 3)))
+
         # Log query if either connection-specific log_queries is True
         # or if LOG_DB_QUERIES is enabled via logging config
         if self.full_details and self.full_details.get("log_queries", False):
             self.log(query, bindings, query_time=elapsed_formatted)
 
+    @staticmethod
+    @contextmanager
+    def record_queries() -> Iterator[list[tuple[str, float]]]:
+        """Collect ``(sql, milliseconds)`` for each statement run in this context.
+
+        Follows the context into tasks it starts and ``run_in_thread``
+        calls. Bindings are not recorded — they may carry PII.
+        """
+        queries: list[tuple[str, float]] = []
+        token = _recorded_queries.set(queries)
+        try:
+            yield queries
+        finally:
+            _recorded_queries.reset(token)
+
     def has_global_connection(self):
         """Check if there's a global connection - removed circular dependency"""
         # This method is now handled by ConnectionResolver externally
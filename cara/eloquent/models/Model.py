@@ -407,6 +407,7 @@ class Model(
     get_dirty_attributes = _ModelData._model_get_dirty_attributes
     get_value = _ModelData._model_get_value
     get_dirty_value = _ModelData._model_get_dirty_value
+    forget_decrypted = _ModelData._model_forget_decrypted
     all_attributes = _ModelData._model_all_attributes
     delete_attribute = _ModelData._model_delete_attribute
     get_cast_map = _ModelData._model_get_cast_map
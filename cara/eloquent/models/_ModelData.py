@@ -361,7 +361,7 @@ def _model_get_value(self, attribute):
         cast_instance = enhanced_registry.get_cast_instance(cast_definition)
 
         if cast_instance:
-            return cast_instance.get(value)
+            return _cast_get(self, attribute, cast_instance, value)
     return value
 
 
@@ -373,10 +373,29 @@ def _model_get_dirty_value(self, attribute):
 
         cast_instance = enhanced_registry.get_cast_instance(self.__casts__[attribute])
         if cast_instance:
-            return cast_instance.get(value)
+            return _cast_get(self, attribute, cast_instance, value)
     return value
 
 
+def _cast_get(self, attribute, cast_instance, value):
+    """Apply ``cast_instance.get``, through the model's plaintext memo when the
+    cast decrypts (see ``EncryptedCast.get_memoized``)."""
+    get_memoized = getattr(cast_instance, "get_memoized", None)
+    if get_memoized is None:
+        return cast_instance.get(value)
+    memo = self.__dict__.setdefault("__decrypted__", {})
+    return get_memoized(value, memo, attribute)
+
+
+def _model_forget_decrypted(self) -> None:
+    """Drop the plaintexts encrypted casts memoized on this instance.
+
+    Python cannot wipe strings in place; releasing the only references is
+    what lets sensitive values be collected once the caller is done.
+    """
+    self.__dict__.pop("__decrypted__", None)
+
+
 def _model_all_attributes(self):
     attributes = {**self.__attributes__, **self.get_dirty_attributes()}
     for key, value in list(attributes.items()):
@@ -428,10 +447,10 @@ def _model_cast_attribute(self, attribute, value):
                     precision = int(cast_params) if cast_params.isdigit() else 2
                     return cast_map[cast_type](precision).get(value)
                 # array / hash / other single-param casts share the same path
-                return cast_map[cast_type](cast_params).get(value)
+                return _cast_get(self, attribute, cast_map[cast_type](cast_params), value)
 
         elif cast_method in cast_map:
-            return cast_map[cast_method]().get(value)
+            return _cast_get(self, attribute, cast_map[cast_method](), value)
 
     return cast_method(value)
 
@@ -12,6 +12,14 @@ construction with a transport-safe alphabet — ``~`` separates because it is
 the one RFC 3986 unreserved character that appears in neither the key-id
 pattern nor the base64url alphabet, so no percent-encoding can ever mangle
 the envelope in a query string, a Location header, or an emailed link.
+
+AES-GCM contexts are built once per key and shared by every ``Crypt`` in the
+process, so a hot path (an export decrypting one column per row) pays only
+for the cipher itself; ``encrypt_many`` / ``decrypt_many`` also hoist the
+envelope work out of the loop. The cache is keyed by key id *and* derived
+key, so rotating the secret behind an id can never reuse the old context.
+Python cannot wipe immutable key bytes; ``forget_ciphers`` drops every cached
+reference (after retiring a key, or at shutdown) so they can be collected.
 """
 
 from __future__ import annotations
@@ -19,7 +27,9 @@ from __future__ import annotations
 import hashlib
 import os
 import re
+import threading
 from base64 import b64decode, b64encode, urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Iterable
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
@@ -32,6 +42,12 @@ _URLSAFE_VERSION = "u2"
 _URLSAFE_SEPARATOR = "~"
 _KEY_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
 
+# (key id, derived key) -> AES-GCM context. Bounded: a process cycling
+# through more keys than this starts over rather than growing.
+_CIPHERS: dict[tuple[str, bytes], AESGCM] = {}
+_CIPHERS_MAX = 64
+_ciphers_lock = threading.Lock()
+
 
 class Crypt:
     def __init__(
@@ -59,47 +75,55 @@ class Crypt:
         if current_key_id not in self.keys:
             raise EncryptionException("Current encryption key is empty or invalid")
 
+    @staticmethod
+    def forget_ciphers() -> None:
+        """Drop every cached AES-GCM context in the process."""
+        with _ciphers_lock:
+            _CIPHERS.clear()
+
     def encrypt(self, value: str) -> str:
+        return self.encrypt_many([value])[0]
+
+    def encrypt_many(self, values: Iterable[str]) -> list[str]:
+        """Encrypt each of ``values`` under the current key, in order."""
         try:
-            nonce = os.urandom(_NONCE_LEN)
             header = f"{_VERSION}:{self.current_key_id}"
-            sealed = AESGCM(self.keys[self.current_key_id]).encrypt(
-                nonce,
-                value.encode(),
-                header.encode(),
-            )
-            ciphertext = sealed[:-_TAG_LEN]
-            tag = sealed[-_TAG_LEN:]
-            payload = b64encode(nonce + tag + ciphertext).decode()
-            return f"{header}:{payload}"
+            cipher = self._cipher(self.current_key_id)
+            return [
+                f"{header}:{b64encode(self._seal(cipher, header, value)).decode()}"
+                for value in values
+            ]
         except EncryptionException:
             raise
         except Exception as e:
             raise EncryptionException(f"Encryption failed: {e}") from e
 
     def decrypt(self, token: str) -> str:
+        return self.decrypt_many([token])[0]
+
+    def decrypt_many(self, tokens: Iterable[str]) -> list[str]:
+        """Decrypt each of ``tokens``, in order.
+
+        Tokens may carry different key ids. One unreadable token fails the
+        whole batch.
+        """
         try:
-            parts = token.split(":", 2)
-            if len(parts) != 3:
-                raise EncryptionException("Unsupported ciphertext envelope")
-            version, key_id, payload = parts
-            if version != _VERSION or not _KEY_ID_PATTERN.fullmatch(key_id):
-                raise EncryptionException("Unsupported ciphertext envelope")
-            key = self.keys.get(key_id)
-            if key is None:
-                raise EncryptionException(f"Encryption key is unavailable: {key_id}")
-            raw = b64decode(payload, validate=True)
-            if len(raw) < _NONCE_LEN + _TAG_LEN:
-                raise EncryptionException("Ciphertext too short")
-            nonce = raw[:_NONCE_LEN]
-            tag = raw[_NONCE_LEN : _NONCE_LEN + _TAG_LEN]
-            ciphertext = raw[_NONCE_LEN + _TAG_LEN :]
-            plaintext = AESGCM(key).decrypt(
-                nonce,
-                ciphertext + tag,
-                f"{version}:{key_id}".encode(),
-            )
-            return plaintext.decode()
+            plaintexts = []
+            for token in tokens:
+                parts = token.split(":", 2)
+                if len(parts) != 3:
+                    raise EncryptionException("Unsupported ciphertext envelope")
+                version, key_id, payload = parts
+                if version != _VERSION or not _KEY_ID_PATTERN.fullmatch(key_id):
+                    raise EncryptionException("Unsupported ciphertext envelope")
+                plaintexts.append(
+                    self._open(
+                        key_id,
+                        f"{version}:{key_id}",
+                        b64decode(payload, validate=True),
+                    )
+                )
+            return plaintexts
         except EncryptionException:
             raise
         except Exception as e:
@@ -113,16 +137,9 @@ class Crypt:
         reserved in a query string; ``decrypt_urlsafe`` restores it.
         """
         try:
-            nonce = os.urandom(_NONCE_LEN)
             header = f"{_URLSAFE_VERSION}{_URLSAFE_SEPARATOR}{self.current_key_id}"
-            sealed = AESGCM(self.keys[self.current_key_id]).encrypt(
-                nonce,
-                value.encode(),
-                header.encode(),
-            )
-            ciphertext = sealed[:-_TAG_LEN]
-            tag = sealed[-_TAG_LEN:]
-            payload = urlsafe_b64encode(nonce + tag + ciphertext).decode().rstrip("=")
+            raw = self._seal(self._cipher(self.current_key_id), header, value)
+            payload = urlsafe_b64encode(raw).decode().rstrip("=")
             return f"{header}{_URLSAFE_SEPARATOR}{payload}"
         except EncryptionException:
             raise
@@ -144,22 +161,40 @@ class Crypt:
             version, key_id, payload = parts
             if version != _URLSAFE_VERSION or not _KEY_ID_PATTERN.fullmatch(key_id):
                 raise EncryptionException("Unsupported ciphertext envelope")
-            key = self.keys.get(key_id)
-            if key is None:
-                raise EncryptionException(f"Encryption key is unavailable: {key_id}")
-            raw = urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
-            if len(raw) < _NONCE_LEN + _TAG_LEN:
-                raise EncryptionException("Ciphertext too short")
-            nonce = raw[:_NONCE_LEN]
-            tag = raw[_NONCE_LEN : _NONCE_LEN + _TAG_LEN]
-            ciphertext = raw[_NONCE_LEN + _TAG_LEN :]
-            plaintext = AESGCM(key).decrypt(
-                nonce,
-                ciphertext + tag,
-                f"{version}{_URLSAFE_SEPARATOR}{key_id}".encode(),
+            return self._open(
+                key_id,
+                f"{version}{_URLSAFE_SEPARATOR}{key_id}",
+                urlsafe_b64decode(payload + "=" * (-len(payload) % 4)),
             )
-            return plaintext.decode()
         except EncryptionException:
             raise
         except Exception as e:
             raise EncryptionException(f"Decryption failed: {e}") from e
+
+    def _cipher(self, key_id: str) -> AESGCM:
+        key = self.keys.get(key_id)
+        if key is None:
+            raise EncryptionException(f"Encryption key is unavailable: {key_id}")
+        cipher = _CIPHERS.get((key_id, key))
+        if cipher is None:
+            with _ciphers_lock:
+                if len(_CIPHERS) >= _CIPHERS_MAX:
+                    _CIPHERS.clear()
+                cipher = _CIPHERS.setdefault((key_id, key), AESGCM(key))
+        return cipher
+
+    @staticmethod
+    def _seal(cipher: AESGCM, header: str, value: str) -> bytes:
+        """``nonce || tag || ciphertext`` for ``value``, bound to ``header``."""
+        nonce = os.urandom(_NONCE_LEN)
+        sealed = cipher.encrypt(nonce, value.encode(), header.encode())
+        return nonce + sealed[-_TAG_LEN:] + sealed[:-_TAG_LEN]
+
+    def _open(self, key_id: str, header: str, raw: bytes) -> str:
+        cipher = self._cipher(key_id)
+        if len(raw) < _NONCE_LEN + _TAG_LEN:
+            raise EncryptionException("Ciphertext too short")
+        nonce = raw[:_NONCE_LEN]
+        tag = raw[_NONCE_LEN : _NONCE_LEN + _TAG_LEN]
+        ciphertext = raw[_NONCE_LEN + _TAG_LEN :]
+        return cipher.decrypt(nonce, ciphertext + tag, header.encode()).decode()
@@ -41,7 +41,18 @@ class EncryptionProvider(DeferredProvider):
         # pinned a single algorithm (sha256), which would have silently weakened
         # any password hashed through the binding.
         self.application.bind("hash", lambda: Hash)
-        self.application.bind(
-            "crypt",
-            lambda: Crypt(keys=keys, current_key_id=current_key_id),
-        )
+
+        # One keyring per process: building a ``Crypt`` re-derives every key,
+        # which is wasted work on each facade call. Built on first use so a
+        # bad key still surfaces where ``crypt`` is resolved.
+        def make_crypt() -> Crypt:
+            return Crypt(keys=keys, current_key_id=current_key_id)
+
+        self.application.singleton("crypt", make_crypt)
+
+        # The hashing pool is built lazily by ``Hash.amake`` / ``acheck``;
+        # stop its workers (child processes in ``process`` mode) with the app,
+        # and drop the cached AES-GCM contexts.
+        if not hasattr(self.application, "_shutdown_callbacks"):
+            self.application._shutdown_callbacks = []
+        self.application._shutdown_callbacks += [Hash.shutdown_pool, Crypt.forget_ciphers]
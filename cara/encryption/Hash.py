@@ -2,11 +2,17 @@
 Hash Utility for the Cara framework.
 
 This module provides the Hash class, which offers a unified interface for password hashing and
-verification using multiple algorithms (Argon2id, bcrypt, sha256).
+verification using multiple algorithms (Argon2id, bcrypt, sha256). Async callers use
+``amake`` / ``acheck``, which run the same work on a bounded hashing pool so it never
+blocks the event loop.
 """
 
 from __future__ import annotations
 
+import os
+import threading
+
+from cara.configuration import config
 from cara.encryption.drivers import Argon2idHasher, BcryptHasher, Sha256Hasher
 
 # An unsupported ``algorithm`` is a bad ARGUMENT, not an encryption-operation
@@ -15,6 +21,8 @@ from cara.encryption.drivers import Argon2idHasher, BcryptHasher, Sha256Hasher
 # cipher/key failures). Callers that validate inputs catch it as ``ValueError``.
 from cara.exceptions import InvalidArgumentException
 
+from ._HashPool import _HashPool
+
 
 class Hash:
     # The algorithm every caller gets unless it names another one. Policy
@@ -39,6 +47,10 @@ class Hash:
         ("$2y$", "bcrypt"),
     )
 
+    # Built from ``encryption.hash_*`` on the first async call.
+    _hash_pool: _HashPool | None = None
+    _hash_pool_lock = threading.Lock()
+
     @classmethod
     def detect_algorithm(cls, hashed: str) -> str | None:
         """Name the algorithm a stored hash was made with, if recognizable."""
@@ -97,6 +109,60 @@ class Hash:
             raise InvalidArgumentException(f"Unsupported algorithm: {resolved}")
         return driver.check(value, hashed)
 
+    @classmethod
+    async def amake(
+        cls,
+        value: str,
+        algorithm: str = DEFAULT_ALGORITHM,
+        rounds: int = 12,
+    ) -> str:
+        """:meth:`make` on the hashing pool, off the event loop.
+
+        Raises ``ServiceUnavailableException`` when the pool's wait queue is
+        full.
+        """
+        return await cls._pool().run("make", cls.make, value, algorithm, rounds)
+
+    @classmethod
+    async def acheck(
+        cls,
+        value: str,
+        hashed: str,
+        algorithm: str | None = None,
+    ) -> bool:
+        """:meth:`check` on the hashing pool, off the event loop.
+
+        Raises ``ServiceUnavailableException`` when the pool's wait queue is
+        full.
+        """
+        return await cls._pool().run("check", cls.check, value, hashed, algorithm)
+
+    @classmethod
+    def _pool(cls) -> _HashPool:
+        if cls._hash_pool is None:
+            with cls._hash_pool_lock:
+                if cls._hash_pool is None:
+                    cls._hash_pool = _HashPool(
+                        workers=config(
+                            "encryption.hash_workers", min(4, os.cpu_count() or 1)
+                        ),
+                        max_pending=config("encryption.hash_max_pending", 64),
+                        mode=config("encryption.hash_executor", "thread"),
+                    )
+        return cls._hash_pool
+
+    @classmethod
+    def shutdown_pool(cls) -> None:
+        """Stop the hashing pool's workers; the next async call builds anew.
+
+        ``EncryptionProvider`` runs this on application shutdown, so a
+        ``process`` pool's children do not outlive the app.
+        """
+        with cls._hash_pool_lock:
+            pool, cls._hash_pool = cls._hash_pool, None
+        if pool is not None:
+            pool.shutdown()
+
     @classmethod
     def needs_rehash(
         cls,
@@ -0,0 +1,125 @@
+"""Bounded executor that keeps password hashing off the event loop.
+
+Argon2id and bcrypt spend tens of milliseconds of CPU per call; run inline
+from an async controller, one login stalls every request on the worker.
+``Hash.amake`` / ``Hash.acheck`` hand the work to this pool instead.
+
+The pool is its own executor, never the loop's default one, so a login
+spike cannot starve ``ExecutionContext.run_in_thread`` work (or the other
+way round). ``workers`` caps how many hashes run at once — the CPU budget
+hashing may take — and ``max_pending`` caps how many more may wait; past
+that a call is shed with a retryable 503 rather than queueing without
+bound. Both hashing libraries release the GIL, so the default thread mode
+hashes in parallel; ``process`` mode isolates the work in child processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from cara.exceptions import EncryptionException, ServiceUnavailableException
+from cara.observability import CapacityMetrics, MetricsBase
+
+_MODES = ("thread", "process")
+
+
+class _HashPool:
+    """Concurrency-capped hashing executor with a bounded wait queue."""
+
+    def __init__(self, workers: int, max_pending: int, mode: str = "thread"):
+        """
+        Args:
+            workers: hashes that may run at once
+            max_pending: further hashes that may wait for a worker
+            mode: ``thread`` or ``process``
+        """
+        if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+            raise EncryptionException(
+                "encryption.hash_workers must be a positive integer"
+            )
+        if (
+            isinstance(max_pending, bool)
+            or not isinstance(max_pending, int)
+            or max_pending < 0
+        ):
+            raise EncryptionException(
+                "encryption.hash_max_pending must be a non-negative integer"
+            )
+        if mode not in _MODES:
+            raise EncryptionException(
+                f"encryption.hash_executor must be one of {', '.join(_MODES)}; "
+                f"got {mode!r}"
+            )
+        self.workers = workers
+        self.max_pending = max_pending
+        self.mode = mode
+        self._executor: concurrent.futures.Executor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def queued(self) -> int:
+        """Hashes waiting for a worker."""
+        return max(self._in_flight - self.workers, 0)
+
+    async def run[T](self, operation: str, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` on the pool; ``operation`` labels the metrics."""
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_pending:
+                MetricsBase.safe_inc(
+                    CapacityMetrics.password_hash_total,
+                    {"operation": operation, "outcome": "shed"},
+                )
+                raise ServiceUnavailableException(
+                    "Password hashing is at capacity", retry_after=1
+                )
+            self._in_flight += 1
+            self._publish_depth()
+            executor = self._ensure_executor()
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            self._finished(operation, "failed")
+            raise
+        future.add_done_callback(
+            lambda done: self._finished(
+                operation,
+                "failed" if done.cancelled() or done.exception() else "done",
+            )
+        )
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            # Reap child processes; a thread pool's workers are daemons.
+            executor.shutdown(wait=self.mode == "process", cancel_futures=True)
+
+    def _ensure_executor(self) -> concurrent.futures.Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.workers
+                )
+            else:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="cara-hash"
+                )
+        return self._executor
+
+    def _finished(self, operation: str, outcome: str) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._publish_depth()
+        MetricsBase.safe_inc(
+            CapacityMetrics.password_hash_total,
+            {"operation": operation, "outcome": outcome},
+        )
+
+    def _publish_depth(self) -> None:
+        MetricsBase.safe_set(CapacityMetrics.password_hash_queue_depth, {}, self.queued)
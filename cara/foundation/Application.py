@@ -96,6 +96,7 @@ class Application(Container):
                 # For each key this provider "provides", defer registration
                 for binding_key in provider_class.provides():
                     self.deferred_providers[binding_key] = provider_class
+                self._invalidate_resolutions()
             else:
                 provider = provider_class(self)
                 provider.register()
@@ -114,6 +115,7 @@ class Application(Container):
             if issubclass(provider_class, DeferredProvider):
                 for binding_key in provider_class.provides():
                     self.deferred_providers[binding_key] = provider_class
+                self._invalidate_resolutions()
             else:
                 provider = provider_class(self)
                 provider.register()
@@ -151,7 +153,16 @@ class Application(Container):
         inside a single critical section. Now B is forced to wait
         behind A's lock, and by the time B gets to ``super().make()``
         the binding is live.
+
+        A resolution-cache hit returns before the lock: an entry only exists
+        for a key whose deferred provider (if any) already fired, and adding
+        a deferred provider invalidates the cache.
         """
+        if isinstance(name, str) or inspect.isclass(name):
+            hit, value = self._cached_make(name, arguments)
+            if hit:
+                return value
+
         with self._deferred_providers_lock:
             # 1) If caller is requesting by class
             if inspect.isclass(name):
@@ -15,10 +15,14 @@ class BodyLimits:
     DEFAULT_BODY_BYTES: ClassVar[int] = 10 * 1024 * 1024
     DEFAULT_FILE_BYTES: ClassVar[int] = 10 * 1024 * 1024
     DEFAULT_FILES: ClassVar[int] = 20
+    DEFAULT_SPOOL_BYTES: ClassVar[int] = 1024 * 1024
 
     body_bytes: int
     file_bytes: int
     files: int
+    # Uploaded file parts stay in memory up to this size, then roll over to
+    # a temporary file on disk.
+    spool_bytes: int = 1024 * 1024
 
     @classmethod
     def configured(cls) -> BodyLimits:
@@ -35,6 +39,10 @@ class BodyLimits:
                 "server.max_files",
                 config("server.max_files", cls.DEFAULT_FILES),
             ),
+            spool_bytes=cls._positive(
+                "server.upload_spool_size",
+                config("server.upload_spool_size", cls.DEFAULT_SPOOL_BYTES),
+            ),
         )
 
     @staticmethod
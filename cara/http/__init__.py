@@ -26,15 +26,19 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "MakesRequestHelpers": (".request", "MakesRequestHelpers"),
     "MakesValidationHelpers": (".request", "MakesValidationHelpers"),
     "MissingValue": (".resources", "MissingValue"),
+    "MultipartStream": (".request", "MultipartStream"),
     "Pagination": (".Pagination", "Pagination"),
     "PendingRequest": (".client", "PendingRequest"),
     "QueryStringParser": (".request", "QueryStringParser"),
     "Request": (".request", "Request"),
     "RequestProvider": (".request", "RequestProvider"),
     "ResourceCollection": (".resources", "ResourceCollection"),
+    "ResourceField": (".resources", "ResourceField"),
+    "ResourcePlan": (".resources", "ResourcePlan"),
     "Response": (".response", "Response"),
     "ResponseFactory": (".response", "ResponseFactory"),
     "ResponseProvider": (".response", "ResponseProvider"),
+    "StaticFile": (".response", "StaticFile"),
     "StrayHttpRequestError": (".client", "StrayHttpRequestError"),
     "StreamingResponse": (".response", "StreamingResponse"),
     "T": (".request", "T"),
@@ -87,15 +91,19 @@ __all__ = [
     "MakesRequestHelpers",
     "MakesValidationHelpers",
     "MissingValue",
+    "MultipartStream",
     "Pagination",
     "PendingRequest",
     "QueryStringParser",
     "Request",
     "RequestProvider",
     "ResourceCollection",
+    "ResourceField",
+    "ResourcePlan",
     "Response",
     "ResponseFactory",
     "ResponseProvider",
+    "StaticFile",
     "StrayHttpRequestError",
     "StreamingResponse",
     "T",
@@ -6,15 +6,18 @@ Laravel-style file upload handling with clean, minimal API.
 
 from __future__ import annotations
 
+import shutil
 import uuid
-from dataclasses import dataclass
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any, BinaryIO
 
 from cara.exceptions import BadRequestException
 from cara.support import Paths
 
+_CHUNK_SIZE = 64 * 1024
+
 
-@dataclass
 class UploadedFile:
     """
     Laravel-style uploaded file handler.
@@ -22,12 +25,64 @@ class UploadedFile:
     Provides clean API for file uploads:
     - store('directory') - Auto filename
     - store_as('directory', 'filename') - Custom filename
+
+    The bytes live in one of three places. Small programmatic uploads keep
+    them in ``content``. Parts parsed off the wire keep them in ``file``, a
+    ``SpooledTemporaryFile`` that stays in memory up to
+    ``server.upload_spool_size`` and rolls over to disk beyond it, so a
+    100 MB upload no longer costs 100 MB of worker RAM. Parts piped by
+    ``Request.store_files`` were never buffered at all; ``storage_key``
+    names the object the driver ``storage`` already holds.
+
+    ``content`` still returns the full bytes in every case for callers that
+    need them, but reading it materialises the file; ``chunks()`` and
+    ``store()`` stream instead.
     """
 
-    name: str
-    filename: str
-    content_type: str
-    content: bytes
+    # Class-level defaults keep instances built via ``__new__`` usable.
+    _content: bytes = b""
+    file: BinaryIO | None = None
+    storage_key: str | None = None
+    storage: Any = None
+    _size: int | None = None
+
+    def __init__(
+        self,
+        name: str,
+        filename: str,
+        content_type: str,
+        content: bytes = b"",
+        *,
+        file: BinaryIO | None = None,
+        size: int | None = None,
+        storage_key: str | None = None,
+        storage: Any = None,
+    ) -> None:
+        self.name = name
+        self.filename = filename
+        self.content_type = content_type
+        self._content = content
+        self.file = file
+        self._size = size
+        self.storage_key = storage_key
+        self.storage = storage
+
+    @property
+    def content(self) -> bytes:
+        """The full file bytes, read from the spool or storage when needed."""
+        if self.file is not None:
+            self.file.seek(0)
+            return self.file.read()
+        if self.storage_key is not None and self.storage is not None:
+            return self.storage.get(self.storage_key)
+        return self._content
+
+    @content.setter
+    def content(self, value: bytes) -> None:
+        self._content = value
+        self.file = None
+        self.storage_key = None
+        self._size = None
 
     def __str__(self) -> str:
         return f"UploadedFile({self.filename}, {self.size} bytes)"
@@ -35,7 +90,14 @@ class UploadedFile:
     @property
     def size(self) -> int:
         """File size in bytes."""
-        return len(self.content)
+        if self._size is not None:
+            return self._size
+        return len(self._content)
+
+    @property
+    def is_stored(self) -> bool:
+        """True when the bytes were piped straight into a storage driver."""
+        return self.storage_key is not None
 
     @property
     def extension(self) -> str:
@@ -51,12 +113,28 @@ class UploadedFile:
 
     def is_valid(self) -> bool:
         """Check if file is valid."""
-        return bool(self.filename and self.content and len(self.content) > 0)
+        return bool(self.filename) and self.size > 0
 
     def is_image(self) -> bool:
         """Check if file is image."""
         return self.mime_type.startswith("image/")
 
+    def chunks(self, chunk_size: int = _CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the file bytes in chunks without loading a spooled file whole."""
+        if self.file is None:
+            content = self.content
+            for start in range(0, len(content), chunk_size):
+                yield content[start : start + chunk_size]
+            return
+        self.file.seek(0)
+        while chunk := self.file.read(chunk_size):
+            yield chunk
+
+    def close(self) -> None:
+        """Release the spool file (and its disk space) early."""
+        if self.file is not None:
+            self.file.close()
+
     def store(self, directory: str) -> str:
         """
         Store file with auto-generated filename.
@@ -118,7 +196,11 @@ class UploadedFile:
         # Write file
         full_path = full_directory / filename
         with open(full_path, "wb") as f:
-            f.write(self.content)
+            if self.file is not None:
+                self.file.seek(0)
+                shutil.copyfileobj(self.file, f, _CHUNK_SIZE)
+            else:
+                f.write(self.content)
 
         # Return Laravel-style relative path
         return f"{directory}/{filename}"
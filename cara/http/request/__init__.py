@@ -11,6 +11,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "MakesBodyParsing": (".mixins", "MakesBodyParsing"),
     "MakesRequestHelpers": (".mixins", "MakesRequestHelpers"),
     "MakesValidationHelpers": (".mixins", "MakesValidationHelpers"),
+    "MultipartStream": (".utils", "MultipartStream"),
     "QueryStringParser": (".utils", "QueryStringParser"),
     "Request": (".Request", "Request"),
     "RequestProvider": (".RequestProvider", "RequestProvider"),
@@ -28,6 +29,7 @@ __all__ = [
     "MakesBodyParsing",
     "MakesRequestHelpers",
     "MakesValidationHelpers",
+    "MultipartStream",
     "QueryStringParser",
     "Request",
     "RequestProvider",
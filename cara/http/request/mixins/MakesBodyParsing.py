@@ -7,13 +7,14 @@ and multipart file uploads with Laravel-like validation and error handling.
 
 from __future__ import annotations
 
-import base64
 import json
 import logging
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from functools import lru_cache
 from typing import Any
 
-from python_multipart import MultipartParser
 from python_multipart.multipart import parse_options_header
 
 from cara.exceptions import (
@@ -33,6 +34,7 @@ from cara.http.BodyLimits import BodyLimits
 # not callable" — aborting every multipart parse. The direct submodule import is
 # immune to that load order.
 from cara.http.request.UploadedFile import UploadedFile
+from cara.http.request.utils.MultipartStream import MultipartStream
 from cara.http.request.utils.QueryStringParser import QueryStringParser
 
 
@@ -53,6 +55,7 @@ def _body_limits() -> dict[str, int]:
         "MAX_BODY_SIZE": limits.body_bytes,
         "MAX_FILE_SIZE": limits.file_bytes,
         "MAX_FILES": limits.files,
+        "SPOOL_SIZE": limits.spool_bytes,
     }
 
 
@@ -77,6 +80,11 @@ class MakesBodyParsing:
     def _max_files(cls) -> int:
         return _body_limits()["MAX_FILES"]
 
+    @classmethod
+    def _spool_size(cls) -> int:
+        """In-memory size of an uploaded file before it rolls over to disk."""
+        return _body_limits().get("SPOOL_SIZE", BodyLimits.DEFAULT_SPOOL_BYTES)
+
     @classmethod
     def _body_size_limit(cls, max_bytes: int | None) -> int:
         configured = cls._max_body_size()
@@ -131,17 +139,34 @@ class MakesBodyParsing:
         # 4 KB chunks did ~31 GB of memcpy. With the list+join approach,
         # total work is O(n).
         chunks: list[bytes] = []
-        total_size = 0
+        async with aclosing(self._receive_chunks(max_body)) as stream:
+            async for chunk in stream:
+                chunks.append(chunk)
 
+        body = b"".join(chunks)
+        self._body = body
+        self._body_consumed = True
+        return body
+
+    async def _receive_chunks(self, max_body: int) -> AsyncIterator[bytes]:
+        """
+        Yield raw body chunks from ASGI receive as they arrive.
+
+        The size cap is enforced incrementally: the chunk that would tip the
+        total past ``max_body`` is never yielded, the rest of the stream is
+        drained, and PayloadTooLargeException is raised. Consumers that keep
+        the chunks (``_read_body``) or feed them to a parser (streaming
+        multipart) therefore never hold more than the cap.
+        """
+        total_size = 0
         try:
             more = True
             while more:
                 message = await self.receive()
                 chunk = message.get("body", b"")
 
-                # Size check fires BEFORE the chunk is added to the
-                # accumulator so we don't allocate the chunk if it
-                # would tip us past the cap.
+                # Size check fires BEFORE the chunk is handed on so we
+                # don't retain the chunk if it would tip us past the cap.
                 if chunk:
                     total_size += len(chunk)
                     if total_size > max_body:
@@ -159,7 +184,7 @@ class MakesBodyParsing:
                                 break
                             total_size += len(message.get("body", b""))
                         raise self._payload_too_large(max_body, total_size)
-                    chunks.append(chunk)
+                    yield chunk
 
                 more = message.get("more_body", False)
         except BadRequestException, PayloadTooLargeException:
@@ -176,11 +201,6 @@ class MakesBodyParsing:
             self._body_consumed = True
             raise BadRequestException(f"Failed to read request body: {exc}") from exc
 
-        body = b"".join(chunks)
-        self._body = body
-        self._body_consumed = True
-        return body
-
     async def json(self) -> dict[str, Any]:
         """
         Parse and cache JSON body.
@@ -256,42 +276,12 @@ class MakesBodyParsing:
                 f"Invalid multipart content-type header: {exc}"
             ) from exc
 
-    def _validate_uploaded_file(
-        self, name: str, filename: str, content: bytes, content_type: str
-    ) -> None:
-        """Validate uploaded file before creating UploadedFile instance."""
-        # Check file size
-        max_file = self._max_file_size()
-        if len(content) > max_file:
-            raise BadRequestException(
-                f"File '{filename}' exceeds maximum size of {max_file} bytes"
-            )
-
-        # Check if file is empty
-        if len(content) == 0:
-            raise BadRequestException(f"File '{filename}' is empty")
-
-        # Validate filename
-        if not filename or filename.strip() == "":
-            raise BadRequestException("Filename cannot be empty")
-
-        # Check for dangerous filenames
-        dangerous_names = [".", "..", ""]
-        if filename in dangerous_names:
-            raise BadRequestException(f"Invalid filename: '{filename}'")
-
-        # Check for path traversal in filename
-        if "/" in filename or "\\" in filename or ".." in filename:
-            raise BadRequestException(
-                f"Filename contains invalid characters: '{filename}'"
-            )
-
     async def _parse_multipart(self) -> None:
         """
         Parse multipart/form‐data body into files and form parameters.
 
-        Caches results so subsequent calls do not re‐parse.
-        Enhanced with Laravel-like validation and error handling.
+        Caches results so subsequent calls do not re‐parse. Multipart bodies
+        are streamed through ``MultipartStream`` — see ``_stream_multipart``.
         """
         if self._files is not None:
             return
@@ -317,146 +307,111 @@ class MakesBodyParsing:
             self._form_params = {}
             return
 
-        raw = await self._read_body()
-        if not raw:
-            return
+        stream = await self._stream_multipart(boundary)
+        if stream is not None:
+            self._files = stream.files
+            self._form_params = stream.form_params
 
-        try:
-            # Storage for current part being processed
-            current_part = {}
-            file_count = 0
-
-            def on_part_begin():
-                nonlocal current_part
-                current_part = {
-                    "headers": {},
-                    "name": None,
-                    "filename": None,
-                    "content_type": None,
-                    # Chunk list, joined once at part end — ``bytes +=``
-                    # is O(n²) over a large upload (same fix as _read_body).
-                    "data": [],
-                }
-
-            def on_header_field(data, start, end):
-                current_part["_header_field"] = data[start:end].decode("utf-8").lower()
-
-            def on_header_value(data, start, end):
-                field = current_part.get("_header_field", "")
-                value = data[start:end].decode("utf-8")
-                current_part["headers"][field] = value
-
-                # Parse Content-Disposition header
-                if field == "content-disposition":
-                    disp_parts = value.split(";")
-                    for part in disp_parts[1:]:  # Skip the first part (form-data)
-                        if "=" in part:
-                            key, val = part.strip().split("=", 1)
-                            val = val.strip('"')  # Remove quotes
-                            if key.strip() == "name":
-                                current_part["name"] = val
-                            elif key.strip() == "filename":
-                                current_part["filename"] = val
-                elif field == "content-type":
-                    current_part["content_type"] = value
-
-            def on_part_data(data, start, end):
-                current_part["data"].append(data[start:end])
-
-            max_files = self._max_files()
-
-            def on_part_end():
-                nonlocal current_part, file_count
-                name = current_part.get("name")
-                filename = current_part.get("filename")
-                content = b"".join(current_part.get("data", []))
-
-                if not name:
-                    return  # Skip parts without names
-
-                if filename:
-                    # This is a file upload
-                    file_count += 1
-                    if file_count > max_files:
-                        raise BadRequestException(
-                            f"Too many files uploaded. Maximum: {max_files}"
-                        )
-
-                    # Validate file before creating UploadedFile
-                    self._validate_uploaded_file(
-                        name,
-                        filename,
-                        content,
-                        current_part.get("content_type", "application/octet-stream"),
-                    )
-
-                    # Create UploadedFile instance
-                    uploaded_file = UploadedFile(
-                        name=name,
-                        filename=filename,
-                        content_type=current_part.get(
-                            "content_type", "application/octet-stream"
-                        ),
-                        content=content,
-                    )
-
-                    # Validate the created file
-                    if not uploaded_file.is_valid():
-                        raise BadRequestException(f"Invalid file upload: '{filename}'")
-
-                    self._files[name] = uploaded_file
-                else:
-                    # This is a form field
-                    try:
-                        self._form_params[name] = content.decode("utf-8")
-                    except UnicodeDecodeError:
-                        # Fallback to latin-1 for binary data in forms
-                        try:
-                            self._form_params[name] = content.decode("latin-1")
-                        except UnicodeDecodeError:
-                            # Last resort: base64 encode. Log this because
-                            # downstream code expects a plain string but
-                            # gets base64 — can cause silent data corruption
-                            # in validation or DB writes.
-
-                            logging.getLogger("cara.http.body").warning(
-                                "Form field '%s' could not be decoded as "
-                                "utf-8 or latin-1; base64-encoding raw bytes",
-                                name,
-                            )
-                            self._form_params[name] = base64.b64encode(content).decode(
-                                "ascii"
-                            )
-
-            # Create parser with callbacks
-            parser = MultipartParser(
-                boundary,
-                callbacks={
-                    "on_part_begin": on_part_begin,
-                    "on_header_field": on_header_field,
-                    "on_header_value": on_header_value,
-                    "on_part_data": on_part_data,
-                    "on_part_end": on_part_end,
-                },
-            )
+    async def _stream_multipart(
+        self, boundary: bytes, storage: Any = None, directory: str = ""
+    ) -> MultipartStream | None:
+        """
+        Feed the body into a ``MultipartStream`` chunk by chunk.
+
+        When the raw body has not been read yet, ASGI ``receive`` chunks go
+        straight into the parser — the body is never joined in memory, file
+        parts spool to disk past ``server.upload_spool_size`` (or into
+        ``storage``), and every limit trips as soon as the offending byte
+        arrives. The stream is consumed by this, so a later ``body()`` call
+        raises "already consumed"; callers that need the raw bytes too
+        (signature checks) read ``body()`` first and the cached bytes are
+        parsed instead. Returns None for an empty body.
+        """
+        stream = MultipartStream(
+            boundary,
+            max_file_size=self._max_file_size(),
+            max_files=self._max_files(),
+            spool_size=self._spool_size(),
+            storage=storage,
+            directory=directory,
+        )
+        if self._body is not None or self._body_consumed:
+            raw = await self._read_body()
+            if not raw:
+                return None
+            stream.write(raw)
+            stream.finalize()
+            return stream
 
-            # Write data to parser. Note: ``MultipartParser.write`` runs
-            # the registered callbacks synchronously, so a
-            # ``BadRequestException`` raised from ``on_part_end`` (e.g.
-            # too-many-files, oversize file) propagates straight out of
-            # ``parser.write`` — which is what the ``except`` below
-            # forwards verbatim. Without the ``isinstance`` guard the
-            # specific user-facing message ("Too many files uploaded.
-            # Maximum: 20") was being rewrapped as a generic "Failed to
-            # parse multipart data: ..." string, hiding the actual cause
-            # from the validator.
-            parser.write(raw)
-            parser.finalize()
-
-        except BadRequestException:
+        received = False
+        try:
+            async with aclosing(self._receive_chunks(self._max_body_size())) as chunks:
+                async for chunk in chunks:
+                    received = True
+                    stream.write(chunk)
+        except BaseException:
+            self._body_consumed = True
+            stream.abort()
             raise
-        except Exception as exc:
-            raise BadRequestException(f"Failed to parse multipart data: {exc}") from exc
+        self._body_consumed = True
+        if not received:
+            return None
+        stream.finalize()
+        return stream
+
+    async def store_files(
+        self, directory: str, driver: str | None = None
+    ) -> dict[str, UploadedFile]:
+        """
+        Pipe every uploaded file straight into a ``Storage`` driver.
+
+        Each file part is written through ``Storage.writer`` as it is
+        received, under ``<directory>/<uuid>.<ext>`` like ``UploadedFile.store``,
+        so an upload of any size is never materialised in memory or in a
+        spool file. Objects are committed only once the whole body parsed
+        cleanly. Returns the files like ``files()``; each carries its
+        ``storage_key``. Form fields are parsed as usual.
+
+        If the body was already parsed, the existing spooled files are
+        copied into storage chunk by chunk instead.
+        """
+        target = self.application.make("storage").driver(driver)
+        if self._files is None:
+            content_type = self.header("content-type", "")
+            boundary = self._validate_multipart_structure(content_type)
+            if boundary is not None:
+                self._files = {}
+                self._form_params = {}
+                stream = await self._stream_multipart(boundary, target, directory)
+                if stream is not None:
+                    self._files = stream.files
+                    self._form_params = stream.form_params
+                return self._files
+
+        files = await self.files()
+        for name, uploaded in list(files.items()):
+            if uploaded.is_stored:
+                continue
+            extension = uploaded.extension or "bin"
+            key = f"{directory.strip('/')}/{uuid.uuid4().hex}.{extension}".lstrip("/")
+            writer = target.writer(key)
+            try:
+                for chunk in uploaded.chunks():
+                    writer.write(chunk)
+            except BaseException:
+                writer.abort()
+                raise
+            writer.commit()
+            uploaded.close()
+            files[name] = UploadedFile(
+                name=uploaded.name,
+                filename=uploaded.filename,
+                content_type=uploaded.content_type,
+                size=uploaded.size,
+                storage_key=key,
+                storage=target,
+            )
+        return files
 
     async def form(self) -> dict[str, Any]:
         """
@@ -0,0 +1,310 @@
+"""
+Incremental multipart/form-data parser for the Cara HTTP request.
+
+``MakesBodyParsing`` used to join the whole request body into one ``bytes``
+and only then hand it to ``MultipartParser``, so a 10 MB upload cost the
+body buffer plus a second full copy per file part. This parser is fed one
+ASGI ``receive`` chunk at a time instead: file parts go straight into a
+``SpooledTemporaryFile`` (in memory up to the spool threshold, on disk
+beyond it) or into a ``StorageWriter``, and the per-file and file-count
+limits are checked as bytes arrive rather than after the fact.
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Any
+
+from python_multipart import MultipartParser
+
+from cara.exceptions import BadRequestException
+from cara.http.request.UploadedFile import UploadedFile
+
+_DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+
+def _decode_field(name: str, content: bytes) -> str:
+    """Decode a plain form field: utf-8, then latin-1, then base64."""
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError:
+        # Fallback to latin-1 for binary data in forms
+        try:
+            return content.decode("latin-1")
+        except UnicodeDecodeError:
+            # Last resort: base64 encode. Log this because downstream code
+            # expects a plain string but gets base64 — can cause silent
+            # data corruption in validation or DB writes.
+            logging.getLogger("cara.http.body").warning(
+                "Form field '%s' could not be decoded as "
+                "utf-8 or latin-1; base64-encoding raw bytes",
+                name,
+            )
+            return base64.b64encode(content).decode("ascii")
+
+
+def _validate_filename(filename: str) -> None:
+    """Reject empty, dot-only and path-carrying upload filenames."""
+    if not filename or filename.strip() == "":
+        raise BadRequestException("Filename cannot be empty")
+
+    if filename in (".", ".."):
+        raise BadRequestException(f"Invalid filename: '{filename}'")
+
+    if "/" in filename or "\\" in filename or ".." in filename:
+        raise BadRequestException(f"Filename contains invalid characters: '{filename}'")
+
+
+class _Part:
+    """State for the multipart part currently being parsed."""
+
+    __slots__ = (
+        "header_field",
+        "header_value",
+        "name",
+        "filename",
+        "content_type",
+        "chunks",
+        "sink",
+        "storage_key",
+        "size",
+    )
+
+    def __init__(self) -> None:
+        # Header names and values can arrive split across body chunks, so
+        # both are accumulated and only interpreted on ``on_header_end``.
+        self.header_field: list[bytes] = []
+        self.header_value: list[bytes] = []
+        self.name: str | None = None
+        self.filename: str | None = None
+        self.content_type: str | None = None
+        # Plain fields: chunk list joined once at part end (``bytes +=`` is
+        # O(n²) over a large value).
+        self.chunks: list[bytes] = []
+        # File parts: a spool file or a ``StorageWriter``.
+        self.sink: Any = None
+        self.storage_key: str | None = None
+        self.size = 0
+
+
+class MultipartStream:
+    """
+    Push-style multipart/form-data parser with bounded memory.
+
+    Call ``write`` for every body chunk and ``finalize`` once the body ends;
+    results accumulate in ``files`` and ``form_params``. When ``storage`` (a
+    storage driver) is given, every file part is written to
+    ``<directory>/<uuid>.<ext>`` through ``storage.writer`` and the objects
+    are committed only when the whole body parsed cleanly — a request that
+    fails half way leaves nothing behind. Call ``abort`` if the feed stops
+    early for any other reason.
+    """
+
+    def __init__(
+        self,
+        boundary: bytes,
+        *,
+        max_file_size: int,
+        max_files: int,
+        spool_size: int,
+        storage: Any = None,
+        directory: str = "",
+    ) -> None:
+        self.files: dict[str, UploadedFile] = {}
+        self.form_params: dict[str, Any] = {}
+        self._max_file_size = max_file_size
+        self._max_files = max_files
+        self._spool_size = spool_size
+        self._storage = storage
+        self._directory = directory.strip("/")
+        self._file_count = 0
+        self._part = _Part()
+        # Storage writers of completed parts, by field name, until finalize.
+        self._pending_writers: dict[str, Any] = {}
+        self._parser = MultipartParser(
+            boundary,
+            callbacks={
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+
+    # ------------------------------------------------------------------
+    # Feed
+    # ------------------------------------------------------------------
+    def write(self, chunk: bytes) -> None:
+        """Parse one body chunk.
+
+        ``MultipartParser.write`` runs the callbacks synchronously, so a
+        ``BadRequestException`` from a limit check (too many files, oversize
+        file) propagates straight out of here with its specific message.
+        Any other parser failure is wrapped as a generic 400. Either way the
+        stream is aborted before raising.
+        """
+        try:
+            self._parser.write(chunk)
+        except BadRequestException:
+            self.abort()
+            raise
+        except Exception as exc:
+            self.abort()
+            raise BadRequestException(f"Failed to parse multipart data: {exc}") from exc
+
+    def finalize(self) -> None:
+        """Finish the parse and commit any storage-bound parts."""
+        try:
+            self._parser.finalize()
+        except BadRequestException:
+            self.abort()
+            raise
+        except Exception as exc:
+            self.abort()
+            raise BadRequestException(f"Failed to parse multipart data: {exc}") from exc
+        writers, self._pending_writers = self._pending_writers, {}
+        for writer in writers.values():
+            writer.commit()
+
+    def abort(self) -> None:
+        """Discard every open spool and uncommitted storage object."""
+        self._discard(self._part)
+        for writer in self._pending_writers.values():
+            writer.abort()
+        self._pending_writers = {}
+        for uploaded in self.files.values():
+            uploaded.close()
+
+    # ------------------------------------------------------------------
+    # Parser callbacks
+    # ------------------------------------------------------------------
+    def _on_part_begin(self) -> None:
+        self._part = _Part()
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._part.header_field.append(data[start:end])
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._part.header_value.append(data[start:end])
+
+    def _on_header_end(self) -> None:
+        part = self._part
+        field = b"".join(part.header_field).decode("utf-8").lower()
+        value = b"".join(part.header_value).decode("utf-8")
+        part.header_field = []
+        part.header_value = []
+
+        # Parse Content-Disposition header
+        if field == "content-disposition":
+            for item in value.split(";")[1:]:  # Skip the first part (form-data)
+                if "=" in item:
+                    key, val = item.strip().split("=", 1)
+                    val = val.strip('"')  # Remove quotes
+                    if key.strip() == "name":
+                        part.name = val
+                    elif key.strip() == "filename":
+                        part.filename = val
+        elif field == "content-type":
+            part.content_type = value
+
+    def _on_headers_finished(self) -> None:
+        """Open the part's sink once we know it is a named file part.
+
+        Count and filename are checked here, before a single byte of the
+        part is stored, so a rejected upload never reaches the disk.
+        """
+        part = self._part
+        if not part.name or not part.filename:
+            return
+
+        self._file_count += 1
+        if self._file_count > self._max_files:
+            raise BadRequestException(
+                f"Too many files uploaded. Maximum: {self._max_files}"
+            )
+        _validate_filename(part.filename)
+
+        if self._storage is None:
+            # Owned by the UploadedFile (or closed by ``abort``), not a block.
+            part.sink = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+                max_size=self._spool_size
+            )
+            return
+        extension = Path(part.filename).suffix.lower().lstrip(".") or "bin"
+        name = f"{uuid.uuid4().hex}.{extension}"
+        part.storage_key = f"{self._directory}/{name}" if self._directory else name
+        part.sink = self._storage.writer(part.storage_key)
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        part = self._part
+        if not part.name:
+            return  # Parts without names are skipped, don't buffer them
+        if part.sink is None:
+            part.chunks.append(data[start:end])
+            return
+        part.size += end - start
+        if part.size > self._max_file_size:
+            raise BadRequestException(
+                f"File '{part.filename}' exceeds maximum size of "
+                f"{self._max_file_size} bytes"
+            )
+        part.sink.write(data[start:end])
+
+    def _on_part_end(self) -> None:
+        part = self._part
+        if not part.name:
+            return  # Skip parts without names
+
+        if part.sink is None:
+            self.form_params[part.name] = _decode_field(part.name, b"".join(part.chunks))
+            return
+
+        if part.size == 0:
+            raise BadRequestException(f"File '{part.filename}' is empty")
+
+        content_type = part.content_type or _DEFAULT_CONTENT_TYPE
+        if part.storage_key is None:
+            uploaded = UploadedFile(
+                name=part.name,
+                filename=part.filename,
+                content_type=content_type,
+                file=part.sink,
+                size=part.size,
+            )
+        else:
+            # A repeated field name replaces the earlier file, so its object
+            # must not be committed as an orphan.
+            replaced = self._pending_writers.pop(part.name, None)
+            if replaced is not None:
+                replaced.abort()
+            self._pending_writers[part.name] = part.sink
+            uploaded = UploadedFile(
+                name=part.name,
+                filename=part.filename,
+                content_type=content_type,
+                size=part.size,
+                storage_key=part.storage_key,
+                storage=self._storage,
+            )
+        previous = self.files.get(part.name)
+        if previous is not None:
+            previous.close()
+        self.files[part.name] = uploaded
+        part.sink = None
+
+    @staticmethod
+    def _discard(part: _Part) -> None:
+        sink, part.sink = part.sink, None
+        if sink is None:
+            return
+        if part.storage_key is None:
+            sink.close()
+        else:
+            sink.abort()
@@ -9,11 +9,13 @@ from cara._LazyExports import _install_lazy_exports
 
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "KeyPart": (".KeyPart", "KeyPart"),
+    "MultipartStream": (".MultipartStream", "MultipartStream"),
     "QueryStringParser": (".QueryStringParser", "QueryStringParser"),
 }
 
 __all__ = [
     "KeyPart",
+    "MultipartStream",
     "QueryStringParser",
 ]
 
@@ -5,8 +5,11 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
+from cara.support import json_bytes
+
 from .MissingValue import MissingValue
 from .ResourceCollection import ResourceCollection
+from .ResourcePlan import ResourcePlan
 from .Serialization import (
     opt_bool,
     opt_datetime,
@@ -17,6 +20,9 @@ from .Serialization import (
 
 if TYPE_CHECKING:
     from .ResourceCollection import ResourceCollection
+    from .ResourceField import ResourceField
+
+_UNCOMPILED = object()
 
 
 class JsonResource:
@@ -43,9 +49,21 @@ class JsonResource:
 
         # Collection
         return ExampleResource.collection(items).to_response(response)
+
+    A resource whose output is a plain projection can declare ``fields``
+    instead of overriding ``to_array``; it is compiled once into a
+    ``ResourcePlan`` and a collection is serialized in one loop::
+
+        class ExampleResource(JsonResource):
+            fields = (
+                ResourceField("id", "public_id"),
+                "title",
+                ResourceField("score", convert=float),
+            )
     """
 
     wrap = "data"
+    fields: tuple[ResourceField | str, ...] = ()
 
     def __init__(self, resource: Any):
         self.resource = resource
@@ -57,9 +75,13 @@ class JsonResource:
     def to_array(self, request=None) -> dict:
         """Transform the resource into a dict.
 
-        Override in subclasses to define the output shape.
-        Falls back to model.serialize() if available, otherwise returns the resource as-is.
+        Override in subclasses to define the output shape, or declare
+        ``fields``. Falls back to model.serialize() if available, otherwise
+        returns the resource as-is.
         """
+        plan = type(self).plan()
+        if plan is not None:
+            return plan.row(self.resource)
         if hasattr(self.resource, "serialize"):
             return self.resource.serialize()
         if isinstance(self.resource, dict):
@@ -171,6 +193,30 @@ class JsonResource:
         resp = response.json(payload, self._status, self._headers or None)
         return resp
 
+    def to_bytes(self, request=None) -> bytes:
+        """Encode the resolved payload straight to JSON bytes."""
+        return json_bytes(self.resolve(request))
+
+    # ── Compiled plan ─────────────────────────────────────────────────────
+
+    @classmethod
+    def plan(cls) -> ResourcePlan | None:
+        """The class's compiled ``ResourcePlan``, or ``None`` without one.
+
+        Only a resource that declares ``fields`` and keeps the inherited
+        ``to_array`` has a plan; an overridden ``to_array`` is code the
+        plan cannot see, so it stays on the per-item path. Compiled on
+        first use and cached on the class itself, never inherited.
+        """
+        cached = cls.__dict__.get("_compiled_plan", _UNCOMPILED)
+        if cached is not _UNCOMPILED:
+            return cached
+        plan = None
+        if cls.fields and cls.to_array is JsonResource.to_array:
+            plan = ResourcePlan(cls.fields)
+        cls._compiled_plan = plan
+        return plan
+
     # ── Collection factory ────────────────────────────────────────────────
 
     @classmethod
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from cara.support import json_bytes
+
+if TYPE_CHECKING:
+    from .ResourcePlan import ResourcePlan
 
 
 class ResourceCollection:
@@ -13,6 +18,10 @@ class ResourceCollection:
         return ResourceCollection(items, ExampleResource).to_response(response)
         # or via the class method shortcut:
         return ExampleResource.collection(items).to_response(response)
+
+    A resource class with a compiled plan (see ``JsonResource.plan``)
+    serializes the whole collection in one loop instead of building a
+    resource per item.
     """
 
     wrap = "data"
@@ -32,6 +41,9 @@ class ResourceCollection:
                 item.serialize() if hasattr(item, "serialize") else item
                 for item in self.items
             ]
+        plan = self._plan()
+        if plan is not None:
+            return plan.rows(self.items)
         return [self.resource_class(item).to_array(request) for item in self.items]
 
     def with_status(self, status: int) -> ResourceCollection:
@@ -56,7 +68,11 @@ class ResourceCollection:
             JsonResource,  # local: cycle with cara.http.resources.JsonResource
         )
 
-        data = [JsonResource._filter_missing(item) for item in self.to_array(request)]
+        data = self.to_array(request)
+        if self._plan() is None:
+            # A plan omits keys itself; only the per-item path can leave
+            # MissingValue behind.
+            data = [JsonResource._filter_missing(item) for item in data]
 
         if self.wrap:
             payload = {self.wrap: data}
@@ -81,6 +97,14 @@ class ResourceCollection:
         payload = self.resolve()
         return response.json(payload, self._status, self._headers or None)
 
+    def to_bytes(self, request=None) -> bytes:
+        """Encode the resolved payload straight to JSON bytes."""
+        return json_bytes(self.resolve(request))
+
+    def _plan(self) -> ResourcePlan | None:
+        plan = getattr(self.resource_class, "plan", None)
+        return plan() if plan is not None else None
+
     def __repr__(self) -> str:
         resource_name = self.resource_class.__name__ if self.resource_class else "None"
         return f"ResourceCollection({resource_name}, count={len(self.items)})"
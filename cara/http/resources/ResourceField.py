@@ -0,0 +1,99 @@
+"""Declarative field for a compiled resource serialization plan."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import date, datetime
+from typing import Any
+
+from .Serialization import (
+    opt_bool,
+    opt_datetime,
+    opt_float,
+    opt_int,
+    opt_list,
+    opt_str,
+)
+
+# A bare type names the ``opt_*`` helper a hand-written ``to_array`` would
+# call for it. ``Decimal`` is deliberately absent: money stays ``Decimal``
+# and becomes exact text at the JSON boundary, not here.
+_TYPE_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    bool: opt_bool,
+    date: opt_datetime,
+    datetime: opt_datetime,
+    float: opt_float,
+    int: opt_int,
+    list: opt_list,
+    str: opt_str,
+}
+
+
+class ResourceField:
+    """One output key of a ``JsonResource.fields`` declaration.
+
+    Usage::
+
+        class ProductResource(JsonResource):
+            fields = (
+                ResourceField("id", "public_id"),
+                "title",
+                ResourceField("score", convert=float),
+                ResourceField("brand", resource=BrandResource, loaded=True),
+            )
+
+    Args:
+        name: Output key.
+        source: Attribute (or dict key) to read; dotted paths walk
+                relations. Defaults to ``name``.
+        convert: Callable applied to the value, or a bare type
+                 (``float``, ``int``, ``str``, ``bool``, ``list``,
+                 ``datetime``, ``date``) naming its ``opt_*`` helper.
+        loaded: Omit the key when the source is absent instead of
+                raising — the declarative ``when_loaded``.
+        resource: Nested ``JsonResource`` class; a single value becomes
+                  one row and an iterable becomes a list of rows.
+    """
+
+    __slots__ = ("convert", "loaded", "name", "resource", "source")
+
+    def __init__(
+        self,
+        name: str,
+        source: str | None = None,
+        convert: Callable[[Any], Any] | type | None = None,
+        *,
+        loaded: bool = False,
+        resource: type | None = None,
+    ):
+        if convert is not None and resource is not None:
+            raise ValueError(
+                f"ResourceField {name!r}: convert and resource are exclusive; "
+                "the nested resource already decides its own output."
+            )
+        if isinstance(convert, type):
+            if convert not in _TYPE_CONVERTERS:
+                raise ValueError(
+                    f"ResourceField {name!r}: no converter for type "
+                    f"{convert.__name__}; pass a callable instead."
+                )
+            convert = _TYPE_CONVERTERS[convert]
+        self.name = name
+        self.source = source or name
+        self.convert = convert
+        self.loaded = loaded
+        self.resource = resource
+
+    @classmethod
+    def of(cls, spec: ResourceField | str) -> ResourceField:
+        """Normalise a ``fields`` entry: a bare string is a plain field."""
+        if isinstance(spec, ResourceField):
+            return spec
+        if isinstance(spec, str):
+            return cls(spec)
+        raise TypeError(
+            f"Resource fields must be ResourceField or str, got {type(spec).__name__}"
+        )
+
+    def __repr__(self) -> str:
+        return f"ResourceField({self.name!r}, {self.source!r})"
@@ -6,6 +6,8 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "JsonResource": (".JsonResource", "JsonResource"),
     "MissingValue": (".MissingValue", "MissingValue"),
     "ResourceCollection": (".ResourceCollection", "ResourceCollection"),
+    "ResourceField": (".ResourceField", "ResourceField"),
+    "ResourcePlan": (".ResourcePlan", "ResourcePlan"),
     "opt_bool": (".Serialization", "opt_bool"),
     "opt_datetime": (".Serialization", "opt_datetime"),
     "opt_float": (".Serialization", "opt_float"),
@@ -18,6 +20,8 @@ __all__ = [
     "JsonResource",
     "MissingValue",
     "ResourceCollection",
+    "ResourceField",
+    "ResourcePlan",
     "opt_bool",
     "opt_datetime",
     "opt_float",
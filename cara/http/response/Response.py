@@ -7,15 +7,16 @@ Orchestrates BaseResponse, ResponseFactory, HeaderManager, ContentTypeDetector,
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from typing import Any
 
-from cara.support import json_dumps
+from cara.support import json_bytes
 
 from .BaseResponse import BaseResponse
 from .ContentTypeDetector import ContentTypeDetector
 from .HeaderManager import HeaderManager
 from .ResponseFactory import ResponseFactory
+from .StaticFile import StaticFile
 from .StreamingResponse import StreamingResponse
 
 
@@ -53,6 +54,9 @@ class Response(BaseResponse):
             ]
             | None
         ) = None
+        self._file_body: (
+            tuple[StaticFile, list[tuple[int, int]] | None, bool, str | None] | None
+        ) = None
 
     def clone_from(self, other: Response) -> None:
         """
@@ -88,6 +92,7 @@ class Response(BaseResponse):
         # configure a stream successfully and the conductor will later emit an
         # empty regular response.
         other_stream_spec = getattr(other, "_stream_spec", None)
+        other_file_body = getattr(other, "_file_body", None)
 
         # Clone base response attributes (content, status, etc.)
         super().clone_from(other)
@@ -97,6 +102,7 @@ class Response(BaseResponse):
         self.factory = ResponseFactory(self)
         self.streaming = StreamingResponse(self)
         self._stream_spec = other_stream_spec
+        self._file_body = other_file_body
 
         # Copy header data and preserve explicit content-type state
         if hasattr(other, "headers") and other.headers:
@@ -123,6 +129,9 @@ class Response(BaseResponse):
                     headers=headers,
                 )
                 return
+            if self._file_body is not None:
+                await self._send_file_body(scope, send)
+                return
 
             self.prepare_content()
             self._finalize_response()
@@ -131,6 +140,24 @@ class Response(BaseResponse):
         except Exception as e:
             await self._handle_error(e, send)
 
+    async def _send_file_body(self, scope: dict, send: Any) -> None:
+        """Send a ``static_file`` response; the headers were set when it was built."""
+        static, ranges, head_only, boundary = self._file_body
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self._status,
+                "headers": self.get_headers(),
+            }
+        )
+        self._started = True
+        scope["response_started"] = True
+        if head_only:
+            await send({"type": "http.response.body", "body": b""})
+        else:
+            await static.send_body(scope, send, ranges, boundary)
+        self._sent = True
+
     def _finalize_response(self) -> None:
         """Finalize response before sending (Laravel-style)."""
         # RFC 9110 forbids content on informational responses, 204 and 304;
@@ -513,6 +540,45 @@ class Response(BaseResponse):
         )
         return self
 
+    def static_file(
+        self,
+        file: StaticFile,
+        ranges: list[tuple[int, int]] | None = None,
+        *,
+        head_only: bool = False,
+        status: int = 200,
+        boundary: str | None = None,
+    ) -> Response:
+        """Configure a deferred file body (see ``StaticFile.respond``).
+
+        Like ``stream()``, nothing is read while the controller or the
+        middleware chain runs. The caller owns the representation headers
+        (``Content-Length``, ``Content-Range``, ``ETag``); when the
+        conductor invokes the response the body is streamed from disk in
+        bounded chunks, served from ``file.data``, or handed to the server
+        through ``http.response.pathsend``.
+        """
+        self.content = b""
+        self._status = int(status)
+        self._file_body = (file, ranges, head_only, boundary)
+        return self
+
+    def has_deferred_body(self) -> bool:
+        """True when the body is produced at send time (stream or file)."""
+        return self._stream_spec is not None or self._file_body is not None
+
+    def map_stream(self, wrap: Callable[[AsyncGenerator[bytes]], Any]) -> bool:
+        """Replace a ``stream()`` body with ``wrap(generator)``; False if not streaming.
+
+        Lets middleware transform a streamed body chunk by chunk (e.g.
+        compression) without consuming it while the chain is still running.
+        """
+        if self._stream_spec is None:
+            return False
+        generator, *rest = self._stream_spec
+        self._stream_spec = (wrap(generator), *rest)
+        return True
+
     def stream_json_lines(
         self,
         data_generator: AsyncGenerator[Any],
@@ -523,7 +589,7 @@ class Response(BaseResponse):
 
         async def chunks() -> AsyncGenerator[bytes]:
             async for data in data_generator:
-                yield (json_dumps(data) + "\n").encode("utf-8")
+                yield json_bytes(data) + b"\n"
 
         return self.stream(
             chunks(),
@@ -11,7 +11,7 @@ import mimetypes
 import os
 from typing import Any
 
-from cara.support import json_dumps
+from cara.support import json_bytes
 
 from .BaseResponse import BaseResponse
 from .ContentTypeDetector import ContentTypeDetector
@@ -79,7 +79,7 @@ class ResponseFactory:
             BaseResponse: Configured response
         """
         self.response._status = status
-        self.response.set_content(json_dumps(payload))
+        self.response.set_content(json_bytes(payload))
 
         # Explicitly set content-type (Laravel approach)
         self.headers.content_type("application/json; charset=utf-8")
@@ -0,0 +1,363 @@
+"""
+Static file representation for ranged, validated, chunked file responses.
+
+``ServeStaticFiles`` used to ``f.read()`` every asset whole on the event
+loop, advertise ``Accept-Ranges: bytes`` without honouring ``Range``, and
+send no validators at all, so every revisit re-downloaded every byte. A
+``StaticFile`` is the stat of one file (or of its precompressed ``.br`` /
+``.gz`` sibling) plus everything derived from it: a strong ``ETag`` and
+``Last-Modified`` built from size and mtime, conditional-request handling,
+single and multi-range selection, and a body that is streamed in bounded
+chunks off the loop — or handed to the server whole via the ASGI
+``http.response.pathsend`` extension when the server offers it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import mimetypes
+import os
+import secrets
+from dataclasses import dataclass, replace
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any
+
+_CHUNK_SIZE = 64 * 1024
+# More ranges than this in one request is either a broken client or an
+# amplification attempt; the full representation is sent instead.
+_MAX_RANGES = 16
+# Preference order of precompressed siblings: (content-coding, suffix).
+_PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepted_codings(accept_encoding: str) -> set[str]:
+    """Content-codings the client accepts with a non-zero weight."""
+    accepted = set()
+    for token in accept_encoding.split(","):
+        coding, _, params = token.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = params.strip()
+        if weight.startswith("q="):
+            try:
+                if float(weight[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding)
+    return accepted
+
+
+def _opaque_tag(raw: str) -> str | None:
+    """The quoted opaque-tag of an entity-tag, ignoring the ``W/`` flag."""
+    token = raw.strip()
+    if token[:2] in ("W/", "w/"):
+        token = token[2:].strip()
+    if len(token) >= 2 and token[0] == '"' and token[-1] == '"':
+        return token[1:-1]
+    return None
+
+
+def _parse_http_date(value: str) -> float | None:
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except TypeError, ValueError, IndexError:
+        return None
+
+
+@dataclass(frozen=True)
+class StaticFile:
+    """One servable file: stat, validators, coding and (optionally) its bytes."""
+
+    path: str
+    size: int
+    mtime: float
+    content_type: str
+    encoding: str | None = None
+    # True when precompressed siblings exist, so caches must key on
+    # ``Accept-Encoding`` even for the identity response.
+    vary: bool = False
+    # Whole-file bytes for small hot assets held by an in-memory cache.
+    data: bytes | None = None
+
+    @classmethod
+    def resolve(
+        cls,
+        path: str,
+        accept_encoding: str = "",
+        *,
+        content_type: str | None = None,
+        precompressed: bool = True,
+    ) -> StaticFile:
+        """Stat ``path``, picking a ``.br``/``.gz`` sibling the client accepts.
+
+        The content type is always guessed from ``path`` itself, never from
+        the sibling, so ``app.js.br`` is still served as JavaScript.
+        """
+        if content_type is None:
+            content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        chosen_path, encoding, vary = path, None, False
+        if precompressed:
+            accepted = _accepted_codings(accept_encoding) if accept_encoding else set()
+            for coding, suffix in _PRECOMPRESSED:
+                sibling = path + suffix
+                if not os.path.isfile(sibling):
+                    continue
+                vary = True
+                if encoding is None and coding in accepted:
+                    chosen_path, encoding = sibling, coding
+        stat = os.stat(chosen_path)
+        return cls(
+            path=chosen_path,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            content_type=content_type,
+            encoding=encoding,
+            vary=vary,
+        )
+
+    def loaded(self) -> StaticFile:
+        """A copy carrying the file's bytes, for serving from memory."""
+        with open(self.path, "rb") as f:
+            return replace(self, data=f.read())
+
+    # ------------------------------------------------------------------
+    # Validators
+    # ------------------------------------------------------------------
+    @property
+    def etag(self) -> str:
+        """Strong ETag from mtime and size, distinct per content-coding."""
+        tag = f"{int(self.mtime * 1_000_000):x}-{self.size:x}"
+        if self.encoding:
+            tag = f"{tag}-{self.encoding}"
+        return f'"{tag}"'
+
+    @property
+    def last_modified(self) -> str:
+        return formatdate(self.mtime, usegmt=True)
+
+    def is_not_modified(
+        self, if_none_match: str | None, if_modified_since: str | None
+    ) -> bool:
+        """RFC 9110 §13.2.2: ``If-None-Match`` wins; ``If-Modified-Since`` otherwise."""
+        if if_none_match:
+            value = if_none_match.strip()
+            if value == "*":
+                return True
+            target = _opaque_tag(self.etag)
+            return any(_opaque_tag(candidate) == target for candidate in value.split(","))
+        if if_modified_since:
+            since = _parse_http_date(if_modified_since)
+            return since is not None and int(self.mtime) <= since
+        return False
+
+    # ------------------------------------------------------------------
+    # Ranges
+    # ------------------------------------------------------------------
+    def ranges(
+        self, range_header: str | None, if_range: str | None = None
+    ) -> list[tuple[int, int]] | None:
+        """Satisfiable ``(start, end)`` byte ranges (inclusive), sorted and merged.
+
+        ``None`` means "send the full representation": no ``Range``, an
+        unparseable one, a stale ``If-Range``, or too many ranges. An empty
+        list means none of the ranges is satisfiable (416).
+        """
+        if not range_header:
+            return None
+        if if_range and not self._if_range_matches(if_range):
+            return None
+        unit, _, spec = range_header.partition("=")
+        if unit.strip().lower() != "bytes" or not spec.strip():
+            return None
+        items = spec.split(",")
+        if len(items) > _MAX_RANGES:
+            return None
+
+        size = self.size
+        ranges: list[tuple[int, int]] = []
+        for item in items:
+            first, dash, last = item.strip().partition("-")
+            if not dash:
+                return None
+            first, last = first.strip(), last.strip()
+            try:
+                if not first:
+                    # Suffix range: the final N bytes.
+                    length = int(last)
+                    if length <= 0 or size == 0:
+                        continue
+                    ranges.append((max(size - length, 0), size - 1))
+                    continue
+                start = int(first)
+                end = int(last) if last else None
+            except ValueError:
+                return None
+            if start < 0 or (end is not None and end < start):
+                return None
+            if start >= size:
+                continue
+            if end is None:
+                end = size - 1
+            ranges.append((start, min(end, size - 1)))
+
+        ranges.sort()
+        merged: list[tuple[int, int]] = []
+        for start, end in ranges:
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def _if_range_matches(self, if_range: str) -> bool:
+        value = if_range.strip()
+        if value.startswith('"') or value[:2] in ("W/", "w/"):
+            # Strong comparison: a weak validator never matches.
+            return not value.startswith(("W/", "w/")) and value == self.etag
+        since = _parse_http_date(value)
+        return since is not None and int(self.mtime) == since
+
+    # ------------------------------------------------------------------
+    # Response construction
+    # ------------------------------------------------------------------
+    def respond(
+        self, request: Any, response: Any, cache_control: str | None = None
+    ) -> Any:
+        """Configure ``response`` for ``request``: 200, 206, 304 or 416.
+
+        The body is not read here; ``response`` sends it when the conductor
+        invokes it (see ``Response.static_file``).
+        """
+        headers = response.headers
+        headers.set("ETag", self.etag)
+        headers.set("Last-Modified", self.last_modified)
+        headers.set("Accept-Ranges", "bytes")
+        if cache_control:
+            headers.set("Cache-Control", cache_control)
+        if self.vary:
+            headers.set("Vary", "Accept-Encoding")
+        if self.encoding:
+            headers.set("Content-Encoding", self.encoding)
+
+        if self.is_not_modified(
+            request.header("If-None-Match"), request.header("If-Modified-Since")
+        ):
+            response.set_content(b"")
+            return response.status(304)
+
+        head_only = request.method == "HEAD"
+        ranges = self.ranges(request.header("Range"), request.header("If-Range"))
+        if ranges is not None and not ranges:
+            headers.set("Content-Range", f"bytes */{self.size}")
+            headers.set("Content-Type", "text/plain; charset=utf-8")
+            response.set_content(b"Range Not Satisfiable")
+            return response.status(416)
+
+        if ranges is None:
+            headers.set("Content-Type", self.content_type)
+            headers.set("Content-Length", str(self.size))
+            return response.static_file(self, None, head_only=head_only)
+
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            headers.set("Content-Type", self.content_type)
+            headers.set("Content-Range", f"bytes {start}-{end}/{self.size}")
+            headers.set("Content-Length", str(end - start + 1))
+            return response.static_file(self, ranges, head_only=head_only, status=206)
+
+        boundary = secrets.token_hex(16)
+        headers.set("Content-Type", f"multipart/byteranges; boundary={boundary}")
+        length = sum(
+            len(part) + (end - start + 1) + 2
+            for part, (start, end) in zip(
+                self._part_headers(ranges, boundary), ranges, strict=True
+            )
+        ) + len(self._closing(boundary))
+        headers.set("Content-Length", str(length))
+        return response.static_file(
+            self, ranges, head_only=head_only, status=206, boundary=boundary
+        )
+
+    def _part_headers(self, ranges: list[tuple[int, int]], boundary: str) -> list[bytes]:
+        return [
+            (
+                f"--{boundary}\r\nContent-Type: {self.content_type}\r\n"
+                f"Content-Range: bytes {start}-{end}/{self.size}\r\n\r\n"
+            ).encode("latin-1")
+            for start, end in ranges
+        ]
+
+    @staticmethod
+    def _closing(boundary: str) -> bytes:
+        return f"--{boundary}--\r\n".encode("latin-1")
+
+    # ------------------------------------------------------------------
+    # Body transmission
+    # ------------------------------------------------------------------
+    async def send_body(
+        self,
+        scope: dict,
+        send: Any,
+        ranges: list[tuple[int, int]] | None,
+        boundary: str | None = None,
+    ) -> None:
+        """Send the body events after ``http.response.start`` went out."""
+        if ranges is None:
+            if self.data is not None:
+                await send({"type": "http.response.body", "body": self.data})
+                return
+            extensions = scope.get("extensions") or {}
+            if "http.response.pathsend" in extensions:
+                await send({"type": "http.response.pathsend", "path": self.path})
+                return
+            await self._send_chunks(send, [(0, self.size - 1)] if self.size else [])
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if boundary is None:
+            await self._send_chunks(send, ranges)
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        for part, single in zip(
+            self._part_headers(ranges, boundary), ranges, strict=True
+        ):
+            await send({"type": "http.response.body", "body": part, "more_body": True})
+            await self._send_chunks(send, [single])
+            await send({"type": "http.response.body", "body": b"\r\n", "more_body": True})
+        await send({"type": "http.response.body", "body": self._closing(boundary)})
+
+    async def _send_chunks(self, send: Any, ranges: list[tuple[int, int]]) -> None:
+        """Send byte ranges as ``more_body`` events, reading off the loop."""
+        if self.data is not None:
+            for start, end in ranges:
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": self.data[start : end + 1],
+                        "more_body": True,
+                    }
+                )
+            return
+        handle = await asyncio.to_thread(open, self.path, "rb")
+        try:
+            for start, end in ranges:
+                await asyncio.to_thread(handle.seek, start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = await asyncio.to_thread(
+                        handle.read, min(_CHUNK_SIZE, remaining)
+                    )
+                    if not chunk:
+                        # The file shrank under us; Content-Length is already
+                        # on the wire, so end the body short and let the
+                        # server close the connection.
+                        return
+                    remaining -= len(chunk)
+                    await send(
+                        {"type": "http.response.body", "body": chunk, "more_body": True}
+                    )
+        finally:
+            handle.close()
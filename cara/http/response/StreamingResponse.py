@@ -14,7 +14,7 @@ import logging
 from collections.abc import AsyncGenerator, Callable
 from typing import Any
 
-from cara.support import json_dumps
+from cara.support import json_bytes, json_dumps
 
 from .BaseResponse import BaseResponse
 from .HeaderManager import HeaderManager
@@ -194,7 +194,7 @@ class StreamingResponse:
 
         async def json_chunk_generator():
             async for data in data_generator:
-                yield f"{json_dumps(data)}\n".encode()
+                yield json_bytes(data) + b"\n"
 
         await self.stream(
             json_chunk_generator(),
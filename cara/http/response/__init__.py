@@ -8,6 +8,7 @@ Exports:
 - HeaderManager: Robust header management
 - ContentTypeDetector: Smart content-type detection
 - StreamingResponse: Streaming capabilities
+- StaticFile: Ranged, validated file bodies
 - ResponseProvider: DI provider (existing)
 """
 
@@ -20,6 +21,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "Response": (".Response", "Response"),
     "ResponseFactory": (".ResponseFactory", "ResponseFactory"),
     "ResponseProvider": (".ResponseProvider", "ResponseProvider"),
+    "StaticFile": (".StaticFile", "StaticFile"),
     "StreamingResponse": (".StreamingResponse", "StreamingResponse"),
 }
 
@@ -30,6 +32,7 @@ __all__ = [
     "Response",
     "ResponseFactory",
     "ResponseProvider",
+    "StaticFile",
     "StreamingResponse",
 ]
 
@@ -26,6 +26,12 @@ class Middleware(ABC):
     - Default values supported
     """
 
+    #: Declare True on middleware that keeps no per-request state on
+    #: ``self`` (configuration loaded in ``__init__`` is fine). The pipeline
+    #: then builds one instance per application for the worker's lifetime
+    #: instead of allocating a fresh one on every request.
+    reusable: bool = False
+
     def __init__(self, application: Any, **kwargs):
         self.application = application
 
@@ -42,6 +48,16 @@ class Middleware(ABC):
         """Called after response is sent. Override for terminable middleware."""
         pass
 
+    @classmethod
+    def is_reusable(cls) -> bool:
+        """Whether the pipeline may share one instance across requests.
+
+        Requires ``reusable`` and the base no-op ``terminate``: a middleware
+        that overrides ``terminate`` carries state from ``handle`` to its
+        cleanup, so it always gets a per-request instance.
+        """
+        return cls.reusable and cls.terminate is Middleware.terminate
+
     @classmethod
     def create_with_parameters(
         cls, application: Any, parameters: list[str] | None = None
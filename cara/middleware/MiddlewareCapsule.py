@@ -9,11 +9,20 @@ import contextlib
 import inspect as _inspect
 from collections.abc import Iterator
 
-from cara.exceptions import RouteMiddlewareNotFoundException
+from cara.exceptions import (
+    MiddlewareNotFoundException,
+    RouteMiddlewareNotFoundException,
+)
 from cara.middleware.Middleware import Middleware
 
 MiddlewareType = type[Middleware]
 
+# (base class, parameters) → its ParameterizedMiddleware class. The class
+# depends on nothing else, so every capsule shares it. Without this, every
+# resolution of ``throttle:60,1`` defined a brand-new class, defeating
+# per-class instance reuse.
+_parameterized_classes: dict[tuple[MiddlewareType, tuple[str, ...]], type] = {}
+
 
 class MiddlewareCapsule:
     """Middleware Capsule for managing middleware execution."""
@@ -29,6 +38,11 @@ class MiddlewareCapsule:
         # how they were registered. Unknown middleware keep registration
         # order and appear after all prioritized ones.
         self._priority: list[MiddlewareType] = []
+        # Bumped by every registration change. Each ``Route`` caches its
+        # resolved middleware chain in a ``DispatchPlan`` stamped with the
+        # revision it was built against, so a new alias, group member or
+        # priority order rebuilds the plans instead of serving stale ones.
+        self.revision = 0
 
     def __iter__(self) -> Iterator[MiddlewareType]:
         return iter(self._global_middleware)
@@ -48,12 +62,14 @@ class MiddlewareCapsule:
         """Add global middleware."""
         if middleware not in self._global_middleware:
             self._global_middleware.append(middleware)
+            self.revision += 1
         return self
 
     def create_group(self, name: str) -> MiddlewareCapsule:
         """Create a new middleware group."""
         if name not in self._route_middleware:
             self._route_middleware[name] = []
+            self.revision += 1
         return self
 
     def add_to_group(self, group: str, middleware: MiddlewareType) -> MiddlewareCapsule:
@@ -63,16 +79,19 @@ class MiddlewareCapsule:
 
         if middleware not in self._route_middleware[group]:
             self._route_middleware[group].append(middleware)
+            self.revision += 1
         return self
 
     def add_alias(self, name: str, middleware: MiddlewareType) -> MiddlewareCapsule:
         """Add middleware alias for easier reference in routes."""
         self._middleware_aliases[name] = middleware
+        self.revision += 1
         return self
 
     def register_terminable(self, middleware: MiddlewareType) -> MiddlewareCapsule:
         """Register middleware as terminable (runs after response is sent)."""
         self._terminable_middleware.add(middleware)
+        self.revision += 1
         return self
 
     def is_terminable(self, middleware: MiddlewareType) -> bool:
@@ -150,9 +169,23 @@ class MiddlewareCapsule:
     def _create_parameterized_middleware(
         self, base_middleware: MiddlewareType, parameters: list[str]
     ) -> MiddlewareType:
-        """Create a parameterized middleware class using Laravel-style parameter parsing."""
+        """Create a parameterized middleware class using Laravel-style parameter parsing.
+
+        Cached per ``(base_middleware, parameters)``, so every route naming
+        ``throttle:60,1`` shares one class (and, when the base middleware is
+        reusable, one instance).
+        """
+        key = (base_middleware, tuple(parameters))
+        cached = _parameterized_classes.get(key)
+        if cached is not None:
+            return cached
 
         class ParameterizedMiddleware:
+            @classmethod
+            def is_reusable(cls) -> bool:
+                check = getattr(base_middleware, "is_reusable", None)
+                return bool(check is not None and check())
+
             def __init__(self, application):
                 self._instance = base_middleware.create_with_parameters(
                     application, parameters
@@ -190,7 +223,7 @@ class MiddlewareCapsule:
         ParameterizedMiddleware.__qualname__ = f"{base_middleware.__qualname__}WithParams"
         # Expose base class so priority-ordering can unwrap the proxy
         ParameterizedMiddleware.__base_middleware__ = base_middleware
-        return ParameterizedMiddleware
+        return _parameterized_classes.setdefault(key, ParameterizedMiddleware)
 
     def remove(self, mw: str | MiddlewareType) -> MiddlewareCapsule:
         """Remove middleware from global list or clear a group."""
@@ -202,6 +235,7 @@ class MiddlewareCapsule:
                 self._global_middleware.remove(mw)
             if mw in self._terminable_middleware:
                 self._terminable_middleware.remove(mw)
+        self.revision += 1
         return self
 
     def get_global_middleware(self) -> list[MiddlewareType]:
@@ -216,6 +250,7 @@ class MiddlewareCapsule:
         order and appear after prioritized ones.
         """
         self._priority = list(priority)
+        self.revision += 1
         return self
 
     def get_priority(self) -> list[MiddlewareType]:
@@ -247,6 +282,32 @@ class MiddlewareCapsule:
         prioritized.sort(key=lambda m: priority_index[_base(m)])
         return prioritized + remainder
 
+    def resolve_route_middleware(
+        self, middleware: list[str | MiddlewareType]
+    ) -> list[MiddlewareType]:
+        """Resolve a route's declared middleware into its priority-sorted chain.
+
+        Aliases, groups and ``name:params`` entries are expanded in
+        declaration order, then ordered by ``sort_by_priority`` so
+        global / route conflict resolution stays in this contract. Routes
+        call this once per ``DispatchPlan``, not once per request.
+
+        Raises:
+            MiddlewareNotFoundException: An entry names no alias or group.
+        """
+        resolved_chain: list[MiddlewareType] = []
+        for mw in middleware:
+            resolved = self.resolve_middleware(mw)
+            if resolved is None:
+                raise MiddlewareNotFoundException(
+                    f"Middleware alias or group '{mw}' could not be resolved."
+                )
+            if isinstance(resolved, list):
+                resolved_chain.extend(resolved)
+            else:
+                resolved_chain.append(resolved)
+        return self.sort_by_priority(resolved_chain)
+
     def get_route_middleware(self, group: str) -> list[MiddlewareType]:
         """Get middleware for a specific route group."""
         if group in self._route_middleware:
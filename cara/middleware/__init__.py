@@ -3,11 +3,13 @@
 from cara._LazyExports import _install_lazy_exports
 
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "AdmitRequests": (".http", "AdmitRequests"),
     "AttachRequestID": (".http", "AttachRequestID"),
     "Authenticate": (".ws", "Authenticate"),
     "AuthenticateUser": (".http", "AuthenticateUser"),
     "AuthenticateUserOptional": (".http", "AuthenticateUserOptional"),
     "CORS_DEFAULTS": (".http", "CORS_DEFAULTS"),
+    "CacheResponses": (".http", "CacheResponses"),
     "CanPerform": (".http", "CanPerform"),
     "CheckMaintenanceMode": (".http", "CheckMaintenanceMode"),
     "CompressResponses": (".http", "CompressResponses"),
@@ -26,9 +28,11 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "MiddlewareProvider": (".MiddlewareProvider", "MiddlewareProvider"),
     "MiddlewareRegistry": (".MiddlewareRegistry", "MiddlewareRegistry"),
     "PersistRequestLog": (".http", "PersistRequestLog"),
+    "ProfileRequests": (".http", "ProfileRequests"),
     "RecordPrometheusMetrics": (".http", "RecordPrometheusMetrics"),
     "RecordRequestMetrics": (".http", "RecordRequestMetrics"),
     "RequestLogStore": (".http", "RequestLogStore"),
+    "RequestLogWriter": (".http", "RequestLogWriter"),
     "ResetHttpAuth": (".http", "ResetHttpAuth"),
     "ResetWebSocketAuth": (".ws", "ResetWebSocketAuth"),
     "SecurityHeaders": (".http", "SecurityHeaders"),
@@ -47,11 +51,13 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
 }
 
 __all__ = [
+    "AdmitRequests",
     "AttachRequestID",
     "Authenticate",
     "AuthenticateUser",
     "AuthenticateUserOptional",
     "CORS_DEFAULTS",
+    "CacheResponses",
     "CanPerform",
     "CheckMaintenanceMode",
     "CompressResponses",
@@ -67,9 +73,11 @@ __all__ = [
     "MiddlewareProvider",
     "MiddlewareRegistry",
     "PersistRequestLog",
+    "ProfileRequests",
     "RecordPrometheusMetrics",
     "RecordRequestMetrics",
     "RequestLogStore",
+    "RequestLogWriter",
     "ResetHttpAuth",
     "ResetWebSocketAuth",
     "SecurityHeaders",
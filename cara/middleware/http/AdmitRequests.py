@@ -0,0 +1,277 @@
+"""AdmitRequests — admission control and load shedding.
+
+Under overload every accepted request makes every other one slower: sync
+work queued behind ``ExecutionContext.run_in_thread`` and blocking cache or
+DB calls stall the loop, and latency climbs for everyone until clients time
+out on requests the worker already paid for. This middleware refuses work
+the worker cannot finish in time, before any of it is done, with ``503``
+and ``Retry-After``.
+
+Signals
+-------
+* **Event-loop lag** — how late the loop runs a timer scheduled
+  ``sample_interval`` ahead. A probe callback re-arms itself on each loop
+  the middleware sees; a probe that is overdue *now* counts as lag too.
+* **In-flight requests** — requests this worker is currently handling
+  past this middleware.
+* **Thread-pool queue depth** — work items waiting for a thread in the
+  loop's default executor, which is where ``run_in_thread`` sends them.
+
+Each signal is divided by its limit; the largest ratio is the worker's
+*pressure*. A limit of ``0`` turns that signal off.
+
+Priority classes
+----------------
+A route declares its class with ``Route.priority(...)``: ``critical``,
+``high``, ``normal`` (the default) or ``low``. A request is shed when the
+pressure reaches its class's ``shed_at`` threshold, so ``low`` routes go
+first and ``high`` routes last; ``critical`` routes are never shed. Paths
+under ``exempt_paths`` (health checks and the metrics scrape by default)
+are critical without a route lookup. Register it first in the global
+chain so shed requests cost nothing downstream.
+
+Every decision is counted in ``http_admission_total`` by priority and
+outcome; shed requests also in ``http_admission_shed_total`` by the
+signal that tripped.
+
+Configurable via ``config/server.py`` → ``ADMISSION`` dict:
+
+  - ``enabled``: master switch (default True)
+  - ``max_loop_lag``: seconds of loop lag at pressure 1.0 (default 0.5)
+  - ``max_in_flight``: in-flight requests at pressure 1.0 (default 0, off)
+  - ``max_thread_queue``: queued thread-pool items at pressure 1.0
+    (default 64)
+  - ``shed_at``: pressure at which each class is shed
+    (default ``{"low": 0.75, "normal": 1.0, "high": 1.5}``)
+  - ``retry_after``: ``Retry-After`` seconds on a shed response (default 2)
+  - ``exempt_paths``: path prefixes treated as critical
+    (default ``["/health", "/metrics"]``)
+  - ``sample_interval``: loop-lag probe period in seconds (default 0.1)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from cara.configuration import config
+from cara.http import Request, Response
+from cara.middleware.Middleware import Middleware
+from cara.observability import MetricsBase
+
+_DEFAULT_MAX_LOOP_LAG = 0.5
+_DEFAULT_MAX_THREAD_QUEUE = 64
+_DEFAULT_SHED_AT: dict[str, float] = {"low": 0.75, "normal": 1.0, "high": 1.5}
+_DEFAULT_RETRY_AFTER = 2
+_DEFAULT_EXEMPT_PATHS: tuple[str, ...] = ("/health", "/metrics")
+_DEFAULT_SAMPLE_INTERVAL = 0.1
+
+# Requests past admission and not yet answered, across the worker's loop.
+_in_flight = 0
+# One lag probe per event loop; weak so a closed loop takes its probe along.
+_probes: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopLagProbe] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _LoopLagProbe:
+    """A self re-arming timer measuring how late the loop runs it."""
+
+    __slots__ = ("_due", "_interval", "lag")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, interval: float) -> None:
+        self._interval = interval
+        self.lag = 0.0
+        self._arm(loop)
+
+    def _arm(self, loop: asyncio.AbstractEventLoop) -> None:
+        # The loop holds the probe through its timer, never the reverse, or
+        # the weak ``_probes`` entry would keep its own key alive.
+        self._due = loop.time() + self._interval
+        loop.call_at(self._due, self._tick, loop)
+
+    def _tick(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.lag = max(0.0, loop.time() - self._due)
+        MetricsBase.safe_set(MetricsBase.event_loop_lag_seconds, {}, self.lag)
+        self._arm(loop)
+
+    def current(self, loop: asyncio.AbstractEventLoop) -> float:
+        # An overdue probe means the loop is behind by at least that much
+        # right now, even before the probe gets to report it.
+        return max(self.lag, loop.time() - self._due)
+
+
+def _loop_lag(loop: asyncio.AbstractEventLoop, interval: float) -> float:
+    probe = _probes.get(loop)
+    if probe is None:
+        probe = _probes[loop] = _LoopLagProbe(loop, interval)
+    return probe.current(loop)
+
+
+def _thread_queue_depth(loop: asyncio.AbstractEventLoop) -> int:
+    executor = getattr(loop, "_default_executor", None)
+    queue = getattr(executor, "_work_queue", None)
+    return queue.qsize() if queue is not None else 0
+
+
+class AdmitRequests(Middleware):
+    """Shed requests by priority class while the worker is overloaded."""
+
+    reusable = True
+
+    def __init__(self, application):
+        super().__init__(application)
+        (
+            self._enabled,
+            self._limits,
+            self._shed_at,
+            self._retry_after,
+            self._exempt,
+            self._interval,
+        ) = self._load_config()
+
+    @staticmethod
+    def _load_config() -> tuple[
+        bool, dict[str, float], dict[str, float], int, tuple[str, ...], float
+    ]:
+        enabled = config("server.admission.enabled", True)
+        max_loop_lag = config("server.admission.max_loop_lag", _DEFAULT_MAX_LOOP_LAG)
+        max_in_flight = config("server.admission.max_in_flight", 0)
+        max_thread_queue = config(
+            "server.admission.max_thread_queue", _DEFAULT_MAX_THREAD_QUEUE
+        )
+        shed_at = config("server.admission.shed_at", None)
+        retry_after = config("server.admission.retry_after", _DEFAULT_RETRY_AFTER)
+        exempt = config("server.admission.exempt_paths", None)
+        interval = config("server.admission.sample_interval", _DEFAULT_SAMPLE_INTERVAL)
+
+        if not isinstance(enabled, bool):
+            raise TypeError("Admission enabled must be boolean")
+        if (
+            isinstance(max_loop_lag, bool)
+            or not isinstance(max_loop_lag, (int, float))
+            or max_loop_lag < 0
+        ):
+            raise ValueError("Admission max_loop_lag must be a non-negative number")
+        for name, limit in (
+            ("max_in_flight", max_in_flight),
+            ("max_thread_queue", max_thread_queue),
+        ):
+            if type(limit) is not int or limit < 0:
+                raise ValueError(f"Admission {name} must be a non-negative integer")
+        if shed_at is None:
+            shed_at = _DEFAULT_SHED_AT
+        elif not isinstance(shed_at, dict) or set(shed_at) != set(_DEFAULT_SHED_AT):
+            raise TypeError(
+                "Admission shed_at must map each of low, normal and high "
+                "to a pressure threshold"
+            )
+        if any(
+            isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0
+            for value in shed_at.values()
+        ):
+            raise ValueError("Admission shed_at thresholds must be positive numbers")
+        if type(retry_after) is not int or retry_after <= 0:
+            raise ValueError("Admission retry_after must be a positive integer")
+        if exempt is None:
+            exempt = _DEFAULT_EXEMPT_PATHS
+        elif not isinstance(exempt, (list, tuple)) or any(
+            not isinstance(prefix, str) or not prefix.startswith("/") for prefix in exempt
+        ):
+            raise TypeError("Admission exempt_paths must be a list of path prefixes")
+        if (
+            isinstance(interval, bool)
+            or not isinstance(interval, (int, float))
+            or interval <= 0
+        ):
+            raise ValueError("Admission sample_interval must be a positive number")
+
+        limits = {
+            "loop_lag": float(max_loop_lag),
+            "in_flight": float(max_in_flight),
+            "thread_queue": float(max_thread_queue),
+        }
+        return (
+            enabled,
+            {signal: limit for signal, limit in limits.items() if limit},
+            {name: float(value) for name, value in shed_at.items()},
+            retry_after,
+            tuple(exempt),
+            float(interval),
+        )
+
+    async def handle(
+        self, request: Request, next_fn: Callable[..., Awaitable[Any]]
+    ) -> Response:
+        global _in_flight
+
+        if not self._enabled:
+            return await next_fn(request)
+
+        signal, pressure = self._pressure(asyncio.get_running_loop())
+        priority = self._priority(request)
+        if priority != "critical" and pressure >= self._shed_at[priority]:
+            MetricsBase.safe_inc(
+                MetricsBase.http_admission_total,
+                {"priority": priority, "outcome": "shed"},
+            )
+            MetricsBase.safe_inc(
+                MetricsBase.http_admission_shed_total, {"signal": signal}
+            )
+            return self._shed()
+
+        MetricsBase.safe_inc(
+            MetricsBase.http_admission_total,
+            {"priority": priority, "outcome": "admitted"},
+        )
+        _in_flight += 1
+        try:
+            return await next_fn(request)
+        finally:
+            _in_flight -= 1
+
+    def _pressure(self, loop: asyncio.AbstractEventLoop) -> tuple[str, float]:
+        """The signal closest to (or furthest past) its limit, and its ratio."""
+        worst, pressure = "", 0.0
+        for signal, limit in self._limits.items():
+            if signal == "loop_lag":
+                value = _loop_lag(loop, self._interval)
+            elif signal == "in_flight":
+                value = _in_flight
+            else:
+                value = _thread_queue_depth(loop)
+                MetricsBase.safe_set(MetricsBase.thread_pool_queue_depth, {}, value)
+            ratio = value / limit
+            if ratio > pressure:
+                worst, pressure = signal, ratio
+        return worst, pressure
+
+    def _priority(self, request: Request) -> str:
+        path = request.path or "/"
+        if any(path.startswith(prefix) for prefix in self._exempt):
+            return "critical"
+        router = getattr(self.application, "router", None)
+        try:
+            route = router.find(path, request.method)
+        except Exception:
+            # Unknown paths and refused methods are answered downstream;
+            # here they are ordinary traffic.
+            return "normal"
+        priority = getattr(route, "get_priority", None)
+        return priority() if callable(priority) else "normal"
+
+    def _shed(self) -> Response:
+        response = Response(self.application)
+        # Canonical ``{error, type}`` envelope, as ``ThrottleRequests`` uses.
+        response.json(
+            {
+                "error": "Service Unavailable",
+                "type": "overloaded",
+                "retry_after": self._retry_after,
+            },
+            503,
+        )
+        response.header("Retry-After", str(self._retry_after))
+        return response
@@ -18,6 +18,8 @@ from cara.observability import set_request_tag
 
 
 class AttachRequestID(Middleware):
+    reusable = True
+
     async def handle(
         self, request: Request, next_fn: Callable[..., Awaitable[Any]]
     ) -> Response:
@@ -0,0 +1,410 @@
+"""CacheResponses — opt-in full-response cache for safe GETs.
+
+Catalog-style endpoints answer the same anonymous GET thousands of times
+between two writes, and every hit re-runs the controller, the ORM and the
+serialization. This middleware stores the finished response — status,
+headers and body — through the ``Cache`` manager and replays it for the
+next identical request without reaching the handler.
+
+Design
+------
+* **Opt-in, per route.** A named middleware with two optional
+  parameters, a TTL and ``|``-separated tags::
+
+      registry.alias("cache.response", CacheResponses)
+      Route.get("/products", ...).middleware(["cache.response:300,products|brands"])
+
+  Attach it *after* authentication so the identity is known.
+* **Keyed on what varies.** The key covers the path, the normalised query
+  string, the configured ``vary`` request headers, the authenticated
+  user id and the locale (the primary ``Accept-Language`` tag). A request
+  carrying ``Authorization`` that no guard resolved is never cached — its
+  identity is unknown, so it may see neither a shared copy nor store one.
+* **The handler has the last word.** ``Cache-Control: no-store``,
+  ``private`` or ``no-cache`` keeps a response out of the cache;
+  ``s-maxage`` (else ``max-age``) overrides the TTL and
+  ``stale-while-revalidate`` the stale window. Only ``200`` responses with
+  a concrete body and no ``Set-Cookie`` are stored, and only when every
+  header in their ``Vary`` is one the key covers (a configured ``vary``
+  header, or ``Accept-Encoding`` on an unencoded body, which the outer
+  compression negotiates per request); ``Vary: *`` never is.
+* **Tags purge through ``CacheTaggedStore``.** Each stored entry writes one
+  marker per tag under ``Cache.tags(tag)``; an entry whose marker is gone
+  is a miss. A model event purges every response carrying a tag with::
+
+      class Product(Model):
+          @saved
+          def purge_catalog(self):
+              CacheResponses.purge("products")
+
+* **Stale-while-revalidate.** Past its TTL an entry is still served for
+  the stale window while one background refresh runs the rest of the
+  pipeline again and re-stores it. An owner-fenced ``CacheLock`` makes
+  that one refresh per key across every worker; the others keep serving
+  the stale copy. The refresh runs after the triggering response was sent,
+  in a fresh ``Container.scope()``, so scoped bindings and vars start anew
+  instead of reaching into the finished request's state. That scope holds
+  no identity, so a per-user entry is never refreshed in the background:
+  past its TTL the handler runs inline, as on a miss.
+* **Never breaks a response.** A cache outage or an unreadable entry falls
+  through to the handler with a debug log, mirroring
+  :class:`ConditionalGet`.
+
+Replayed responses carry ``X-Cache`` (``HIT`` or ``STALE``) and ``Age``;
+a handler response the middleware stored carries ``X-Cache: MISS``.
+
+Configurable via ``config/cache.py`` → ``RESPONSE`` dict:
+
+  - ``enabled``: master switch (default True)
+  - ``ttl``: fresh seconds when neither the route nor the handler says
+    (default 60)
+  - ``stale_while_revalidate``: stale seconds (default 0, off)
+  - ``vary``: request headers that split the key (default ``["Accept"]``)
+  - ``driver``: cache driver name (default: the default driver)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+from cara.configuration import config
+from cara.facades import Cache, Log
+from cara.http import Request, Response
+from cara.middleware.Middleware import Middleware
+from cara.support import optional_user_id
+
+_DEFAULT_TTL = 60
+_DEFAULT_VARY: tuple[str, ...] = ("Accept",)
+# Long enough for one slow refresh; a crashed refresher frees the key.
+_REFRESH_LOCK_SECONDS = 30
+_KEY_PREFIX = "response"
+# Headers that describe one exchange, not the representation. A replayed
+# copy must not repeat them; the outer pipeline sets its own.
+_UNSTORED_HEADERS: frozenset[str] = frozenset(
+    {
+        "age",
+        "content-length",
+        "date",
+        "server-timing",
+        "set-cookie",
+        "transfer-encoding",
+        "x-cache",
+        "x-request-id",
+    }
+)
+_UNCACHEABLE_DIRECTIVES: frozenset[str] = frozenset({"no-store", "private", "no-cache"})
+
+# Background refreshes, referenced until done so the loop cannot drop them.
+_refreshing: set[asyncio.Task] = set()
+
+
+class CacheResponses(Middleware):
+    """Replay stored GET responses, revalidating stale ones in the background."""
+
+    reusable = True
+
+    def __init__(self, application, ttl=None, tags=None):
+        """``ttl`` and ``tags`` arrive as raw route-middleware strings.
+
+        Left unannotated for the same reason as :class:`ThrottleRequests`:
+        ``MiddlewareParameterParser`` coerces by annotation.
+        """
+        super().__init__(application)
+        self._enabled, self._default_ttl, self._stale, self._vary, self._driver = (
+            self._load_config()
+        )
+        self._ttl = self._parse_ttl(ttl)
+        self._tags = self._parse_tags(tags)
+
+    @staticmethod
+    def _load_config() -> tuple[bool, int, int, tuple[str, ...], str | None]:
+        enabled = config("cache.response.enabled", True)
+        ttl = config("cache.response.ttl", _DEFAULT_TTL)
+        stale = config("cache.response.stale_while_revalidate", 0)
+        vary = config("cache.response.vary", None)
+        driver = config("cache.response.driver", None)
+
+        if not isinstance(enabled, bool):
+            raise TypeError("Response cache enabled must be boolean")
+        if type(ttl) is not int or ttl <= 0:
+            raise ValueError("Response cache ttl must be a positive integer")
+        if type(stale) is not int or stale < 0:
+            raise ValueError(
+                "Response cache stale_while_revalidate must be a non-negative integer"
+            )
+        if vary is None:
+            vary = _DEFAULT_VARY
+        elif not isinstance(vary, (list, tuple)) or any(
+            not isinstance(name, str) or not name.strip() for name in vary
+        ):
+            raise TypeError("Response cache vary must be a list of header names")
+        if driver is not None and (not isinstance(driver, str) or not driver):
+            raise TypeError("Response cache driver must be a driver name")
+        vary = tuple(sorted({name.strip().lower() for name in vary}))
+        return enabled, ttl, stale, vary, driver
+
+    @staticmethod
+    def _parse_ttl(raw: Any) -> int | None:
+        if raw is None or raw == "":
+            return None
+        try:
+            ttl = int(raw)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"cache.response ttl must be an integer, got {raw!r}") from e
+        if ttl <= 0:
+            raise ValueError("cache.response ttl must be positive")
+        return ttl
+
+    @staticmethod
+    def _parse_tags(raw: Any) -> tuple[str, ...]:
+        if raw is None:
+            return ()
+        if isinstance(raw, str):
+            raw = raw.split("|")
+        return tuple(dict.fromkeys(tag.strip() for tag in raw if tag and tag.strip()))
+
+    # ── Pipeline ─────────────────────────────────────────────────────
+
+    async def handle(
+        self, request: Request, next_fn: Callable[..., Awaitable[Any]]
+    ) -> Response:
+        target = self._key_for(request) if self._enabled else None
+        if target is None:
+            return await next_fn(request)
+        key, personal = target
+
+        entry = self._read(key)
+        if entry is not None:
+            age = time.time() - entry["stored_at"]
+            if age < entry["fresh"]:
+                return self._replay(entry, age, "HIT")
+            if not personal and age < entry["fresh"] + entry["stale"]:
+                self._revalidate(key, request, next_fn)
+                return self._replay(entry, age, "STALE")
+
+        response = await next_fn(request)
+        try:
+            if self._store(key, response):
+                response.header("X-Cache", "MISS")
+        except Exception as e:
+            self._log_debug(f"CacheResponses: store failed ({e.__class__.__name__}: {e})")
+        return response
+
+    @classmethod
+    def purge(cls, *tags: str, driver_name: str | None = None) -> int:
+        """Drop every stored response carrying any of ``tags``.
+
+        Returns the number of tag markers removed.
+        """
+        if driver_name is None:
+            driver_name = config("cache.response.driver", None)
+        return sum(
+            int(Cache.tags(tag, driver_name=driver_name).flush() or 0) for tag in tags
+        )
+
+    # ── Key ──────────────────────────────────────────────────────────
+
+    def _key_for(self, request: Request) -> tuple[str, bool] | None:
+        """``(key, personal)`` for ``request``, or ``None`` when it must bypass.
+
+        ``personal`` is true when the key holds the authenticated user id.
+        """
+        if request.method != "GET":
+            return None
+        user_id = optional_user_id(request)
+        if user_id is None and request.header("Authorization"):
+            return None
+        query = urlencode(
+            sorted(parse_qsl(request.scope.get("query_string", b"").decode("latin-1")))
+        )
+        parts = [
+            request.path,
+            query,
+            str(user_id) if user_id is not None else "",
+            self._locale(request),
+            *(request.header(name) or "" for name in self._vary),
+        ]
+        digest = hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+        return f"{_KEY_PREFIX}:{digest}", user_id is not None
+
+    @staticmethod
+    def _locale(request: Request) -> str:
+        """Primary ``Accept-Language`` tag, weights ignored (``tr-TR,en;q=0.8`` → ``tr-tr``)."""
+        header = request.header("Accept-Language") or ""
+        return header.split(",", 1)[0].split(";", 1)[0].strip().lower()
+
+    # ── Storage ──────────────────────────────────────────────────────
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        try:
+            entry = Cache.get(key, None, self._driver, strict=False)
+            if not isinstance(entry, dict):
+                return None
+            for tag in entry["tags"]:
+                marker = Cache.tags(tag, driver_name=self._driver).get(
+                    key, None, strict=False
+                )
+                if marker is None:
+                    # Purged since it was stored.
+                    return None
+            return entry
+        except Exception as e:
+            self._log_debug(f"CacheResponses: read failed ({e.__class__.__name__}: {e})")
+            return None
+
+    def _store(self, key: str, response: Any) -> bool:
+        """Store ``response`` under ``key``; whether it was cacheable."""
+        lifetimes = self._lifetimes(response)
+        if lifetimes is None:
+            return False
+        fresh, stale = lifetimes
+        body = self._response_bytes(response)
+        if body is None:
+            return False
+        headers = [
+            [name, value]
+            for name, value in response.headers.all().items()
+            if name.lower() not in _UNSTORED_HEADERS
+        ]
+        entry = {
+            "status": response.get_status_code(),
+            "headers": headers,
+            "body": body,
+            "stored_at": time.time(),
+            "fresh": fresh,
+            "stale": stale,
+            "tags": list(self._tags),
+        }
+        ttl = fresh + stale
+        Cache.put(key, entry, ttl, self._driver, strict=False)
+        for tag in self._tags:
+            Cache.tags(tag, driver_name=self._driver).put(key, 1, ttl, strict=False)
+        return True
+
+    def _lifetimes(self, response: Any) -> tuple[int, int] | None:
+        """``(fresh, stale)`` seconds for ``response``, or ``None`` to skip it."""
+        if response.get_status_code() != 200:
+            return None
+        headers = response.headers
+        if headers.has("Set-Cookie") or not self._varies_within_key(headers):
+            return None
+        fresh = self._ttl or self._default_ttl
+        stale = self._stale
+        directives = self._cache_control(headers.get("Cache-Control") or "")
+        if _UNCACHEABLE_DIRECTIVES & directives.keys():
+            return None
+        max_age = directives.get("s-maxage", directives.get("max-age"))
+        if max_age is not None:
+            fresh = max_age
+        if directives.get("stale-while-revalidate") is not None:
+            stale = directives["stale-while-revalidate"]
+        if fresh <= 0:
+            return None
+        return fresh, stale
+
+    def _varies_within_key(self, headers: Any) -> bool:
+        """Whether every header the response ``Vary``-s on splits the key.
+
+        Anything else (``Authorization``, ``Accept-Language``, a tenant
+        header, ``*``) would let one variant's body answer the others.
+        """
+        covered = set(self._vary)
+        if not headers.get("Content-Encoding"):
+            covered.add("accept-encoding")
+        names = (name.strip().lower() for name in (headers.get("Vary") or "").split(","))
+        return all(name in covered for name in names if name)
+
+    @staticmethod
+    def _cache_control(value: str) -> dict[str, int | None]:
+        """Directive → seconds (``None`` for flags and unparseable values)."""
+        directives: dict[str, int | None] = {}
+        for part in value.split(","):
+            name, _, raw = part.strip().partition("=")
+            if not name:
+                continue
+            try:
+                seconds = int(raw.strip().strip('"')) if raw else None
+            except ValueError:
+                seconds = None
+            directives[name.lower()] = seconds
+        return directives
+
+    @staticmethod
+    def _response_bytes(response: Any) -> bytes | None:
+        """The concrete byte body; ``None`` for streaming, file and absent bodies."""
+        deferred = getattr(response, "has_deferred_body", None)
+        if callable(deferred) and deferred():
+            return None
+        content = getattr(response, "content", None)
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, str):
+            return content.encode("utf-8")
+        return None
+
+    # ── Replay / revalidation ────────────────────────────────────────
+
+    def _replay(self, entry: dict[str, Any], age: float, state: str) -> Response:
+        response = Response(self.application)
+        response.set_content(entry["body"])
+        response.status(entry["status"])
+        for name, value in entry["headers"]:
+            response.header(name, value)
+        response.header("Age", str(max(0, int(age))))
+        response.header("X-Cache", state)
+        return response
+
+    def _revalidate(
+        self,
+        key: str,
+        request: Request,
+        next_fn: Callable[..., Awaitable[Any]],
+    ) -> None:
+        """Start the one background refresh for ``key`` unless one is running."""
+        try:
+            lock = Cache.lock(
+                f"{key}:refresh", _REFRESH_LOCK_SECONDS, driver_name=self._driver
+            )
+            if not lock.acquire():
+                return
+        except Exception as e:
+            self._log_debug(
+                f"CacheResponses: refresh lock failed ({e.__class__.__name__}: {e})"
+            )
+            return
+        task = asyncio.create_task(self._refresh(key, request, next_fn, lock))
+        _refreshing.add(task)
+        task.add_done_callback(_refreshing.discard)
+
+    async def _refresh(
+        self,
+        key: str,
+        request: Request,
+        next_fn: Callable[..., Awaitable[Any]],
+        lock: Any,
+    ) -> None:
+        try:
+            # The task inherited the request's context; give the replayed
+            # pipeline its own scope rather than the finished request's.
+            with self.application.scope():
+                self._store(key, await next_fn(request))
+        except Exception as e:
+            self._log_debug(
+                f"CacheResponses: refresh failed ({e.__class__.__name__}: {e})"
+            )
+        finally:
+            try:
+                lock.release()
+            except Exception as e:
+                self._log_debug(
+                    f"CacheResponses: refresh unlock failed ({e.__class__.__name__}: {e})"
+                )
+
+    @staticmethod
+    def _log_debug(msg: str) -> None:
+        Log.debug(msg, category="cara.http.response_cache")
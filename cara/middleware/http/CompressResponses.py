@@ -1,7 +1,7 @@
-"""CompressResponses — opt-in gzip middleware for HTTP responses.
+"""CompressResponses — opt-in zstd / brotli / gzip middleware for HTTP responses.
 
 Most prod deployments terminate compression at the edge (nginx, ALB,
-Cloudfront) so the application server never gzips itself. This
+Cloudfront) so the application server never compresses itself. This
 middleware is the origin-side fallback for the cases where that
 isn't true:
 
@@ -11,38 +11,66 @@ isn't true:
 
 Behaviour:
 
-  - Only compresses when the client sent ``Accept-Encoding: gzip``.
+  - Negotiates the coding from ``Accept-Encoding`` with its quality
+    weights: the highest-weighted coding wins, ties go to the server
+    preference (``zstd``, ``br``, ``gzip`` — whichever are importable;
+    see ``_ContentCodings``). ``q=0`` refuses a coding, ``*`` covers the
+    ones the client did not name.
   - Only compresses when the response is large enough to benefit
     (``min_size``, default 1 KB). Tiny JSON envelopes don't compress
-    well — the gzip header overhead can leave them BIGGER.
+    well — the container overhead can leave them BIGGER.
   - Only compresses compressible content types (text/*, application/
     json, javascript). Refuses to touch already-compressed payloads
-    (images, gzip, brotli, video, audio) — re-gzipping a JPEG wastes
+    (images, gzip, brotli, video, audio) — re-compressing a JPEG wastes
     CPU and grows the byte count.
   - Skips when ``Content-Encoding`` is already set (an upstream
-    middleware already compressed) or when the response is a
-    streaming/SSE body.
+    middleware already compressed, or a precompressed static file).
+  - Streaming bodies (``Response.stream`` and the JSON-lines / SSE
+    helpers built on it) are compressed chunk by chunk as they are
+    sent, never buffered. Server-sent events are flushed after every
+    event so the client still sees each one immediately; other streams
+    are flushed at least every ``_STREAM_FLUSH_BYTES`` of input.
+  - Buffered bodies of ``offload_size`` bytes or more are compressed in
+    a worker thread so a multi-megabyte JSON list does not stall every
+    other request on the event loop.
   - Sets ``Vary: Accept-Encoding`` so shared caches keyed on the URL
-    don't serve gzip bytes to clients that didn't ask for them.
+    don't serve compressed bytes to clients that didn't ask for them.
+  - Records the compression ratio, CPU seconds and bytes in/out per
+    coding on ``MetricsBase``.
 
 Configurable via ``config/compression.py`` → ``COMPRESSION`` dict:
 
   - ``enabled``: master switch (default True)
   - ``min_size``: bytes (default 1024)
-  - ``level``: 1-9 (default 6 — same as nginx's ``gzip_comp_level``)
+  - ``level``: gzip level 1-9 (default 6 — same as nginx's
+    ``gzip_comp_level``)
   - ``content_types``: list of prefixes that ARE compressible
+  - ``encodings``: server preference order (default
+    ``["zstd", "br", "gzip"]``); unavailable codings are dropped
+  - ``offload_size``: bytes from which buffered bodies are compressed
+    off the event loop (default 64 KiB)
 """
 
 from __future__ import annotations
 
-import gzip
-from collections.abc import Awaitable, Callable, Iterable
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
 from typing import Any
 
 from cara.configuration import config
 from cara.facades import Log
 from cara.http import Request, Response
 from cara.middleware.Middleware import Middleware
+from cara.observability import MetricsBase
+
+from ._ContentCodings import (
+    _DEFAULT_PREFERENCE,
+    _compress_whole,
+    _encoder_factories,
+    _negotiate,
+)
 
 # Default compressible MIME prefixes. Match conservatively: anything
 # already compressed (image/*, video/*, audio/*, application/zip,
@@ -66,15 +94,25 @@ _DEFAULT_COMPRESSIBLE_PREFIXES: tuple[str, ...] = (
 
 _DEFAULT_MIN_SIZE = 1024  # 1 KB — below this gzip overhead dominates.
 _DEFAULT_LEVEL = 6  # nginx's gzip_comp_level default.
+# Compressing 64 KiB of JSON costs roughly a millisecond of CPU; from there
+# on the loop stall outweighs the thread hand-off.
+_DEFAULT_OFFLOAD_SIZE = 64 * 1024
+# Streams that are not SSE are flushed at least this often, so a slow
+# export still makes visible progress without a sync flush per chunk.
+_STREAM_FLUSH_BYTES = 64 * 1024
+# Streams whose every chunk is an event the client is waiting on.
+_FLUSH_EVERY_CHUNK_TYPES: tuple[str, ...] = ("text/event-stream",)
 
 
 class CompressResponses(Middleware):
-    """Gzip-compress eligible responses based on Accept-Encoding."""
+    """Compress eligible responses with the coding negotiated from Accept-Encoding."""
 
     def __init__(self, application, parameters=None):
         super().__init__(application)
         self.parameters = parameters or []
         self._enabled, self._min_size, self._level, self._prefixes = self._load_config()
+        self._encodings, self._offload_size = self._load_codec_config()
+        self._factories = _encoder_factories()
 
     @staticmethod
     def _load_config() -> tuple[bool, int, int, tuple[str, ...]]:
@@ -108,6 +146,34 @@ class CompressResponses(Middleware):
             prefixes = tuple(value.strip().lower() for value in configured_types)
         return enabled, min_size, level, prefixes
 
+    @staticmethod
+    def _load_codec_config() -> tuple[tuple[str, ...], int]:
+        configured = config("compression.compression.encodings", None)
+        offload_size = config(
+            "compression.compression.offload_size", _DEFAULT_OFFLOAD_SIZE
+        )
+
+        if type(offload_size) is not int or offload_size < 0:
+            raise ValueError(
+                "Response compression offload_size must be a non-negative integer"
+            )
+        if configured is None:
+            preference = _DEFAULT_PREFERENCE
+        else:
+            if not isinstance(configured, (list, tuple)) or not configured:
+                raise TypeError("Response compression encodings must be a non-empty list")
+            preference = tuple(
+                value.strip().lower() for value in configured if isinstance(value, str)
+            )
+            unknown = set(preference) - set(_DEFAULT_PREFERENCE)
+            if len(preference) != len(configured) or unknown:
+                raise ValueError(
+                    "Response compression encodings must be drawn from "
+                    f"{', '.join(_DEFAULT_PREFERENCE)}"
+                )
+        available = _encoder_factories()
+        return tuple(c for c in preference if c in available), offload_size
+
     async def handle(
         self, request: Request, next_fn: Callable[..., Awaitable[Any]]
     ) -> Response:
@@ -117,23 +183,30 @@ class CompressResponses(Middleware):
             return response
 
         try:
-            if not self._accepts_gzip(request):
+            coding = self._negotiate_coding(request)
+            if coding is None:
                 return response
             if self._already_encoded(response):
                 return response
             content_type = self._response_content_type(response)
             if not self._is_compressible_type(content_type):
                 return response
+            if self._compress_stream(response, coding, content_type):
+                return response
             body = self._response_bytes(response)
             if body is None or len(body) < self._min_size:
                 return response
 
-            compressed = gzip.compress(body, compresslevel=self._level)
-            # Defensive: if gzip somehow grew the payload (very short or
-            # incompressible content that slipped past the type filter),
+            if len(body) >= self._offload_size:
+                compressed, cpu = await asyncio.to_thread(self._compress, coding, body)
+            else:
+                compressed, cpu = self._compress(coding, body)
+            self._record(coding, "buffered", len(body), len(compressed), cpu)
+            # Defensive: if compression somehow grew the payload (very short
+            # or incompressible content that slipped past the type filter),
             # send the original. Re-checking here keeps a malformed
             # client + small payload from going on the wire as a
-            # larger gzip blob.
+            # larger compressed blob.
             if len(compressed) >= len(body):
                 return response
 
@@ -142,7 +215,7 @@ class CompressResponses(Middleware):
             # the original bytes intact instead of returning compressed bytes
             # without a correct cache key.
             self._append_vary(response, "Accept-Encoding")
-            response.header("Content-Encoding", "gzip")
+            response.header("Content-Encoding", coding)
             response.header("Content-Length", str(len(compressed)))
             response.content = compressed
         except Exception as e:
@@ -150,30 +223,106 @@ class CompressResponses(Middleware):
             # through with the original bytes. Log at debug so a
             # systematic issue is visible during incident review.
             self._log_debug(
-                f"CompressResponses: gzip failed ({e.__class__.__name__}: {e})"
+                f"CompressResponses: compression failed ({e.__class__.__name__}: {e})"
             )
 
         return response
 
     # ── Helpers ──────────────────────────────────────────────────────
 
-    @staticmethod
-    def _accepts_gzip(request: Request) -> bool:
+    def _negotiate_coding(self, request: Request) -> str | None:
         try:
             raw = request.header("Accept-Encoding")
         except Exception:
             raw = None
         if not raw or not isinstance(raw, str):
+            return None
+        return _negotiate(raw, self._encodings)
+
+    def _compress(self, coding: str, body: bytes) -> tuple[bytes, float]:
+        """Compress a whole body; returns the bytes and the CPU seconds spent.
+
+        ``thread_time`` is per thread, so the figure is right whether this
+        runs on the loop or in the ``to_thread`` worker.
+        """
+        started = time.thread_time()
+        compressed = _compress_whole(self._factories[coding](self._level), body)
+        return compressed, time.thread_time() - started
+
+    def _compress_stream(self, response: Any, coding: str, content_type: str) -> bool:
+        """Wrap a ``Response.stream`` body in an incremental encoder.
+
+        Returns False when the response is not a stream. Nothing is read
+        here: the wrapper runs when the conductor sends the response.
+        """
+        map_stream = getattr(response, "map_stream", None)
+        if map_stream is None:
+            return False
+        flush_every_chunk = content_type.startswith(_FLUSH_EVERY_CHUNK_TYPES)
+        if not map_stream(
+            lambda source: self._compressed_chunks(source, coding, flush_every_chunk)
+        ):
             return False
-        # Token match — ``Accept-Encoding`` values can include weights
-        # (``gzip;q=0``). Refuse to compress when the client explicitly
-        # weights gzip at zero.
-        for token in raw.split(","):
-            tok = token.strip().lower()
-            if not tok.startswith("gzip"):
-                continue
-            return not (";q=0" in tok and ";q=0." not in tok)
-        return False
+        self._append_vary(response, "Accept-Encoding")
+        response.header("Content-Encoding", coding)
+        response.headers.remove("Content-Length")
+        return True
+
+    async def _compressed_chunks(
+        self, source: AsyncGenerator[bytes], coding: str, flush_every_chunk: bool
+    ) -> AsyncGenerator[bytes]:
+        encoder = self._factories[coding](self._level)
+        total_in = total_out = unflushed = 0
+        cpu = 0.0
+        async with contextlib.aclosing(source):
+            try:
+                async for chunk in source:
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode("utf-8")
+                    if not chunk:
+                        continue
+                    started = time.thread_time()
+                    out = encoder.compress(chunk)
+                    unflushed += len(chunk)
+                    if flush_every_chunk or unflushed >= _STREAM_FLUSH_BYTES:
+                        out += encoder.flush()
+                        unflushed = 0
+                    cpu += time.thread_time() - started
+                    total_in += len(chunk)
+                    total_out += len(out)
+                    if out:
+                        yield out
+                started = time.thread_time()
+                tail = encoder.finish()
+                cpu += time.thread_time() - started
+                total_out += len(tail)
+                if tail:
+                    yield tail
+            finally:
+                self._record(coding, "stream", total_in, total_out, cpu)
+
+    @staticmethod
+    def _record(coding: str, mode: str, size_in: int, size_out: int, cpu: float) -> None:
+        labels = {"encoding": coding}
+        if size_in:
+            MetricsBase.safe_observe(
+                MetricsBase.http_compression_ratio, labels, size_out / size_in
+            )
+        MetricsBase.safe_inc(
+            MetricsBase.http_compression_cpu_seconds_total,
+            {"encoding": coding, "mode": mode},
+            cpu,
+        )
+        MetricsBase.safe_inc(
+            MetricsBase.http_compression_bytes_total,
+            {"encoding": coding, "direction": "in"},
+            size_in,
+        )
+        MetricsBase.safe_inc(
+            MetricsBase.http_compression_bytes_total,
+            {"encoding": coding, "direction": "out"},
+            size_out,
+        )
 
     @staticmethod
     def _already_encoded(response: Any) -> bool:
@@ -224,9 +373,9 @@ class CompressResponses(Middleware):
                 return content.encode("utf-8")
             if content is None:
                 return None
-            # Streaming / generator bodies — refuse. Compressing a
-            # streaming response would buffer the whole payload, which
-            # defeats the streaming and risks OOM on large feeds.
+            # Generator bodies — refuse. Buffering them to compress would
+            # defeat the streaming and risk OOM on large feeds;
+            # ``Response.stream`` bodies go through ``_compress_stream``.
             if isinstance(content, (Iterable,)) and not isinstance(content, (bytes, str)):
                 return None
         except AttributeError, TypeError, RuntimeError:
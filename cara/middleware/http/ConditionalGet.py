@@ -30,8 +30,23 @@ Design
   error body with an ETag is meaningless.
 * **Does not fight cache-control.** The middleware only ever sets
   ``ETag`` (and, on a 304, prunes the body/length headers). It never
-  writes ``Cache-Control`` / ``Expires`` / ``Vary`` — those stay owned
-  by the controller's ``apply_*_cache`` helpers / :class:`HeaderManager`.
+  decides ``Cache-Control`` / ``Expires`` / ``Vary`` — those stay owned
+  by the controller's ``apply_*_cache`` helpers / :class:`HeaderManager`;
+  an early 304 only repeats what the handler set on its 200.
+* **Declared validators skip the handler.** A route declared with
+  ``Route.conditional(fn)`` or a handler decorated ``@conditional(fn)``
+  supplies a cheap validator — a version counter, a ``VersionedCache``
+  stamp, the max ``updated_at`` — that is evaluated *before* dispatch.
+  A matching ``If-None-Match`` (or, absent one, ``If-Modified-Since``
+  against a ``datetime`` validator) is answered with a 304 straight
+  away, so the handler's queries and serialization never run. Hashing
+  the serialized body remains the fallback for routes that declare
+  nothing. RFC 9110 §15.4.5 wants a 304 to carry the ``Cache-Control``,
+  ``Vary`` and ``Expires`` a 200 would, so those are remembered per
+  route and tag from the handler's 200; a tag not yet seen is
+  dispatched and the 304 built from its response. Attach the
+  middleware *after* authentication so a 304 is only ever given to a
+  caller who may see the resource.
 * **Never breaks a response.** Any failure while hashing or comparing
   falls through with the original response and a debug log, mirroring
   :class:`CompressResponses` / :class:`SecurityHeaders`.
@@ -41,7 +56,12 @@ from __future__ import annotations
 
 import contextlib
 import hashlib
+import inspect
+import weakref
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable, Iterable
+from datetime import UTC, datetime
+from email.utils import formatdate, parsedate_to_datetime
 from typing import Any
 
 from cara.facades import Log
@@ -53,6 +73,16 @@ from cara.middleware.Middleware import Middleware
 # meaningful — a HEAD with a matching If-None-Match collapses to 304.
 _SAFE_METHODS: frozenset[str] = frozenset({"GET", "HEAD"})
 
+# Headers a 304 must repeat from the 200 it stands for (RFC 9110 §15.4.5).
+_CACHE_HEADERS: tuple[str, ...] = ("Cache-Control", "Vary", "Expires")
+
+# Per route, the cache headers of the last 200 served under each declared
+# tag — bounded, since user-specific validators mint a tag per user.
+_MAX_REMEMBERED_TAGS = 256
+_served_headers: weakref.WeakKeyDictionary[Any, OrderedDict[str, dict[str, str]]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class ConditionalGet(Middleware):
     """Emit weak ETags and answer ``If-None-Match`` with ``304``."""
@@ -60,6 +90,21 @@ class ConditionalGet(Middleware):
     async def handle(
         self, request: Request, next_fn: Callable[..., Awaitable[Any]]
     ) -> Response:
+        declared = await self._declared_validators(request)
+        if declared is not None:
+            etag, last_modified = declared
+            cache_headers = self._served_cache_headers(request, etag)
+            if cache_headers is not None and self._is_not_modified(
+                request, etag, last_modified
+            ):
+                response = Response(self.application)
+                for name, value in cache_headers.items():
+                    response.header(name, value)
+                if last_modified is not None:
+                    response.header("Last-Modified", last_modified)
+                self._make_not_modified(response, etag)
+                return response
+
         response = await next_fn(request)
 
         try:
@@ -68,6 +113,17 @@ class ConditionalGet(Middleware):
             if not self._is_2xx(response):
                 return response
 
+            if declared is not None:
+                # The declared validator stands for the body; no hashing.
+                etag, last_modified = declared
+                response.header("ETag", etag)
+                if last_modified is not None:
+                    response.header("Last-Modified", last_modified)
+                self._remember_cache_headers(request, etag, response)
+                if self._is_not_modified(request, etag, last_modified):
+                    self._make_not_modified(response, etag)
+                return response
+
             body = self._response_bytes(response)
             if body is None:
                 # Streaming / generator / absent body — nothing stable to
@@ -89,6 +145,98 @@ class ConditionalGet(Middleware):
 
         return response
 
+    # ── Declared validators ──────────────────────────────────────────
+
+    async def _declared_validators(
+        self, request: Request
+    ) -> tuple[str, str | None] | None:
+        """``(etag, last_modified)`` from the route's declared validator.
+
+        ``None`` when the request is not a safe method, the route declares
+        nothing, the validator returns ``None`` or it fails — in every such
+        case the request proceeds to the handler as usual.
+        """
+        try:
+            if not self._is_safe_method(request):
+                return None
+            get_conditional = getattr(
+                getattr(request, "route", None), "get_conditional", None
+            )
+            if not callable(get_conditional):
+                return None
+            validator = get_conditional()
+            if validator is None:
+                return None
+            value = validator(request)
+            if inspect.isawaitable(value):
+                value = await value
+            if value is None:
+                return None
+            if isinstance(value, datetime):
+                if value.tzinfo is None:
+                    value = value.replace(tzinfo=UTC)
+                timestamp = value.timestamp()
+                etag = self._compute_weak_etag(f"{timestamp:.6f}".encode())
+                return etag, formatdate(timestamp, usegmt=True)
+            if not isinstance(value, bytes):
+                value = str(value).encode("utf-8")
+            return self._compute_weak_etag(value), None
+        except Exception as e:
+            self._log_debug(
+                f"ConditionalGet: validator failed ({e.__class__.__name__}: {e})"
+            )
+            return None
+
+    @staticmethod
+    def _served_cache_headers(request: Request, etag: str) -> dict[str, str] | None:
+        """Cache headers of the 200 last served under ``etag``, if any.
+
+        A route object that cannot be weakly referenced never remembers
+        anything, so its 304s always come from the dispatched response.
+        """
+        try:
+            served = _served_headers.get(getattr(request, "route", None))
+        except TypeError:
+            return None
+        return None if served is None else served.get(etag)
+
+    @staticmethod
+    def _remember_cache_headers(request: Request, etag: str, response: Any) -> None:
+        """Record the 200's cache headers so an early 304 can repeat them."""
+        try:
+            served = _served_headers.setdefault(
+                getattr(request, "route", None), OrderedDict()
+            )
+        except TypeError:
+            return
+        served[etag] = {
+            name: value
+            for name in _CACHE_HEADERS
+            if isinstance(value := response.header(name), str)
+        }
+        served.move_to_end(etag)
+        while len(served) > _MAX_REMEMBERED_TAGS:
+            served.popitem(last=False)
+
+    @classmethod
+    def _is_not_modified(
+        cls, request: Request, etag: str, last_modified: str | None
+    ) -> bool:
+        """RFC 9110 §13.2.2: ``If-None-Match`` wins; ``If-Modified-Since`` otherwise."""
+        inm = cls._request_header(request, "If-None-Match")
+        if inm:
+            return cls._if_none_match_matches(inm, etag)
+        ims = cls._request_header(request, "If-Modified-Since")
+        if not ims or last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(ims)
+        except TypeError, ValueError, IndexError:
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        return parsedate_to_datetime(last_modified) <= since
+
     # ── Method / status gates ────────────────────────────────────────
 
     @staticmethod
@@ -123,6 +271,11 @@ class ConditionalGet(Middleware):
         ``None`` so the caller skips ETag emission entirely.
         """
         try:
+            # A deferred stream or file body leaves ``content`` empty; its
+            # hash would be the same for every response.
+            deferred = getattr(response, "has_deferred_body", None)
+            if callable(deferred) and deferred():
+                return None
             content = getattr(response, "content", None)
             if isinstance(content, bytes):
                 return content
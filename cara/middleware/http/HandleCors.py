@@ -39,6 +39,8 @@ class HandleCors(Middleware):
     Handles OPTIONS preflight requests automatically.
     """
 
+    reusable = True
+
     def __init__(self, application, parameters=None):
         """
         Initialize CORS middleware.
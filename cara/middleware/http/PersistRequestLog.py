@@ -4,8 +4,12 @@ Persist Request Log Middleware
 Writes one durable row per served request through the application's
 :class:`RequestLogStore` binding. Sits at the *end* of the middleware chain
 so status and duration reflect the final response (including downstream
-middleware mutations). Every write goes through a fire-and-forget thread —
-a slow log INSERT must never extend the user-visible latency of a request.
+middleware mutations). A request only appends its row to the application's
+:class:`RequestLogWriter`, which writes whole batches through
+:meth:`RequestLogStore.insert_many` on one background thread hop — a slow log
+INSERT must never extend the user-visible latency of a request, and a busy
+service should not pay a thread hop and a round-trip per row either. The
+writer is drained on lifespan shutdown.
 
 Probe endpoints are skipped so the log does not fill with orchestrator noise.
 The framework default is ``("/health", "/metrics")``; an application widens it
@@ -26,7 +30,8 @@ Row shape handed to the store::
 Anything beyond that is application schema: override :meth:`extra_columns`
 to stamp additional columns onto the row.
 
-Configuration (all read at call time, never snapshotted at import):
+Configuration (read once when the middleware is built at boot; a change
+needs a restart):
 
 ``logging.persist_http_requests``
     Kill switch. Default ``True``.
@@ -37,22 +42,30 @@ Configuration (all read at call time, never snapshotted at import):
     the sweep instead of truncating the log.
 ``logging.http_request_log_cleanup_every``
     Sampled sweep cadence. Default :attr:`DEFAULT_CLEANUP_EVERY`. ``<= 0``
-    disables the sweep entirely so operators can flip it off without a deploy.
+    disables the sweep entirely.
+``logging.http_request_log_batch_size``
+    Rows per store write. Default :attr:`DEFAULT_BATCH_SIZE`.
+``logging.http_request_log_flush_interval``
+    Seconds a buffered row may wait before it is written regardless of
+    batch size. Default :attr:`DEFAULT_FLUSH_INTERVAL`.
+``logging.http_request_log_max_backlog``
+    Rows held in memory while the store is slow; past this, new rows are
+    dropped and counted. Default :attr:`DEFAULT_MAX_BACKLOG`.
 """
 
 from __future__ import annotations
 
-import asyncio
 import time
+import weakref
 from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
 from cara.configuration import config
-from cara.context import ExecutionContext
 from cara.facades import Log
 from cara.http import Request, Response
 from cara.middleware.http.RequestLogStore import RequestLogStore
+from cara.middleware.http.RequestLogWriter import RequestLogWriter
 from cara.middleware.Middleware import Middleware
 from cara.support import optional_user_id
 
@@ -70,67 +83,42 @@ class PersistRequestLog(Middleware):
     #: warning is visible out of the box.
     LOG_CATEGORY = "cara.http.request_log"
 
+    reusable = True
+
     SKIP_PREFIXES = ("/health", "/metrics")
     MAX_PATH_LEN = 500
     MAX_UA_LEN = 500
 
     DEFAULT_RETENTION_DAYS = 30
     DEFAULT_CLEANUP_EVERY = 1000
+    DEFAULT_BATCH_SIZE = 500
+    DEFAULT_FLUSH_INTERVAL = 1.0
+    DEFAULT_MAX_BACKLOG = 10_000
 
     # Process-wide kill switch flipped the first time the destination
-    # relation is missing. Without this, every served request retries the
-    # INSERT and spams the same error into the worker log. One warning is
-    # enough — the operator runs the migration and the next process boot
-    # rehydrates the switch.
+    # relation is missing. Without this, every batch retries the INSERT and
+    # spams the same error into the worker log. One warning is enough — the
+    # operator runs the migration and the next process boot rehydrates the
+    # switch.
     _table_missing = False
 
-    # Sampled-cleanup counter — every Nth request the worker thread also
-    # asks the store to prune rows past the retention horizon, so the log
-    # doesn't grow without bound.
+    # Sampled-cleanup counter — every Nth request the writer also asks the
+    # store to prune rows past the retention horizon, so the log doesn't
+    # grow without bound.
     _request_counter = 0
 
-    # Strong references to the in-flight write/sweep tasks. ``asyncio``
-    # registers a task with the running loop only WEAKLY, so a task whose
-    # sole remaining referent was a local in ``_persist`` can be collected
-    # before it ever runs — the row silently never lands, and it happens
-    # under exactly the memory pressure that makes an access log most
-    # useful. Shared across subclasses by design (mutated, never rebound):
-    # one process, one set of pending writes.
-    _inflight_tasks: set[asyncio.Task] = set()
+    # One writer per application, shared by every instance built for it, so
+    # the whole process has a single buffer and a single shutdown drain.
+    _writers: weakref.WeakKeyDictionary[Any, RequestLogWriter] = (
+        weakref.WeakKeyDictionary()
+    )
 
-    @classmethod
-    def _spawn(cls, coro: Any) -> None:
-        """Schedule ``coro`` and hold it until it finishes.
+    def __init__(self, application: Any, **kwargs: Any) -> None:
+        """Resolve the persistence port and snapshot the configuration.
 
-        The reference is dropped by the done-callback, so the set tracks
-        exactly the writes still owed to the store.
+        Fails fast on bad wiring: an unbound store is a boot error, not a
+        silently empty log.
         """
-        task = asyncio.create_task(coro)
-        cls._inflight_tasks.add(task)
-        task.add_done_callback(cls._inflight_tasks.discard)
-        task.add_done_callback(cls._warn_on_task_failure)
-
-    @classmethod
-    def _warn_on_task_failure(cls, task: asyncio.Task) -> None:
-        """Retrieve a failed task's exception so the loop cannot eat it.
-
-        ``_insert`` and ``_cleanup_old_rows`` handle their own errors, so
-        anything surfacing here failed before them — the thread hop itself.
-        Nobody awaits these tasks, so without this callback asyncio only
-        emits an unretrieved-exception message at GC time, detached from
-        the request that caused it.
-        """
-        if task.cancelled():
-            return
-        exc = task.exception()
-        if exc is not None:
-            Log.warning(
-                f"{cls.TABLE} background write could not be dispatched: {exc}",
-                category=cls.LOG_CATEGORY,
-            )
-
-    def __init__(self, application: Any, **kwargs: Any) -> None:
-        """Resolve the persistence port once and fail fast on bad wiring."""
         super().__init__(application, **kwargs)
         try:
             self._request_logs = application.make(RequestLogStore)
@@ -140,6 +128,35 @@ class PersistRequestLog(Middleware):
                 "bound. Bind one in a service provider: "
                 "application.bind(RequestLogStore, <your store>)."
             ) from exc
+        self._enabled = bool(config("logging.persist_http_requests", True))
+        self._skip = self._skip_prefixes()
+        self._retention = self._retention_days()
+        self._cleanup_every = self._cleanup_cadence()
+        self._writer = self._writer_for(application)
+
+    def _writer_for(self, application: Any) -> RequestLogWriter:
+        writer = self._writers.get(application)
+        if writer is None:
+            writer = RequestLogWriter(
+                self._request_logs,
+                batch_size=self._configured(
+                    "logging.http_request_log_batch_size", self.DEFAULT_BATCH_SIZE
+                ),
+                flush_interval=self._configured(
+                    "logging.http_request_log_flush_interval",
+                    self.DEFAULT_FLUSH_INTERVAL,
+                    float,
+                ),
+                max_backlog=self._configured(
+                    "logging.http_request_log_max_backlog", self.DEFAULT_MAX_BACKLOG
+                ),
+                on_error=self._write_failed,
+            )
+            self._writers[application] = writer
+            if not hasattr(application, "_shutdown_callbacks"):
+                application._shutdown_callbacks = []
+            application._shutdown_callbacks.append(writer.close)
+        return writer
 
     def extra_columns(self, request: Request) -> dict[str, Any]:
         """Application-owned columns merged onto the row.
@@ -151,11 +168,9 @@ class PersistRequestLog(Middleware):
 
     async def handle(self, request: Request, get_response: Callable) -> Response:
         path = request.path or ""
-        if any(path.startswith(prefix) for prefix in self._skip_prefixes()):
-            return await get_response(request)
-        if not self._enabled():
+        if not self._enabled or PersistRequestLog._table_missing:
             return await get_response(request)
-        if PersistRequestLog._table_missing:
+        if any(path.startswith(prefix) for prefix in self._skip):
             return await get_response(request)
 
         start = time.time()
@@ -186,7 +201,7 @@ class PersistRequestLog(Middleware):
         duration_ms: int,
         response: Response | None,
     ) -> None:
-        """Build the log row and fire the (thread-off) insert + sampled sweep.
+        """Build the log row and hand it to the writer, plus the sampled sweep.
 
         Never raises: a logging failure here runs inside the caller's
         ``finally`` and must not mask the response — or the exception — the
@@ -208,13 +223,9 @@ class PersistRequestLog(Middleware):
                 else None,
             }
             payload.update(self.extra_columns(request))
-            self._spawn(ExecutionContext.run_in_thread(self._insert, payload))
-            cadence = self._cleanup_cadence()
-            if self._should_run_cleanup(cleanup_every=cadence):
-                retention = self._retention_days()
-                self._spawn(
-                    ExecutionContext.run_in_thread(self._cleanup_old_rows, retention),
-                )
+            self._writer.append(payload)
+            if self._should_run_cleanup(cleanup_every=self._cleanup_every):
+                self._writer.prune(self._retention)
         except Exception as exc:
             Log.debug(
                 f"PersistRequestLog skipped row: {exc}",
@@ -229,13 +240,9 @@ class PersistRequestLog(Middleware):
         except Exception:
             return 0
 
-    @staticmethod
-    def _enabled() -> bool:
-        return bool(config("logging.persist_http_requests", True))
-
     @classmethod
     def _skip_prefixes(cls) -> tuple[str, ...]:
-        """Resolve the skip list at call time so config can widen it."""
+        """Resolve the configured skip list; config replaces the default."""
         configured = config("logging.http_request_log_skip_prefixes", None)
         if configured is None:
             return cls.SKIP_PREFIXES
@@ -246,13 +253,12 @@ class PersistRequestLog(Middleware):
         except TypeError:
             return cls.SKIP_PREFIXES
 
-    def _insert(self, payload: dict[str, Any]) -> None:
-        try:
-            self._request_logs.insert(payload)
-        except Exception as exc:
+    def _write_failed(self, operation: str, exc: Exception) -> None:
+        """Writer error hook: one warning per failure, never a raise."""
+        if operation == "insert":
             # Relation missing? Trip the kill switch and emit ONE warning
             # with the fix instruction so the worker log doesn't drown in a
-            # per-request stream of the same error.
+            # per-batch stream of the same error.
             if self._is_missing_table_error(exc):
                 if not PersistRequestLog._table_missing:
                     PersistRequestLog._table_missing = True
@@ -268,6 +274,16 @@ class PersistRequestLog(Middleware):
                 f"{self.TABLE} insert failed: {exc}",
                 category=self.LOG_CATEGORY,
             )
+        elif operation == "prune":
+            Log.warning(
+                f"{self.TABLE} cleanup failed: {exc}",
+                category=self.LOG_CATEGORY,
+            )
+        else:
+            Log.warning(
+                f"{self.TABLE} background write could not be dispatched: {exc}",
+                category=self.LOG_CATEGORY,
+            )
 
     @classmethod
     def _is_missing_table_error(cls, exc: Exception) -> bool:
@@ -318,43 +334,23 @@ class PersistRequestLog(Middleware):
 
     @classmethod
     def _retention_days(cls) -> int:
-        try:
-            return int(
-                config(
-                    "logging.http_request_log_retention_days",
-                    cls.DEFAULT_RETENTION_DAYS,
-                )
-            )
-        except TypeError, ValueError:
-            return cls.DEFAULT_RETENTION_DAYS
+        return cls._configured(
+            "logging.http_request_log_retention_days", cls.DEFAULT_RETENTION_DAYS
+        )
 
     @classmethod
     def _cleanup_cadence(cls) -> int:
-        try:
-            return int(
-                config(
-                    "logging.http_request_log_cleanup_every",
-                    cls.DEFAULT_CLEANUP_EVERY,
-                )
-            )
-        except TypeError, ValueError:
-            return cls.DEFAULT_CLEANUP_EVERY
-
-    def _cleanup_old_rows(self, retention_days: int) -> None:
-        """Ask the store to drop rows older than ``retention_days``.
+        return cls._configured(
+            "logging.http_request_log_cleanup_every", cls.DEFAULT_CLEANUP_EVERY
+        )
 
-        ``retention_days <= 0`` is a deliberate no-op on the store side: it
-        means 'retention disabled', not 'retain nothing'. This wrapper only
-        preserves the fire-and-forget warning-logging contract on the hot
-        request path.
-        """
+    @staticmethod
+    def _configured(key: str, default: Any, cast: Callable[[Any], Any] = int) -> Any:
+        """Read a numeric setting, falling back to ``default`` when malformed."""
         try:
-            self._request_logs.prune_old(retention_days)
-        except Exception as exc:
-            Log.warning(
-                f"{self.TABLE} cleanup failed: {exc}",
-                category=self.LOG_CATEGORY,
-            )
+            return cast(config(key, default))
+        except TypeError, ValueError:
+            return default
 
     @staticmethod
     def _resolve_route(request: Request) -> str | None:
@@ -0,0 +1,210 @@
+"""ProfileRequests — on-demand profiling of a single production request.
+
+A slow endpoint in production rarely reproduces anywhere else. This
+middleware profiles exactly the requests that ask for it and nothing
+else:
+
+* **Opt-in per request.** A request carrying the profiling header
+  (``X-Profile``) with a valid token is profiled. The token is either a
+  short-lived ``SignedToken`` minted with :meth:`ProfileRequests.issue`
+  (optionally scoped to a path prefix) or one of the configured static
+  ``tokens``. A missing or invalid token is ignored silently, so the
+  header reveals nothing to a prober.
+* **Zero cost otherwise.** An unprofiled request pays one header lookup.
+* **Sampling, per task.** A :class:`StackSampler` samples the loop
+  thread while it runs this request's task, so concurrent requests on the
+  same worker are neither charged to the profile nor slowed by it.
+* **Query log.** With ``queries`` on, every SQL statement the request
+  runs is recorded with its duration (``BaseConnection.record_queries``;
+  bindings are never recorded).
+
+The profile is written through the ``storage`` manager as
+``<directory>/<id>.folded`` — collapsed stacks for ``flamegraph.pl``,
+speedscope or inferno — and ``<directory>/<id>.json`` holding the
+request line, duration, sample count and query log. The response carries
+the id in ``X-Profile-Id``. A storage failure is logged at debug level
+and never fails the request.
+
+    token = ProfileRequests.issue(ttl=300, path="/api/products")
+    # curl -H "X-Profile: $token" https://.../api/products?page=3
+
+Configurable via ``config/server.py`` → ``PROFILING`` dict:
+
+  - ``enabled``: master switch (default True)
+  - ``header``: request header carrying the token (default ``X-Profile``)
+  - ``tokens``: static tokens that always profile (default none)
+  - ``max_ttl``: longest signed-token lifetime accepted, seconds
+    (default 900)
+  - ``interval``: sampling interval in seconds (default 0.002)
+  - ``queries``: record the SQL query log (default True)
+  - ``directory``: storage prefix (default ``profiles``)
+  - ``driver``: storage driver name (default: the default driver)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import json
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
+from typing import Any
+
+from cara.configuration import config
+from cara.context import ExecutionContext
+from cara.eloquent import BaseConnection
+from cara.facades import Log
+from cara.http import Request, Response
+from cara.middleware.Middleware import Middleware
+from cara.observability import StackSampler
+from cara.security import SignedToken
+
+_PURPOSE = "cara.profile-request"
+_DEFAULT_HEADER = "X-Profile"
+_DEFAULT_MAX_TTL = 900
+_DEFAULT_INTERVAL = 0.002
+_DEFAULT_DIRECTORY = "profiles"
+
+
+class ProfileRequests(Middleware):
+    """Profile requests that carry a valid profiling token."""
+
+    reusable = True
+
+    def __init__(self, application):
+        super().__init__(application)
+        (
+            self._enabled,
+            self._header,
+            self._tokens,
+            self._max_ttl,
+            self._interval,
+            self._queries,
+            self._directory,
+            self._driver,
+        ) = self._load_config()
+
+    @staticmethod
+    def _load_config() -> tuple[
+        bool, str, tuple[str, ...], int, float, bool, str, str | None
+    ]:
+        enabled = config("server.profiling.enabled", True)
+        header = config("server.profiling.header", _DEFAULT_HEADER)
+        tokens = config("server.profiling.tokens", None) or ()
+        max_ttl = config("server.profiling.max_ttl", _DEFAULT_MAX_TTL)
+        interval = config("server.profiling.interval", _DEFAULT_INTERVAL)
+        queries = config("server.profiling.queries", True)
+        directory = config("server.profiling.directory", _DEFAULT_DIRECTORY)
+        driver = config("server.profiling.driver", None)
+
+        if not isinstance(enabled, bool) or not isinstance(queries, bool):
+            raise TypeError("Profiling enabled and queries must be boolean")
+        if not isinstance(header, str) or not header.strip():
+            raise TypeError("Profiling header must be a header name")
+        if not isinstance(tokens, (list, tuple)) or any(
+            not isinstance(token, str) or len(token) < 32 for token in tokens
+        ):
+            raise ValueError("Profiling tokens must be strings of at least 32 chars")
+        if type(max_ttl) is not int or max_ttl <= 0:
+            raise ValueError("Profiling max_ttl must be a positive integer")
+        if (
+            isinstance(interval, bool)
+            or not isinstance(interval, (int, float))
+            or interval <= 0
+        ):
+            raise ValueError("Profiling interval must be a positive number")
+        if not isinstance(directory, str) or not directory.strip("/"):
+            raise TypeError("Profiling directory must be a storage prefix")
+        if driver is not None and (not isinstance(driver, str) or not driver):
+            raise TypeError("Profiling driver must be a driver name")
+        return (
+            enabled,
+            header,
+            tuple(tokens),
+            max_ttl,
+            float(interval),
+            queries,
+            directory.strip("/"),
+            driver,
+        )
+
+    @classmethod
+    def issue(cls, ttl: int = 300, path: str = "/") -> str:
+        """Mint a profiling token valid for ``ttl`` seconds under ``path``."""
+        if not isinstance(path, str) or not path.startswith("/"):
+            raise ValueError("Profiling token path must start with '/'")
+        return SignedToken.issue({"path": path}, purpose=_PURPOSE, ttl=ttl)["token"]
+
+    async def handle(
+        self, request: Request, next_fn: Callable[..., Awaitable[Any]]
+    ) -> Response:
+        if not self._enabled:
+            return await next_fn(request)
+        token = request.header(self._header)
+        if not token or not self._authorized(token, request.path or "/"):
+            return await next_fn(request)
+
+        profile_id = uuid.uuid4().hex
+        sampler = StackSampler(asyncio.current_task(), interval=self._interval)
+        recorder = BaseConnection.record_queries() if self._queries else nullcontext([])
+        started = time.perf_counter()
+        with recorder as queries:
+            sampler.start()
+            try:
+                response = await next_fn(request)
+            finally:
+                sampler.stop()
+                duration = time.perf_counter() - started
+                await self._store(profile_id, request, sampler, queries, duration)
+        response.header("X-Profile-Id", profile_id)
+        return response
+
+    def _authorized(self, token: str, path: str) -> bool:
+        if any(hmac.compare_digest(token, allowed) for allowed in self._tokens):
+            return True
+        try:
+            verified = SignedToken.verify(token, purpose=_PURPOSE, max_ttl=self._max_ttl)
+        except RuntimeError:
+            # No usable APP_KEY: signed tokens cannot be checked at all.
+            return False
+        if verified is None:
+            return False
+        scope = verified["claims"].get("path")
+        if not isinstance(scope, str):
+            return False
+        # Match whole path segments: a token for /admin must not open /administrator.
+        return path == scope or path.startswith(scope.rstrip("/") + "/")
+
+    async def _store(
+        self,
+        profile_id: str,
+        request: Request,
+        sampler: StackSampler,
+        queries: list[tuple[str, float]],
+        duration: float,
+    ) -> None:
+        summary = {
+            "id": profile_id,
+            "method": request.method,
+            "path": request.path,
+            "duration_ms": round(duration * 1000, 3),
+            "interval_ms": round(self._interval * 1000, 3),
+            "samples": sampler.total,
+            "queries": [{"sql": sql, "ms": ms} for sql, ms in queries],
+        }
+        base = f"{self._directory}/{profile_id}"
+        try:
+            storage = self.application.make("storage")
+            await ExecutionContext.run_in_thread(
+                storage.put, f"{base}.folded", sampler.collapsed().encode(), self._driver
+            )
+            await ExecutionContext.run_in_thread(
+                storage.put, f"{base}.json", json.dumps(summary).encode(), self._driver
+            )
+        except Exception as e:
+            Log.debug(
+                f"Request profile {profile_id} not stored: {e}",
+                category="cara.http.profiler",
+            )
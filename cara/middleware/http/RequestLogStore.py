@@ -12,7 +12,7 @@ port from the container, so an application binds its own implementation::
         def register(self) -> None:
             self.application.bind(RequestLogStore, HttpRequestLogRepository())
 
-Both methods run on a worker thread off the request path and are allowed to
+Every method runs on a worker thread off the request path and is allowed to
 raise — ``PersistRequestLog`` converts a failure into a single warning and,
 for a missing destination relation, a process-wide kill switch.
 """
@@ -30,6 +30,18 @@ class RequestLogStore(ABC):
     def insert(self, payload: dict[str, Any]) -> None:
         """Persist one request-log row."""
 
+    def insert_many(self, payloads: list[dict[str, Any]]) -> None:
+        """Persist a batch of request-log rows.
+
+        ``PersistRequestLog`` buffers rows and calls this once per batch.
+        The default loops over :meth:`insert`; a store should override it
+        with a single round-trip — one multi-row ``INSERT`` (for example
+        ``QueryBuilder.bulk_create``) or, on PostgreSQL, ``COPY ... FROM
+        STDIN`` — which is the whole point of batching.
+        """
+        for payload in payloads:
+            self.insert(payload)
+
     @abstractmethod
     def prune_old(self, retention_days: int) -> None:
         """Delete rows older than ``retention_days``.
@@ -0,0 +1,187 @@
+"""Buffered, batching writer behind ``PersistRequestLog``.
+
+One thread hop and one single-row INSERT per request doubles the database
+write load of a busy service for a table nobody reads on the hot path.
+The writer instead appends each row to an in-process buffer and hands
+the store whole batches through :meth:`RequestLogStore.insert_many` —
+one multi-row INSERT or ``COPY`` on the store's side — from a worker
+thread:
+
+* **Size trigger.** As soon as ``batch_size`` rows are waiting, a flush
+  starts.
+* **Age trigger.** A row never waits longer than ``flush_interval``
+  seconds; a quiet service still lands its rows promptly.
+* **One flush at a time.** Batches are written sequentially, so a slow
+  database sees one writer per process instead of a thread per request.
+* **Bounded backlog.** While the database is slow, rows accumulate up to
+  ``max_backlog``; past that, new rows are dropped and counted rather
+  than growing memory without bound.
+* **Drain on shutdown.** :meth:`close` writes whatever is buffered; the
+  middleware registers it as a lifespan shutdown callback.
+
+A sampled retention sweep requested with :meth:`prune` runs on the same
+thread hop, after the next batch, instead of on a request of its own.
+
+Metrics: ``http_request_log_rows_total{outcome}`` (``written``,
+``dropped``, ``failed``), ``http_request_log_backlog`` and
+``http_request_log_flush_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from cara.context import ExecutionContext
+from cara.observability import MetricsBase
+
+from .RequestLogStore import RequestLogStore
+
+
+class RequestLogWriter:
+    """Buffer request-log rows and write them to the store in batches."""
+
+    def __init__(
+        self,
+        store: RequestLogStore,
+        *,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_backlog: int = 10_000,
+        on_error: Callable[[str, Exception], None] | None = None,
+    ) -> None:
+        """``on_error(operation, exc)`` hears about every failed write.
+
+        ``operation`` is ``"insert"`` (the store rejected a batch),
+        ``"prune"`` (the retention sweep raised) or ``"dispatch"`` (the
+        thread hop itself failed). The writer never raises on its own.
+        """
+        self._store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_backlog = max_backlog
+        self._on_error = on_error
+        self._buffer: list[dict[str, Any]] = []
+        self._writing = 0
+        self._prune_days: int | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._drain: asyncio.Task | None = None
+
+    @property
+    def backlog(self) -> int:
+        """Rows buffered or being written."""
+        return len(self._buffer) + self._writing
+
+    def append(self, row: dict[str, Any]) -> bool:
+        """Buffer ``row``; ``False`` when the backlog is full and it was dropped."""
+        if self.backlog >= self.max_backlog:
+            MetricsBase.safe_inc(
+                MetricsBase.http_request_log_rows_total, {"outcome": "dropped"}
+            )
+            return False
+        self._buffer.append(row)
+        self._report_backlog()
+        if len(self._buffer) >= self.batch_size:
+            self._start_drain(full_batches_only=True)
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.flush_interval, self._on_timer
+            )
+        return True
+
+    def prune(self, retention_days: int) -> None:
+        """Run the store's retention sweep after the next batch."""
+        self._prune_days = retention_days
+
+    async def flush(self) -> None:
+        """Write every buffered row and wait until the store has them."""
+        while self._drain is not None and not self._drain.done():
+            await asyncio.shield(self._drain)
+        self._cancel_timer()
+        if self._buffer or self._prune_days is not None:
+            self._start_drain(full_batches_only=False)
+            await asyncio.shield(self._drain)
+
+    async def close(self) -> None:
+        """Lifespan shutdown hook: drain the buffer."""
+        await self.flush()
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._start_drain(full_batches_only=False)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _start_drain(self, *, full_batches_only: bool) -> None:
+        if self._drain is not None and not self._drain.done():
+            # The running drain re-checks the buffer before it exits.
+            return
+        self._drain = asyncio.get_running_loop().create_task(
+            self._drain_buffer(full_batches_only)
+        )
+
+    async def _drain_buffer(self, full_batches_only: bool) -> None:
+        limit = self.batch_size if full_batches_only else 1
+        while len(self._buffer) >= limit or (
+            not full_batches_only and self._prune_days is not None
+        ):
+            batch = self._buffer[: self.batch_size]
+            del self._buffer[: self.batch_size]
+            prune_days, self._prune_days = self._prune_days, None
+            self._writing = len(batch)
+            try:
+                await ExecutionContext.run_in_thread(self._write, batch, prune_days)
+            except Exception as exc:
+                # The hop itself failed; ``_write`` reports its own errors.
+                self._fail(batch, "dispatch", exc)
+            finally:
+                self._writing = 0
+                self._report_backlog()
+            if full_batches_only:
+                continue
+            if not self._buffer:
+                break
+        if self._buffer and self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.flush_interval, self._on_timer
+            )
+
+    def _write(self, batch: list[dict[str, Any]], prune_days: int | None) -> None:
+        if batch:
+            started = time.perf_counter()
+            try:
+                self._store.insert_many(batch)
+            except Exception as exc:
+                self._fail(batch, "insert", exc)
+            else:
+                MetricsBase.safe_inc(
+                    MetricsBase.http_request_log_rows_total,
+                    {"outcome": "written"},
+                    len(batch),
+                )
+            MetricsBase.safe_observe(
+                MetricsBase.http_request_log_flush_seconds,
+                {},
+                time.perf_counter() - started,
+            )
+        if prune_days is not None:
+            try:
+                self._store.prune_old(prune_days)
+            except Exception as exc:
+                if self._on_error is not None:
+                    self._on_error("prune", exc)
+
+    def _fail(self, batch: list[dict[str, Any]], operation: str, exc: Exception) -> None:
+        MetricsBase.safe_inc(
+            MetricsBase.http_request_log_rows_total, {"outcome": "failed"}, len(batch)
+        )
+        if self._on_error is not None:
+            self._on_error(operation, exc)
+
+    def _report_backlog(self) -> None:
+        MetricsBase.safe_set(MetricsBase.http_request_log_backlog, {}, self.backlog)
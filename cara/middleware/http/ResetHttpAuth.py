@@ -5,7 +5,11 @@ CRITICAL: This terminable middleware ensures all authentication-related caches
 are cleared after each request to prevent user data leakage between requests.
 Guards are singleton instances that persist across requests.
 
-This middleware runs automatically after every HTTP response is sent.
+The built-in guards no longer need it: their per-request identity lives in
+ContextVars registered with ``Container.scoped_var``, and ``HttpConductor``
+runs every request in a ``Container.scope()`` that resets them. Register it
+as terminable middleware only for custom guards that still cache identity on
+instance attributes.
 """
 
 from __future__ import annotations
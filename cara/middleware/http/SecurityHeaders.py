@@ -42,6 +42,8 @@ from ._SecurityHeaderPolicy import (
 class SecurityHeaders(Middleware):
     """Attach baseline security headers to every response."""
 
+    reusable = True
+
     def __init__(self, application, parameters=None):
         super().__init__(application)
         self.parameters = parameters or []
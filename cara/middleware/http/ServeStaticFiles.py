@@ -7,16 +7,51 @@ static file serving capability. It handles files like images, CSS, JS, etc.
 
 from __future__ import annotations
 
-import mimetypes
 import os
 import sys
+import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
-from typing import Any
+from typing import Any, ClassVar
 
-from cara.http import Request, Response
+from cara.http import Request, Response, StaticFile
 from cara.middleware.Middleware import Middleware
 from cara.support import public_path
 
+_MISSING = object()
+
+
+class _AssetCache:
+    """Bounded LRU of path lookups, each trusted for ``ttl`` seconds.
+
+    Values are a ``StaticFile`` (small ones carry their bytes) or ``None``
+    for "not a static file", so application routes stop paying an
+    ``isfile`` stat per request too.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple[str, str], tuple[float, StaticFile | None]] = (
+            OrderedDict()
+        )
+
+    def get(self, key: tuple[str, str], now: float) -> Any:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= now:
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(
+        self, key: tuple[str, str], value: StaticFile | None, expires: float, limit: int
+    ) -> None:
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > limit:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
 
 class ServeStaticFiles(Middleware):
     """
@@ -24,8 +59,27 @@ class ServeStaticFiles(Middleware):
 
     This middleware checks if the request is for a static file in the public
     directory and serves it directly, bypassing the normal routing system.
+
+    Files are served through ``StaticFile``: strong ``ETag`` and
+    ``Last-Modified`` validators (``304`` on a match), single and
+    multi-range requests (``206`` / ``416``), ``.br`` / ``.gz`` siblings
+    for clients that accept them, and a body streamed in chunks off the
+    event loop (or via ``http.response.pathsend``) instead of one
+    ``f.read()`` on it. Lookups are memoised in a process-wide LRU for
+    ``cache_ttl`` seconds, and assets up to ``cache_asset_bytes`` are kept
+    in memory, so hot assets cost no syscalls at all; an edited file is
+    picked up once its entry expires.
     """
 
+    reusable = True
+
+    cache_control: ClassVar[str] = "public, max-age=3600"
+    cache_entries: ClassVar[int] = 512
+    cache_asset_bytes: ClassVar[int] = 64 * 1024
+    cache_ttl: ClassVar[float] = 1.0
+
+    _assets: ClassVar[_AssetCache] = _AssetCache()
+
     async def handle(
         self, request: Request, next_fn: Callable[..., Awaitable[Any]]
     ) -> Response:
@@ -39,9 +93,6 @@ class ServeStaticFiles(Middleware):
         Returns:
             Response: Either the static file response or the result of next_fn
         """
-        # Get the public directory path using Laravel-style helper
-        public_dir = public_path()
-
         # Only handle GET and HEAD requests for static files
         if request.method not in ["GET", "HEAD"]:
             return await next_fn(request)
@@ -49,25 +100,23 @@ class ServeStaticFiles(Middleware):
         # Check if this looks like a static file request
         path = request.path.lstrip("/")
 
-        # Skip if path is empty or doesn't exist
+        # Skip if path is empty
         if not path:
             return await next_fn(request)
 
-        if not os.path.exists(public_dir):
-            return await next_fn(request)
-
-        # Check if the file exists in the public directory
+        # Get the public directory path using Laravel-style helper
+        public_dir = public_path()
         full_path = os.path.join(public_dir, path)
 
         # Security check: ensure the path is within public directory
         if not self._is_safe_path(full_path, public_dir):
             return await next_fn(request)
 
-        if not os.path.isfile(full_path):
-            return await next_fn(request)
-
         try:
-            return self._serve_file(full_path, request.method == "HEAD")
+            static = self._lookup(full_path, request)
+            if static is None:
+                return await next_fn(request)
+            return static.respond(request, Response(self.application), self.cache_control)
         except Exception as exc:
             print(
                 f"[cara.middleware] ServeStaticFiles failed for '{path}': {exc}",
@@ -75,6 +124,35 @@ class ServeStaticFiles(Middleware):
             )
             return await next_fn(request)
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget every memoised lookup (after a deploy swapped the assets)."""
+        cls._assets.clear()
+
+    def _lookup(self, full_path: str, request: Request) -> StaticFile | None:
+        """Resolve ``full_path`` for this request, through the LRU.
+
+        A ``Range`` request is always answered from the identity file:
+        resumable downloaders expect offsets into the bytes they asked
+        for, not into a compressed sibling.
+        """
+        accept_encoding = (
+            "" if request.header("Range") else request.header("Accept-Encoding", "")
+        )
+        key = (full_path, accept_encoding or "")
+        now = time.monotonic()
+        cached = self._assets.get(key, now)
+        if cached is not _MISSING:
+            return cached
+
+        static = None
+        if os.path.isfile(full_path):
+            static = StaticFile.resolve(full_path, accept_encoding or "")
+            if static.size <= self.cache_asset_bytes:
+                static = static.loaded()
+        self._assets.put(key, static, now + self.cache_ttl, self.cache_entries)
+        return static
+
     def _is_safe_path(self, path: str, public_dir: str) -> bool:
         """
         Check if the requested path is safe (within public directory).
@@ -97,49 +175,3 @@ class ServeStaticFiles(Middleware):
             return os.path.commonpath([public_dir, requested_path]) == public_dir
         except ValueError, OSError:
             return False
-
-    def _serve_file(self, file_path: str, head_only: bool = False) -> Response:
-        """
-        Serve a static file.
-
-        Args:
-            file_path: Path to the file to serve
-            head_only: If True, only send headers (for HEAD requests)
-
-        Returns:
-            Response: The file response
-        """
-        response = Response(self.application)
-
-        # Get file info
-        stat = os.stat(file_path)
-        file_size = stat.st_size
-
-        # Determine content type
-        content_type, _ = mimetypes.guess_type(file_path)
-        if content_type is None:
-            content_type = "application/octet-stream"
-
-        # Set headers
-        response.header("Content-Type", content_type)
-        response.header("Content-Length", str(file_size))
-        response.header("Accept-Ranges", "bytes")
-
-        # Add caching headers for static files
-        response.header("Cache-Control", "public, max-age=3600")
-
-        # For HEAD requests, don't send body
-        if head_only:
-            return response
-
-        # Read and serve file content
-        try:
-            with open(file_path, "rb") as f:
-                file_content = f.read()
-                # Directly set content attribute
-                response.content = file_content
-        except OSError:
-            response.status(404)
-            response.content = b"File not found"
-
-        return response
@@ -1,7 +1,10 @@
 """
-Middleware that enforces a fixed-window rate limit on each request.
+Middleware that enforces a rate limit on each request.
 
-Laravel-style parametric usage: throttle:60,1 (60 requests per 1 minute)
+Laravel-style parametric usage: throttle:60,1 (60 requests per 1 minute), with an
+optional algorithm: throttle:60,1,gcra (``fixed`` by default; also ``gcra``,
+``sliding_log`` and ``sliding_window``). Named limiters pick theirs with
+``Limit.using(...)``.
 If the client exceeds the limit, returns a 429 Response with appropriate headers so the client
 knows when to retry. Otherwise, adds rate-limit info in response headers.
 """
@@ -15,13 +18,18 @@ import cara.facades as facades
 from cara.exceptions import RateLimitConfigurationException
 from cara.http import Request, Response
 from cara.middleware.Middleware import Middleware
-from cara.rates import Limit, attempt_rate_limit
+from cara.rates import Limit, RateLimitLeases, attempt_rate_limit
 
 
 class ThrottleRequests(Middleware):
     """Rate limiting middleware with automatic parameter parsing."""
 
-    def __init__(self, application, limit=None, window=None):
+    custom_algorithm: str | None = None
+    # One lease pool per (size, ttl) for every throttle in the process, so
+    # routes sharing a key also share its leased tokens.
+    _lease_pools: dict[tuple[int, float], RateLimitLeases] = {}
+
+    def __init__(self, application, limit=None, window=None, algorithm=None):
         """ROOT-CAUSE / scenario 6 (concurrent load probe).
         ----------------------------------------------------
         ``limit`` and ``window`` are intentionally **untyped**.
@@ -59,6 +67,8 @@ class ThrottleRequests(Middleware):
         else:
             self.custom_window_minutes = None
 
+        self.custom_algorithm = algorithm
+
     async def handle(
         self, request: Request, next_fn: Callable[..., Awaitable[Any]]
     ) -> Response:
@@ -216,7 +226,16 @@ class ThrottleRequests(Middleware):
         if self.custom_limit is not None:
             # Custom numeric parameters provided (throttle:60,1)
             window_minutes = self.custom_window_minutes or 1
-            return Limit(max_attempts=self.custom_limit, decay_minutes=window_minutes)
+            limit = Limit(max_attempts=self.custom_limit, decay_minutes=window_minutes)
+            if self.custom_algorithm:
+                try:
+                    limit.using(self.custom_algorithm)
+                except ValueError as exc:
+                    raise RateLimitConfigurationException(
+                        f"throttle:{self.custom_limit},{window_minutes},"
+                        f"{self.custom_algorithm}: {exc}"
+                    ) from exc
+            return limit
 
         raise RateLimitConfigurationException(
             "ThrottleRequests reached with no resolvable limit configuration."
@@ -289,10 +308,10 @@ class ThrottleRequests(Middleware):
         Returns:
             Tuple of (allowed: bool, remaining: int, reset_in: int).
             ``reset_in`` is the actual remaining seconds until the
-            counter resets — it queries ``Cache.ttl(...)`` after the
-            atomic increment instead of returning the full window
-            length. The previous implementation always reported the
-            full window, so a client that hit the limit at second 50
+            budget resets (or, when denied, until the next request would
+            be allowed) as decided by the store, instead of the full
+            window length. The previous implementation always reported
+            the full window, so a client that hit the limit at second 50
             of a 60-second window was told "retry in 60 s" when the
             truth was "retry in ~10 s".
         """
@@ -303,11 +322,26 @@ class ThrottleRequests(Middleware):
         window_seconds = int(limit_config.decay_minutes * 60)
         cache_key = f"throttle_{key}"
 
+        algorithm = getattr(limit_config, "algorithm", "fixed")
+        lease = getattr(limit_config, "lease", None)
+        if lease is not None:
+            # Leased limits spend tokens reserved by this worker and only
+            # reach the authority to refill them (Limit.leased).
+            leases = ThrottleRequests._lease_pools.get(lease)
+            if leases is None:
+                leases = ThrottleRequests._lease_pools.setdefault(
+                    lease, RateLimitLeases(*lease)
+                )
+            return leases.attempt(
+                cache_key, window_seconds, limit_config.max_attempts, algorithm
+            )
+
         # Shared authoritative accounting keeps HTTP and direct callers on
         # one fail-closed outage policy.
         allowed, remaining, reset_in = attempt_rate_limit(
             cache_key=cache_key,
             window_seconds=window_seconds,
             max_attempts=limit_config.max_attempts,
+            algorithm=algorithm,
         )
         return allowed, remaining, reset_in
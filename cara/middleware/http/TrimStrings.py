@@ -14,6 +14,8 @@ from cara.middleware.Middleware import Middleware
 
 
 class TrimStrings(Middleware):
+    reusable = True
+
     async def handle(
         self, request: Request, next_fn: Callable[..., Awaitable[Any]]
     ) -> Response:
@@ -0,0 +1,134 @@
+"""Content-coding negotiation and incremental encoders for ``CompressResponses``.
+
+Three codings are supported, each behind the same three-call encoder
+(``compress`` / ``flush`` / ``finish``) so buffered bodies and streamed
+bodies share one code path:
+
+  - ``gzip`` — always available (``zlib``).
+  - ``br`` — when the optional ``brotli`` package is installed.
+  - ``zstd`` — from the standard library's ``compression.zstd``.
+
+``flush`` emits everything compressed so far as a decodable block without
+ending the stream (``Z_SYNC_FLUSH`` / brotli flush / zstd ``FLUSH_BLOCK``),
+which is what lets a compressed SSE or NDJSON stream still deliver each
+event the moment it is produced.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Callable
+
+try:
+    # Optional: brotli is not a framework dependency. Without it ``br`` is
+    # simply never negotiated.
+    import brotli
+except ImportError:  # pragma: no cover - exercised only with the package
+    brotli = None  # type: ignore[assignment]
+
+try:
+    from compression import zstd
+except ImportError:  # pragma: no cover - exercised only before Python 3.14
+    zstd = None  # type: ignore[assignment]
+
+# Brotli quality 4 and zstd level 3 are the usual "dynamic content"
+# settings: within a few percent of the best ratio at a fraction of the
+# CPU of the maximum levels. gzip keeps the configured ``level``.
+_BROTLI_QUALITY = 4
+_ZSTD_LEVEL = 3
+
+# Server preference when the client weights several codings equally.
+_DEFAULT_PREFERENCE: tuple[str, ...] = ("zstd", "br", "gzip")
+
+
+class _Encoder:
+    """One incremental encoder: ``compress`` / ``flush`` / ``finish``."""
+
+    __slots__ = ("compress", "flush", "finish")
+
+    def __init__(
+        self,
+        compress: Callable[[bytes], bytes],
+        flush: Callable[[], bytes],
+        finish: Callable[[], bytes],
+    ) -> None:
+        self.compress = compress
+        self.flush = flush
+        self.finish = finish
+
+
+def _gzip_encoder(level: int) -> _Encoder:
+    # wbits=31 → gzip container (16) + 32 KiB window (15).
+    obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return _Encoder(
+        obj.compress,
+        lambda: obj.flush(zlib.Z_SYNC_FLUSH),
+        lambda: obj.flush(zlib.Z_FINISH),
+    )
+
+
+def _brotli_encoder(_level: int) -> _Encoder:
+    obj = brotli.Compressor(quality=_BROTLI_QUALITY)
+    return _Encoder(obj.process, obj.flush, obj.finish)
+
+
+def _zstd_encoder(_level: int) -> _Encoder:
+    obj = zstd.ZstdCompressor(level=_ZSTD_LEVEL)
+    return _Encoder(
+        obj.compress,
+        lambda: obj.flush(zstd.ZstdCompressor.FLUSH_BLOCK),
+        lambda: obj.flush(zstd.ZstdCompressor.FLUSH_FRAME),
+    )
+
+
+def _encoder_factories() -> dict[str, Callable[[int], _Encoder]]:
+    """Encoders whose library is importable in this process."""
+    factories: dict[str, Callable[[int], _Encoder]] = {"gzip": _gzip_encoder}
+    if brotli is not None:
+        factories["br"] = _brotli_encoder
+    if zstd is not None:
+        factories["zstd"] = _zstd_encoder
+    return factories
+
+
+def _compress_whole(encoder: _Encoder, body: bytes) -> bytes:
+    return encoder.compress(body) + encoder.finish()
+
+
+def _parse_accept_encoding(raw: str) -> dict[str, float]:
+    """``{coding: q}`` for every listed coding; malformed weights count as 0."""
+    weights: dict[str, float] = {}
+    for token in raw.split(","):
+        coding, _, params = token.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+    return weights
+
+
+def _negotiate(raw: str | None, preference: tuple[str, ...]) -> str | None:
+    """Pick the coding to use from ``Accept-Encoding`` (RFC 9110 §12.5.3).
+
+    The highest non-zero weight wins; ties go to the earlier entry in
+    ``preference``. ``*`` covers every coding the client did not list.
+    Returns ``None`` when nothing acceptable is available (identity).
+    """
+    if not raw:
+        return None
+    weights = _parse_accept_encoding(raw)
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in preference:
+        q = weights.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
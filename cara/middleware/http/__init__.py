@@ -3,6 +3,7 @@
 from cara._LazyExports import _install_lazy_exports
 
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "AdmitRequests": (".AdmitRequests", "AdmitRequests"),
     "AttachRequestID": (".AttachRequestID", "AttachRequestID"),
     "AuthenticateUser": (".AuthenticateUser", "AuthenticateUser"),
     "AuthenticateUserOptional": (
@@ -10,6 +11,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
         "AuthenticateUserOptional",
     ),
     "CORS_DEFAULTS": (".Cors", "CORS_DEFAULTS"),
+    "CacheResponses": (".CacheResponses", "CacheResponses"),
     "CanPerform": (".CanPerform", "CanPerform"),
     "CheckMaintenanceMode": (".CheckMaintenanceMode", "CheckMaintenanceMode"),
     "CompressResponses": (".CompressResponses", "CompressResponses"),
@@ -19,9 +21,11 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "HandleCors": (".HandleCors", "HandleCors"),
     "LogHttpRequests": (".LogHttpRequests", "LogHttpRequests"),
     "PersistRequestLog": (".PersistRequestLog", "PersistRequestLog"),
+    "ProfileRequests": (".ProfileRequests", "ProfileRequests"),
     "RecordPrometheusMetrics": (".RecordPrometheusMetrics", "RecordPrometheusMetrics"),
     "RecordRequestMetrics": (".RecordRequestMetrics", "RecordRequestMetrics"),
     "RequestLogStore": (".RequestLogStore", "RequestLogStore"),
+    "RequestLogWriter": (".RequestLogWriter", "RequestLogWriter"),
     "ResetHttpAuth": (".ResetHttpAuth", "ResetHttpAuth"),
     "SecurityHeaders": (".SecurityHeaders", "SecurityHeaders"),
     "ServeStaticFiles": (".ServeStaticFiles", "ServeStaticFiles"),
@@ -38,10 +42,12 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
 }
 
 __all__ = [
+    "AdmitRequests",
     "AttachRequestID",
     "AuthenticateUser",
     "AuthenticateUserOptional",
     "CORS_DEFAULTS",
+    "CacheResponses",
     "CanPerform",
     "CheckMaintenanceMode",
     "CompressResponses",
@@ -51,9 +57,11 @@ __all__ = [
     "HandleCors",
     "LogHttpRequests",
     "PersistRequestLog",
+    "ProfileRequests",
     "RecordPrometheusMetrics",
     "RecordRequestMetrics",
     "RequestLogStore",
+    "RequestLogWriter",
     "ResetHttpAuth",
     "SecurityHeaders",
     "ServeStaticFiles",
@@ -0,0 +1,39 @@
+"""Metrics for the primitives that ration shared capacity.
+
+Kept beside :class:`MetricsBase` rather than on it: these collectors belong
+to opt-in features, and they share its registry and namespace, so they
+scrape exactly as if they were declared there. Write them through the
+``MetricsBase.safe_*`` wrappers like any framework metric.
+"""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge
+
+from .MetricsBase import REGISTRY, metric_name
+
+
+class CapacityMetrics:
+    """Collectors for rate-limit leasing and the password-hashing pool."""
+
+    # Rate-limit leasing (``RateLimitLeases``). ``source`` "local" is a remote
+    # call saved; "inline" / "background" are remote lease reservations.
+    rate_limit_lease_calls_total = Counter(
+        metric_name("rate_limit_lease_calls_total"),
+        "Leased rate-limit calls, by where they were served.",
+        labelnames=("source",),
+        registry=REGISTRY,
+    )
+    # Off-loop password hashing (``Hash.amake`` / ``Hash.acheck``).
+    # ``outcome`` is "done", "failed" or "shed" (pool at capacity).
+    password_hash_total = Counter(
+        metric_name("password_hash_total"),
+        "Pooled password-hash operations, by operation and outcome.",
+        labelnames=("operation", "outcome"),
+        registry=REGISTRY,
+    )
+    password_hash_queue_depth = Gauge(
+        metric_name("password_hash_queue_depth"),
+        "Password hashes waiting for a hashing-pool worker.",
+        registry=REGISTRY,
+    )
@@ -0,0 +1,23 @@
+"""One event-loop stall reported by ``LoopWatchdog``."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LoopStall:
+    """How long the loop was blocked and by what.
+
+    ``stack`` holds the loop thread's formatted frames captured mid-stall,
+    outermost first; it is empty when the stall ended before the watchdog
+    thread looked.
+    """
+
+    duration: float
+    origin: str
+    stack: tuple[str, ...] = ()
+
+    @property
+    def blocking_frame(self) -> str | None:
+        return self.stack[-1] if self.stack else None
@@ -0,0 +1,217 @@
+"""Event-loop stall detection with blocking-frame attribution.
+
+A sync call on the event loop — ``Cache.remember``'s poll sleep, the sync
+redis client, a psycopg2 query, ``Hash.check`` — freezes every request the
+worker holds, and afterwards nothing says which code did it. The watchdog
+catches it in the act:
+
+* The loop re-arms a heartbeat timer every ``interval`` seconds.
+* A daemon thread checks the heartbeat. Once it is ``threshold`` seconds
+  overdue the loop is stalled, and the thread captures the loop thread's
+  current stack — the blocking frame is at its tip — and the origin of
+  the task running it.
+* When the loop gets to the heartbeat again it knows the full stall
+  duration: it counts the stall in ``event_loop_stalls_total``, observes
+  ``event_loop_stall_seconds`` (both labelled by origin) and logs the
+  captured stack.
+
+The origin is the route template for HTTP work (``GET /products/@id``),
+the label set with :func:`stall_origin` (the queue worker sets
+``job:<JobClass>``), or ``unknown`` for callbacks outside any task. Stalls
+shorter than a check interval can finish before the thread looks; they
+are still counted, with no stack.
+
+Explicit process wiring, like ``setup_sentry`` — call from a startup
+callback on the loop to watch::
+
+    app._startup_callbacks.append(lambda: watch_event_loop(threshold=0.1))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+
+from cara.facades import Log
+from cara.http import current_request
+
+from .LoopStall import LoopStall
+from .MetricsBase import MetricsBase
+
+# Frames kept from the tip of a captured stack.
+_STACK_LIMIT = 40
+
+_origin: ContextVar[str | None] = ContextVar("cara_loop_stall_origin", default=None)
+# One watchdog per event loop (``watch_event_loop`` is idempotent).
+_watchdogs: dict[int, LoopWatchdog] = {}
+_watchdogs_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def stall_origin(origin: str) -> Iterator[None]:
+    """Attribute stalls inside this block (and tasks it starts) to ``origin``."""
+    token = _origin.set(origin)
+    try:
+        yield
+    finally:
+        _origin.reset(token)
+
+
+class LoopWatchdog:
+    """Detect event-loop stalls and attribute them to the blocking code.
+
+    Args:
+        threshold: Seconds the loop must be blocked to count as a stall.
+        interval: Heartbeat period in seconds (default ``threshold / 2``).
+        on_stall: Called on the loop with each :class:`LoopStall`, after
+                  the metrics and the log line.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.1,
+        interval: float | None = None,
+        on_stall: Callable[[LoopStall], None] | None = None,
+    ):
+        if isinstance(threshold, bool) or not isinstance(threshold, (int, float)):
+            raise TypeError("Watchdog threshold must be a number of seconds")
+        if threshold <= 0:
+            raise ValueError("Watchdog threshold must be positive")
+        if interval is None:
+            interval = threshold / 2
+        if interval <= 0:
+            raise ValueError("Watchdog interval must be positive")
+        self.threshold = float(threshold)
+        self.interval = float(interval)
+        self._on_stall = on_stall
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        # (loop-clock due time, monotonic deadline) of the armed heartbeat;
+        # the loop clock need not be ``time.monotonic`` (uvloop).
+        self._armed = (0.0, 0.0)
+        self._captured: tuple[float, str, tuple[str, ...]] | None = None
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> LoopWatchdog:
+        """Watch the running loop. Call from a coroutine or callback on it."""
+        if self._loop is not None:
+            return self
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._arm()
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+
+    # ── Loop side ────────────────────────────────────────────────────
+
+    def _arm(self) -> None:
+        due = self._loop.time() + self.interval
+        self._armed = (due, time.monotonic() + self.interval)
+        self._loop.call_at(due, self._beat, due)
+
+    def _beat(self, due: float) -> None:
+        if self._stopped.is_set():
+            return
+        late = self._loop.time() - due
+        if late >= self.threshold:
+            captured = self._captured
+            if captured is not None and captured[0] == due:
+                stall = LoopStall(late, captured[1], captured[2])
+            else:
+                stall = LoopStall(late, "unknown")
+            self._report(stall)
+        self._arm()
+
+    def _report(self, stall: LoopStall) -> None:
+        labels = {"origin": stall.origin}
+        MetricsBase.safe_inc(MetricsBase.event_loop_stalls_total, labels)
+        MetricsBase.safe_observe(
+            MetricsBase.event_loop_stall_seconds, labels, stall.duration
+        )
+        # A stall report must never add a failure of its own to the loop.
+        with contextlib.suppress(Exception):
+            Log.warning(
+                "Event loop blocked for %.3fs by %s at %s\n%s",
+                stall.duration,
+                stall.origin,
+                stall.blocking_frame or "<not captured>",
+                "".join(stall.stack),
+                category="cara.observability",
+            )
+        if self._on_stall is not None:
+            self._on_stall(stall)
+
+    # ── Watchdog thread ──────────────────────────────────────────────
+
+    def _watch(self) -> None:
+        # Half an interval bounds how late the thread notices a stall.
+        period = self.interval / 2
+        while not self._stopped.wait(period):
+            if self._loop.is_closed():
+                return
+            due, deadline = self._armed
+            if time.monotonic() - deadline < self.threshold:
+                continue
+            captured = self._captured
+            if captured is not None and captured[0] == due:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            stack = (
+                tuple(traceback.format_stack(frame, limit=_STACK_LIMIT))
+                if frame is not None
+                else ()
+            )
+            self._captured = (due, self._current_origin(), stack)
+
+    def _current_origin(self) -> str:
+        """Origin of the task the loop is running right now."""
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            return "unknown"
+        if task is None:
+            return "unknown"
+        context = task.get_context()
+        origin = context.get(_origin)
+        if origin:
+            return origin
+        request = context.get(current_request)
+        if request is not None:
+            route = getattr(request, "route", None)
+            if route is not None:
+                return f"{request.method} {route.url}"
+            return "http"
+        return "unknown"
+
+
+def watch_event_loop(
+    *,
+    threshold: float = 0.1,
+    interval: float | None = None,
+    on_stall: Callable[[LoopStall], None] | None = None,
+) -> LoopWatchdog:
+    """Start (once per loop) a :class:`LoopWatchdog` on the running loop."""
+    loop = asyncio.get_running_loop()
+    with _watchdogs_lock:
+        watchdog = _watchdogs.get(id(loop))
+        if watchdog is None or watchdog._loop is not loop or watchdog._stopped.is_set():
+            watchdog = _watchdogs[id(loop)] = LoopWatchdog(
+                threshold=threshold, interval=interval, on_stall=on_stall
+            )
+    return watchdog.start()
@@ -289,6 +289,86 @@ class MetricsBase:
         "HTTP requests currently being handled.",
         registry=REGISTRY,
     )
+    # Origin-side response compression (``CompressResponses``). ``mode`` is
+    # "buffered" or "stream" — two values.
+    http_compression_ratio = Histogram(
+        metric_name("http_compression_ratio"),
+        "Compressed / original size of responses the origin compressed.",
+        labelnames=("encoding",),
+        buckets=(0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0),
+        registry=REGISTRY,
+    )
+    http_compression_cpu_seconds_total = Counter(
+        metric_name("http_compression_cpu_seconds_total"),
+        "CPU seconds spent compressing response bodies.",
+        labelnames=("encoding", "mode"),
+        registry=REGISTRY,
+    )
+    http_compression_bytes_total = Counter(
+        metric_name("http_compression_bytes_total"),
+        "Response bytes fed to (``in``) and emitted by (``out``) compression.",
+        labelnames=("encoding", "direction"),
+        registry=REGISTRY,
+    )
+    # Admission control (``AdmitRequests``). ``priority`` is the route's
+    # admission class (4 values); ``signal`` is the limit that tripped —
+    # "loop_lag", "in_flight" or "thread_queue".
+    http_admission_total = Counter(
+        metric_name("http_admission_total"),
+        "Requests admitted or shed by admission control.",
+        labelnames=("priority", "outcome"),
+        registry=REGISTRY,
+    )
+    http_admission_shed_total = Counter(
+        metric_name("http_admission_shed_total"),
+        "Requests shed by admission control, by the signal that tripped.",
+        labelnames=("signal",),
+        registry=REGISTRY,
+    )
+    event_loop_lag_seconds = Gauge(
+        metric_name("event_loop_lag_seconds"),
+        "Most recent event-loop scheduling lag sampled by admission control.",
+        registry=REGISTRY,
+    )
+    thread_pool_queue_depth = Gauge(
+        metric_name("thread_pool_queue_depth"),
+        "Work items waiting for a thread in the loop's default executor.",
+        registry=REGISTRY,
+    )
+    # Buffered request log (``RequestLogWriter``). ``outcome`` is
+    # "written", "dropped" (backlog full) or "failed" (store raised).
+    http_request_log_rows_total = Counter(
+        metric_name("http_request_log_rows_total"),
+        "Request-log rows handed to the store, by outcome.",
+        labelnames=("outcome",),
+        registry=REGISTRY,
+    )
+    http_request_log_backlog = Gauge(
+        metric_name("http_request_log_backlog"),
+        "Request-log rows buffered or being written.",
+        registry=REGISTRY,
+    )
+    http_request_log_flush_seconds = Histogram(
+        metric_name("http_request_log_flush_seconds"),
+        "Time the store took to write one request-log batch.",
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+        registry=REGISTRY,
+    )
+    # Event-loop stalls (``LoopWatchdog``). ``origin`` is a route template,
+    # ``job:<JobClass>`` or "unknown" — bounded by the codebase.
+    event_loop_stalls_total = Counter(
+        metric_name("event_loop_stalls_total"),
+        "Times the event loop was blocked past the watchdog threshold.",
+        labelnames=("origin",),
+        registry=REGISTRY,
+    )
+    event_loop_stall_seconds = Histogram(
+        metric_name("event_loop_stall_seconds"),
+        "How long the event loop stayed blocked, per stall.",
+        labelnames=("origin",),
+        buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+        registry=REGISTRY,
+    )
 
     # ─── Queue worker ───────────────────────────────────────────────────
     queue_dispatches_total = Counter(
@@ -0,0 +1,93 @@
+"""Sampling profiler for one asyncio task.
+
+Profiling a request in a live worker cannot use ``cProfile``: the loop
+thread interleaves every request it holds, so a deterministic profiler
+charges the profiled request for its neighbours' work, and its per-call
+hooks slow them all down. ``StackSampler`` instead reads the loop thread's
+stack from a side thread every ``interval`` seconds and keeps the sample
+only while the loop is running the profiled task. Nothing is installed on
+the loop itself; the cost is one thread for the profile's lifetime.
+
+``collapsed()`` renders the samples in the collapsed-stack format
+(``root;child;leaf <count>`` per line) read by ``flamegraph.pl``,
+speedscope and inferno.
+
+    sampler = StackSampler(asyncio.current_task()).start()
+    try:
+        await handler()
+    finally:
+        sampler.stop()
+    Storage.put("profiles/<id>.folded", sampler.collapsed().encode())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+from collections import Counter
+
+# Deepest stack kept per sample; deeper frames fold into the root.
+_MAX_DEPTH = 128
+
+
+class StackSampler:
+    """Sample the stacks of one task running on the current thread's loop."""
+
+    def __init__(self, task: asyncio.Task, *, interval: float = 0.002):
+        if interval <= 0:
+            raise ValueError("Sampling interval must be positive")
+        self.interval = interval
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self._task = task
+        self._loop = task.get_loop()
+        self._loop_thread = threading.get_ident()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> StackSampler:
+        self._thread = threading.Thread(
+            target=self._sample, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    @property
+    def total(self) -> int:
+        return sum(self.samples.values())
+
+    def collapsed(self) -> str:
+        """Samples as collapsed stacks, heaviest first."""
+        return "".join(
+            f"{';'.join(stack)} {count}\n" for stack, count in self.samples.most_common()
+        )
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                if asyncio.current_task(self._loop) is not self._task:
+                    continue
+            except RuntimeError:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is not None:
+                self.samples[self._stack(frame)] += 1
+
+    @staticmethod
+    def _stack(frame) -> tuple[str, ...]:
+        names: list[str] = []
+        while frame is not None and len(names) < _MAX_DEPTH:
+            code = frame.f_code
+            # ``;`` separates frames in the collapsed format.
+            names.append(
+                f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})".replace(
+                    ";", ":"
+                )
+            )
+            frame = frame.f_back
+        return tuple(reversed(names))
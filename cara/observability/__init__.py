@@ -1,15 +1,20 @@
 """Observability bootstrap — generic wiring for tracking backends.
 
 Currently ships Sentry / GlitchTip. Future backends (OpenTelemetry,
-Datadog) plug into the same ``setup_observability`` family.
+Datadog) plug into the same ``setup_observability`` family. The
+event-loop stall watchdog is wired the same way (``watch_event_loop``).
 """
 
 from cara._LazyExports import _install_lazy_exports
 
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "AlertSink": (".AlertSink", "AlertSink"),
+    "CapacityMetrics": (".CapacityMetrics", "CapacityMetrics"),
+    "LoopStall": (".LoopStall", "LoopStall"),
+    "LoopWatchdog": (".LoopWatchdog", "LoopWatchdog"),
     "MetricsBase": (".MetricsBase", "MetricsBase"),
     "REGISTRY": (".MetricsBase", "REGISTRY"),
+    "StackSampler": (".StackSampler", "StackSampler"),
     "available": (".Trace", "available"),
     "bool_label": (".MetricsBase", "bool_label"),
     "capture_exception": (".Sentry", "capture_exception"),
@@ -40,14 +45,20 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "setup_sentry": (".Sentry", "setup_sentry"),
     "setup_tracing": (".Tracing", "setup_tracing"),
     "span": (".Trace", "span"),
+    "stall_origin": (".LoopWatchdog", "stall_origin"),
     "start_http_server": (".MetricsBase", "start_http_server"),
     "status_class": (".MetricsBase", "status_class"),
+    "watch_event_loop": (".LoopWatchdog", "watch_event_loop"),
 }
 
 __all__ = [
     "AlertSink",
+    "CapacityMetrics",
+    "LoopStall",
+    "LoopWatchdog",
     "MetricsBase",
     "REGISTRY",
+    "StackSampler",
     "available",
     "bool_label",
     "capture_exception",
@@ -78,8 +89,10 @@ __all__ = [
     "setup_sentry",
     "setup_tracing",
     "span",
+    "stall_origin",
     "start_http_server",
     "status_class",
+    "watch_event_loop",
 ]
 
 _install_lazy_exports(__name__, _LAZY_EXPORTS)
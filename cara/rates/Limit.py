@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
+from cara.rates.contracts import RateLimitStore
+
 
 class Limit:
     """
@@ -33,6 +35,8 @@ class Limit:
             )
         self.max_attempts = max_attempts
         self.decay_minutes = decay_minutes
+        self.algorithm = "fixed"
+        self.lease: tuple[int, float] | None = None
         self._key = None
         self._response = None
 
@@ -71,6 +75,48 @@ class Limit:
         self._key = key.strip()
         return self
 
+    def using(self, algorithm: str) -> Limit:
+        """
+        Set the counting algorithm: ``fixed`` (default), ``gcra``,
+        ``sliding_log`` or ``sliding_window`` (see ``RateLimitStore``).
+
+        Args:
+            algorithm: Name of the algorithm
+
+        Returns:
+            self for method chaining
+        """
+        if algorithm not in RateLimitStore.ALGORITHMS:
+            raise ValueError(
+                f"rate-limit algorithm must be one of "
+                f"{', '.join(RateLimitStore.ALGORITHMS)}"
+            )
+        self.algorithm = algorithm
+        return self
+
+    def leased(self, size: int, ttl: float = 1.0) -> Limit:
+        """
+        Spend this limit from locally leased batches of ``size`` tokens,
+        each valid for at most ``ttl`` seconds (see ``RateLimitLeases``).
+
+        Trades precision for remote calls: the shared bucket may count up to
+        ``size`` unspent tokens per worker as used. ``sliding_log`` cannot
+        be leased.
+
+        Args:
+            size: Tokens reserved per remote call (at least 2)
+            ttl: Seconds a leased batch stays spendable
+
+        Returns:
+            self for method chaining
+        """
+        if isinstance(size, bool) or not isinstance(size, int) or size < 2:
+            raise ValueError("rate-limit lease size must be an integer of at least 2")
+        if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0:
+            raise ValueError("rate-limit lease ttl must be a positive number")
+        self.lease = (size, float(ttl))
+        return self
+
     def response(self, callback: Callable) -> Limit:
         """
         Set a custom response handler for when rate limit is exceeded.
@@ -0,0 +1,215 @@
+"""
+In-process rate-limit store for the Cara framework.
+
+Implements the same algorithms as ``RedisRateLimitStore`` with the same
+arithmetic — microsecond integer timestamps, the same rounding, the same
+``reset_in`` rules — so a limiter behaves identically whichever store backs
+it. State lives in this process only: use it for tests and single-process
+deployments, never behind a load balancer.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from cara.exceptions import RateLimitConfigurationException
+from cara.rates.contracts import RateLimitStore
+
+# Expired keys are swept every this many hits so a stream of unique keys
+# (per-IP, per-user) cannot grow the table without bound.
+_SWEEP_EVERY = 1024
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """Thread-safe, process-local rate-limit store."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._entries: dict[tuple[str, str], list[Any]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+
+    def hit(
+        self, algorithm: str, key: str, limit: int, window_seconds: int
+    ) -> tuple[bool, int, int]:
+        if algorithm not in self.ALGORITHMS:
+            raise RateLimitConfigurationException(
+                f"Unknown rate-limit algorithm {algorithm!r}."
+            )
+        return self._decide(
+            getattr(self, f"_{algorithm}"), algorithm, key, limit, window_seconds
+        )
+
+    def lease(
+        self, algorithm: str, key: str, limit: int, window_seconds: int, amount: int
+    ) -> tuple[int, int, int]:
+        if algorithm not in self.LEASABLE:
+            raise RateLimitConfigurationException(
+                f"Rate-limit algorithm {algorithm!r} cannot be leased."
+            )
+        lease = getattr(self, f"_lease_{algorithm}")
+        return self._decide(
+            lambda state, now, limit, window: lease(state, now, limit, window, amount),
+            algorithm,
+            key,
+            limit,
+            window_seconds,
+        )
+
+    def _decide(
+        self,
+        decide: Callable[..., tuple],
+        algorithm: str,
+        key: str,
+        limit: int,
+        window_seconds: int,
+    ) -> tuple[Any, int, int]:
+        window = window_seconds * 1_000_000
+        with self._lock:
+            now = int(self._clock() * 1_000_000)
+            self._hits += 1
+            if self._hits % _SWEEP_EVERY == 0:
+                self._sweep(now)
+            entry = self._entries.get((algorithm, key))
+            if entry is not None and entry[0] <= now:
+                entry = None
+            outcome, remaining, reset, state, expires_at = decide(
+                entry[1] if entry else None, now, limit, window
+            )
+            if state is not None:
+                self._entries[(algorithm, key)] = [expires_at, state]
+        return outcome, remaining, _seconds(reset)
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            for algorithm in self.ALGORITHMS:
+                self._entries.pop((algorithm, key), None)
+
+    def _sweep(self, now: int) -> None:
+        expired = [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for k in expired:
+            del self._entries[k]
+
+    # Each decision returns (allowed or granted, remaining, reset_us,
+    # new_state, expires_at_us); a ``None`` state leaves the stored entry
+    # untouched. Keep these in step with the Lua in ``RedisRateLimitStore``.
+
+    @staticmethod
+    def _fixed(state, now, limit, window):
+        count, expires_at = state if state else (0, now + window)
+        count += 1
+        return (
+            count <= limit,
+            max(limit - count, 0),
+            expires_at - now,
+            (count, expires_at),
+            expires_at,
+        )
+
+    @staticmethod
+    def _lease_fixed(state, now, limit, window, amount):
+        count, expires_at = state if state else (0, now + window)
+        granted = min(amount, max(limit - count, 0))
+        if granted == 0:
+            return 0, 0, expires_at - now, None, 0
+        count += granted
+        return granted, limit - count, expires_at - now, (count, expires_at), expires_at
+
+    @staticmethod
+    def _gcra(state, now, limit, window):
+        interval = window / limit
+        tat = max(state if state is not None else now, now)
+        new_tat = math.ceil(tat + interval)
+        allow_at = new_tat - window
+        if now < allow_at:
+            return False, 0, allow_at - now, None, 0
+        remaining = math.floor((now - allow_at) / interval)
+        return True, remaining, new_tat - now, new_tat, new_tat
+
+    @staticmethod
+    def _lease_gcra(state, now, limit, window, amount):
+        interval = window / limit
+        tat = max(state if state is not None else now, now)
+        granted = min(amount, math.floor((now + window - tat) / interval))
+        if granted <= 0:
+            return 0, 0, math.ceil(tat + interval) - window - now, None, 0
+        new_tat = math.ceil(tat + granted * interval)
+        remaining = math.floor((now + window - new_tat) / interval)
+        return granted, remaining, new_tat - now, new_tat, new_tat
+
+    @staticmethod
+    def _sliding_log(state, now, limit, window):
+        hits = state if state is not None else deque()
+        while hits and hits[0] <= now - window:
+            hits.popleft()
+        if len(hits) < limit:
+            hits.append(now)
+            return True, limit - len(hits), window, hits, now + window
+        return False, 0, hits[0] + window - now, hits, hits[-1] + window
+
+    @staticmethod
+    def _sliding_window(state, now, limit, window):
+        index = math.floor(now / window)
+        elapsed = now - index * window
+        counts = state if state is not None else {}
+        previous = counts.get(index - 1, 0)
+        current = counts.get(index, 0)
+        weight = (window - elapsed) / window
+        estimate = previous * weight + current
+        if estimate + 1 > limit:
+            wait = _sliding_window_wait(
+                previous, current, weight, estimate, elapsed, limit, window
+            )
+            return False, 0, wait, None, 0
+        counts = {index - 1: previous, index: current + 1}
+        return (
+            True,
+            math.floor(limit - estimate - 1),
+            2 * window - elapsed,
+            counts,
+            (index + 2) * window,
+        )
+
+    @staticmethod
+    def _lease_sliding_window(state, now, limit, window, amount):
+        index = math.floor(now / window)
+        elapsed = now - index * window
+        counts = state if state is not None else {}
+        previous = counts.get(index - 1, 0)
+        current = counts.get(index, 0)
+        weight = (window - elapsed) / window
+        estimate = previous * weight + current
+        granted = min(amount, max(math.floor(limit - estimate), 0))
+        if granted == 0:
+            wait = _sliding_window_wait(
+                previous, current, weight, estimate, elapsed, limit, window
+            )
+            return 0, 0, wait, None, 0
+        counts = {index - 1: previous, index: current + granted}
+        return (
+            granted,
+            math.floor(limit - estimate - granted),
+            2 * window - elapsed,
+            counts,
+            (index + 2) * window,
+        )
+
+
+def _sliding_window_wait(previous, current, weight, estimate, elapsed, limit, window):
+    """Microseconds until the weighted estimate leaves room for one hit."""
+    need = estimate - (limit - 1)
+    if previous > 0 and need <= previous * weight:
+        wait = need * window / previous
+    else:
+        extra = 0 if current <= limit - 1 else window * (1 - (limit - 1) / current)
+        wait = (window - elapsed) + extra
+    return math.ceil(wait)
+
+
+def _seconds(microseconds: float) -> int:
+    return max(math.ceil(microseconds / 1_000_000), 0)
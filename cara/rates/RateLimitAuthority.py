@@ -1,23 +1,96 @@
-"""Fail-closed accounting against the shared rate-limit authority."""
+"""Fail-closed accounting against the shared rate-limit authority.
+
+Where decisions are made (``rate.store``, applied by ``RateLimitProvider``):
+
+- ``cache`` (default): a Redis cache driver runs every algorithm as one
+  atomic script per decision (``RedisRateLimitStore``). Any other cache
+  driver only supports ``fixed``, through ``Cache.increment`` and
+  ``Cache.ttl``.
+- ``memory``: ``MemoryRateLimitStore`` in this process — tests and
+  single-process deployments only.
+"""
 
 from __future__ import annotations
 
 import contextlib
+from collections.abc import Callable
+from typing import Any
 
 import cara.facades as facades
 from cara.exceptions import RateLimitConfigurationException, ServiceUnavailableException
 
 from ._RateBackendHealth import _RateBackendHealth
+from .contracts import RateLimitStore
+from .MemoryRateLimitStore import MemoryRateLimitStore
+from .RedisRateLimitStore import RedisRateLimitStore
+
+_STORES = ("cache", "memory")
 
 _health = _RateBackendHealth()
+_memory = MemoryRateLimitStore()
+_store = "cache"
+# The script-backed store for the current Redis cache driver, so scripts are
+# registered once rather than per decision.
+_redis_store: tuple[Any, RedisRateLimitStore] | None = None
 
 
 def attempt_rate_limit(
     cache_key: str,
     window_seconds: int,
     max_attempts: int,
+    algorithm: str = "fixed",
 ) -> tuple[bool, int, int]:
-    """Increment the authoritative bucket or deny while it is unavailable."""
+    """Decide one hit against the authoritative bucket, or deny while it is
+    unavailable."""
+    _validate(cache_key, window_seconds, max_attempts, algorithm)
+
+    def decide(store: RateLimitStore | None) -> tuple[bool, int, int]:
+        if store is None:
+            return _attempt_through_cache(
+                cache_key, window_seconds, max_attempts, algorithm
+            )
+        return store.hit(algorithm, cache_key, max_attempts, window_seconds)
+
+    return _against_authority(decide)
+
+
+def lease_rate_limit(
+    cache_key: str,
+    window_seconds: int,
+    max_attempts: int,
+    amount: int,
+    algorithm: str = "fixed",
+) -> tuple[int, int, int]:
+    """Reserve up to ``amount`` units of the authoritative bucket in one
+    round trip, for ``RateLimitLeases`` to spend locally.
+
+    Returns ``(granted, remaining, reset_in)``; fails closed exactly like
+    :func:`attempt_rate_limit`.
+    """
+    _validate(cache_key, window_seconds, max_attempts, algorithm)
+    if isinstance(amount, bool) or not isinstance(amount, int) or amount < 1:
+        raise RateLimitConfigurationException(
+            "Rate-limit lease amount must be a positive integer."
+        )
+    if algorithm not in RateLimitStore.LEASABLE:
+        raise RateLimitConfigurationException(
+            f"Rate-limit algorithm {algorithm!r} cannot be leased; expected one "
+            f"of {', '.join(RateLimitStore.LEASABLE)}."
+        )
+
+    def decide(store: RateLimitStore | None) -> tuple[int, int, int]:
+        if store is None:
+            raise RateLimitConfigurationException(
+                "Rate-limit leasing needs a Redis cache driver or rate.store = 'memory'."
+            )
+        return store.lease(algorithm, cache_key, max_attempts, window_seconds, amount)
+
+    return _against_authority(decide)
+
+
+def _validate(
+    cache_key: str, window_seconds: int, max_attempts: int, algorithm: str
+) -> None:
     if not isinstance(cache_key, str) or not cache_key:
         raise RateLimitConfigurationException(
             "Rate-limit cache key must be a non-empty string."
@@ -30,13 +103,20 @@ def attempt_rate_limit(
             raise RateLimitConfigurationException(
                 f"Rate-limit {name} must be a positive integer."
             )
+    if algorithm not in RateLimitStore.ALGORITHMS:
+        raise RateLimitConfigurationException(
+            f"Unknown rate-limit algorithm {algorithm!r}; expected one of "
+            f"{', '.join(RateLimitStore.ALGORITHMS)}."
+        )
+
+
+def _against_authority[T](decide: Callable[[RateLimitStore | None], T]) -> T:
+    """Run ``decide`` on the active store, turning backend faults into a
+    fail-closed 503 and logging outage transitions once."""
     try:
-        count = facades.Cache.increment(cache_key, 1, window_seconds)
-        if isinstance(count, bool) or not isinstance(count, int) or count < 1:
-            raise RuntimeError("rate-limit counter returned an invalid value")
-        ttl = facades.Cache.ttl(cache_key)
-        if isinstance(ttl, bool) or not isinstance(ttl, int) or ttl < 0:
-            raise RuntimeError("rate-limit counter has no authoritative expiry")
+        decision = decide(_resolve_store())
+    except RateLimitConfigurationException:
+        raise
     except Exception as exc:
         _record_failure(exc)
         raise ServiceUnavailableException(
@@ -56,9 +136,63 @@ def attempt_rate_limit(
                 category="rate.backend",
             )
 
-    allowed = count <= max_attempts
-    remaining = max(max_attempts - count, 0)
-    return allowed, remaining, ttl
+    return decision
+
+
+def reset_rate_limit(cache_key: str) -> None:
+    """Forget ``cache_key``'s state under every algorithm."""
+    store = _resolve_store()
+    if store is not None:
+        store.reset(cache_key)
+    facades.Cache.forget(cache_key)
+
+
+def _resolve_store() -> RateLimitStore | None:
+    """The script store for the active backend; ``None`` means the generic
+    cache counter."""
+    if _store == "memory":
+        return _memory
+    resolve_driver = getattr(facades.Cache, "driver", None)
+    if not callable(resolve_driver):
+        return None
+    driver = resolve_driver()
+    connection = getattr(driver, "connection", None)
+    if not callable(connection):
+        return None
+    global _redis_store
+    if _redis_store is None or _redis_store[0] is not driver:
+        # Under the driver's prefix, so apps sharing a Redis database keep
+        # separate buckets; fixed windows keep counting on the very keys
+        # ``Cache.increment`` used.
+        key_prefix = getattr(driver, "key_prefix", None)
+        counter_key = getattr(driver, "counter_key", None)
+        _redis_store = (
+            driver,
+            RedisRateLimitStore(
+                connection(),
+                prefix=f"{key_prefix() if callable(key_prefix) else ''}rate:",
+                counter_key=counter_key if callable(counter_key) else None,
+            ),
+        )
+    return _redis_store[1]
+
+
+def _attempt_through_cache(
+    cache_key: str, window_seconds: int, max_attempts: int, algorithm: str
+) -> tuple[bool, int, int]:
+    """Fixed window on a cache driver without server-side scripting."""
+    if algorithm != "fixed":
+        raise RateLimitConfigurationException(
+            f"Rate-limit algorithm {algorithm!r} needs a Redis cache driver "
+            "or rate.store = 'memory'; this cache driver only supports 'fixed'."
+        )
+    count = facades.Cache.increment(cache_key, 1, window_seconds)
+    if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+        raise RuntimeError("rate-limit counter returned an invalid value")
+    ttl = facades.Cache.ttl(cache_key)
+    if isinstance(ttl, bool) or not isinstance(ttl, int) or ttl < 0:
+        raise RuntimeError("rate-limit counter has no authoritative expiry")
+    return count <= max_attempts, max(max_attempts - count, 0), ttl
 
 
 def _record_failure(exc: Exception) -> None:
@@ -78,8 +212,22 @@ def _record_failure(exc: Exception) -> None:
         )
 
 
+def _use_store(name: str) -> None:
+    """Select where decisions are made (``rate.store``)."""
+    global _store
+    if name not in _STORES:
+        raise RateLimitConfigurationException(
+            f"rate.store must be one of {', '.join(_STORES)}; got {name!r}."
+        )
+    _store = name
+
+
 def _reset_for_tests() -> None:
+    global _memory, _redis_store, _store
     _health.reset()
+    _memory = MemoryRateLimitStore()
+    _redis_store = None
+    _store = "cache"
 
 
-__all__ = ["attempt_rate_limit"]
+__all__ = ["attempt_rate_limit", "lease_rate_limit", "reset_rate_limit"]
@@ -0,0 +1,250 @@
+"""
+Local token leasing for high-volume rate-limit keys.
+
+A global limit such as a per-tenant API quota puts every request on a
+round trip to the shared store, even when the bucket is nowhere near empty.
+With leasing, each worker reserves a batch of ``size`` tokens from the
+shared bucket in one atomic call (:func:`lease_rate_limit`) and spends them
+locally; when the batch runs low it is refilled in the background, so a
+busy key costs one remote call per batch instead of one per request.
+
+The trade-off is precision, bounded per limiter by two knobs:
+
+- ``size``: tokens a worker may hold. Up to ``size`` unspent tokens per
+  worker are counted as used by the shared bucket, so other workers can be
+  denied slightly early; a bigger batch saves more calls.
+- ``ttl``: seconds a leased batch stays spendable (never longer than the
+  bucket's own reset). Tokens leased in one window are not carried far
+  into the next; what is left when a lease expires is simply lost.
+
+A denial is remembered until the store's retry time, so a client hammering
+an exhausted key does not turn into one remote call per request either.
+
+Metrics: ``rate_limit_lease_calls_total{source}`` — ``local`` counts the
+remote calls leasing saved, ``inline`` / ``background`` the leases taken.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import math
+import threading
+import time
+from typing import Any
+
+from cara.exceptions import RateLimitConfigurationException
+from cara.facades import Log
+from cara.observability import CapacityMetrics, MetricsBase
+from cara.rates.contracts import RateLimitStore
+from cara.rates.RateLimitAuthority import lease_rate_limit
+
+# Expired leases are swept every this many decisions.
+_SWEEP_EVERY = 1024
+
+_executor: concurrent.futures.Executor | None = None
+_executor_lock = threading.Lock()
+
+
+def _refill_executor() -> concurrent.futures.Executor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="cara-rate-lease"
+            )
+        return _executor
+
+
+class RateLimitLeases:
+    """Per-process token leases on shared rate-limit buckets."""
+
+    def __init__(
+        self,
+        size: int,
+        ttl: float = 1.0,
+        refill_below: float = 0.25,
+        *,
+        executor: concurrent.futures.Executor | None = None,
+    ):
+        """
+        Args:
+            size: tokens reserved per remote call (at least 2)
+            ttl: seconds a leased batch stays spendable
+            refill_below: refill in the background once the local share
+                falls to this fraction of ``size``
+            executor: where background refills run (default: a small
+                shared thread pool)
+        """
+        if isinstance(size, bool) or not isinstance(size, int) or size < 2:
+            raise RateLimitConfigurationException(
+                "Rate-limit lease size must be an integer of at least 2."
+            )
+        if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0:
+            raise RateLimitConfigurationException(
+                "Rate-limit lease ttl must be a positive number of seconds."
+            )
+        if (
+            isinstance(refill_below, bool)
+            or not isinstance(refill_below, (int, float))
+            or not 0 <= refill_below < 1
+        ):
+            raise RateLimitConfigurationException(
+                "Rate-limit lease refill_below must be a fraction in [0, 1)."
+            )
+        self.size = size
+        self.ttl = float(ttl)
+        self._low_water = math.floor(size * refill_below)
+        self._executor = executor
+        # cache_key -> [tokens, remote_remaining, expires_at, reset_at,
+        #               refilling, denied]
+        self._leases: dict[str, list[Any]] = {}
+        self._lock = threading.Lock()
+        self._decisions = 0
+
+    def attempt(
+        self,
+        cache_key: str,
+        window_seconds: int,
+        max_attempts: int,
+        algorithm: str = "fixed",
+    ) -> tuple[bool, int, int]:
+        """Decide one hit, from the local lease when it holds a token."""
+        if algorithm not in RateLimitStore.LEASABLE:
+            raise RateLimitConfigurationException(
+                f"Rate-limit algorithm {algorithm!r} cannot be leased; expected one "
+                f"of {', '.join(RateLimitStore.LEASABLE)}."
+            )
+        now = time.monotonic()
+        refill = False
+        with self._lock:
+            self._decisions += 1
+            if self._decisions % _SWEEP_EVERY == 0:
+                self._sweep(now)
+            lease = self._leases.get(cache_key)
+            decision = None
+            if lease is not None and lease[2] > now:
+                tokens, remote_remaining, _, reset_at, refilling, denied = lease
+                reset_in = max(math.ceil(reset_at - now), 0)
+                if denied:
+                    return False, 0, reset_in
+                # An empty lease that was not denied (a refill still in
+                # flight, or one that failed) falls through to an inline
+                # lease: the shared bucket may well have budget left.
+                if tokens > 0:
+                    lease[0] = tokens - 1
+                    if lease[0] <= self._low_water and not refilling:
+                        lease[4] = refill = True
+                    decision = (True, lease[0] + remote_remaining, reset_in)
+        if decision is not None:
+            MetricsBase.safe_inc(
+                CapacityMetrics.rate_limit_lease_calls_total, {"source": "local"}
+            )
+            if refill:
+                self._schedule_refill(cache_key, window_seconds, max_attempts, algorithm)
+            return decision
+
+        granted, remaining, reset_in = self._lease(
+            cache_key, window_seconds, max_attempts, algorithm, "inline"
+        )
+        with self._lock:
+            # Keep the flag of a refill still in flight so it is not queued
+            # twice; it tops up whichever record it finds.
+            current = self._leases.get(cache_key)
+            refilling = current is not None and current[4]
+            if granted == 0:
+                if reset_in > 0:
+                    self._leases[cache_key] = [
+                        0,
+                        0,
+                        now + reset_in,
+                        now + reset_in,
+                        refilling,
+                        True,
+                    ]
+                return False, 0, reset_in
+            self._leases[cache_key] = [
+                granted - 1,
+                remaining,
+                now + self._lifetime(reset_in),
+                now + reset_in,
+                refilling,
+                False,
+            ]
+        return True, granted - 1 + remaining, reset_in
+
+    def forget(self, cache_key: str) -> None:
+        """Drop this worker's lease on ``cache_key`` (unspent tokens are lost)."""
+        with self._lock:
+            self._leases.pop(cache_key, None)
+
+    def _lease(
+        self,
+        cache_key: str,
+        window_seconds: int,
+        max_attempts: int,
+        algorithm: str,
+        source: str,
+    ) -> tuple[int, int, int]:
+        MetricsBase.safe_inc(
+            CapacityMetrics.rate_limit_lease_calls_total, {"source": source}
+        )
+        return lease_rate_limit(
+            cache_key, window_seconds, max_attempts, self.size, algorithm
+        )
+
+    def _schedule_refill(
+        self, cache_key: str, window_seconds: int, max_attempts: int, algorithm: str
+    ) -> None:
+        executor = self._executor or _refill_executor()
+        try:
+            executor.submit(
+                self._refill, cache_key, window_seconds, max_attempts, algorithm
+            )
+        except RuntimeError:
+            # Interpreter shutdown; the next inline lease takes over.
+            self._finish_refill(cache_key, None)
+
+    def _refill(
+        self, cache_key: str, window_seconds: int, max_attempts: int, algorithm: str
+    ) -> None:
+        try:
+            grant = self._lease(
+                cache_key, window_seconds, max_attempts, algorithm, "background"
+            )
+        except Exception as exc:
+            # Whatever failed will fail again, loudly and closed, on the
+            # inline lease once the local tokens are gone.
+            Log.debug(
+                f"Rate-limit lease refill for {cache_key!r} failed: {exc}",
+                category="rate.backend",
+            )
+            grant = None
+        self._finish_refill(cache_key, grant)
+
+    def _finish_refill(self, cache_key: str, grant: tuple[int, int, int] | None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            lease = self._leases.get(cache_key)
+            if lease is None:
+                return
+            lease[4] = False
+            if not grant or grant[0] == 0:
+                return
+            granted, remaining, reset_in = grant
+            if lease[2] <= now:
+                lease[0] = 0
+            lease[0] += granted
+            lease[1] = remaining
+            lease[5] = False
+            lease[2] = now + self._lifetime(reset_in)
+            lease[3] = now + reset_in
+
+    def _lifetime(self, reset_in: int) -> float:
+        return min(self.ttl, reset_in) if reset_in > 0 else self.ttl
+
+    def _sweep(self, now: float) -> None:
+        expired = [
+            key for key, lease in self._leases.items() if lease[2] <= now and not lease[4]
+        ]
+        for key in expired:
+            del self._leases[key]
@@ -12,6 +12,7 @@ from typing import Any
 from cara.configuration import config
 from cara.exceptions import RateLimitConfigurationException
 from cara.foundation import DeferredProvider
+from cara.rates.RateLimitAuthority import _use_store
 from cara.rates.RateLimiter import RateLimiter
 
 
@@ -42,6 +43,10 @@ class RateLimitProvider(DeferredProvider):
                 f"Rate limit driver '{default_driver}' not supported."
             )
 
+        # Where decisions are made: "cache" (Redis scripts, or the cache
+        # counter on other drivers) or "memory" (this process only).
+        _use_store(config("rate.store", "cache"))
+
         limiter = RateLimiter(
             application=self.application,
             options=driver_opts,
@@ -1,9 +1,10 @@
 """
-Fixed-Window Rate Limiter for the Cara framework.
+Rate Limiter for the Cara framework.
 
-This module implements a fixed-window rate limiting algorithm using the cache system, enforcing
-request limits per key within a time window. It supports named limiters (Laravel-style)
-for flexible per-user, per-endpoint rate limiting.
+This module enforces request limits per key within a time window through the shared
+rate-limit authority, with a configurable algorithm (fixed window by default, or GCRA,
+sliding log, sliding window). It supports named limiters (Laravel-style) for flexible
+per-user, per-endpoint rate limiting.
 """
 
 from __future__ import annotations
@@ -11,17 +12,18 @@ from __future__ import annotations
 from collections.abc import Callable
 
 from cara.exceptions import RateLimitConfigurationException
-from cara.facades import Cache
-from cara.rates.contracts import RateLimit
-from cara.rates.RateLimitAuthority import attempt_rate_limit
+from cara.rates.contracts import RateLimit, RateLimitStore
+from cara.rates.RateLimitAuthority import attempt_rate_limit, reset_rate_limit
+from cara.rates.RateLimitLeases import RateLimitLeases
 
 
 class RateLimiter(RateLimit):
     """
-    Fixed‐window rate limiter with named limiter support.
+    Rate limiter with a configurable algorithm and named limiter support.
 
-    Uses the 'cache' to store per‐key counts and supports named rate limiters
-    for flexible per-user, per-endpoint configuration.
+    Decisions go through the shared rate-limit authority (Redis scripts, the
+    cache counter or the in-process store) and named rate limiters allow
+    flexible per-user, per-endpoint configuration.
     """
 
     driver_name = "fixed"
@@ -34,6 +36,13 @@ class RateLimiter(RateLimit):
                 - limit: int, max hits per window
                 - window_seconds: int, length of window in seconds
                 - cache_prefix: str, prefix for all counter keys
+                - algorithm: str, optional — "fixed" (default), "gcra",
+                  "sliding_log" or "sliding_window"
+                - lease_size: int, optional — spend from locally leased
+                  batches of this many tokens (see ``RateLimitLeases``);
+                  off by default
+                - lease_ttl: float, optional — seconds a leased batch
+                  stays spendable (default 1.0)
         """
         if not isinstance(options, dict):
             raise RateLimitConfigurationException(
@@ -42,6 +51,8 @@ class RateLimiter(RateLimit):
         limit = options.get("limit")
         window = options.get("window_seconds")
         prefix = options.get("cache_prefix")
+        algorithm = options.get("algorithm", "fixed")
+        lease_size = options.get("lease_size")
         if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
             raise RateLimitConfigurationException(
                 "rate.drivers.fixed.limit must be a positive integer."
@@ -54,10 +65,26 @@ class RateLimiter(RateLimit):
             raise RateLimitConfigurationException(
                 "rate.drivers.fixed.cache_prefix must be a non-empty string."
             )
+        if algorithm not in RateLimitStore.ALGORITHMS:
+            raise RateLimitConfigurationException(
+                "rate.drivers.fixed.algorithm must be one of "
+                f"{', '.join(RateLimitStore.ALGORITHMS)}."
+            )
+        if lease_size is not None and algorithm not in RateLimitStore.LEASABLE:
+            raise RateLimitConfigurationException(
+                f"rate.drivers.fixed.algorithm {algorithm!r} cannot be leased; "
+                f"lease_size needs one of {', '.join(RateLimitStore.LEASABLE)}."
+            )
         self.application = application
         self.limit = limit
         self.window = window
         self.prefix = prefix.strip()
+        self.algorithm = algorithm
+        self._leases = (
+            RateLimitLeases(lease_size, options.get("lease_ttl", 1.0))
+            if lease_size is not None
+            else None
+        )
         self._limiters = {}  # Named limiter definitions (name -> callback)
 
     def attempt(self, key: str) -> tuple[bool, int, int]:
@@ -90,14 +117,18 @@ class RateLimiter(RateLimit):
         Apps calling ``RateLimiter.attempt(key)`` directly (custom
         middleware, queue jobs, console commands) inherited the race.
 
-        This rewrite delegates to ``Cache.increment`` for the count and
-        ``Cache.ttl`` for the reset deadline, matching the throttle
-        middleware's semantics and giving the same atomic guarantee on
-        every backend the framework supports (Redis ``INCRBY`` is
-        atomic; the file driver acquires a per-key lock around the
-        increment).
+        This method delegates to ``attempt_rate_limit``, matching the
+        throttle middleware's semantics and giving the same atomic
+        guarantee on every backend the framework supports: on Redis each
+        decision is one server-side script (one round trip, any
+        algorithm); the file driver's fixed-window ``Cache.increment``
+        holds a per-key lock around the increment.
         """
         cache_key = f"{self.prefix}{key}"
+        if self._leases is not None:
+            return self._leases.attempt(
+                cache_key, self.window, self.limit, self.algorithm
+            )
 
         # Both this method and transport middleware use one fail-closed
         # authority, so accounting and outage policy cannot drift.
@@ -105,6 +136,7 @@ class RateLimiter(RateLimit):
             cache_key=cache_key,
             window_seconds=self.window,
             max_attempts=self.limit,
+            algorithm=self.algorithm,
         )
         return allowed, remaining, reset_in
 
@@ -190,5 +222,6 @@ class RateLimiter(RateLimit):
     def reset(self, key: str) -> None:
         """Immediately reset this key's counter."""
         cache_key = f"{self.prefix}{key}"
-        # Simply remove it
-        Cache.forget(cache_key)
+        if self._leases is not None:
+            self._leases.forget(cache_key)
+        reset_rate_limit(cache_key)
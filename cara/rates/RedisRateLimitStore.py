@@ -0,0 +1,225 @@
+"""
+Redis-backed rate-limit store for the Cara framework.
+
+Every decision is one Lua script run server-side — read state, apply the
+algorithm, write state, return ``(allowed, remaining, reset)`` — so it costs
+exactly one round trip (``EVALSHA``; redis-py re-sends the script once after
+a ``NOSCRIPT``) and is atomic across every worker sharing the Redis.
+
+Scripts read the clock with Redis ``TIME`` rather than trusting the caller's,
+so application hosts with skewed clocks still agree on every window. Each
+script touches a single key, which keeps them valid on Redis Cluster.
+
+The arithmetic mirrors ``MemoryRateLimitStore`` step for step; change both
+together.
+"""
+
+from __future__ import annotations
+
+import math
+import secrets
+from collections.abc import Callable
+from typing import Any
+
+from cara.exceptions import RateLimitConfigurationException
+from cara.rates.contracts import RateLimitStore
+
+# KEYS[1] = state key; ARGV[1] = limit; ARGV[2] = window (µs);
+# ARGV[3] = unique member (sliding_log) or lease amount (lease scripts).
+# Decision scripts return {allowed, remaining, reset_us}; lease scripts
+# return {granted, remaining, reset_us}.
+_PRELUDE = (
+    "local limit = tonumber(ARGV[1]) "
+    "local window = tonumber(ARGV[2]) "
+    "local clock = redis.call('TIME') "
+    "local now = tonumber(clock[1]) * 1000000 + tonumber(clock[2]) "
+)
+
+# Shared by the sliding-window decision and lease scripts.
+_SLIDING_WINDOW_STATE = (
+    "local index = math.floor(now / window) "
+    "local elapsed = now - index * window "
+    "local field = string.format('%.0f', index) "
+    "local previous = tonumber(redis.call('HGET', KEYS[1], "
+    "  string.format('%.0f', index - 1))) or 0 "
+    "local current = tonumber(redis.call('HGET', KEYS[1], field)) or 0 "
+    "local weight = (window - elapsed) / window "
+    "local estimate = previous * weight + current "
+    "local function wait_us() "
+    "  local need = estimate - (limit - 1) "
+    "  local wait "
+    "  if previous > 0 and need <= previous * weight then "
+    "    wait = need * window / previous "
+    "  else "
+    "    local extra = 0 "
+    "    if current > limit - 1 then "
+    "      extra = window * (1 - (limit - 1) / current) "
+    "    end "
+    "    wait = (window - elapsed) + extra "
+    "  end "
+    "  return math.ceil(wait) "
+    "end "
+)
+
+_SCRIPTS = {
+    "fixed": _PRELUDE
+    + (
+        "local count = redis.call('INCR', KEYS[1]) "
+        "local ttl = redis.call('PTTL', KEYS[1]) "
+        "if ttl < 0 then "
+        "  ttl = window / 1000 "
+        "  redis.call('PEXPIRE', KEYS[1], ttl) "
+        "end "
+        "local allowed = 0 "
+        "if count <= limit then allowed = 1 end "
+        "return {allowed, math.max(limit - count, 0), ttl * 1000}"
+    ),
+    "gcra": _PRELUDE
+    + (
+        "local interval = window / limit "
+        "local tat = tonumber(redis.call('GET', KEYS[1])) or now "
+        "if tat < now then tat = now end "
+        "local new_tat = math.ceil(tat + interval) "
+        "local allow_at = new_tat - window "
+        "if now < allow_at then return {0, 0, allow_at - now} end "
+        "redis.call('SET', KEYS[1], string.format('%.0f', new_tat), "
+        "  'PX', math.ceil((new_tat - now) / 1000)) "
+        "return {1, math.floor((now - allow_at) / interval), new_tat - now}"
+    ),
+    "sliding_log": _PRELUDE
+    + (
+        "redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window) "
+        "local count = redis.call('ZCARD', KEYS[1]) "
+        "if count < limit then "
+        "  redis.call('ZADD', KEYS[1], now, ARGV[3]) "
+        "  redis.call('PEXPIRE', KEYS[1], math.ceil(window / 1000)) "
+        "  return {1, limit - count - 1, window} "
+        "end "
+        "local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES') "
+        "return {0, 0, tonumber(oldest[2]) + window - now}"
+    ),
+    "sliding_window": _PRELUDE
+    + _SLIDING_WINDOW_STATE
+    + (
+        "if estimate + 1 > limit then return {0, 0, wait_us()} end "
+        "redis.call('HINCRBY', KEYS[1], field, 1) "
+        "redis.call('HDEL', KEYS[1], string.format('%.0f', index - 2)) "
+        "redis.call('PEXPIRE', KEYS[1], math.ceil(2 * window / 1000)) "
+        "return {1, math.floor(limit - estimate - 1), 2 * window - elapsed}"
+    ),
+}
+
+_LEASE_SCRIPTS = {
+    "fixed": _PRELUDE
+    + (
+        "local amount = tonumber(ARGV[3]) "
+        "local count = tonumber(redis.call('GET', KEYS[1])) or 0 "
+        "local ttl = redis.call('PTTL', KEYS[1]) "
+        "if ttl < 0 then ttl = window / 1000 end "
+        "local granted = math.min(amount, math.max(limit - count, 0)) "
+        "if granted == 0 then return {0, 0, ttl * 1000} end "
+        "redis.call('INCRBY', KEYS[1], granted) "
+        "redis.call('PEXPIRE', KEYS[1], ttl) "
+        "return {granted, limit - count - granted, ttl * 1000}"
+    ),
+    "gcra": _PRELUDE
+    + (
+        "local amount = tonumber(ARGV[3]) "
+        "local interval = window / limit "
+        "local tat = tonumber(redis.call('GET', KEYS[1])) or now "
+        "if tat < now then tat = now end "
+        "local granted = math.min(amount, math.floor((now + window - tat) / interval)) "
+        "if granted <= 0 then "
+        "  return {0, 0, math.ceil(tat + interval) - window - now} "
+        "end "
+        "local new_tat = math.ceil(tat + granted * interval) "
+        "redis.call('SET', KEYS[1], string.format('%.0f', new_tat), "
+        "  'PX', math.ceil((new_tat - now) / 1000)) "
+        "return {granted, math.floor((now + window - new_tat) / interval), "
+        "  new_tat - now}"
+    ),
+    "sliding_window": _PRELUDE
+    + _SLIDING_WINDOW_STATE
+    + (
+        "local amount = tonumber(ARGV[3]) "
+        "local granted = math.min(amount, math.max(math.floor(limit - estimate), 0)) "
+        "if granted == 0 then return {0, 0, wait_us()} end "
+        "redis.call('HINCRBY', KEYS[1], field, granted) "
+        "redis.call('HDEL', KEYS[1], string.format('%.0f', index - 2)) "
+        "redis.call('PEXPIRE', KEYS[1], math.ceil(2 * window / 1000)) "
+        "return {granted, math.floor(limit - estimate - granted), "
+        "  2 * window - elapsed}"
+    ),
+}
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """Atomic, single-round-trip rate-limit decisions on Redis."""
+
+    def __init__(
+        self,
+        connection: Any,
+        prefix: str = "rate:",
+        counter_key: Callable[[str], str] | None = None,
+    ):
+        """
+        Args:
+            connection: a redis-py client (``RedisCacheDriver.connection()``)
+            prefix: namespace for the state keys
+            counter_key: maps a key to its fixed-window counter (default:
+                under ``prefix``); ``RedisCacheDriver.counter_key`` keeps the
+                counters ``Cache.increment`` wrote
+        """
+        self._connection = connection
+        self._prefix = prefix
+        self._counter_key = counter_key
+        self._scripts = {
+            name: connection.register_script(source) for name, source in _SCRIPTS.items()
+        }
+        self._lease_scripts = {
+            name: connection.register_script(source)
+            for name, source in _LEASE_SCRIPTS.items()
+        }
+
+    def hit(
+        self, algorithm: str, key: str, limit: int, window_seconds: int
+    ) -> tuple[bool, int, int]:
+        script = self._scripts.get(algorithm)
+        if script is None:
+            raise RateLimitConfigurationException(
+                f"Unknown rate-limit algorithm {algorithm!r}."
+            )
+        member = secrets.token_hex(8) if algorithm == "sliding_log" else ""
+        allowed, remaining, reset = script(
+            keys=[self._key(algorithm, key)],
+            args=[limit, window_seconds * 1_000_000, member],
+        )
+        return bool(int(allowed)), int(remaining), _seconds(reset)
+
+    def lease(
+        self, algorithm: str, key: str, limit: int, window_seconds: int, amount: int
+    ) -> tuple[int, int, int]:
+        script = self._lease_scripts.get(algorithm)
+        if script is None:
+            raise RateLimitConfigurationException(
+                f"Rate-limit algorithm {algorithm!r} cannot be leased."
+            )
+        granted, remaining, reset = script(
+            keys=[self._key(algorithm, key)],
+            args=[limit, window_seconds * 1_000_000, amount],
+        )
+        return int(granted), int(remaining), _seconds(reset)
+
+    def reset(self, key: str) -> None:
+        self._connection.delete(
+            *(self._key(algorithm, key) for algorithm in self.ALGORITHMS)
+        )
+
+    def _key(self, algorithm: str, key: str) -> str:
+        if algorithm == "fixed" and self._counter_key is not None:
+            return self._counter_key(key)
+        return f"{self._prefix}{algorithm}:{key}"
+
+
+def _seconds(microseconds: Any) -> int:
+    return max(math.ceil(int(microseconds) / 1_000_000), 0)
@@ -4,18 +4,30 @@ from cara._LazyExports import _install_lazy_exports
 
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "Limit": (".Limit", "Limit"),
+    "MemoryRateLimitStore": (".MemoryRateLimitStore", "MemoryRateLimitStore"),
     "RateLimit": (".contracts", "RateLimit"),
+    "RateLimitLeases": (".RateLimitLeases", "RateLimitLeases"),
     "RateLimitProvider": (".RateLimitProvider", "RateLimitProvider"),
+    "RateLimitStore": (".contracts", "RateLimitStore"),
     "RateLimiter": (".RateLimiter", "RateLimiter"),
+    "RedisRateLimitStore": (".RedisRateLimitStore", "RedisRateLimitStore"),
     "attempt_rate_limit": (".RateLimitAuthority", "attempt_rate_limit"),
+    "lease_rate_limit": (".RateLimitAuthority", "lease_rate_limit"),
+    "reset_rate_limit": (".RateLimitAuthority", "reset_rate_limit"),
 }
 
 __all__ = [
     "Limit",
+    "MemoryRateLimitStore",
     "RateLimit",
+    "RateLimitLeases",
     "RateLimitProvider",
+    "RateLimitStore",
     "RateLimiter",
+    "RedisRateLimitStore",
     "attempt_rate_limit",
+    "lease_rate_limit",
+    "reset_rate_limit",
 ]
 
 _install_lazy_exports(__name__, _LAZY_EXPORTS)
@@ -0,0 +1,64 @@
+"""
+Rate Limit Store Interface for the Cara framework.
+
+A store makes one rate-limit decision atomically: it reads the key's state,
+applies the algorithm, writes the new state and reports the outcome in a
+single step, so concurrent callers can never both spend the last unit of
+budget.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class RateLimitStore(ABC):
+    """Contract for an atomic rate-limit decision store."""
+
+    #: Algorithms every store implements, with identical semantics:
+    #:
+    #: - ``fixed``: counter per window; bursts of up to twice the limit are
+    #:   possible across a window boundary.
+    #: - ``gcra``: generic cell rate algorithm; hits are spaced
+    #:   ``window / limit`` apart with a burst allowance of ``limit``.
+    #: - ``sliding_log``: exact count of hits in the trailing window.
+    #: - ``sliding_window``: the current window's count plus the previous
+    #:   window's, weighted by how much of it still overlaps.
+    ALGORITHMS = ("fixed", "gcra", "sliding_log", "sliding_window")
+
+    #: Algorithms whose budget can be reserved in batches (:meth:`lease`).
+    #: ``sliding_log`` is excluded: an exact log and locally spent tokens
+    #: contradict each other.
+    LEASABLE = ("fixed", "gcra", "sliding_window")
+
+    @abstractmethod
+    def hit(
+        self, algorithm: str, key: str, limit: int, window_seconds: int
+    ) -> tuple[bool, int, int]:
+        """
+        Record one hit against ``key`` and decide it.
+
+        Returns ``(allowed, remaining, reset_in)``: ``remaining`` is the
+        budget left after this hit, ``reset_in`` the whole seconds until the
+        budget is fully restored — or, for a denied hit, until the next hit
+        would be allowed.
+        """
+        ...
+
+    @abstractmethod
+    def lease(
+        self, algorithm: str, key: str, limit: int, window_seconds: int, amount: int
+    ) -> tuple[int, int, int]:
+        """
+        Reserve up to ``amount`` units of ``key``'s budget in one step.
+
+        Returns ``(granted, remaining, reset_in)``: ``granted`` may be fewer
+        than asked, down to ``0`` when the budget is spent, in which case
+        ``reset_in`` is the seconds until the next unit frees up.
+        """
+        ...
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+        """Forget every algorithm's state for ``key``."""
+        ...
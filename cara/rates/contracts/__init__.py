@@ -4,10 +4,12 @@ from cara._LazyExports import _install_lazy_exports
 
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "RateLimit": (".RateLimit", "RateLimit"),
+    "RateLimitStore": (".RateLimitStore", "RateLimitStore"),
 }
 
 __all__ = [
     "RateLimit",
+    "RateLimitStore",
 ]
 
 _install_lazy_exports(__name__, _LAZY_EXPORTS)
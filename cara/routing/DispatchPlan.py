@@ -0,0 +1,53 @@
+"""
+Frozen per-route dispatch plan.
+
+Everything a request to one route executes that does not depend on the
+request itself: the resolved, priority-sorted middleware chain and the
+handler's ``InjectionPlan`` (controller construction, handler parameters,
+route-parameter conversion). ``HttpConductor.get_route_middleware`` used to
+re-resolve every alias and group through ``MiddlewareCapsule`` and re-sort by
+priority on every request; now a ``Route`` builds its plan once when routes
+load and the request path only executes it.
+
+A plan is stamped with the capsule it was resolved against and that capsule's
+``revision``. Registering an alias, group member or priority order bumps the
+revision; editing the route's own middleware drops the plan. Either way the
+next request rebuilds it rather than serving a stale chain.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from cara.routing.InjectionPlan import InjectionPlan
+
+
+@dataclass(frozen=True)
+class DispatchPlan:
+    """Resolved middleware chain + injection plan for one route."""
+
+    middleware: tuple[Any, ...]
+    injection: InjectionPlan
+    capsule_revision: int
+    capsule: Any = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def build(cls, route: Any, capsule: Any) -> DispatchPlan:
+        """Resolve ``route``'s middleware through ``capsule`` and compile its
+        handler's injection plan.
+
+        Raises:
+            MiddlewareNotFoundException: A declared alias or group is unknown.
+        """
+        middleware = capsule.resolve_route_middleware(route.get_middleware())
+        return cls(
+            middleware=tuple(middleware),
+            injection=route.controller.injection_plan(),
+            capsule_revision=capsule.revision,
+            capsule=capsule,
+        )
+
+    def is_current(self, capsule: Any) -> bool:
+        """Whether this plan still reflects ``capsule``'s registrations."""
+        return capsule is self.capsule and capsule.revision == self.capsule_revision
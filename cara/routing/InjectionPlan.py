@@ -0,0 +1,298 @@
+"""
+Compiled dependency-injection recipe for one route handler.
+
+``RouteResolver`` used to work out, on every request, which provider fed each
+handler parameter (``inspect.signature`` walks, annotation lookups per route
+parameter, a fresh provider dict of lambdas) and how to build the controller
+(``inspect.signature(__init__)`` plus string-annotation resolution). None of
+that depends on the request. The plan does it once per handler and keeps
+only what varies — the request, the response, the matched values — for the
+request path.
+
+Resolution order is exactly the provider order the resolver used:
+
+HTTP: ``Request``-typed, ``Response``-typed, a matched route parameter of the
+same name, then the ``request`` / ``response`` names; WebSocket: ``Socket``-
+typed, a matched route parameter, then ``socket`` / ``message``. A provider
+that yields ``None`` falls through to container injection by type (class
+annotations) or by name (unannotated), then to the parameter default.
+"""
+
+from __future__ import annotations
+
+import inspect
+import typing
+from collections.abc import Callable
+from typing import Any
+
+from cara.exceptions import (
+    MissingContainerBindingException,
+    RouteRegistrationException,
+)
+from cara.http import Request, Response
+from cara.routing.RouteParameterValidator import RouteParameterValidator
+from cara.websocket import Socket
+
+_EMPTY = inspect.Parameter.empty
+_PRIMITIVES = (str, int, float, bool, dict, list, tuple, type(None))
+_UNSET = object()
+
+
+def _convert_param_value(value: Any, expected_type: Any) -> Any:
+    """Convert a matched route value to the handler's annotated type.
+
+    Unconvertible values are returned unchanged so the handler (or its
+    FormRequest) decides what a malformed value means.
+    """
+    if expected_type is None or value is None:
+        return value
+
+    try:
+        if expected_type is int:
+            return int(value)
+        elif expected_type is float:
+            return float(value)
+        elif expected_type is bool:
+            return value.lower() in ("true", "1", "yes", "on")
+        elif expected_type is str:
+            return str(value)
+        elif hasattr(expected_type, "__origin__"):
+            # Handle typing generics like Optional[int], List[str], etc.
+            origin = getattr(expected_type, "__origin__", None)
+            args = getattr(expected_type, "__args__", ())
+
+            if origin is typing.Union:
+                # Handle Optional[T] which is Union[T, None]
+                non_none_types = [arg for arg in args if arg is not type(None)]
+                if non_none_types:
+                    return _convert_param_value(value, non_none_types[0])
+            elif origin is list:
+                # Handle List[T] - split by comma
+                items = [item.strip() for item in value.split(",")]
+                if args:
+                    return [_convert_param_value(item, args[0]) for item in items]
+                return items
+        else:
+            # For other types, try direct conversion
+            return expected_type(value)
+    except ValueError, TypeError:
+        # If conversion fails, return original value
+        return value
+
+
+class _HandlerParam:
+    """One handler parameter with its provider decisions precomputed."""
+
+    __slots__ = (
+        "name",
+        "annotation",
+        "default",
+        "is_request",
+        "is_response",
+        "is_socket",
+        "is_class",
+        "convert",
+    )
+
+    def __init__(self, param: inspect.Parameter) -> None:
+        annotation = param.annotation
+        self.name = param.name
+        self.annotation = annotation
+        self.default = param.default
+        self.is_request = annotation is Request
+        self.is_response = annotation is Response
+        self.is_socket = annotation is Socket
+        self.is_class = annotation is not _EMPTY and isinstance(annotation, type)
+        expected = None if annotation is _EMPTY else annotation
+        self.convert: Callable[[Any], Any] = (
+            (lambda value: value)
+            if expected is None
+            else (lambda value: _convert_param_value(value, expected))
+        )
+
+
+class InjectionPlan:
+    """Handler-parameter, constructor and coercion plan for one route handler."""
+
+    def __init__(
+        self,
+        handler_signature: inspect.Signature | None,
+        controller_class: type | None = None,
+    ) -> None:
+        parameters = handler_signature.parameters.values() if handler_signature else ()
+        self.params: tuple[_HandlerParam, ...] = tuple(
+            _HandlerParam(param)
+            for param in parameters
+            if param.name != "self"
+            and param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+        )
+        self.controller_class = controller_class
+        self._constructor: Any = _UNSET
+        self._coercions: dict[str, Callable[[Any], Any] | None] = {}
+        self._rule_revision = RouteParameterValidator.revision
+
+    # ------------------------------------------------------------------
+    # ``request.param_<name>`` coercion (``Route.compile`` rules)
+    # ------------------------------------------------------------------
+    def coerce(self, name: str, value: Any) -> Any:
+        """Coerce one matched value by its ``Route.compile`` rule."""
+        if value is None:
+            return value
+        if self._rule_revision != RouteParameterValidator.revision:
+            self._coercions.clear()
+            self._rule_revision = RouteParameterValidator.revision
+        try:
+            converter = self._coercions[name]
+        except KeyError:
+            converter = self._coercions[name] = RouteParameterValidator.coercion_for(name)
+        if converter is None:
+            return value
+        try:
+            return converter(value)
+        except ValueError, TypeError:
+            return value
+
+    # ------------------------------------------------------------------
+    # Controller construction
+    # ------------------------------------------------------------------
+    def instantiate(self, container: Any) -> Any:
+        """Build the controller, injecting typed constructor dependencies."""
+        controller_class = self.controller_class
+        if not container:
+            return controller_class()
+        if self._constructor is _UNSET:
+            self._constructor = self._constructor_plan(container)
+        if self._constructor is None:
+            return controller_class()
+
+        params = {}
+        for param_name, param_type, default in self._constructor:
+            try:
+                params[param_name] = container.make(param_type)
+            except Exception:
+                if default is _EMPTY:
+                    raise MissingContainerBindingException(
+                        f"Cannot resolve dependency '{param_name}' "
+                        f"of type '{param_type}' for controller "
+                        f"'{controller_class.__name__}'"
+                    )
+                params[param_name] = default
+        return controller_class(**params)
+
+    def _constructor_plan(self, container: Any) -> list[tuple[str, Any, Any]] | None:
+        """Injectable ``__init__`` parameters, or None when there's no signature."""
+        controller_class = self.controller_class
+        try:
+            sig = inspect.signature(controller_class.__init__)
+        except ValueError, TypeError:
+            return None
+
+        plan: list[tuple[str, Any, Any]] = []
+        for param_name, param in sig.parameters.items():
+            if param_name == "self":
+                continue
+            param_type = param.annotation
+            if param_type == _EMPTY:
+                continue
+
+            # Resolve string annotations caused by `from __future__ import annotations`
+            if isinstance(param_type, str):
+                module = inspect.getmodule(controller_class)
+                if module is not None:
+                    param_type = module.__dict__.get(param_type, param_type)
+                if isinstance(param_type, str):
+                    continue
+
+            if hasattr(container, "_unwrap_annotation"):
+                param_type = container._unwrap_annotation(param_type)
+                if param_type is None:
+                    continue
+
+            if param_type in _PRIMITIVES or not inspect.isclass(param_type):
+                continue
+            plan.append((param_name, param_type, param.default))
+        return plan
+
+    # ------------------------------------------------------------------
+    # Handler keyword arguments
+    # ------------------------------------------------------------------
+    def kwargs(self, context: Any, container: Any) -> dict[str, Any]:
+        """Keyword arguments for the handler in an HTTP or WebSocket context."""
+        if isinstance(context, tuple) and len(context) == 2:
+            first, second = context
+            if isinstance(first, Request) and isinstance(second, Response):
+                return self._http_kwargs(first, second, container or first.application)
+            if isinstance(first, Socket) and isinstance(second, dict):
+                return self._ws_kwargs(
+                    first, second, container or getattr(first, "application", None)
+                )
+        raise RouteRegistrationException("Unknown context type for dependency resolution")
+
+    def _http_kwargs(
+        self, request: Request, response: Response, container: Any
+    ) -> dict[str, Any]:
+        route_params = getattr(request, "params", {})
+        kwargs: dict[str, Any] = {}
+        for param in self.params:
+            name = param.name
+            if param.is_request:
+                value = request
+            elif param.is_response:
+                value = response
+            elif name in route_params:
+                value = param.convert(route_params[name])
+            elif name == "request":
+                value = request
+            elif name == "response":
+                value = response
+            else:
+                value = None
+            if value is None:
+                value = self._fallback(param, container)
+            kwargs[name] = value
+        return kwargs
+
+    def _ws_kwargs(self, socket: Socket, message: dict, container: Any) -> dict[str, Any]:
+        route_params = getattr(socket, "params", {})
+        kwargs: dict[str, Any] = {}
+        for param in self.params:
+            name = param.name
+            if param.is_socket:
+                value = socket
+            elif name in route_params:
+                value = param.convert(route_params[name])
+            elif name == "socket":
+                value = socket
+            elif name == "message":
+                value = message
+            else:
+                value = None
+            if value is None:
+                value = self._fallback(param, container)
+            kwargs[name] = value
+        return kwargs
+
+    @staticmethod
+    def _fallback(param: _HandlerParam, container: Any) -> Any:
+        """Container injection by type or name, then the declared default."""
+        if param.is_class:
+            try:
+                return container.make(param.annotation)
+            except MissingContainerBindingException:
+                if param.default is not _EMPTY:
+                    return param.default
+                raise RouteRegistrationException(
+                    f"Failed to resolve required dependency by type: {param.annotation}"
+                )
+        if param.annotation is _EMPTY:
+            try:
+                return container.make(param.name)
+            except MissingContainerBindingException:
+                if param.default is not _EMPTY:
+                    return param.default
+                raise RouteRegistrationException(
+                    f"Failed to resolve required dependency by name: {param.name}"
+                )
+        if param.default is not _EMPTY:
+            return param.default
+        raise RouteRegistrationException(f"Could not resolve parameter: {param.name}")
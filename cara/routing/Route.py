@@ -8,8 +8,10 @@ Mirrors Laravel-style syntax for HTTP and WebSocket routes with support for:
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
+from cara.routing.DispatchPlan import DispatchPlan
 from cara.routing.RouteCompiler import RouteCompiler
 from cara.routing.RouteGroup import RouteGroup
 from cara.routing.RouteParameterValidator import RouteParameterValidator
@@ -40,6 +42,9 @@ class Route:
 
     controllers_locations: list[str] = []
 
+    # Admission priority classes, most protected first (see ``AdmitRequests``).
+    priorities: tuple[str, ...] = ("critical", "high", "normal", "low")
+
     def __init__(
         self,
         url: str,
@@ -65,6 +70,10 @@ class Route:
         self.request_method = [m.lower() for m in request_method]
         self._name = name
         self._middleware: list[str] = []
+        self._dispatch_plan: DispatchPlan | None = None
+        self._conditional: Callable[[Any], Any] | None = None
+        self._coalesce = False
+        self._priority = "normal"
         self.compiler = RouteCompiler(self.url, compilers or Route.compilers)
         self.controller = RouteResolver(
             controller,
@@ -125,6 +134,7 @@ class Route:
             self._middleware.extend(middleware)
         else:
             self._middleware.append(middleware)
+        self._dispatch_plan = None
         return self
 
     def prepend_middleware(self, middleware: str | list[str]) -> Route:
@@ -139,11 +149,78 @@ class Route:
             self._middleware = list(middleware) + self._middleware
         else:
             self._middleware = [middleware] + self._middleware
+        self._dispatch_plan = None
         return self
 
     def get_middleware(self) -> list[str]:
         return self._middleware
 
+    def conditional(self, validator: Callable[[Any], Any]) -> Route:
+        """Declare a cheap validator for ``ConditionalGet``.
+
+        ``validator(request)`` (sync or async) returns a version stamp —
+        a counter, a hash, a ``VersionedCache.read()`` value — or a
+        ``datetime`` such as the max ``updated_at`` of the listed rows.
+        ``ConditionalGet`` evaluates it *before* dispatch and, once a 200
+        has been served for that stamp, answers a matching
+        ``If-None-Match`` / ``If-Modified-Since`` with a 304 without
+        running the handler. It must change whenever the
+        representation does, including anything user- or query-specific.
+        """
+        self._conditional = validator
+        return self
+
+    def get_conditional(self) -> Callable[[Any], Any] | None:
+        """The route's validator, else one declared with ``@conditional``."""
+        if self._conditional is not None:
+            return self._conditional
+        return self.controller.handler_attribute("__conditional__")
+
+    def coalesce(self, enabled: bool = True) -> Route:
+        """Collapse identical concurrent GETs into one handler execution.
+
+        While one request runs the handler, every concurrent GET with the
+        same path, query string, user and ``Accept`` / ``Accept-Language``
+        headers waits for it and is answered with a copy of its response
+        (see ``HttpConductor``). Only for handlers whose response depends
+        on nothing else in the request.
+        """
+        self._coalesce = enabled
+        return self
+
+    def is_coalesced(self) -> bool:
+        return self._coalesce
+
+    def priority(self, priority: str) -> Route:
+        """Set the route's admission class for ``AdmitRequests``.
+
+        Under overload ``low`` routes are shed first, then ``normal``, then
+        ``high``; ``critical`` routes (health checks, payment callbacks)
+        are never shed.
+        """
+        if priority not in Route.priorities:
+            raise ValueError(
+                f"Unknown route priority {priority!r}; "
+                f"expected one of {', '.join(Route.priorities)}"
+            )
+        self._priority = priority
+        return self
+
+    def get_priority(self) -> str:
+        return self._priority
+
+    def dispatch_plan(self, capsule: Any) -> DispatchPlan:
+        """This route's dispatch plan against ``capsule``, built on demand.
+
+        ``RouteProvider`` builds every plan while routes load; this only
+        rebuilds when the capsule's registrations or the route's own
+        middleware changed since.
+        """
+        plan = self._dispatch_plan
+        if plan is None or not plan.is_current(capsule):
+            plan = self._dispatch_plan = DispatchPlan.build(self, capsule)
+        return plan
+
     def matches(self, path: str, method: str) -> bool:
         return self.compiler.matches(path) and method.lower() in self.request_method
 
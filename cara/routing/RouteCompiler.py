@@ -15,9 +15,24 @@ from urllib.parse import unquote
 class RouteCompiler:
     """Handles route compilation and parameter extraction."""
 
+    #: Bumped whenever an already-compiled route is compiled AGAIN anywhere
+    #: in the process. A ``RouteIndex`` records the value it was built
+    #: against, so a route re-prefixed after registration (``Route.group``
+    #: over routes already handed to the router) invalidates the index
+    #: instead of leaving it matching the old URL. A first compile does not
+    #: count: the per-request preflight ``Route`` must not force a rebuild.
+    generation: int = 0
+
     def __init__(self, url: str, compilers: dict[str, str]):
         self._compiled_regex = None
         self.url_list: list[str] = []
+        # One ``(pattern, optional)`` entry per URL segment, in order.
+        # ``pattern`` is ``None`` for a static segment (whose literal text
+        # is carried in the third slot) and the exact compiler regex used
+        # for a parameter segment. ``RouteIndex`` builds its tree from
+        # this rather than re-parsing the URL, so the tree and the regex
+        # can never disagree about which compiler a segment used.
+        self.segments: list[tuple[str | None, bool, str]] = []
         # Maps parameter name → compiler type name (e.g. "id" → "int")
         self.param_types: dict[str, str] = {}
         self.compilers = compilers or {"default": r"([^/]+)"}
@@ -28,6 +43,7 @@ class RouteCompiler:
         parts = url.strip("/").split("/")
         regex = "^"
         url_list: list[str] = []
+        segments: list[tuple[str | None, bool, str]] = []
 
         for part in parts:
             if part == "":
@@ -38,6 +54,7 @@ class RouteCompiler:
                 name, _, compiler_name = part[1:].partition(":")
                 pattern = self.compilers.get(compiler_name, self.compilers["default"])
                 regex += f"/{pattern}"
+                segments.append((pattern, False, part))
                 url_list.append(name)
                 if compiler_name:
                     self.param_types[name] = compiler_name
@@ -49,6 +66,7 @@ class RouteCompiler:
                 pattern = self.compilers.get(compiler_name, self.compilers["default"])
                 # Wrap slash+pattern in a single optional non-capturing group
                 regex += f"(?:/{pattern})?"
+                segments.append((pattern, True, part))
                 url_list.append(name)
                 if compiler_name:
                     self.param_types[name] = compiler_name
@@ -56,10 +74,14 @@ class RouteCompiler:
             # Static segment
             else:
                 regex += f"/{re.escape(part)}"
+                segments.append((None, False, part))
 
         # Allow an optional trailing slash, then anchor end
         regex += r"/?$"
         self.url_list = url_list
+        self.segments = segments
+        if self._compiled_regex is not None:
+            RouteCompiler.generation += 1
         self._compiled_regex = re.compile(regex)
         return regex
 
@@ -59,6 +59,7 @@ class RouteGroup:
                     # before per-route `verified` reads it).
                     existing = list(route.get_middleware())
                     route._middleware = list(self._middleware) + existing
+                    route._dispatch_plan = None
                 output.append(route)
         return output
 
@@ -0,0 +1,240 @@
+"""
+Compiled routing index built once from a Router's method buckets.
+
+``Router.find`` used to walk every route registered for the request method
+and run each ``RouteCompiler`` regex in turn; a miss then rescanned every
+bucket in ``get_allowed_methods`` before raising 404/405. With a few hundred
+routes that linear scan was one of the largest per-request costs, and
+scanner traffic (404s) paid the worst case every time.
+
+The index answers the same two questions from one structure:
+
+- an exact-match hash for every fully static URL, holding the precomputed
+  winner per method and the allow-list — an O(1) answer for the common case;
+- a radix tree over path segments for everything else, with static children
+  looked up by hash and typed parameter children (``@id:int``) keyed by the
+  compiler regex that route was compiled with;
+- a residual list for routes the tree cannot represent exactly (``:any``,
+  custom compilers that may span ``/`` or match empty, many optional
+  segments), checked by regex exactly as before.
+
+Precedence is unchanged: the tree only narrows the candidate set, every
+candidate keeps its position in the method bucket, and the winner is the
+lowest-positioned candidate whose own compiled regex matches the path. The
+regex stays the single source of truth; the index never decides a match the
+regex would reject.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from cara.routing.RouteCompiler import RouteCompiler
+
+#: Compiler regexes that always match exactly one non-empty path segment.
+#: Keyed by the pattern text rather than the compiler name because
+#: ``Route.compile`` can rebind a name (``int``) to an arbitrary pattern.
+_SEGMENT_SAFE_PATTERNS = frozenset(
+    {
+        r"(\d+)",
+        r"([a-zA-Z]+)",
+        r"([a-zA-Z0-9]+)",
+        r"([\w-]+)",
+        r"([0-9a-fA-F-]{36})",
+        r"(true|false|1|0)",
+        r"([^/]+)",
+    }
+)
+
+#: Optional segments expand into one tree path per present/absent
+#: combination; past this many a route stays in the residual regex list.
+_MAX_OPTIONAL_SEGMENTS = 3
+
+# (method, bucket position, route)
+_Entry = tuple[str, int, Any]
+
+
+class _Node:
+    """One radix-tree node: static children, typed parameter children, and
+    the route entries that terminate here."""
+
+    __slots__ = ("static", "params", "entries")
+
+    def __init__(self) -> None:
+        self.static: dict[str, _Node] = {}
+        self.params: dict[str, tuple[re.Pattern[str], _Node]] = {}
+        self.entries: list[_Entry] = []
+
+    def child(self, pattern: str | None, literal: str) -> _Node:
+        if pattern is None:
+            node = self.static.get(literal)
+            if node is None:
+                node = self.static[literal] = _Node()
+            return node
+        found = self.params.get(pattern)
+        if found is None:
+            found = self.params[pattern] = (re.compile(pattern), _Node())
+        return found[1]
+
+
+class _StaticAnswer:
+    """Precomputed result for one exact static path."""
+
+    __slots__ = ("by_method", "allowed")
+
+    def __init__(self, by_method: dict[str, Any], allowed: list[str]) -> None:
+        self.by_method = by_method
+        self.allowed = allowed
+
+
+class RouteIndex:
+    """Radix tree + static hash over a Router's ``routes_by_method``."""
+
+    def __init__(self, routes: list[Any], routes_by_method: dict[str, list[Any]]) -> None:
+        self.generation = RouteCompiler.generation
+        self.methods: list[str] = list(routes_by_method)
+        self._root = _Node()
+        self._residual: dict[str, list[_Entry]] = {}
+        self._static: dict[str, _StaticAnswer] = {}
+
+        static_urls: list[str] = []
+        for method, bucket in routes_by_method.items():
+            for position, route in enumerate(bucket):
+                entry = (method, position, route)
+                if not self._insert(entry, route):
+                    self._residual.setdefault(method, []).append(entry)
+                if all(pattern is None for pattern, _, _ in route.compiler.segments):
+                    static_urls.append(route.url)
+        self._static_answers(static_urls)
+
+        # First registration wins, matching ``Router.find_by_name``'s scan.
+        self._names: dict[str, Any] = {}
+        for route in routes:
+            name = route.get_name()
+            if name is not None:
+                self._names.setdefault(name, route)
+
+    # ------------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------------
+    def _insert(self, entry: _Entry, route: Any) -> bool:
+        """Place ``entry`` in the tree; False when the route needs the regex."""
+        segments = route.compiler.segments
+        optional = [i for i, (_, is_optional, _) in enumerate(segments) if is_optional]
+        if len(optional) > _MAX_OPTIONAL_SEGMENTS:
+            return False
+        for pattern, _, _ in segments:
+            if pattern is not None and pattern not in _SEGMENT_SAFE_PATTERNS:
+                return False
+
+        # Every present/absent combination of the optional segments is its
+        # own exact tree path: a segment-safe pattern can neither span a
+        # ``/`` nor match empty, so ``(?:/p)?`` means "this segment or not".
+        leaves: set[int] = set()
+        for mask in range(1 << len(optional)):
+            skipped = {optional[bit] for bit in range(len(optional)) if mask >> bit & 1}
+            node = self._root
+            for i, (pattern, _, literal) in enumerate(segments):
+                if i not in skipped:
+                    node = node.child(pattern, literal)
+            if id(node) not in leaves:
+                leaves.add(id(node))
+                node.entries.append(entry)
+        return True
+
+    def _static_answers(self, urls: list[str]) -> None:
+        """Precompute the full answer for each static URL (with and without
+        the trailing slash every route regex accepts)."""
+        for url in urls:
+            for path in {url, url.rstrip("/") + "/"}:
+                if path in self._static:
+                    continue
+                entries = self._collect(path)
+                by_method = {
+                    method: route
+                    for method in self.methods
+                    if (route := self._first(entries, path, method)) is not None
+                }
+                self._static[path] = _StaticAnswer(by_method, list(by_method))
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def match(self, path: str, method: str) -> Any | None:
+        """The route ``Router.find`` would have picked, or None."""
+        answer = self._static.get(path)
+        if answer is not None:
+            return answer.by_method.get(method)
+        return self._first(self._collect(path), path, method)
+
+    def allowed_methods(self, path: str) -> list[str]:
+        """Methods with at least one route matching ``path``, bucket order."""
+        answer = self._static.get(path)
+        if answer is not None:
+            return list(answer.allowed)
+        entries = self._collect(path)
+        return [
+            method
+            for method in self.methods
+            if self._first(entries, path, method) is not None
+        ]
+
+    def named(self, name: str) -> Any | None:
+        """The first route registered under ``name`` when the index was built."""
+        return self._names.get(name)
+
+    def _first(self, entries: list[_Entry], path: str, method: str) -> Any | None:
+        candidates = [entry for entry in entries if entry[0] == method]
+        candidates.extend(self._residual.get(method, ()))
+        candidates.sort(key=lambda entry: entry[1])
+        verb = method.lower()
+        for _, _, route in candidates:
+            if route.matches(path, verb):
+                return route
+        return None
+
+    def _collect(self, path: str) -> list[_Entry]:
+        """Tree entries whose segments could match ``path``.
+
+        A superset of the true matches: candidates are still confirmed by
+        their own regex. The regex ``$`` also accepts one trailing newline,
+        so a path ending in ``\\n`` is walked both with and without it.
+        """
+        entries: dict[tuple[str, int], _Entry] = {}
+        variants = [path]
+        if path.endswith("\n"):
+            variants.append(path[:-1])
+        for variant in variants:
+            segments = _split(variant)
+            if segments is None:
+                continue
+            for node in _walk(self._root, segments, 0):
+                for entry in node.entries:
+                    entries.setdefault((entry[0], entry[1]), entry)
+        return list(entries.values())
+
+
+def _split(path: str) -> list[str] | None:
+    """Path segments as every route regex sees them, or None if no tree
+    route can match (the leading ``/`` every non-root regex requires)."""
+    if path.endswith("/"):
+        path = path[:-1]
+    if not path:
+        return []
+    if path[0] != "/":
+        return None
+    return path[1:].split("/")
+
+
+def _walk(node: _Node, segments: list[str], depth: int):
+    if depth == len(segments):
+        yield node
+        return
+    segment = segments[depth]
+    child = node.static.get(segment)
+    if child is not None:
+        yield from _walk(child, segments, depth + 1)
+    for regex, param_child in node.params.values():
+        if regex.fullmatch(segment):
+            yield from _walk(param_child, segments, depth + 1)
@@ -20,6 +20,7 @@ FormRequest.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from cara.validation import Validation
@@ -39,6 +40,9 @@ class RouteParameterValidator:
 
     _compile_rules: dict[str, str] = {}
     _compile_patterns: dict[str, str] = {}
+    #: Bumped whenever the rule set changes; ``InjectionPlan`` caches one
+    #: coercion per parameter name and drops the cache on a new revision.
+    revision: int = 0
 
     @classmethod
     def set_compile_rule(
@@ -48,6 +52,15 @@ class RouteParameterValidator:
         cls._compile_rules[parameter] = compiler_type
         if pattern:
             cls._compile_patterns[parameter] = pattern
+        cls.revision += 1
+
+    @classmethod
+    def coercion_for(cls, parameter: str) -> Callable[[Any], Any] | None:
+        """The converter ``parameter``'s compiler rule implies, or None."""
+        compiler_type = cls._compile_rules.get(parameter)
+        if not compiler_type:
+            return None
+        return CompilerRuleMapper.get_type_converter_for_compiler(compiler_type)
 
     @classmethod
     def convert_parameter_value(cls, parameter: str, value: Any) -> Any:
@@ -59,13 +72,7 @@ class RouteParameterValidator:
         if value is None:
             return value
 
-        # Get compiler type for this parameter
-        compiler_type = cls._compile_rules.get(parameter)
-        if not compiler_type:
-            return value
-
-        # Get converter function
-        converter = CompilerRuleMapper.get_type_converter_for_compiler(compiler_type)
+        converter = cls.coercion_for(parameter)
         if not converter:
             return value
 
@@ -138,6 +145,7 @@ class RouteParameterValidator:
         cls._validation_rules.clear()
         cls._compile_rules.clear()
         cls._compile_patterns.clear()
+        cls.revision += 1
 
     @classmethod
     def get_debug_info(cls, parameter: str | None = None) -> dict[str, Any]:
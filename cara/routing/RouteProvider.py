@@ -7,6 +7,8 @@ framework. It supports controller-based routing and route decorators.
 
 from __future__ import annotations
 
+from cara.exceptions import MiddlewareNotFoundException
+from cara.facades import Log
 from cara.foundation import DeferredProvider
 from cara.routing.loaders import (
     ControllerRouteLoader,
@@ -44,8 +46,27 @@ class RouteProvider(DeferredProvider):
         # Load routes from different sources
         all_routes = self._load_all_routes()
 
-        # Register routes with router
-        self.application.make("router").add(all_routes)
+        # Register routes with router, then build the routing index at
+        # boot so the first request doesn't pay for it.
+        self.application.make("router").add(all_routes).compile()
+
+    def boot(self) -> None:
+        """Build every route's dispatch plan once routes are loaded.
+
+        Resolving the middleware chains here rather than on the first request
+        to each route keeps alias/group resolution and priority sorting off
+        the request path. An unresolvable alias is NOT fatal at boot — the
+        route raises ``MiddlewareNotFoundException`` when dispatched, exactly
+        as it did before plans existed — but it is reported now.
+        """
+        capsules = [
+            self.application.make(key) if self.application.has(key) else None
+            for key in ("middleware_http", "middleware_ws")
+        ]
+        try:
+            self.application.make("router").build_dispatch_plans(*capsules)
+        except MiddlewareNotFoundException as e:
+            Log.warning("Route dispatch plans not prebuilt: %s", e)
 
     def _bind_router(self) -> None:
         """Bind Router instance to application container."""
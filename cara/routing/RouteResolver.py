@@ -6,21 +6,17 @@ Provides Laravel-style dependency injection by analyzing method signatures and a
 from __future__ import annotations
 
 import inspect
-import typing
 from collections.abc import Callable
 from typing import Any, get_type_hints
 
 from cara.exceptions import (
     ControllerMethodNotFoundException,
     InvalidArgumentException,
-    MissingContainerBindingException,
     RouteRegistrationException,
 )
 from cara.facades import Loader
-from cara.http import Request, Response
-from cara.routing.RouteParameterValidator import RouteParameterValidator
+from cara.routing.InjectionPlan import InjectionPlan
 from cara.support import modularize
-from cara.websocket import Socket
 
 
 class RouteResolver:
@@ -45,6 +41,7 @@ class RouteResolver:
         self._handler_signature: inspect.Signature | None = None
         self._controller_class = None
         self._controller_method_name = None
+        self._plan: InjectionPlan | None = None
 
         self.resolve(handler)
 
@@ -105,122 +102,30 @@ class RouteResolver:
             # Fallback: create empty signature
             return inspect.Signature()
 
-    def _instantiate_controller(self, controller_class, container=None):
-        """
-        Instantiate controller with dependency injection.
-        Resolves constructor parameters from the container.
-        """
-        # Use provided container or fall back to stored one
-        _container = container or self._container
-
-        # If no container, instantiate without DI
-        if not _container:
-            return controller_class()
-
-        # Get constructor signature
-        try:
-            sig = inspect.signature(controller_class.__init__)
-        except ValueError, TypeError:
-            # No signature available, instantiate without args
-            return controller_class()
-
-        # Resolve constructor parameters
-        params = {}
-        for param_name, param in sig.parameters.items():
-            # Skip 'self'
-            if param_name == "self":
-                continue
-
-            # Get type annotation
-            param_type = param.annotation
-            if param_type == inspect.Parameter.empty:
-                continue
-
-            # Resolve string annotations caused by `from __future__ import annotations`
-            if isinstance(param_type, str):
-                module = inspect.getmodule(controller_class)
-                if module is not None:
-                    param_type = module.__dict__.get(param_type, param_type)
-                # Still a string → cannot resolve, skip
-                if isinstance(param_type, str):
-                    continue
-
-            if hasattr(_container, "_unwrap_annotation"):
-                param_type = _container._unwrap_annotation(param_type)
-                if param_type is None:
-                    continue
-
-            if param_type in (str, int, float, bool, dict, list, tuple, type(None)):
-                continue
-            if not inspect.isclass(param_type):
-                continue
-
-            try:
-                resolved = _container.make(param_type)
-                params[param_name] = resolved
-            except Exception:
-                if param.default != inspect.Parameter.empty:
-                    params[param_name] = param.default
-                else:
-                    raise MissingContainerBindingException(
-                        f"Cannot resolve dependency '{param_name}' "
-                        f"of type '{param_type}' for controller "
-                        f"'{controller_class.__name__}'"
-                    )
-
-        # Instantiate with resolved dependencies
-        return controller_class(**params)
-
-    def _get_param_type(self, param_name: str):
-        """Get the expected type for a parameter from method signature."""
-        if not self._handler_signature:
-            return None
+    def injection_plan(self) -> InjectionPlan:
+        """The handler's compiled injection plan, built on first use.
 
-        for name, param in self._handler_signature.parameters.items():
-            if name == param_name and param.annotation != inspect.Parameter.empty:
-                return param.annotation
-        return None
+        Routes build it while loading (``DispatchPlan``) so the request path
+        only executes it; the signature it compiles never changes after
+        ``resolve``.
+        """
+        plan = self._plan
+        if plan is None:
+            plan = self._plan = InjectionPlan(
+                self._handler_signature, self._controller_class
+            )
+        return plan
 
-    def _convert_param_value(self, value: str, expected_type):
-        """Convert route parameter value to expected type."""
-        if expected_type is None or value is None:
-            return value
+    def handler_attribute(self, name: str, default: Any = None) -> Any:
+        """An attribute a decorator left on the handler (e.g. ``@conditional``).
 
-        try:
-            # Handle common type conversions
-            if expected_type is int:
-                return int(value)
-            elif expected_type is float:
-                return float(value)
-            elif expected_type is bool:
-                return value.lower() in ("true", "1", "yes", "on")
-            elif expected_type is str:
-                return str(value)
-            elif hasattr(expected_type, "__origin__"):
-                # Handle typing generics like Optional[int], List[str], etc.
-
-                origin = getattr(expected_type, "__origin__", None)
-                args = getattr(expected_type, "__args__", ())
-
-                if origin is typing.Union:
-                    # Handle Optional[T] which is Union[T, None]
-                    non_none_types = [arg for arg in args if arg is not type(None)]
-                    if non_none_types:
-                        return self._convert_param_value(value, non_none_types[0])
-                elif origin is list:
-                    # Handle List[T] - split by comma
-                    items = [item.strip() for item in value.split(",")]
-                    if args:
-                        return [
-                            self._convert_param_value(item, args[0]) for item in items
-                        ]
-                    return items
-            else:
-                # For other types, try direct conversion
-                return expected_type(value)
-        except ValueError, TypeError:
-            # If conversion fails, return original value
-            return value
+        Read from the unbound controller method for ``"Controller@method"``
+        handlers, so no controller is instantiated to look it up.
+        """
+        handler = self._route_handler
+        if handler is None and self._controller_class is not None:
+            handler = getattr(self._controller_class, self._controller_method_name, None)
+        return getattr(handler, name, default)
 
     def resolve(self, handler: Any) -> None:
         """
@@ -233,6 +138,8 @@ class RouteResolver:
                 - Controller class
                 - Controller instance method
         """
+        # A re-resolved handler has a new signature; its plan is stale.
+        self._plan = None
         if isinstance(handler, str):
             # "UserController@index" or "api.v1.UserController@index"
             self.resolve_controller_string(handler)
@@ -338,122 +245,6 @@ class RouteResolver:
                 f"Unexpected error resolving route '{handler_path}': {e}"
             ) from e
 
-    def _resolve_params(self, param_items, providers, container):
-        """
-        Resolves parameters for a handler using providers (by type or name), container, and default values.
-        """
-        kwargs = {}
-        for name, param in param_items:
-            if name == "self" or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
-                continue
-            annotation = param.annotation
-            # Priority: providers (by type or name)
-            for key, provider in providers.items():
-                if (
-                    callable(key) and annotation is not inspect._empty and key(annotation)
-                ) or (isinstance(key, str) and name == key):
-                    val = provider()
-                    if val is not None:
-                        kwargs[name] = val
-                        break
-            else:
-                # Type-hint injection for custom classes
-                if annotation is not inspect._empty and isinstance(annotation, type):
-                    try:
-                        kwargs[name] = container.make(annotation)
-                        continue
-                    except MissingContainerBindingException:
-                        if param.default is not inspect._empty:
-                            kwargs[name] = param.default
-                            continue
-                        raise RouteRegistrationException(
-                            f"Failed to resolve required dependency by type: {annotation}"
-                        )
-                # Name-based injection (only if no type hint)
-                if annotation is inspect._empty:
-                    try:
-                        kwargs[name] = container.make(name)
-                        continue
-                    except MissingContainerBindingException:
-                        if param.default is not inspect._empty:
-                            kwargs[name] = param.default
-                            continue
-                        raise RouteRegistrationException(
-                            f"Failed to resolve required dependency by name: {name}"
-                        )
-                if param.default is not inspect._empty:
-                    kwargs[name] = param.default
-                    continue
-                raise RouteRegistrationException(f"Could not resolve parameter: {name}")
-        return kwargs
-
-    def _http_providers(self, request, response):
-        # Match by type identity AND by parameter name. The name-based keys
-        # are essential for controllers that use ``from __future__ import
-        # annotations`` (PEP 563): there the ``request: Request`` hint is the
-        # string ``"Request"`` at runtime, so the ``t is Request`` type check
-        # never matches and the parameter would fail to resolve ("Could not
-        # resolve parameter: request"). Matching the conventional ``request``
-        # / ``response`` parameter names keeps DI working regardless of how
-        # the annotation evaluates.
-        providers = {
-            (lambda t: t is Request): lambda: request,
-            (lambda t: t is Response): lambda: response,
-            "request": lambda: request,
-            "response": lambda: response,
-        }
-
-        # Add route parameters with automatic type conversion
-        route_params = getattr(request, "params", {})
-        for param_name, param_value in route_params.items():
-            # Get the expected type from method signature
-            expected_type = self._get_param_type(param_name)
-            converted_value = self._convert_param_value(param_value, expected_type)
-            providers[param_name] = lambda v=converted_value: v
-
-        return providers
-
-    def _ws_providers(self, socket, message):
-        providers = {
-            (lambda t: t is Socket): lambda: socket,
-            "socket": lambda: socket,
-            "message": lambda: message,
-        }
-
-        # Add route parameters with automatic type conversion for WebSocket
-        route_params = getattr(socket, "params", {})
-        for param_name, param_value in route_params.items():
-            # Get the expected type from method signature
-            expected_type = self._get_param_type(param_name)
-            converted_value = self._convert_param_value(param_value, expected_type)
-            providers[param_name] = lambda v=converted_value: v
-
-        return providers
-
-    def _context_map(self):
-        return {
-            (Request, Response): lambda ctx: self._resolve_params(
-                self._handler_signature.parameters.items(),
-                self._http_providers(ctx[0], ctx[1]),
-                self._container or ctx[0].application,
-            ),
-            (Socket, dict): lambda ctx: self._resolve_params(
-                self._handler_signature.parameters.items(),
-                self._ws_providers(ctx[0], ctx[1]),
-                self._container or getattr(ctx[0], "application", None),
-            ),
-        }
-
-    def _get_resolver(self, context):
-        for types, resolver in self._context_map().items():
-            if (
-                isinstance(context, tuple)
-                and len(context) == len(types)
-                and all(isinstance(context[i], t) for i, t in enumerate(types))
-            ):
-                return resolver
-        raise RouteRegistrationException("Unknown context type for dependency resolution")
-
     async def handle(self, context: Any) -> Any:
         """
         Resolves dependencies and executes the route handler for any supported context.
@@ -464,27 +255,25 @@ class RouteResolver:
         Returns:
             Handler result (automatically awaited if async)
         """
+        plan = self.injection_plan()
+
         # Inject route parameters into request if available
         request = context[0] if context else None
         if hasattr(request, "params"):
             for key, value in request.params.items():
-                converted_value = RouteParameterValidator.convert_parameter_value(
-                    key, value
-                )
-                setattr(request, f"param_{key}", converted_value)
+                setattr(request, f"param_{key}", plan.coerce(key, value))
 
         # If controller class stored, instantiate with DI at runtime
         if self._controller_class and self._controller_method_name:
             container = self._container or (request.application if request else None)
-            controller = self._instantiate_controller(self._controller_class, container)
+            controller = plan.instantiate(container)
             route_handler = getattr(controller, self._controller_method_name)
         else:
             route_handler = self._route_handler
             if not route_handler:
                 raise RouteRegistrationException("No route handler has been resolved")
 
-        resolver = self._get_resolver(context)
-        kwargs = resolver(context)
+        kwargs = plan.kwargs(context, self._container)
         result = route_handler(**kwargs)
         if inspect.isawaitable(result):
             result = await result
@@ -17,6 +17,8 @@ from cara.exceptions import (
 from cara.support import flatten
 
 from .Route import Route
+from .RouteCompiler import RouteCompiler
+from .RouteIndex import RouteIndex
 
 # Include "WS" so WebSocket routes are bucketed
 HTTP_METHODS = [
@@ -30,6 +32,9 @@ HTTP_METHODS = [
     "WS",
 ]
 
+# ``@name`` or ``@name:type`` — the placeholder shape ``Router.url`` fills.
+_PLACEHOLDER = _re.compile(r"@(\w+)(?::\w+)?")
+
 
 class Router:
     """Router for mapping incoming ASGI scopes to Route instances."""
@@ -61,6 +66,13 @@ class Router:
                 key = m.upper()
                 self.routes_by_method.setdefault(key, []).append(route)
 
+        # Compiled lookup structure over ``routes_by_method``; built on
+        # first use (or eagerly via ``compile()`` at boot) and dropped
+        # whenever the route set changes.
+        self._index: RouteIndex | None = None
+        # ``route.url`` -> precompiled ``Router.url`` template.
+        self._url_templates: dict[str, tuple[list[tuple[str, str, str]], str]] = {}
+
     def add(self, *routes: Route) -> Router:
         """Add routes to the router."""
         for r in flatten(routes):
@@ -71,13 +83,47 @@ class Router:
                 # allow-list ``in`` check so non-standard verbs
                 # registered after construction are also reachable.
                 self.routes_by_method.setdefault(key, []).append(r)
+        self._index = None
         return self
 
+    def compile(self) -> RouteIndex:
+        """Build the routing index now rather than on the first request.
+
+        ``RouteProvider`` calls this once routes are loaded so the first
+        request doesn't pay for it. Adding routes drops the index; so does
+        recompiling any route's URL (``Route.group`` over routes already
+        registered), detected through ``RouteCompiler.generation``.
+        """
+        self._index = RouteIndex(self.routes, self.routes_by_method)
+        return self._index
+
+    def build_dispatch_plans(self, http_capsule: Any, ws_capsule: Any = None) -> None:
+        """Build every route's ``DispatchPlan`` against its middleware capsule.
+
+        WebSocket routes resolve through ``ws_capsule``, everything else
+        through ``http_capsule``; a route whose capsule is absent is left to
+        build its plan on first dispatch.
+        """
+        for route in self.routes:
+            capsule = ws_capsule if route.is_ws() else http_capsule
+            if capsule is not None:
+                route.dispatch_plan(capsule)
+
+    def _routing_index(self) -> RouteIndex:
+        index = self._index
+        if index is None or index.generation != RouteCompiler.generation:
+            index = self.compile()
+        return index
+
     # ------------------------------------------------------------------
     # Named-route URL generation (Laravel: ``route('users.show', {id:1})``)
     # ------------------------------------------------------------------
     def find_by_name(self, name: str) -> Route | None:
         """Return the Route registered under ``name`` or None."""
+        route = self._routing_index().named(name)
+        if route is not None and route.get_name() == name:
+            return route
+        # Renamed after the index was built — fall back to the scan.
         for route in self.routes:
             if route.get_name() == name:
                 return route
@@ -95,37 +141,52 @@ class Router:
         if route is None:
             raise RouteNotFoundException(f"Route named '{name}' is not registered.")
         params = params or {}
-        url = route.url
-
-        def _replace(match):
-            key = match.group(1)
-            if key in params:
-                return str(params[key])
-            return match.group(0)
-
-        # Match @name or @name:type
-        url = _re.sub(r"@(\w+)(?::\w+)?", _replace, url)
+        parts, tail = self._url_template(route.url)
+        pieces: list[str] = []
+        used: set[str] = set()
+        for literal, key, placeholder in parts:
+            pieces.append(literal)
+            used.add(key)
+            pieces.append(str(params[key]) if key in params else placeholder)
+        pieces.append(tail)
+        url = "".join(pieces)
         # Append extra params as a query string.
-        used = set(m.group(1) for m in _re.finditer(r"@(\w+)(?::\w+)?", route.url))
         extras = {k: v for k, v in params.items() if k not in used}
         if extras:
             url = f"{url}?{_up.urlencode(extras, doseq=True)}"
         return url
 
+    def _url_template(self, url: str) -> tuple[list[tuple[str, str, str]], str]:
+        """Split ``url`` once into ``(literal, name, placeholder)`` parts.
+
+        Same placeholder grammar the per-call ``re.sub`` used; cached by the
+        URL string itself so a route re-prefixed later gets a fresh entry.
+        """
+        template = self._url_templates.get(url)
+        if template is None:
+            parts: list[tuple[str, str, str]] = []
+            cursor = 0
+            for match in _PLACEHOLDER.finditer(url):
+                parts.append(
+                    (url[cursor : match.start()], match.group(1), match.group(0))
+                )
+                cursor = match.end()
+            template = self._url_templates[url] = (parts, url[cursor:])
+        return template
+
     def find(self, path: str, request_method: str) -> Route:
         """Find a matching route by path and method.
 
         For HTTP OPTIONS, automatically generates preflight if needed.
         """
         method = request_method.upper()
-        candidates = self.routes_by_method.get(method, [])
-
-        for route in candidates:
-            if route.matches(path, request_method):
-                return route
+        index = self._routing_index()
+        route = index.match(path, method)
+        if route is not None:
+            return route
 
         # If no direct match, check for method-not-allowed
-        allowed = self.get_allowed_methods(path)
+        allowed = index.allowed_methods(path)
         if allowed:
             if method == "OPTIONS":
                 return self._create_preflight_route(path, allowed)
@@ -150,13 +211,7 @@ class Router:
         Returns:
             List of allowed HTTP methods
         """
-        allowed: list[str] = []
-        for m, bucket in self.routes_by_method.items():
-            for route in bucket:
-                if route.matches(path, m.lower()):
-                    allowed.append(m)
-                    break
-        return allowed
+        return self._routing_index().allowed_methods(path)
 
     def _create_preflight_route(self, path: str, allowed_methods: list[str]) -> Route:
         """Generate an OPTIONS route for CORS preflight.
@@ -5,12 +5,15 @@ from cara._LazyExports import _install_lazy_exports
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "CompilerRuleMapper": (".CompilerRuleMapper", "CompilerRuleMapper"),
     "ControllerRouteLoader": (".loaders", "ControllerRouteLoader"),
+    "DispatchPlan": (".DispatchPlan", "DispatchPlan"),
     "ExplicitRouteLoader": (".loaders", "ExplicitRouteLoader"),
     "FunctionRouteLoader": (".loaders", "FunctionRouteLoader"),
     "HTTP_METHODS": (".Router", "HTTP_METHODS"),
+    "InjectionPlan": (".InjectionPlan", "InjectionPlan"),
     "Route": (".Route", "Route"),
     "RouteCompiler": (".RouteCompiler", "RouteCompiler"),
     "RouteGroup": (".RouteGroup", "RouteGroup"),
+    "RouteIndex": (".RouteIndex", "RouteIndex"),
     "RouteParameterValidator": (".RouteParameterValidator", "RouteParameterValidator"),
     "RouteProvider": (".RouteProvider", "RouteProvider"),
     "RouteResolver": (".RouteResolver", "RouteResolver"),
@@ -20,12 +23,15 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
 __all__ = [
     "CompilerRuleMapper",
     "ControllerRouteLoader",
+    "DispatchPlan",
     "ExplicitRouteLoader",
     "FunctionRouteLoader",
     "HTTP_METHODS",
+    "InjectionPlan",
     "Route",
     "RouteCompiler",
     "RouteGroup",
+    "RouteIndex",
     "RouteParameterValidator",
     "RouteProvider",
     "RouteResolver",
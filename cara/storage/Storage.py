@@ -8,6 +8,7 @@ operations to the appropriate driver instance.
 from __future__ import annotations
 
 from cara.exceptions import DriverNotRegisteredException
+from cara.storage.contracts import StorageWriter
 
 
 class Storage:
@@ -49,6 +50,10 @@ class Storage:
         """Store raw bytes under `key` via selected driver."""
         self.driver(driver_name).put(key, data)
 
+    def writer(self, key: str, driver_name: str | None = None) -> StorageWriter:
+        """Open an incremental write handle for `key` via selected driver."""
+        return self.driver(driver_name).writer(key)
+
     def get(self, key: str, driver_name: str | None = None) -> bytes:
         """Retrieve bytes for `key` via selected driver."""
         return self.driver(driver_name).get(key)
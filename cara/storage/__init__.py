@@ -7,6 +7,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "Storage": (".Storage", "Storage"),
     "StorageContract": (".contracts", "StorageContract"),
     "StorageProvider": (".StorageProvider", "StorageProvider"),
+    "StorageWriter": (".contracts", "StorageWriter"),
 }
 
 __all__ = [
@@ -14,6 +15,7 @@ __all__ = [
     "Storage",
     "StorageContract",
     "StorageProvider",
+    "StorageWriter",
 ]
 
 _install_lazy_exports(__name__, _LAZY_EXPORTS)
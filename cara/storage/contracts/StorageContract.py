@@ -9,6 +9,8 @@ from __future__ import annotations
 
 from typing import Protocol
 
+from cara.storage.contracts.StorageWriter import StorageWriter
+
 
 class StorageContract(Protocol):
     """Contract that any storage driver must implement."""
@@ -16,6 +18,13 @@ class StorageContract(Protocol):
     def put(self, key: str, data: bytes) -> None:
         """Store raw bytes under `key`."""
 
+    def writer(self, key: str) -> StorageWriter:
+        """
+        Open an incremental write handle for `key`.
+
+        Nothing is visible under `key` until the handle is committed.
+        """
+
     def get(self, key: str) -> bytes:
         """
         Retrieve bytes for `key`.
@@ -0,0 +1,29 @@
+"""
+Storage Writer Interface for the Cara framework.
+
+This module defines the contract for an incremental, all-or-nothing write handle returned by a
+storage driver's ``writer(key)``.
+"""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class StorageWriter(Protocol):
+    """
+    Incremental write handle for one storage key.
+
+    Bytes are appended with ``write`` as they arrive and only become visible under the key on
+    ``commit``; ``abort`` discards everything written so far. Exactly one of the two must be
+    called, after which the handle is spent.
+    """
+
+    def write(self, data: bytes) -> None:
+        """Append ``data`` to the pending object."""
+
+    def commit(self) -> None:
+        """Publish the pending object under its key, replacing any previous value."""
+
+    def abort(self) -> None:
+        """Discard the pending object; the key keeps its previous value (if any)."""
@@ -4,10 +4,12 @@ from cara._LazyExports import _install_lazy_exports
 
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "StorageContract": (".StorageContract", "StorageContract"),
+    "StorageWriter": (".StorageWriter", "StorageWriter"),
 }
 
 __all__ = [
     "StorageContract",
+    "StorageWriter",
 ]
 
 _install_lazy_exports(__name__, _LAZY_EXPORTS)
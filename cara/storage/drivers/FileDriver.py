@@ -7,8 +7,10 @@ directory.
 
 from __future__ import annotations
 
+import contextlib
 import os
 import shutil
+import tempfile
 from pathlib import Path, PurePosixPath
 
 from cara.exceptions import (
@@ -16,7 +18,53 @@ from cara.exceptions import (
     StorageConfigurationException,
     StorageException,
 )
-from cara.storage.contracts import StorageContract
+from cara.storage.contracts import StorageContract, StorageWriter
+
+
+class _FileWriter:
+    """Write handle that fills a hidden sibling temp file and renames it on commit.
+
+    The temp file lives in the destination directory so ``os.replace`` is
+    an atomic same-filesystem rename: readers see either the previous
+    object or the complete new one, never a half-written upload.
+    """
+
+    def __init__(self, key: str, file_path: str) -> None:
+        self._key = key
+        self._file_path = file_path
+        directory = os.path.dirname(file_path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, self._temp_path = tempfile.mkstemp(
+                dir=directory, prefix=".", suffix=".part"
+            )
+        except Exception as e:
+            raise StorageException(f"Failed to open writer for key '{key}': {e}") from e
+        self._handle = os.fdopen(fd, "wb")
+
+    def write(self, data: bytes) -> None:
+        try:
+            self._handle.write(data)
+        except Exception as e:
+            self.abort()
+            raise StorageException(
+                f"Failed to write data for key '{self._key}': {e}"
+            ) from e
+
+    def commit(self) -> None:
+        try:
+            self._handle.close()
+            os.replace(self._temp_path, self._file_path)
+        except Exception as e:
+            self.abort()
+            raise StorageException(
+                f"Failed to write data for key '{self._key}': {e}"
+            ) from e
+
+    def abort(self) -> None:
+        self._handle.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._temp_path)
 
 
 class FileDriver(StorageContract):
@@ -54,6 +102,9 @@ class FileDriver(StorageContract):
         except Exception as e:
             raise StorageException(f"Failed to write data for key '{key}': {e}") from e
 
+    def writer(self, key: str) -> StorageWriter:
+        return _FileWriter(key, self._file_path(key))
+
     def get(self, key: str) -> bytes:
         file_path = self._file_path(key)
         if not os.path.exists(file_path):
@@ -108,18 +108,82 @@ just broken at the far end where nobody owns it. Both now raise, and
 
 Either way the conversion belongs in the resource layer, where the value
 still has a meaning to convert.
+
+Native encoder backend
+----------------------
+``json_bytes`` is the hot-path twin of ``json_dumps``: the same
+``", "`` / ``": "`` separators (so response bytes and their ETags do not
+depend on the backend), UTF-8 ``bytes`` out, no ``str`` round-trip, and no
+keyword overrides.
+Buffered and streamed JSON responses use it. With ``orjson`` installed it
+encodes natively; otherwise it is the stdlib encoder. ``CARA_JSON_BACKEND``
+(``auto`` — the default —, ``orjson`` or ``stdlib``) or
+``use_json_backend`` chooses explicitly.
+
+The native path is held to the stdlib bytes, not to "equivalent JSON".
+Where orjson's own rules differ, it defers to the stdlib encoder, which
+either produces the canonical bytes or raises the canonical error:
+
+- ``datetime`` / ``date`` / ``time`` and dataclasses are passed through to
+  ``json_default`` — orjson truncates second-precision UTC offsets and
+  would encode a dataclass the stdlib path refuses.
+- anything orjson refuses (integers past 64 bits, non-``str`` keys, float
+  subclasses, tuple subclasses, cycles, and every error ``json_default``
+  raises) is re-encoded by the stdlib.
+- orjson writes a non-finite float as ``null``; when the output contains
+  ``null`` the payload is scanned and a ``NaN`` is re-encoded — and
+  therefore refused — by the stdlib.
+- orjson's exponent text varies by version and differs from
+  ``float.__repr__`` (``1e-7`` vs ``1e-07``, ``1e16`` vs ``1e+16``), and it
+  writes ``0.00001`` where ``float.__repr__`` writes ``1e-05``; output
+  holding any exponent, or that positional shape, is re-encoded by the
+  stdlib.
+- orjson only writes compact separators. Its output is widened to the
+  stdlib's spacing when every ``,`` and ``:`` in it is structural — the
+  count outside string literals matches the total, and no string holds an
+  escaped quote that would hide a literal's end. A string containing
+  either character is re-encoded by the stdlib.
+
+``tests/support/test_json_backend_conformance.py`` pins both paths to the
+same bytes over a corpus of every type this module knows.
 """
 
 from __future__ import annotations
 
 import json
+import math
+import os
+import re
+from collections.abc import Callable
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
 from typing import Any
 from uuid import UUID
 
-__all__ = ["decimal_to_wire", "json_default", "json_dumps"]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the package
+    orjson = None  # type: ignore[assignment]
+
+__all__ = [
+    "decimal_to_wire",
+    "json_bytes",
+    "json_default",
+    "json_dumps",
+    "use_json_backend",
+]
+
+# Where orjson's float text can differ from ``float.__repr__``: any
+# exponent (``1e-7`` vs ``1e-07``; ``1e16`` vs ``1e+16`` on some releases)
+# and positional notation below 1e-4 (``0.00001`` vs ``1e-05``). Both
+# patterns open with a literal so the scan stays at memchr speed; a string
+# that merely looks like either costs one stdlib re-encode, never a wrong
+# byte.
+_EXPONENT = re.compile(rb"(?<=\d)e[-+]?\d")
+_TINY_POSITIONAL = re.compile(rb"(?<![\d.])0\.0000")
+_FINITE_SCALARS = frozenset({str, int, bool, type(None)})
+_INFINITIES = (math.inf, -math.inf)
 
 
 def decimal_to_wire(value: Decimal) -> str:
@@ -180,3 +244,108 @@ def json_dumps(obj: Any, **kwargs: Any) -> str:
     kwargs.setdefault("allow_nan", False)
     kwargs.setdefault("default", json_default)
     return json.dumps(obj, **kwargs)
+
+
+def _stdlib_bytes(obj: Any) -> bytes:
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        allow_nan=False,
+        default=json_default,
+    ).encode("utf-8")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Whether a ``NaN`` / ``Infinity`` float sits anywhere in ``obj``.
+
+    Exact-type checks first: this runs over whole list payloads, and the
+    ``isinstance`` chain is only for the rare subclass or ``Enum``.
+    """
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        value = pop()
+        cls = type(value)
+        if cls is dict:
+            extend(value.values())
+        elif cls is list:
+            extend(value)
+        elif cls in _FINITE_SCALARS:
+            continue
+        elif cls is float:
+            if value != value or value in _INFINITIES:
+                return True
+        elif isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            extend(value)
+        elif isinstance(value, Enum):
+            stack.append(value.value)
+    return False
+
+
+def _orjson_bytes(obj: Any) -> bytes:
+    try:
+        out = orjson.dumps(
+            obj,
+            default=json_default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+    except orjson.JSONEncodeError:
+        return _stdlib_bytes(obj)
+    if (
+        _EXPONENT.search(out)
+        or (b"0.0000" in out and _TINY_POSITIONAL.search(out))
+        or (b"null" in out and _has_non_finite(obj))
+        or b'\\"' in out
+    ):
+        return _stdlib_bytes(obj)
+    # With no escaped quote, the even fields of a split on ``"`` are the
+    # text between string literals.
+    between = b"".join(out.split(b'"')[::2])
+    if between.count(b",") != out.count(b",") or between.count(b":") != out.count(b":"):
+        return _stdlib_bytes(obj)
+    return out.replace(b",", b", ").replace(b":", b": ")
+
+
+_BACKENDS: dict[str, Callable[[Any], bytes]] = {"stdlib": _stdlib_bytes}
+if orjson is not None:
+    _BACKENDS["orjson"] = _orjson_bytes
+
+_encode: Callable[[Any], bytes] | None = None
+
+
+def use_json_backend(name: str) -> None:
+    """Select the ``json_bytes`` backend: ``auto``, ``orjson`` or ``stdlib``.
+
+    Raises ``ValueError`` for an unknown backend or one whose package is
+    not installed — silently encoding with another backend would hide a
+    deployment mistake.
+    """
+    global _encode
+    name = name.strip().lower()
+    if name == "auto":
+        _encode = _BACKENDS.get("orjson", _stdlib_bytes)
+        return
+    if name not in ("orjson", "stdlib"):
+        raise ValueError(f"Unknown JSON backend {name!r}; use auto, orjson or stdlib")
+    if name not in _BACKENDS:
+        raise ValueError(f"JSON backend {name!r} is not installed")
+    _encode = _BACKENDS[name]
+
+
+def json_bytes(obj: Any) -> bytes:
+    """Serialize ``obj`` to UTF-8 bytes with cara's wire rules.
+
+    Byte-for-byte ``json_dumps(obj).encode()`` — ``Decimal`` as exact
+    text, ISO-8601 timestamps, no ``NaN``, unescaped non-ASCII, the
+    default separators — using the native backend when one is installed.
+    """
+    encode = _encode
+    if encode is None:
+        use_json_backend(os.environ.get("CARA_JSON_BACKEND") or "auto")
+        encode = _encode
+    return encode(obj)
@@ -27,10 +27,18 @@ prevent.
 from __future__ import annotations
 
 import inspect
+import weakref
 from collections.abc import Awaitable, Callable
 from functools import reduce
 from typing import Any
 
+# application → {pipe class → the one instance every pipeline shares}.
+# Only classes whose ``is_reusable()`` says so are kept here; keyed weakly
+# so a discarded application (tests, reloads) takes its instances with it.
+_shared_pipes: weakref.WeakKeyDictionary[Any, dict[type, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class Pipeline:
     """Pipeline class for sequential data processing.
@@ -163,10 +171,35 @@ class Pipeline:
         ``terminate()`` called.
         """
         if isinstance(pipe, type):
-            pipe = pipe(self.application) if self.application else pipe()
+            pipe = self._instantiate(pipe)
         self.executed_instances.append(pipe)
         return pipe
 
+    def _instantiate(self, pipe_class: type) -> Any:
+        """Build ``pipe_class``, or reuse its shared instance when reusable.
+
+        Stateless middleware (``is_reusable()``) used to be allocated again
+        for every request; now one instance per application serves them all.
+        Everything else still gets a fresh instance per pipeline run.
+        """
+        application = self.application
+        if not application:
+            return pipe_class()
+        is_reusable = getattr(pipe_class, "is_reusable", None)
+        if is_reusable is None or not is_reusable():
+            return pipe_class(application)
+        try:
+            shared = _shared_pipes.get(application)
+            if shared is None:
+                shared = _shared_pipes.setdefault(application, {})
+        except TypeError:
+            # Not weak-referenceable (a bare test double): no sharing.
+            return pipe_class(application)
+        instance = shared.get(pipe_class)
+        if instance is None:
+            instance = shared.setdefault(pipe_class, pipe_class(application))
+        return instance
+
     def _invoke(self, pipe: Any, request: Any, next_callable: Callable) -> Any:
         """Call ``pipe`` with ``(request, next_callable)`` using the right shape.
 
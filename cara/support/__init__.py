@@ -67,6 +67,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "is_public_id": (".PublicIds", "is_public_id"),
     "is_public_id_prefix": (".PublicIds", "is_public_id_prefix"),
     "iso_datetime": (".DateSerialization", "iso_datetime"),
+    "json_bytes": (".JsonEncoding", "json_bytes"),
     "json_default": (".JsonEncoding", "json_default"),
     "json_dumps": (".JsonEncoding", "json_dumps"),
     "like_contains": (".LikeEscape", "like_contains"),
@@ -104,6 +105,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "to_decimal_or_none": (".Number", "to_decimal_or_none"),
     "to_pendulum": (".Time", "to_pendulum"),
     "trusted_client_ip": (".ClientIp", "trusted_client_ip"),
+    "use_json_backend": (".JsonEncoding", "use_json_backend"),
     "user_id": (".Auth", "user_id"),
     "validate_path_param": (".RequestPath", "validate_path_param"),
 }
@@ -167,6 +169,7 @@ __all__ = [
     "is_public_id",
     "is_public_id_prefix",
     "iso_datetime",
+    "json_bytes",
     "json_default",
     "json_dumps",
     "like_contains",
@@ -204,6 +207,7 @@ __all__ = [
     "to_decimal_or_none",
     "to_pendulum",
     "trusted_client_ip",
+    "use_json_backend",
     "user_id",
     "validate_path_param",
 ]
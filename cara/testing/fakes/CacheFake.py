@@ -14,6 +14,10 @@ from typing import Any
 
 
 class CacheFake:
+    # Marks an in-process driver: state-heavy primitives such as
+    # ``LoginAttemptTracker`` keep their own in-memory store beside it.
+    driver_name = "memory"
+
     def __init__(self) -> None:
         self._store: dict[str, Any] = {}
         self._ttls: dict[str, int | None] = {}
@@ -76,6 +76,11 @@ setup(
             "pika>=1.3",
             "redis>=4.0",
         ],
+        # Native JSON encoding for responses (cara.support.json_bytes); the
+        # stdlib encoder produces the same bytes without it.
+        "json": [
+            "orjson>=3.10",
+        ],
         "dev": [
             "bandit==1.9.4",
             "pip-audit==2.10.1",
@@ -0,0 +1,261 @@
+"""The verified-token cache answers warm tokens from memory without ever
+outliving a revocation.
+
+Two guards sharing one fake Redis stand in for two workers: revocations
+written through either must evict the other's cache via the pub/sub
+broadcast.
+"""
+
+from __future__ import annotations
+
+import importlib
+import queue
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from cara.authentication.contracts import Authenticatable
+from cara.exceptions import AuthenticationConfigurationException
+from cara.testing.fakes import CacheFake
+
+guard_module = importlib.import_module("cara.authentication.guards.JWTGuard")
+lifecycle = importlib.import_module("cara.authentication.guards._JWTTokenLifecycle")
+
+
+class User(Authenticatable):
+    __observers__: dict = {}
+    loads = 0
+
+    def __init__(self, attributes: dict | None = None) -> None:
+        self.__attributes__ = dict(attributes or {"id": 7, "auth_version": 3})
+
+    def get_auth_id(self):
+        return self.__attributes__["id"]
+
+    def get_auth_version(self):
+        return self.__attributes__["auth_version"]
+
+    @classmethod
+    def hydrate(cls, attributes: dict) -> User:
+        return cls(attributes)
+
+    @classmethod
+    def observe(cls, observer) -> None:
+        cls.__observers__.setdefault(cls, []).append(observer)
+
+    @classmethod
+    def authenticate_jwt(cls, user_id, _claims):
+        cls.loads += 1
+        return cls() if str(user_id) == "7" else None
+
+
+class _Subscription:
+    def __init__(self, bus: _Bus) -> None:
+        self.bus = bus
+        self.messages: queue.Queue = queue.Queue()
+
+    def subscribe(self, _channel: str) -> None:
+        self.bus.subscribers.append(self)
+
+    def get_message(self, timeout: float):
+        try:
+            return {"data": self.messages.get(timeout=min(timeout, 0.02))}
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        self.bus.subscribers.remove(self)
+
+
+class _Bus:
+    """Just enough of a Redis client for pub/sub."""
+
+    def __init__(self) -> None:
+        self.subscribers: list[_Subscription] = []
+        self.published: list[str] = []
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> _Subscription:
+        return _Subscription(self)
+
+    def publish(self, _channel: str, message: str) -> None:
+        self.published.append(message)
+        for subscription in list(self.subscribers):
+            subscription.messages.put(message.encode())
+
+
+class _CountingCache(CacheFake):
+    def __init__(self, bus: _Bus | None) -> None:
+        super().__init__()
+        self.bus = bus
+        self.reads = 0
+
+    def get(self, *args, **kwargs):
+        self.reads += 1
+        return super().get(*args, **kwargs)
+
+    def driver(self, _name=None):
+        return SimpleNamespace(connection=lambda: self.bus) if self.bus else object()
+
+
+@pytest.fixture
+def make_guard(monkeypatch):
+    guards = []
+    User.__observers__ = {}
+    User.loads = 0
+
+    def make(cache, application=None, **options):
+        monkeypatch.setattr(guard_module, "Cache", cache)
+        monkeypatch.setattr(lifecycle, "Cache", cache)
+        monkeypatch.setattr(guard_module.JWTGuard, "_load_user_class", lambda *_: User)
+        guard = guard_module.JWTGuard(
+            application=application,
+            secret="x" * 48,
+            ttl=900,
+            refresh_ttl=259_200,
+            **options,
+        )
+        guards.append(guard)
+        return guard
+
+    yield make
+    for guard in guards:
+        guard._verified._close()
+
+
+def _subscribed(guard) -> None:
+    guard._verified.claims("warm-up")
+    deadline = time.monotonic() + 2
+    while not guard._verified._active:
+        assert time.monotonic() < deadline, "revocation listener never subscribed"
+        time.sleep(0.005)
+
+
+def _eventually(predicate) -> None:
+    deadline = time.monotonic() + 2
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_a_warm_token_is_answered_without_cache_reads(make_guard):
+    cache = _CountingCache(_Bus())
+    guard = make_guard(cache, verified_cache_ttl=30)
+    _subscribed(guard)
+    token = guard.generate_access_token(User())
+
+    assert guard._resolve_user_from_token(token) is not None
+    reads = cache.reads
+    for _ in range(5):
+        assert guard._resolve_user_from_token(token) is not None
+
+    assert cache.reads == reads
+    assert guard.last_payload["typ"] == "access"
+
+
+@pytest.mark.parametrize("revoke", ["blacklist", "family", "user"])
+def test_revocation_on_one_worker_evicts_every_worker(make_guard, revoke):
+    shared = _CountingCache(_Bus())
+    worker = make_guard(shared, verified_cache_ttl=30)
+    other = make_guard(shared, verified_cache_ttl=30)
+    _subscribed(worker)
+    token = worker.generate_access_token(User())
+    assert worker._resolve_user_from_token(token) is not None
+    payload = worker.last_payload
+
+    if revoke == "blacklist":
+        other._blacklist_token(token)
+    elif revoke == "family":
+        other.revoke_token_family(payload["fid"])
+    else:
+        time.sleep(0.01)  # the cutoff must fall after the token's iat
+        other.revoke_user_sessions(payload["sub"])
+
+    _eventually(lambda: not worker._verified._claims)
+    assert worker._resolve_user_from_token(token) is None
+
+
+def test_an_eviction_during_verification_blocks_the_store(make_guard):
+    guard = make_guard(_CountingCache(_Bus()), verified_cache_ttl=30)
+    _subscribed(guard)
+    cache = guard._verified
+    generation = cache.generation
+
+    cache.evict("family", "f" * 16)
+    cache.store_claims("digest", {"exp": time.time() + 60, "fid": "f" * 16}, generation)
+
+    assert cache.claims("digest") is None
+
+
+def test_without_pub_sub_the_cache_stays_off(make_guard):
+    cache = _CountingCache(None)
+    guard = make_guard(cache, verified_cache_ttl=30)
+    token = guard.generate_access_token(User())
+
+    guard._resolve_user_from_token(token)
+    reads = cache.reads
+    guard._resolve_user_from_token(token)
+
+    assert cache.reads > reads
+    _eventually(lambda: not guard._verified._listener.is_alive())
+    assert guard._verified.claims(lifecycle._hash_token(token)) is None
+
+
+def test_losing_the_subscription_clears_the_cache(make_guard):
+    bus = _Bus()
+    guard = make_guard(_CountingCache(bus), verified_cache_ttl=30)
+    _subscribed(guard)
+    token = guard.generate_access_token(User())
+    guard._resolve_user_from_token(token)
+    assert guard._verified._claims
+
+    def broken(timeout):
+        raise ConnectionError("connection reset")
+
+    bus.subscribers[0].get_message = broken
+
+    _eventually(lambda: not guard._verified._claims)
+
+
+def test_application_shutdown_stops_the_listener(make_guard):
+    application = SimpleNamespace()
+    guard = make_guard(_CountingCache(_Bus()), application, verified_cache_ttl=30)
+    _subscribed(guard)
+
+    for callback in application._shutdown_callbacks:
+        callback()
+
+    assert not guard._verified._listener.is_alive()
+    assert not guard._verified._active
+
+
+def test_user_cache_skips_the_database_until_the_row_changes(make_guard):
+    guard = make_guard(_CountingCache(_Bus()), verified_cache_ttl=30, user_cache_ttl=30)
+    _subscribed(guard)
+    token = guard.generate_access_token(User())
+
+    first = guard._resolve_user_from_token(token)
+    second = guard._resolve_user_from_token(token)
+    assert User.loads == 1
+    assert second is not first and second.get_auth_id() == 7
+
+    for observer in User.__observers__[User]:
+        observer.updated(first)
+    guard._resolve_user_from_token(token)
+
+    assert User.loads == 2
+    assert guard._verified._claims  # a row change keeps the token verified
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"verified_cache_ttl": -1},
+        {"verified_cache_ttl": True},
+        {"verified_cache_ttl": 301},
+        {"user_cache_ttl": 30},
+    ],
+)
+def test_cache_settings_are_validated(make_guard, options):
+    with pytest.raises(AuthenticationConfigurationException):
+        make_guard(_CountingCache(None), **options)
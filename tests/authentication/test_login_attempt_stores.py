@@ -0,0 +1,291 @@
+"""Login attempt stores record a failure in one atomic step.
+
+The in-memory store is the executable reference for the Redis script: the
+same window, source cap and lock decision, driven here by a hand-cranked
+clock. The Redis store is pinned on its wire contract — one script call per
+failure, both keys in one hash slot — since no Redis runs in the test suite.
+"""
+
+from __future__ import annotations
+
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+from cara.authentication import (
+    LoginLocked,
+    MemoryLoginAttemptStore,
+    RedisLoginAttemptStore,
+)
+from cara.exceptions import (
+    AuthenticationConfigurationException,
+    ServiceUnavailableException,
+)
+from cara.testing.fakes import CacheFake
+
+tracker_module = importlib.import_module("cara.authentication.LoginAttemptTracker")
+Tracker = tracker_module.LoginAttemptTracker
+
+_LIMITS = {
+    "window_seconds": 600,
+    "lock_seconds": 3600,
+    "max_failures": 5,
+    "single_source_threshold": 20,
+    "source_cap": 3,
+}
+
+
+class _Clock:
+    def __init__(self, now: float = 1_700_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _store() -> tuple[MemoryLoginAttemptStore, _Clock]:
+    clock = _Clock()
+    return MemoryLoginAttemptStore(clock=clock), clock
+
+
+# ── Memory store ─────────────────────────────────────────────────────
+
+
+def test_one_source_under_the_high_threshold_never_locks():
+    store, _ = _store()
+
+    results = [store.record_failure("a", "ip1", **_LIMITS) for _ in range(19)]
+
+    assert results[-1] == (19, 19, 1, False)
+    assert not store.is_locked("a")
+
+
+def test_a_single_source_past_the_high_threshold_locks():
+    store, clock = _store()
+    for _ in range(19):
+        store.record_failure("a", "ip1", **_LIMITS)
+
+    assert store.record_failure("a", "ip1", **_LIMITS) == (20, 20, 1, True)
+    assert store.is_locked("a")
+    clock.now += 3600
+    assert not store.is_locked("a")
+
+
+def test_failures_from_two_sources_lock_at_the_account_threshold():
+    store, _ = _store()
+    for _ in range(4):
+        store.record_failure("a", "ip1", **_LIMITS)
+
+    assert store.record_failure("a", "ip2", **_LIMITS) == (5, 1, 2, True)
+    assert store.is_locked("a")
+    assert not store.is_locked("b")
+
+
+def test_sources_past_the_cap_count_for_the_account_only():
+    store, _ = _store()
+    for source in ("ip1", "ip2", "ip3"):
+        store.record_failure("a", source, **_LIMITS)
+
+    assert store.record_failure("a", "ip4", **_LIMITS) == (4, 0, 3, False)
+    assert store.record_failure("a", "ip1", **_LIMITS) == (5, 2, 3, True)
+
+
+def test_the_window_starts_at_the_first_failure():
+    store, clock = _store()
+    store.record_failure("a", "ip1", **_LIMITS)
+    clock.now += 599
+    assert store.record_failure("a", "ip1", **_LIMITS)[0] == 2
+
+    clock.now += 1
+    assert store.record_failure("a", "ip1", **_LIMITS) == (1, 1, 1, False)
+
+
+def test_clear_keeps_the_lock_unless_asked():
+    store, _ = _store()
+    for source in ("ip1", "ip2") * 3:
+        store.record_failure("a", source, **_LIMITS)
+
+    store.clear("a", include_lock=False)
+    assert store.is_locked("a")
+    assert store.record_failure("a", "ip1", **_LIMITS)[0] == 1
+
+    store.clear("a", include_lock=True)
+    assert not store.is_locked("a")
+
+
+# ── Redis store wire contract ────────────────────────────────────────
+
+
+class _Redis:
+    def __init__(self, reply=(5, 1, 2, 1)) -> None:
+        self.calls: list[tuple[str, list, list]] = []
+        self.deleted: tuple = ()
+        self.reply = reply
+
+    def register_script(self, source: str):
+        def run(keys, args):
+            self.calls.append((source, keys, args))
+            return list(self.reply)
+
+        return run
+
+    def exists(self, key: str) -> int:
+        self.calls.append(("EXISTS", [key], []))
+        return 0
+
+    def delete(self, *keys):
+        self.deleted = keys
+
+
+def test_redis_store_records_a_failure_in_one_script_call():
+    redis = _Redis()
+    store = RedisLoginAttemptStore(redis)
+
+    assert store.record_failure("a", "ip1", **_LIMITS) == (5, 1, 2, True)
+
+    ((source, keys, args),) = redis.calls
+    assert keys == ["login:{a}:state", "login:{a}:lock"]
+    assert args == ["ip1", 600, 3600, 5, 20, 3]
+    assert "HINCRBY" in source
+
+
+def test_redis_store_clears_with_one_delete():
+    redis = _Redis()
+    store = RedisLoginAttemptStore(redis)
+
+    store.clear("a", include_lock=False)
+    assert redis.deleted == ("login:{a}:state",)
+    store.clear("a", include_lock=True)
+    assert redis.deleted == ("login:{a}:state", "login:{a}:lock")
+
+
+# ── Tracker wiring ───────────────────────────────────────────────────
+
+
+def _configure(monkeypatch, store: str, cache) -> None:
+    settings = {"app.key": "x" * 48, "security.login_attempt_store": store}
+    monkeypatch.setattr(
+        tracker_module, "config", lambda key, default=None: settings.get(key, default)
+    )
+    monkeypatch.setattr(tracker_module, "Cache", cache)
+    monkeypatch.setattr(tracker_module, "_memory", MemoryLoginAttemptStore())
+    monkeypatch.setattr(tracker_module, "_driver_store", None)
+    monkeypatch.setattr(
+        tracker_module, "Log", SimpleNamespace(warning=lambda *a, **k: None)
+    )
+
+
+def test_tracker_locks_through_the_memory_store(monkeypatch):
+    _configure(monkeypatch, "memory", SimpleNamespace())
+
+    for ip in ("203.0.113.1", "203.0.113.2") * 2:
+        Tracker.record_failure("user@example.com", ip)
+    Tracker.assert_unlocked("user@example.com")
+    assert Tracker.record_failure("user@example.com", "203.0.113.1") == 5
+
+    with pytest.raises(LoginLocked):
+        Tracker.assert_unlocked("user@example.com")
+    Tracker.clear_lockout("user@example.com")
+    Tracker.assert_unlocked("user@example.com")
+
+
+def test_tracker_uses_the_redis_store_when_the_cache_driver_has_one(monkeypatch):
+    redis = _Redis(reply=(1, 1, 1, 0))
+    driver = SimpleNamespace(connection=lambda: redis)
+    _configure(monkeypatch, "cache", SimpleNamespace(driver=lambda: driver))
+
+    assert Tracker.record_failure("user@example.com", "203.0.113.1") == 1
+
+    ((_, keys, args),) = redis.calls
+    digest = Tracker.identifier_digest("user@example.com")
+    assert keys[0] == f"login:{{{digest}}}:state"
+    assert args[0] == Tracker.identifier_digest("203.0.113.1")
+
+
+def test_tracker_keys_live_under_the_cache_driver_prefix(monkeypatch):
+    redis = _Redis(reply=(1, 1, 1, 0))
+    driver = SimpleNamespace(connection=lambda: redis, key_prefix=lambda: "app:j1:")
+    _configure(monkeypatch, "cache", SimpleNamespace(driver=lambda: driver))
+
+    Tracker.record_failure("user@example.com", "203.0.113.1")
+
+    digest = Tracker.identifier_digest("user@example.com")
+    assert redis.calls[0][1][0] == f"app:j1:login:{{{digest}}}:state"
+
+
+def test_legacy_lock_sentinels_hold_for_one_lock_duration(monkeypatch):
+    sentinels = {}
+    driver = SimpleNamespace(connection=_Redis)
+    cache = SimpleNamespace(
+        driver=lambda: driver,
+        get=lambda key, *a, **k: sentinels.get(key),
+        forget=lambda key: sentinels.pop(key, None),
+    )
+    _configure(monkeypatch, "cache", cache)
+    sentinels[Tracker._lock_key("user@example.com")] = "1"
+
+    with pytest.raises(LoginLocked):
+        Tracker.assert_unlocked("user@example.com")
+    monkeypatch.setattr(tracker_module, "_started", -3600.0)
+    Tracker.assert_unlocked("user@example.com")
+
+    monkeypatch.setattr(tracker_module, "_started", tracker_module.time.monotonic())
+    Tracker.clear_lockout("user@example.com")
+    assert sentinels == {}
+    Tracker.assert_unlocked("user@example.com")
+
+
+def test_an_in_process_cache_driver_gets_its_own_memory_store(monkeypatch):
+    fake = CacheFake()
+    _configure(monkeypatch, "cache", SimpleNamespace(driver=lambda: fake))
+
+    for ip in ("203.0.113.1", "203.0.113.2") * 2 + ("203.0.113.1",):
+        Tracker.record_failure("user@example.com", ip)
+
+    with pytest.raises(LoginLocked):
+        Tracker.assert_unlocked("user@example.com")
+    assert fake.all() == {}
+
+    fresh = CacheFake()
+    monkeypatch.setattr(tracker_module.Cache, "driver", lambda: fresh)
+    Tracker.assert_unlocked("user@example.com")
+
+
+def test_per_key_path_follows_the_store_rules(monkeypatch):
+    fake = CacheFake()
+    _configure(monkeypatch, "cache", fake)
+    monkeypatch.setattr(tracker_module, "_IP_SET_CAP", 2)
+    digest = Tracker.identifier_digest("user@example.com")
+
+    Tracker.record_failure("user@example.com", "203.0.113.1")
+    fake._ttls[f"login_fails:{digest}"] = 120  # most of the window has passed
+    Tracker.record_failure("user@example.com", "203.0.113.2")
+    Tracker.record_failure("user@example.com", "203.0.113.3")
+
+    per_ip = {k: v for k, v in fake.all().items() if k.startswith("login_fails_ip:")}
+    assert sorted(per_ip.values()) == [1, 1]
+    late = Tracker._per_ip_key("user@example.com", "203.0.113.2")
+    assert fake.ttl_of(late) == 120
+    assert fake.ttl_of(f"login_fail_ips:{digest}") == 120
+
+
+def test_store_failures_deny_authentication(monkeypatch):
+    def broken(*_args, **_kwargs):
+        raise ConnectionError("connection reset")
+
+    redis = SimpleNamespace(register_script=lambda _source: broken, exists=broken)
+    driver = SimpleNamespace(connection=lambda: redis)
+    _configure(monkeypatch, "cache", SimpleNamespace(driver=lambda: driver))
+
+    with pytest.raises(ServiceUnavailableException):
+        Tracker.record_failure("user@example.com", "203.0.113.1")
+    with pytest.raises(ServiceUnavailableException):
+        Tracker.assert_unlocked("user@example.com")
+
+
+def test_unknown_store_is_a_configuration_error(monkeypatch):
+    _configure(monkeypatch, "database", SimpleNamespace())
+
+    with pytest.raises(AuthenticationConfigurationException):
+        Tracker.assert_unlocked("user@example.com")
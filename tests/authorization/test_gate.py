@@ -10,6 +10,7 @@ from __future__ import annotations
 import pytest
 
 from cara.authorization import AuthorizationResponse, Gate, Policy
+from cara.container import Container
 from cara.exceptions import AuthorizationFailedException
 
 # -- fixtures ------------------------------------------------------------- #
@@ -260,3 +261,127 @@ def test_for_user_shares_registries_but_isolates_user(gate, admin, plain):
     assert v1._policies is v2._policies is gate._policies
     assert v1._current_user is admin
     assert v2._current_user is plain
+
+
+# -- batches and memoization ---------------------------------------------- #
+
+
+class Post:
+    def __init__(self, owner_id):
+        self.owner_id = owner_id
+
+
+class PostPolicy(Policy):
+    pure = True
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def update(self, user, model):
+        self.calls.append("update")
+        return model.owner_id == user.id
+
+    def delete_many(self, user, models):
+        self.calls.append("delete_many")
+        return [model.owner_id == user.id for model in models]
+
+    def delete(self, user, model):
+        self.calls.append("delete")
+        return model.owner_id == user.id
+
+    def archive_many(self, user, models):
+        return [True]
+
+
+def _post_gate():
+    g = Gate()
+    g.policy(Post, PostPolicy)
+    return g, g._instantiate_policy(PostPolicy)
+
+
+def test_check_many_calls_the_vectorized_policy_once(plain):
+    g, policy = _post_gate()
+    posts = [Post(2), Post(9), Post(2)]
+
+    assert g.for_user(plain).check_many("delete", posts) == [True, False, True]
+    assert policy.calls == ["delete_many"]
+
+
+def test_check_many_falls_back_to_one_call_per_model(plain):
+    g, policy = _post_gate()
+
+    assert g.for_user(plain).check_many("update", [Post(2), Post(9)]) == [True, False]
+    assert policy.calls == ["update", "update"]
+
+
+def test_check_many_matches_single_checks(gate, admin, plain, root, product):
+    for user in (admin, plain, root, None):
+        scoped = gate.for_user(user)
+        for ability in ("update", "delete", "explode", "admin"):
+            batch = scoped.inspect_many(ability, [product, Post(2)])
+            single = [scoped.inspect(ability, product), scoped.inspect(ability, Post(2))]
+            assert [r.allowed() for r in batch] == [r.allowed() for r in single]
+            assert [r.message() for r in batch] == [r.message() for r in single]
+
+
+def test_a_malformed_batch_result_fails_closed(admin):
+    g, _ = _post_gate()
+
+    assert g.for_user(admin).check_many("archive", [Post(1), Post(1)]) == [False, False]
+
+
+def test_pure_policy_decisions_are_memoized_per_scope(plain):
+    g, policy = _post_gate()
+    post = Post(2)
+
+    with Container().scope():
+        for _ in range(3):
+            assert g.for_user(plain).allows("update", post) is True
+        assert g.for_user(plain).check_many("delete", [post, post]) == [True, True]
+    assert policy.calls == ["update", "delete_many"]
+
+    with Container().scope():
+        g.for_user(plain).allows("update", post)
+    assert policy.calls == ["update", "delete_many", "update"]
+
+
+class Note:
+    def __init__(self, owner_id):
+        self.owner_id = owner_id
+
+
+class NotePolicy(Policy):
+    pure = True
+
+    def delete_many(self, user, models):
+        return [model.owner_id == user.id for model in models]
+
+
+def test_a_vectorized_only_ability_decides_single_checks_and_memo_misses(plain):
+    g = Gate()
+    g.policy(Note, NotePolicy)
+    first, second = Note(2), Note(2)
+
+    assert g.for_user(plain).allows("delete", first) is True
+    assert g.for_user(plain).check_many("delete", [first]) == [True]
+    with Container().scope():
+        assert g.for_user(plain).allows("delete", first) is True
+        # ``first`` is a memo hit, ``second`` the lone miss.
+        assert g.for_user(plain).check_many("delete", [first, second]) == [True, True]
+
+
+def test_impure_policies_and_unscoped_checks_are_not_memoized(admin, product):
+    g, policy = _post_gate()
+    post = Post(1)
+    for _ in range(2):
+        g.for_user(admin).allows("update", post)
+    assert policy.calls == ["update", "update"]
+
+    calls = []
+    g.before(lambda *_args: calls.append(1))
+    g.policy(Product, ProductPolicy)
+    with Container().scope():
+        g.for_user(admin).allows("update", product)
+        g.for_user(admin).allows("update", product)
+    assert len(calls) == 2  # gate-level callbacks run on every check
@@ -0,0 +1,124 @@
+"""
+Benchmark pins: every one of cara's own hot-path benchmarks runs against
+its in-process stand-ins; a result carries ops/s and ordered percentiles;
+generator factories are torn down; applications register their own
+benchmarks; a baseline round-trips through JSON, and ``craft bench``
+exits non-zero only when a median regresses past the threshold.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+
+import pytest
+
+from cara.benchmarks import (
+    Benchmark,
+    BenchmarkBaseline,
+    BenchmarkRegistry,
+    BenchmarkResult,
+    BenchmarkRunner,
+    benchmark,
+)
+from cara.exceptions import StorageException
+
+command_module = importlib.import_module("cara.commands.core.BenchCommand")
+BenchCommand = command_module.BenchCommand
+
+_FAST = {"rounds": 3, "warmup": 0, "min_round_time": 0.001}
+
+
+def _result(name: str, p50: float) -> BenchmarkResult:
+    return BenchmarkResult(name, "app", 100, 1 / p50, p50, p50 * 1.1, p50 * 1.2)
+
+
+@pytest.fixture(autouse=True)
+def _registry():
+    BenchmarkRegistry.clear()
+    yield
+    BenchmarkRegistry.clear()
+
+
+@pytest.mark.parametrize(
+    "bench", [b for b in BenchmarkRegistry.all() if b.group == "cara"], ids=str
+)
+def test_core_benchmarks_run_in_process(bench):
+    result = BenchmarkRunner(**_FAST).run(bench)
+    assert result.operations > 0 and result.ops_per_sec > 0
+    assert 0 < result.p50 <= result.p95 <= result.p99
+
+
+def test_generator_factory_is_torn_down_and_coroutines_are_awaited():
+    events: list[str] = []
+
+    def factory():
+        events.append("setup")
+
+        async def op():
+            events.append("op")
+
+        yield op
+        events.append("teardown")
+
+    BenchmarkRunner(**_FAST).run(Benchmark("gen", factory))
+    assert events[0] == "setup" and events[-1] == "teardown"
+    assert set(events[1:-1]) == {"op"}
+
+
+def test_application_benchmarks_register_by_name():
+    @benchmark("app.noop", description="nothing")
+    def noop():
+        return lambda: None
+
+    assert BenchmarkRegistry.get("app.noop").description == "nothing"
+    with pytest.raises(ValueError):
+        benchmark("app.noop")(lambda: lambda: None)
+    BenchmarkRegistry.clear()
+    assert BenchmarkRegistry.get("app.noop") is None
+    assert BenchmarkRegistry.get("cara.router.find") is not None
+
+
+def test_baseline_round_trips_and_flags_regressions(tmp_path):
+    path = tmp_path / "baseline.json"
+    BenchmarkBaseline({"a": _result("a", 1e-5), "b": _result("b", 1e-5)}).save(path)
+    stored = BenchmarkBaseline.load(path)
+
+    current = [_result("a", 1.05e-5), _result("b", 1.5e-5), _result("new", 1e-3)]
+    assert [(r.name, round(c, 2)) for r, c in stored.regressions(current, 0.1)] == [
+        ("b", 0.5)
+    ]
+    assert BenchmarkBaseline.load(tmp_path / "missing.json").results == {}
+    path.write_text("{}")
+    with pytest.raises(StorageException):
+        BenchmarkBaseline.load(path)
+
+
+def test_bench_command_saves_then_gates_on_regression(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        command_module,
+        "config",
+        lambda key, default=None: {"benchmarks.modules": ()}.get(key, default),
+    )
+    monkeypatch.setattr(
+        command_module,
+        "BenchmarkRunner",
+        lambda rounds: BenchmarkRunner(rounds=rounds, warmup=0, min_round_time=0.001),
+    )
+    baseline = str(tmp_path / "baseline.json")
+
+    def run(**options) -> int:
+        cmd = BenchCommand(application=None)
+        cmd.set_parsed_options(options)
+        return cmd.handle(
+            only="cara.router.*", rounds=3, baseline=baseline, threshold=0.1
+        )
+
+    assert run(save=True) == 0
+    saved = json.loads((tmp_path / "baseline.json").read_text())
+    assert list(saved["results"]) == ["cara.router.find"]
+
+    BenchmarkBaseline({"cara.router.find": _result("cara.router.find", 1e-9)}).save(
+        baseline
+    )
+    assert run() == 1
@@ -47,6 +47,21 @@ def test_the_accessor_is_public_and_callable(driver) -> None:
     assert callable(accessor)
 
 
+def test_raw_keys_share_the_configured_prefix() -> None:
+    driver = RedisCacheDriver(
+        host="localhost",
+        port=6379,
+        db=0,
+        password=None,
+        prefix="shop",
+        signing_key="test-signing-key-for-the-cache-codec",
+    )
+
+    assert driver.key_prefix() == driver._prefix
+    assert driver.key_prefix().startswith("shop:")
+    assert driver.counter_key("hits") == driver._counter_key("hits")
+
+
 def test_the_middleware_resolves_it_through_the_cache_manager(driver) -> None:
     """End-to-end: manager → ``driver()`` → ``connection()``.
 
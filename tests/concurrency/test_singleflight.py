@@ -0,0 +1,256 @@
+"""
+Singleflight pins: concurrent callers of one key share a single execution
+and its outcome — in one worker (``SingleFlight``, async and threads), and
+across workers (``DistributedSingleFlight``, leader elected through
+``CacheLock``, followers woken by pub/sub or polling). A failed leader
+hands the key to a follower instead of failing everyone.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import threading
+import time
+
+import pytest
+
+from cara.cache import Cache
+from cara.concurrency import DistributedSingleFlight, SingleFlight
+from cara.decorators import singleflight
+from cara.testing.fakes import CacheFake
+
+distributed_module = importlib.import_module("cara.concurrency.DistributedSingleFlight")
+
+
+class _Counter:
+    def __init__(self, delay: float = 0.05, fail: bool = False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self, value: str = "result") -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("backend down")
+        return value
+
+    def blocking(self, value: str = "result") -> str:
+        self.calls += 1
+        time.sleep(self.delay)
+        return value
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_execution(self):
+        flight, work = SingleFlight(), _Counter()
+        results = await asyncio.gather(*(flight.run("k", work) for _ in range(10)))
+        assert results == ["result"] * 10
+        assert work.calls == 1
+        assert not flight.in_flight("k")
+
+        await flight.run("k", work)
+        assert work.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_distinct_keys_do_not_collapse(self):
+        flight, work = SingleFlight(), _Counter()
+        await asyncio.gather(flight.run("a", work, "a"), flight.run("b", work, "b"))
+        assert work.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        flight, work = SingleFlight(), _Counter(fail=True)
+        results = await asyncio.gather(
+            *(flight.run("k", work) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert work.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_the_others(self):
+        flight, work = SingleFlight(), _Counter(delay=0.1)
+        first = asyncio.create_task(flight.run("k", work))
+        second = asyncio.create_task(flight.run("k", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == "result"
+        assert work.calls == 1
+
+    def test_threads_share_one_execution(self):
+        flight, work = SingleFlight(), _Counter(delay=0.1)
+        results: list[str] = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(flight.run_sync("k", work.blocking))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == ["result"] * 5
+        assert work.calls == 1
+
+
+class TestDecorator:
+    @pytest.mark.asyncio
+    async def test_key_template_binds_arguments_and_namespaces_per_function(self):
+        work = _Counter()
+
+        class Catalog:
+            @singleflight("category:{category_id}")
+            async def top(self, category_id: int) -> str:
+                return await work(f"top-{category_id}")
+
+            @singleflight("category:{category_id}")
+            async def other(self, category_id: int) -> str:
+                return await work(f"other-{category_id}")
+
+        catalog = Catalog()
+        results = await asyncio.gather(
+            catalog.top(1), catalog.top(category_id=1), catalog.top(2), catalog.other(1)
+        )
+        assert results == ["top-1", "top-1", "top-2", "other-1"]
+        assert work.calls == 3
+
+    def test_sync_function_and_callable_key(self):
+        work = _Counter()
+
+        @singleflight(lambda user_id: f"feed:{user_id}")
+        def feed(user_id: int) -> str:
+            return work.blocking(f"feed-{user_id}")
+
+        assert feed(7) == "feed-7"
+        assert feed.__name__ == "feed"
+
+    def test_options_require_distributed(self):
+        with pytest.raises(TypeError):
+            singleflight("k", result_ttl=5)
+
+
+class _PubSubClient:
+    """In-memory stand-in for the redis-py client's publish / pubsub."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.published: list[str] = []
+
+    def publish(self, channel: str, message: bytes) -> None:
+        with self.condition:
+            self.published.append(channel)
+            self.condition.notify_all()
+
+    def pubsub(self, ignore_subscribe_messages: bool = False):
+        return _Subscription(self)
+
+
+class _Subscription:
+    def __init__(self, client: _PubSubClient):
+        self.client = client
+        self.seen = 0
+        self.closed = False
+
+    def subscribe(self, channel: str) -> None:
+        self.channel = channel
+        self.seen = len(self.client.published)
+
+    def get_message(self, timeout: float):
+        with self.client.condition:
+            self.client.condition.wait_for(
+                lambda: len(self.client.published) > self.seen, timeout
+            )
+            self.seen = len(self.client.published)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _RedisLikeDriver(CacheFake):
+    def __init__(self):
+        super().__init__()
+        self.client = _PubSubClient()
+
+    def connection(self) -> _PubSubClient:
+        return self.client
+
+
+@pytest.fixture(params=["pubsub", "polling"])
+def cache(request, monkeypatch) -> Cache:
+    manager = Cache(application=None, default_driver="fake")
+    driver = _RedisLikeDriver() if request.param == "pubsub" else CacheFake()
+    manager.add_driver("fake", driver)
+    monkeypatch.setattr(distributed_module, "Cache", manager)
+    return manager
+
+
+class TestDistributedSingleFlight:
+    @pytest.mark.asyncio
+    async def test_workers_share_the_leaders_result(self, cache):
+        # Two instances stand in for two workers: separate local flights,
+        # one shared cache.
+        workers = [DistributedSingleFlight(), DistributedSingleFlight()]
+        work = _Counter(delay=0.1)
+        results = await asyncio.gather(
+            *(worker.run("homepage", work) for worker in workers for _ in range(3))
+        )
+        assert results == ["result"] * 6
+        assert work.calls == 1
+        assert not cache.has("lock:singleflight:homepage")
+
+    @pytest.mark.asyncio
+    async def test_failed_leader_hands_the_key_to_a_follower(self, cache):
+        leader, follower = DistributedSingleFlight(), DistributedSingleFlight()
+        failing, healthy = _Counter(delay=0.1, fail=True), _Counter()
+
+        lead = asyncio.create_task(leader.run("k", failing))
+        await asyncio.sleep(0.01)
+        follow = asyncio.create_task(follower.run("k", healthy))
+
+        with pytest.raises(RuntimeError):
+            await lead
+        assert await follow == "result"
+        assert (failing.calls, healthy.calls) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_a_finished_flight_is_not_served_to_later_callers(self, cache):
+        flight, work = DistributedSingleFlight(), _Counter()
+
+        assert await flight.run("k", work) == "result"
+        assert await flight.run("k", work, "fresh") == "fresh"
+        assert work.calls == 2
+
+    def test_a_finished_blocking_flight_is_not_served_to_later_callers(self, cache):
+        flight, work = DistributedSingleFlight(), _Counter(delay=0)
+
+        assert flight.run_sync("k", work.blocking) == "result"
+        assert flight.run_sync("k", work.blocking, "fresh") == "fresh"
+        assert work.calls == 2
+
+    def test_blocking_callers_share_the_leaders_result(self, cache):
+        workers = [DistributedSingleFlight(), DistributedSingleFlight()]
+        work = _Counter(delay=0.1)
+        results: list[str] = []
+        threads = [
+            threading.Thread(
+                target=lambda worker=worker: results.append(
+                    worker.run_sync("k", work.blocking)
+                )
+            )
+            for worker in workers
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == ["result"] * 2
+        assert work.calls == 1
+
+    def test_invalid_options_are_refused(self):
+        with pytest.raises(ValueError):
+            DistributedSingleFlight(lock_seconds=0)
+        with pytest.raises(ValueError):
+            DistributedSingleFlight(wait=0)
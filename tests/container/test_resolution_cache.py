@@ -0,0 +1,147 @@
+"""
+Resolution-cache pins for ``Container.make``.
+
+After the first resolution a key is served from the cache without taking
+``_deferred_lock`` or re-scanning bindings. Every binding change must
+invalidate it, and a cache hit must behave exactly like the slow path:
+classes are still constructed fresh, factories still called, hooks still
+fired.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+import pytest
+
+from cara.container import Container
+from cara.exceptions import MissingContainerBindingException
+from cara.foundation.Application import Application
+from cara.foundation.DeferredProvider import DeferredProvider
+
+
+class _Contract(ABC):
+    @abstractmethod
+    def name(self) -> str: ...
+
+
+class _Impl(_Contract):
+    def name(self) -> str:
+        return "impl"
+
+
+class _Other(_Contract):
+    def name(self) -> str:
+        return "other"
+
+
+class _Needs:
+    def __init__(self, dep: _Contract, label: str = "x", *, flag: bool = True):
+        self.dep = dep
+        self.label = label
+        self.flag = flag
+
+
+class _LockSpy:
+    """Stands in for ``_deferred_lock`` and counts acquisitions."""
+
+    def __init__(self) -> None:
+        self.entered = 0
+
+    def __enter__(self):
+        self.entered += 1
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class TestCacheHits:
+    def test_second_make_skips_the_lock(self):
+        container = Container()
+        container.bind("greeting", "hello")
+        spy = container._deferred_lock = _LockSpy()
+
+        assert container.make("greeting") == "hello"
+        assert container.make("greeting") == "hello"
+        assert spy.entered == 1
+        assert container.resolution_stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    def test_subclass_scan_result_is_cached(self):
+        container = Container()
+        container.bind("impl", _Impl())
+        first = container.make(_Contract)
+        spy = container._deferred_lock = _LockSpy()
+        assert container.make(_Contract) is first
+        assert spy.entered == 0
+
+    def test_bound_class_is_constructed_fresh_on_every_hit(self):
+        container = Container()
+        container.bind(_Contract, _Impl)
+        first = container.make(_Needs)
+        second = container.make(_Needs)
+        assert first is not second
+        assert isinstance(second.dep, _Impl)
+        assert (second.label, second.flag) == ("x", True)
+
+    def test_factory_is_called_on_every_hit(self):
+        calls = []
+        container = Container()
+        container.bind("counter", lambda: calls.append(1) or len(calls))
+        assert [container.make("counter") for _ in range(3)] == [1, 2, 3]
+
+    def test_hooks_still_fire_on_cache_hits(self):
+        seen = []
+        container = Container()
+        container.bind("impl", _Impl)
+        container.on_make(_Impl, lambda obj, _c: seen.append(obj))
+        container.make("impl")
+        container.make("impl")
+        assert seen == [_Impl, _Impl]
+
+
+class TestInvalidation:
+    def test_rebind_is_visible(self):
+        container = Container()
+        container.bind(_Contract, _Impl)
+        assert container.make(_Contract).name() == "impl"
+        container.bind(_Contract, _Other)
+        assert container.make(_Contract).name() == "other"
+
+    def test_unbind_is_visible(self):
+        container = Container()
+        container.bind("key", "value")
+        container.make("key")
+        container.unbind("key")
+        with pytest.raises(MissingContainerBindingException):
+            container.make("key")
+
+    def test_swap_is_visible(self):
+        container = Container()
+        container.swap("mailer", "fake")
+        assert container.make("mailer") == "fake"
+        container.swap("mailer", "other-fake")
+        assert container.make("mailer") == "other-fake"
+
+    def test_singleton_replaces_the_cached_binding(self):
+        container = Container()
+        container.bind(_Contract, _Impl)
+        container.make(_Contract)
+        container.singleton(_Contract, _Other)
+        assert container.make(_Contract) is container.make(_Contract)
+        assert container.make(_Contract).name() == "other"
+
+    def test_deferred_provider_registration_is_visible(self):
+        class _Provider(DeferredProvider):
+            @classmethod
+            def provides(cls) -> list[str]:
+                return ["lazy"]
+
+            def register(self) -> None:
+                self.application.bind("lazy", "from-provider")
+
+        app = Application()
+        app.swap("lazy", "swapped")
+        assert app.make("lazy") == "swapped"
+        app.add_providers(_Provider)
+        assert app.make("lazy") == "from-provider"
@@ -0,0 +1,115 @@
+"""
+Scoped-lifetime pins: one instance per ``Container.scope()``, built lazily,
+dropped on exit, never shared between concurrent scopes; registered
+per-request ContextVars start fresh in each scope and are restored after.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from contextvars import ContextVar
+
+import pytest
+
+from cara.container import Container
+from cara.exceptions import StrictContainerException
+
+
+class _RequestState:
+    created = 0
+
+    def __init__(self) -> None:
+        type(self).created += 1
+        self.items: list[str] = []
+
+
+class _UsesState:
+    def __init__(self, state: _RequestState) -> None:
+        self.state = state
+
+
+_jwt_guard_mod = importlib.import_module("cara.authentication.guards.JWTGuard")
+
+_IDENTITY: ContextVar[str | None] = Container.scoped_var(
+    ContextVar("test_scoped_identity", default=None)
+)
+
+
+def _container() -> Container:
+    container = Container()
+    container.scoped(_RequestState, _RequestState)
+    return container
+
+
+class TestScopedInstances:
+    def test_one_instance_per_scope_and_lazy(self):
+        container = _container()
+        before = _RequestState.created
+        with container.scope():
+            assert _RequestState.created == before
+            first = container.make(_RequestState)
+            assert container.make(_RequestState) is first
+            assert container.make(_UsesState).state is first
+        with container.scope():
+            assert container.make(_RequestState) is not first
+
+    def test_nested_scope_is_isolated_and_restores_outer(self):
+        container = _container()
+        with container.scope():
+            outer = container.make(_RequestState)
+            with container.scope():
+                assert container.make(_RequestState) is not outer
+            assert container.make(_RequestState) is outer
+
+    def test_outside_any_scope_the_instance_is_process_wide(self):
+        container = _container()
+        assert container.make(_RequestState) is container.make(_RequestState)
+
+    def test_factory_binding_by_string_key(self):
+        container = Container()
+        container.scoped("cart", lambda: [])
+        with container.scope():
+            container.make("cart").append("x")
+            assert container.make("cart") == ["x"]
+        with container.scope():
+            assert container.make("cart") == []
+
+    def test_concurrent_scopes_do_not_share(self):
+        container = _container()
+
+        async def unit(tag: str) -> _RequestState:
+            with container.scope():
+                state = container.make(_RequestState)
+                state.items.append(tag)
+                await asyncio.sleep(0)
+                assert container.make(_RequestState) is state
+                return state
+
+        async def main():
+            return await asyncio.gather(unit("a"), unit("b"))
+
+        a, b = asyncio.run(main())
+        assert a is not b
+        assert (a.items, b.items) == (["a"], ["b"])
+
+    def test_instance_binding_is_rejected(self):
+        with pytest.raises(StrictContainerException):
+            Container().scoped("config", object())
+
+
+class TestScopedVars:
+    def test_scope_starts_fresh_and_restores_on_exit(self):
+        token = _IDENTITY.set("outer")
+        try:
+            with Container().scope():
+                assert _IDENTITY.get() is None
+                _IDENTITY.set("alice")
+            assert _IDENTITY.get() == "outer"
+        finally:
+            _IDENTITY.reset(token)
+
+    def test_auth_guard_identity_is_scoped(self):
+        with Container().scope():
+            _jwt_guard_mod._REQUEST_USER.set("alice")
+        assert _jwt_guard_mod._REQUEST_USER.get() is None
@@ -0,0 +1,109 @@
+"""Encrypted casts decrypt a stored value once per model instance.
+
+Reads after the first are answered from the instance's plaintext memo until
+the stored value changes or ``forget_decrypted`` drops it; JSON reads still
+decode afresh so callers never share a mutable result.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from cara.eloquent import DatabaseManager, get_cast_instance
+from cara.eloquent.models.Model import Model
+from cara.encryption import Crypt
+from cara.testing.FacadeSwap import swap
+
+_KEY = "m" * 32
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _register_memory_connection():
+    """Instantiating a model validates its connection; no query is executed."""
+    manager = DatabaseManager(
+        "app", {"app": {"driver": "sqlite", "database": ":memory:"}}
+    )
+    with swap("DB", manager):
+        yield
+
+
+@pytest.fixture
+def decrypts(monkeypatch):
+    calls = []
+    decrypt = Crypt.decrypt
+
+    def counting(self, token):
+        calls.append(token)
+        return decrypt(self, token)
+
+    monkeypatch.setattr(Crypt, "decrypt", counting)
+    return calls
+
+
+class _Vault(Model):
+    __table__ = "vaults"
+    __casts__ = {"secret": f"encrypted:{_KEY}", "config": f"encrypted_json:{_KEY}"}
+
+
+def _stored(**values) -> _Vault:
+    crypt = Crypt(_KEY)
+    vault = _Vault()
+    vault.__attributes__["secret"] = crypt.encrypt(values["secret"])
+    vault.__attributes__["config"] = json.dumps(
+        {"$enc": crypt.encrypt(json.dumps(values["config"]))}
+    )
+    return vault
+
+
+def test_repeated_reads_decrypt_once(decrypts):
+    vault = _stored(secret="s3cret", config={"token": "t"})
+
+    assert [vault.secret for _ in range(3)] == ["s3cret"] * 3
+    assert vault.all_attributes()["secret"] == "s3cret"
+    assert len(decrypts) == 2  # ``secret`` once, ``config`` once
+
+
+def test_json_reads_are_fresh_objects(decrypts):
+    vault = _stored(secret="s", config={"token": "t"})
+
+    first = vault.config
+    first["token"] = "mutated"
+
+    assert vault.config == {"token": "t"}
+    assert vault.config is not vault.config
+    assert len(decrypts) == 1
+
+
+def test_a_changed_value_is_decrypted_again(decrypts):
+    vault = _stored(secret="old", config={})
+    assert vault.secret == "old"
+
+    vault.__attributes__["secret"] = Crypt(_KEY).encrypt("new")
+
+    assert vault.secret == "new"
+    assert len(decrypts) == 2
+
+
+def test_forget_decrypted_drops_the_plaintexts(decrypts):
+    vault = _stored(secret="s3cret", config={})
+    assert vault.secret == "s3cret"
+
+    vault.forget_decrypted()
+
+    assert "__decrypted__" not in vault.__dict__
+    assert vault.secret == "s3cret"
+    assert len(decrypts) == 2
+
+
+def test_explicit_keys_share_the_bounded_cipher_cache():
+    first = get_cast_instance(f"encrypted:{_KEY}")
+    second = get_cast_instance(f"encrypted:{_KEY}")
+
+    cached = first._cipher()._cipher("explicit")
+    assert second._cipher()._cipher("explicit") is cached
+
+    Crypt.forget_ciphers()
+    assert first._cipher()._cipher("explicit") is not cached
+    assert second.get(first.set("s3cret")) == "s3cret"
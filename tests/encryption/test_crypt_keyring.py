@@ -53,3 +53,31 @@ def test_missing_historical_key_fails_closed():
 
     with pytest.raises(EncryptionException, match="unavailable"):
         current.decrypt(token)
+
+
+def test_batches_round_trip_across_key_ids():
+    old = Crypt(keys={"old": "o" * 32}, current_key_id="old")
+    rotated = Crypt(keys={"old": "o" * 32, "new": "n" * 32}, current_key_id="new")
+    tokens = old.encrypt_many(["a", "b"]) + rotated.encrypt_many(["c"])
+
+    assert [token.split(":")[1] for token in tokens] == ["old", "old", "new"]
+    assert rotated.decrypt_many(tokens) == ["a", "b", "c"]
+    assert rotated.decrypt_many([]) == []
+    with pytest.raises(EncryptionException):
+        rotated.decrypt_many([tokens[0], "unversioned"])
+
+
+def test_cipher_contexts_are_shared_but_follow_the_secret():
+    first = Crypt(keys={"k": "a" * 32}, current_key_id="k")
+    second = Crypt(keys={"k": "a" * 32}, current_key_id="k")
+    rotated = Crypt(keys={"k": "b" * 32}, current_key_id="k")
+
+    assert first._cipher("k") is second._cipher("k")
+    assert rotated._cipher("k") is not first._cipher("k")
+    with pytest.raises(EncryptionException):
+        rotated.decrypt(first.encrypt("credential"))
+
+    cached = first._cipher("k")
+    Crypt.forget_ciphers()
+    assert first._cipher("k") is not cached
+    assert second.decrypt(first.encrypt("credential")) == "credential"
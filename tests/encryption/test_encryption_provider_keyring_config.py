@@ -27,7 +27,8 @@ from unittest.mock import patch
 
 import pytest
 
-from cara.encryption import EncryptionProvider
+from cara.container import Container
+from cara.encryption import Crypt, EncryptionProvider
 from cara.exceptions import EncryptionException
 
 # Pull the MODULE (not the class re-exported by the package ``__init__``) out of
@@ -51,6 +52,9 @@ class _StubApp:
     def bind(self, name: str, factory):
         self.bindings[name] = factory
 
+    def singleton(self, name: str, factory):
+        self.bindings[name] = factory
+
     def has(self, _name: str) -> bool:
         return False
 
@@ -116,6 +120,22 @@ class TestEncryptionProviderReadsKeyringConfigPaths:
         )
         assert crypt.decrypt(token) == "plaintext"
 
+    def test_crypt_is_one_lazily_built_container_singleton(self) -> None:
+        container = Container()
+        provider = EncryptionProvider(application=container)
+
+        patcher, _ = _stub_config(
+            {
+                "encryption.keys": {"local": _SECRET},
+                "encryption.current_key_id": "local",
+            }
+        )
+        with patcher:
+            provider.register()
+
+        assert container.make("crypt") is container.make("crypt")
+        assert Crypt.forget_ciphers in container._shutdown_callbacks
+
 
 class TestEncryptionProviderFailsClosedWhenKeyringMissing:
     """A missing keyring must raise, not bind a half-configured Crypt."""
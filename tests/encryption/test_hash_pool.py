@@ -0,0 +1,124 @@
+"""``Hash.amake`` / ``Hash.acheck`` hash on a bounded pool, off the loop."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from cara.encryption import EncryptionProvider, Hash
+from cara.encryption._HashPool import _HashPool
+from cara.exceptions import EncryptionException, ServiceUnavailableException
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = _HashPool(workers=1, max_pending=1)
+    monkeypatch.setattr(Hash, "_hash_pool", pool)
+    yield pool
+    pool.shutdown()
+
+
+def test_async_hashing_round_trips_on_the_pool(pool):
+    async def scenario():
+        hashed = await Hash.amake("bcrypt password", algorithm="bcrypt", rounds=4)
+        return hashed, await Hash.acheck("bcrypt password", hashed)
+
+    hashed, verified = asyncio.run(scenario())
+
+    assert hashed.startswith("$2b$")
+    assert verified
+    assert Hash.check("bcrypt password", hashed)
+
+
+def test_hashing_never_runs_on_the_loop_thread(pool):
+    threads = []
+
+    def record(value, *_):
+        threads.append(threading.current_thread())
+        return value
+
+    async def scenario():
+        return await pool.run("make", record, "x")
+
+    assert asyncio.run(scenario()) == "x"
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_a_full_queue_sheds_instead_of_waiting(pool):
+    release = threading.Event()
+
+    async def scenario():
+        blocked = [
+            asyncio.ensure_future(pool.run("check", release.wait)) for _ in range(2)
+        ]
+        await asyncio.sleep(0.05)
+        assert pool.queued == 1
+        with pytest.raises(ServiceUnavailableException):
+            await pool.run("check", release.wait)
+        release.set()
+        await asyncio.gather(*blocked)
+
+    asyncio.run(scenario())
+    assert pool.queued == 0
+
+
+def test_errors_in_the_pool_reach_the_caller(pool):
+    with pytest.raises(ValueError):
+        asyncio.run(Hash.amake("x", algorithm="md5"))
+    assert pool.queued == 0
+
+
+def test_process_mode_hashes_in_child_processes_and_reaps_them():
+    pool = _HashPool(workers=1, max_pending=0, mode="process")
+
+    async def scenario():
+        return await pool.run("make", Hash.make, "x", "sha256")
+
+    try:
+        assert Hash.check("x", asyncio.run(scenario()), "sha256")
+        children = list(pool._executor._processes.values())
+        assert children and all(child.is_alive() for child in children)
+    finally:
+        pool.shutdown()
+    assert not any(child.is_alive() for child in children)
+    assert pool.queued == 0
+
+
+def test_application_shutdown_stops_the_pool(monkeypatch):
+    provider_module = importlib.import_module("cara.encryption.EncryptionProvider")
+    values = {
+        "encryption.keys": {"local": "k" * 32},
+        "encryption.current_key_id": "local",
+    }
+    monkeypatch.setattr(
+        provider_module, "config", lambda key, default=None: values.get(key, default)
+    )
+    application = SimpleNamespace(bind=lambda *_: None, singleton=lambda *_: None)
+    EncryptionProvider(application=application).register()
+    pool = _HashPool(workers=1, max_pending=0)
+    monkeypatch.setattr(Hash, "_hash_pool", pool)
+    asyncio.run(pool.run("make", str, "x"))
+
+    for callback in application._shutdown_callbacks:
+        callback()
+
+    assert Hash._hash_pool is None
+    assert pool._executor is None
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"workers": 0, "max_pending": 1},
+        {"workers": True, "max_pending": 1},
+        {"workers": 1, "max_pending": -1},
+        {"workers": 1, "max_pending": 1, "mode": "fiber"},
+    ],
+)
+def test_pool_settings_are_validated(kwargs):
+    with pytest.raises(EncryptionException):
+        _HashPool(**kwargs)
@@ -0,0 +1,189 @@
+"""
+Compiled resource plan pins: a resource that declares ``fields`` serializes
+to exactly the payload its hand-written ``to_array`` twin produces — same
+keys, same order, same bytes — for models and dict rows, with ``loaded``
+relations omitted when absent and nested resources rendered through their
+own plans. ``craft bench --only 'cara.resource.*'`` times the two paths.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from cara.http.resources import (
+    JsonResource,
+    MissingValue,
+    ResourceCollection,
+    ResourceField,
+    ResourcePlan,
+)
+
+
+class BrandResource(JsonResource):
+    fields = ("id", "name")
+
+
+class ProductResource(JsonResource):
+    fields = (
+        ResourceField("id", "public_id"),
+        "title",
+        ResourceField("score", convert=float),
+        "price",
+        ResourceField("updated_at", convert=datetime),
+        ResourceField("brand", resource=BrandResource, loaded=True),
+        ResourceField("tags", resource=BrandResource, loaded=True),
+    )
+
+
+class HandWrittenProductResource(JsonResource):
+    """Today's per-item path for the same shape."""
+
+    def to_array(self, request=None) -> dict:
+        product = self.resource
+        return {
+            "id": product.public_id,
+            "title": product.title,
+            "score": self.opt_float(product.score),
+            "price": product.price,
+            "updated_at": self.opt_datetime(product.updated_at),
+            "brand": self.when_loaded(
+                product, "brand", lambda brand: BrandResource(brand).to_array()
+            ),
+            "tags": self.when_loaded(
+                product,
+                "tags",
+                lambda tags: [BrandResource(tag).to_array() for tag in tags],
+            ),
+        }
+
+
+def _product(index: int, **overrides) -> SimpleNamespace:
+    values = {
+        "public_id": f"prd_{index}",
+        "title": f"Widget {index}",
+        "score": index / 3,
+        "price": Decimal("19.90"),
+        "updated_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+        "brand": SimpleNamespace(id=index, name="Acme"),
+        "tags": [SimpleNamespace(id=1, name="new")],
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestParityWithPerItemPath:
+    def test_collection_payload_and_bytes_are_identical(self):
+        items = [_product(index) for index in range(20)]
+        planned = ProductResource.collection(items).with_meta({"page": 1})
+        manual = HandWrittenProductResource.collection(items).with_meta({"page": 1})
+
+        assert ProductResource.plan() is not None
+        assert HandWrittenProductResource.plan() is None
+        assert planned.resolve() == manual.resolve()
+        assert list(planned.resolve()["data"][0]) == list(manual.resolve()["data"][0])
+        assert planned.to_bytes() == manual.to_bytes()
+
+    def test_single_resource_uses_the_plan(self):
+        product = _product(1)
+        assert (
+            ProductResource(product).to_bytes()
+            == HandWrittenProductResource(product).to_bytes()
+        )
+
+    def test_absent_relation_is_omitted_and_none_stays_null(self):
+        product = _product(1, brand=None)
+        del product.tags
+        row = ProductResource.plan().row(product)
+        assert row["brand"] is None
+        assert "tags" not in row
+        assert (
+            row == HandWrittenProductResource.collection([product]).resolve()["data"][0]
+        )
+
+    def test_dict_rows_and_dotted_sources(self):
+        class RowResource(JsonResource):
+            fields = (
+                "id",
+                ResourceField("brand_name", "brand.name"),
+                ResourceField("rating", "rating", convert=int, loaded=True),
+            )
+
+        rows = [
+            {"id": 1, "brand": {"name": "Acme"}, "rating": "4"},
+            {"id": 2, "brand": {"name": "Zed"}},
+        ]
+        objects = [SimpleNamespace(id=3, brand=SimpleNamespace(name="Obj"))]
+        assert RowResource.collection(rows + objects).to_array() == [
+            {"id": 1, "brand_name": "Acme", "rating": 4},
+            {"id": 2, "brand_name": "Zed"},
+            {"id": 3, "brand_name": "Obj"},
+        ]
+
+
+class TestNesting:
+    def test_nested_resource_without_a_plan_goes_through_to_array(self):
+        class LegacyBrand(JsonResource):
+            def to_array(self, request=None) -> dict:
+                return {"name": self.resource.name, "hidden": MissingValue()}
+
+        class Product(JsonResource):
+            fields = (ResourceField("brand", resource=LegacyBrand),)
+
+        assert Product.plan().row(_product(1)) == {"brand": {"name": "Acme"}}
+
+    def test_self_referencing_resource(self):
+        class CategoryResource(JsonResource):
+            fields = ("name",)
+
+        CategoryResource.fields = (
+            "name",
+            ResourceField("children", resource=CategoryResource),
+        )
+        tree = SimpleNamespace(
+            name="root", children=[SimpleNamespace(name="leaf", children=[])]
+        )
+        assert CategoryResource.plan().row(tree) == {
+            "name": "root",
+            "children": [{"name": "leaf", "children": []}],
+        }
+
+
+class TestCompilation:
+    def test_plan_is_compiled_once_per_class_and_not_inherited(self):
+        class Base(JsonResource):
+            fields = ("id",)
+
+        class Child(Base):
+            fields = ("id", "name")
+
+        assert Base.plan() is Base.plan()
+        assert [field.name for field in Child.plan().fields] == ["id", "name"]
+
+    def test_overriding_to_array_keeps_the_per_item_path(self):
+        class Custom(JsonResource):
+            fields = ("id",)
+
+            def to_array(self, request=None) -> dict:
+                return {"custom": True}
+
+        assert Custom.plan() is None
+        assert ResourceCollection([1], Custom).resolve() == {"data": [{"custom": True}]}
+
+    def test_invalid_declarations_are_refused(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            ResourcePlan(["id", ResourceField("id", "pk")])
+        with pytest.raises(ValueError, match="no converter"):
+            ResourceField("price", convert=Decimal)
+        with pytest.raises(ValueError, match="exclusive"):
+            ResourceField("brand", convert=str, resource=BrandResource)
+        with pytest.raises(TypeError):
+            ResourcePlan([42])
+
+    def test_declared_values_never_reach_generated_source(self):
+        hostile = 'x": 1}) or __import__("os") #'
+        plan = ResourcePlan([ResourceField(hostile, "id")])
+        assert plan.row({"id": 7}) == {hostile: 7}
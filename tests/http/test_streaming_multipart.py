@@ -0,0 +1,212 @@
+"""
+Streaming multipart pins: the body is fed to the parser one ``receive``
+chunk at a time, file parts spool to disk past ``server.upload_spool_size``,
+limits trip while bytes are still arriving, and ``store_files`` pipes parts
+into a storage driver without buffering them — committing only when the
+whole body parsed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from importlib import import_module
+
+import pytest
+
+from cara.exceptions import BadRequestException, PayloadTooLargeException
+from cara.http import Request
+from cara.storage import Storage
+from cara.storage.drivers import FileDriver
+
+body_parsing_module = import_module("cara.http.request.mixins.MakesBodyParsing")
+
+_BOUNDARY = "xYzBoundary"
+
+
+def _limits(body=1024 * 1024, file=1024 * 1024, files=20, spool=64):
+    return lambda: {
+        "MAX_BODY_SIZE": body,
+        "MAX_FILE_SIZE": file,
+        "MAX_FILES": files,
+        "SPOOL_SIZE": spool,
+    }
+
+
+@pytest.fixture(autouse=True)
+def _small_spool(monkeypatch) -> None:
+    monkeypatch.setattr(body_parsing_module, "_body_limits", _limits())
+
+
+def _multipart(*parts: tuple[str, str | None, bytes]) -> bytes:
+    out = b""
+    for name, filename, data in parts:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        out += (
+            f"--{_BOUNDARY}\r\nContent-Disposition: {disposition}\r\n"
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        out += data + b"\r\n"
+    return out + f"--{_BOUNDARY}--\r\n".encode()
+
+
+def _request(body: bytes, chunk_size: int = 7) -> tuple[Request, list[int]]:
+    chunks: Sequence[bytes] = [
+        body[i : i + chunk_size] for i in range(0, len(body), chunk_size)
+    ]
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    received: list[int] = []
+
+    async def receive() -> dict:
+        message = messages.pop(0)
+        received.append(len(message["body"]))
+        return message
+
+    headers = [(b"content-type", f"multipart/form-data; boundary={_BOUNDARY}".encode())]
+    request = Request(None).load({"type": "http", "headers": headers}, receive)
+    return request, received
+
+
+class _App:
+    def __init__(self, storage: Storage) -> None:
+        self.storage = storage
+
+    def make(self, key: str):
+        assert key == "storage"
+        return self.storage
+
+
+def _storage(tmp_path) -> Storage:
+    storage = Storage(None, "file")
+    storage.add_driver("file", FileDriver(str(tmp_path / "store")))
+    return storage
+
+
+class TestStreamingParse:
+    @pytest.mark.asyncio
+    async def test_fields_and_files_parse_from_small_chunks(self):
+        request, _ = _request(
+            _multipart(("title", None, "héllo".encode()), ("doc", "a.txt", b"abc")),
+            chunk_size=3,
+        )
+        assert await request.form() == {"title": "héllo"}
+        doc = await request.file("doc")
+        assert (doc.filename, doc.size, doc.content) == ("a.txt", 3, b"abc")
+        assert request._body is None
+
+    @pytest.mark.asyncio
+    async def test_large_file_rolls_over_to_disk(self):
+        payload = b"z" * 1000
+        request, _ = _request(_multipart(("doc", "big.bin", payload)), chunk_size=128)
+        doc = await request.file("doc")
+        assert doc.file._rolled
+        assert doc.size == 1000
+        assert b"".join(doc.chunks(100)) == payload
+
+    @pytest.mark.asyncio
+    async def test_cached_body_is_still_parsed(self):
+        body = _multipart(("title", None, b"x"))
+        request, _ = _request(body)
+        assert await request.body() == body
+        assert await request.form() == {"title": "x"}
+
+    @pytest.mark.asyncio
+    async def test_body_is_consumed_by_a_streamed_parse(self):
+        request, _ = _request(_multipart(("title", None, b"x")))
+        await request.form()
+        with pytest.raises(BadRequestException, match="already consumed"):
+            await request.body()
+
+
+class TestIncrementalLimits:
+    @pytest.mark.asyncio
+    async def test_oversize_file_is_rejected_mid_stream(self, monkeypatch):
+        monkeypatch.setattr(body_parsing_module, "_body_limits", _limits(file=50))
+        request, received = _request(
+            _multipart(("doc", "a.bin", b"q" * 400)), chunk_size=20
+        )
+        with pytest.raises(BadRequestException, match="exceeds maximum size of 50"):
+            await request.files()
+        # The parse stopped well before the end of the body.
+        assert sum(received) < 200
+
+    @pytest.mark.asyncio
+    async def test_body_cap_still_applies(self, monkeypatch):
+        monkeypatch.setattr(body_parsing_module, "_body_limits", _limits(body=100))
+        request, _ = _request(_multipart(("doc", "a.bin", b"q" * 400)))
+        with pytest.raises(PayloadTooLargeException):
+            await request.files()
+
+    @pytest.mark.asyncio
+    async def test_file_count_and_filename_rules(self, monkeypatch):
+        monkeypatch.setattr(body_parsing_module, "_body_limits", _limits(files=1))
+        request, _ = _request(_multipart(("a", "a.txt", b"1"), ("b", "b.txt", b"2")))
+        with pytest.raises(BadRequestException, match="Too many files"):
+            await request.files()
+
+        request, _ = _request(_multipart(("a", "../etc.txt", b"1")))
+        with pytest.raises(BadRequestException, match="invalid characters"):
+            await request.files()
+
+        request, _ = _request(_multipart(("a", "empty.txt", b"")))
+        with pytest.raises(BadRequestException, match="is empty"):
+            await request.files()
+
+
+class TestStoreFiles:
+    @pytest.mark.asyncio
+    async def test_parts_are_piped_into_storage(self, tmp_path):
+        storage = _storage(tmp_path)
+        request, _ = _request(
+            _multipart(("note", None, b"hi"), ("doc", "report.pdf", b"%PDF-data"))
+        )
+        request.application = _App(storage)
+
+        files = await request.store_files("uploads")
+        doc = files["doc"]
+        assert doc.is_stored and doc.file is None
+        assert doc.storage_key.startswith("uploads/")
+        assert doc.storage_key.endswith(".pdf")
+        assert storage.get(doc.storage_key) == b"%PDF-data"
+        assert doc.content == b"%PDF-data"
+        assert await request.form() == {"note": "hi"}
+
+    @pytest.mark.asyncio
+    async def test_failed_parse_commits_nothing(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(body_parsing_module, "_body_limits", _limits(files=1))
+        storage = _storage(tmp_path)
+        request, _ = _request(_multipart(("a", "a.txt", b"1"), ("b", "b.txt", b"2")))
+        request.application = _App(storage)
+
+        with pytest.raises(BadRequestException):
+            await request.store_files("uploads")
+        assert not [p for p in (tmp_path / "store").rglob("*") if p.is_file()]
+
+    @pytest.mark.asyncio
+    async def test_already_parsed_files_are_copied_from_the_spool(self, tmp_path):
+        storage = _storage(tmp_path)
+        request, _ = _request(_multipart(("doc", "a.txt", b"abc")))
+        request.application = _App(storage)
+        await request.files()
+
+        doc = (await request.store_files("uploads"))["doc"]
+        assert storage.get(doc.storage_key) == b"abc"
+
+
+def test_file_driver_writer_publishes_only_on_commit(tmp_path):
+    driver = FileDriver(str(tmp_path / "store"))
+    writer = driver.writer("a/b.bin")
+    writer.write(b"partial")
+    assert not driver.exists("a/b.bin")
+    writer.commit()
+    assert driver.get("a/b.bin") == b"partial"
+
+    aborted = driver.writer("a/c.bin")
+    aborted.write(b"gone")
+    aborted.abort()
+    assert not driver.exists("a/c.bin")
+    assert sorted(p.name for p in (tmp_path / "store" / "a").iterdir()) == ["b.bin"]
@@ -0,0 +1,203 @@
+"""
+AdmitRequests pins: a worker under its limits admits everything; past them
+requests are shed with 503 + ``Retry-After`` in priority order — ``low``
+first, ``high`` last, ``critical`` routes and exempt paths never — on
+in-flight count, event-loop lag or thread-pool queue depth; every decision
+is counted by priority and outcome.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from cara.exceptions import RouteNotFoundException
+from cara.http import Response
+from cara.observability import MetricsBase
+from cara.routing import Route
+
+module = importlib.import_module("cara.middleware.http.AdmitRequests")
+AdmitRequests = module.AdmitRequests
+
+
+class _Router:
+    def __init__(self, *routes: Route):
+        self.routes = {route.url: route for route in routes}
+
+    def find(self, path, method):
+        if path not in self.routes:
+            raise RouteNotFoundException(path)
+        return self.routes[path]
+
+
+def _request(path: str):
+    return SimpleNamespace(method="GET", path=path)
+
+
+def _routes() -> _Router:
+    return _Router(
+        Route.get("/export", lambda request: None).priority("low"),
+        Route.get("/products", lambda request: None),
+        Route.get("/checkout", lambda request: None).priority("high"),
+        Route.get("/webhooks/payments", lambda request: None).priority("critical"),
+    )
+
+
+def _config(monkeypatch, **values):
+    prefixed = {f"server.admission.{key}": value for key, value in values.items()}
+    monkeypatch.setattr(
+        module, "config", lambda key, default=None: prefixed.get(key, default)
+    )
+
+
+def _middleware(monkeypatch, **values) -> AdmitRequests:
+    # Only the signal under test is switched on unless a test says otherwise.
+    values = {"max_loop_lag": 0, "max_thread_queue": 0, **values}
+    _config(monkeypatch, **values)
+    return AdmitRequests(SimpleNamespace(router=_routes()))
+
+
+async def _ok(request):
+    return Response(None).json({"ok": True})
+
+
+async def _status(middleware: AdmitRequests, path: str) -> int:
+    return (await middleware.handle(_request(path), _ok)).get_status_code()
+
+
+class TestInFlight:
+    @pytest.mark.asyncio
+    async def test_requests_are_shed_in_priority_order(self, monkeypatch):
+        middleware = _middleware(monkeypatch, max_in_flight=4)
+        release = asyncio.Event()
+
+        async def held(request):
+            await release.wait()
+            return await _ok(request)
+
+        async def statuses() -> dict[str, int]:
+            paths = ("/export", "/products", "/checkout", "/webhooks/payments")
+            return {path: await _status(middleware, path) for path in paths}
+
+        # 2 of 4 in flight: pressure 0.5, below every threshold.
+        holders = [
+            asyncio.create_task(middleware.handle(_request("/products"), held))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        assert set((await statuses()).values()) == {200}
+
+        # 4 of 4: pressure 1.0 sheds low (0.75) and normal (1.0) only.
+        holders += [
+            asyncio.create_task(middleware.handle(_request("/products"), held))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        assert await statuses() == {
+            "/export": 503,
+            "/products": 503,
+            "/checkout": 200,
+            "/webhooks/payments": 200,
+        }
+        assert await _status(middleware, "/health/ready") == 200
+
+        release.set()
+        await asyncio.gather(*holders)
+        assert module._in_flight == 0
+        assert await _status(middleware, "/export") == 200
+
+    @pytest.mark.asyncio
+    async def test_shed_response_carries_retry_after(self, monkeypatch):
+        middleware = _middleware(monkeypatch, max_in_flight=1, retry_after=7)
+        release = asyncio.Event()
+
+        async def held(request):
+            await release.wait()
+            return await _ok(request)
+
+        holder = asyncio.create_task(middleware.handle(_request("/products"), held))
+        await asyncio.sleep(0)
+        response = await middleware.handle(_request("/unknown"), _ok)
+        release.set()
+        await holder
+
+        assert response.get_status_code() == 503
+        assert response.header("Retry-After") == "7"
+        assert b'"type": "overloaded"' in response.content
+
+    @pytest.mark.asyncio
+    async def test_decisions_are_counted(self, monkeypatch):
+        middleware = _middleware(monkeypatch, max_in_flight=1)
+
+        def count(priority: str, outcome: str) -> float:
+            return MetricsBase.http_admission_total.labels(
+                priority=priority, outcome=outcome
+            )._value.get()
+
+        admitted, shed = count("low", "admitted"), count("low", "shed")
+        release = asyncio.Event()
+
+        async def held(request):
+            await release.wait()
+            return await _ok(request)
+
+        holder = asyncio.create_task(middleware.handle(_request("/export"), held))
+        await asyncio.sleep(0)
+        await _status(middleware, "/export")
+        release.set()
+        await holder
+
+        assert count("low", "admitted") == admitted + 1
+        assert count("low", "shed") == shed + 1
+
+
+@pytest.mark.asyncio
+async def test_event_loop_lag_sheds(monkeypatch):
+    middleware = _middleware(monkeypatch, max_loop_lag=0.05, sample_interval=0.01)
+    assert await _status(middleware, "/products") == 200
+
+    time.sleep(0.1)  # a blocking call on the loop
+    assert await _status(middleware, "/products") == 503
+    assert await _status(middleware, "/webhooks/payments") == 200
+
+    await asyncio.sleep(0.05)  # the probe catches up once the loop is free
+    assert await _status(middleware, "/products") == 200
+
+
+@pytest.mark.asyncio
+async def test_thread_pool_queue_depth_sheds(monkeypatch):
+    middleware = _middleware(monkeypatch, max_thread_queue=2)
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+    release = threading.Event()
+
+    # One item runs, two wait for the single thread: pressure 1.0.
+    blocked = [loop.run_in_executor(None, release.wait) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    try:
+        assert await _status(middleware, "/products") == 503
+        assert await _status(middleware, "/checkout") == 200
+    finally:
+        release.set()
+        await asyncio.gather(*blocked)
+    assert await _status(middleware, "/products") == 200
+
+
+def test_route_priority_is_validated():
+    route = Route.get("/products", lambda request: None)
+    assert route.get_priority() == "normal"
+    with pytest.raises(ValueError):
+        route.priority("urgent")
+
+
+def test_invalid_config_is_refused(monkeypatch):
+    with pytest.raises(TypeError):
+        _middleware(monkeypatch, shed_at={"low": 0.5})
+    with pytest.raises(ValueError):
+        _middleware(monkeypatch, max_in_flight=-1)
@@ -0,0 +1,294 @@
+"""
+CacheResponses pins: a stored GET is replayed without reaching the handler,
+keyed on path, query, vary headers, identity and locale; the handler's
+``Cache-Control`` decides what is stored and for how long; tag markers
+purged through ``CacheTaggedStore`` turn entries into misses; a stale entry
+is served while exactly one background refresh re-stores it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from contextvars import ContextVar
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from cara.cache import Cache
+from cara.container import Container
+from cara.http import Response
+from cara.testing.fakes import CacheFake
+
+module = importlib.import_module("cara.middleware.http.CacheResponses")
+CacheResponses = module.CacheResponses
+
+_request_state = Container.scoped_var(
+    ContextVar("tests.cache_responses.request_state", default=None)
+)
+
+
+class _Request:
+    def __init__(self, path="/products", query=b"", method="GET", user=None, **headers):
+        self.method = method
+        self.path = path
+        self.scope = {"query_string": query}
+        self._user = user
+        self._headers = {name.replace("_", "-").lower(): v for name, v in headers.items()}
+
+    def header(self, name, default=None):
+        return self._headers.get(name.lower(), default)
+
+    def user(self):
+        return self._user
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+class _Handler:
+    def __init__(self, cache_control: str | None = None, **headers: str):
+        self.calls = 0
+        self.cache_control = cache_control
+        self.headers = headers
+
+    async def __call__(self, request):
+        self.calls += 1
+        response = Response(MagicMock()).json({"version": self.calls})
+        if self.cache_control:
+            response.header("Cache-Control", self.cache_control)
+        for name, value in self.headers.items():
+            response.header(name.replace("_", "-"), value)
+        return response
+
+
+@pytest.fixture(autouse=True)
+def _default_config(monkeypatch):
+    _config(monkeypatch)
+
+
+@pytest.fixture
+def cache(monkeypatch) -> Cache:
+    manager = Cache(application=None, default_driver="fake")
+    manager.add_driver("fake", CacheFake())
+    monkeypatch.setattr(module, "Cache", manager)
+    return manager
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(module, "time", clock)
+    return clock
+
+
+def _config(monkeypatch, **values):
+    prefixed = {f"cache.response.{key}": value for key, value in values.items()}
+    monkeypatch.setattr(
+        module, "config", lambda key, default=None: prefixed.get(key, default)
+    )
+
+
+def _middleware(ttl=None, tags=None) -> CacheResponses:
+    return CacheResponses(MagicMock(), ttl, tags)
+
+
+class TestReplay:
+    @pytest.mark.asyncio
+    async def test_second_request_is_served_without_the_handler(self, cache, clock):
+        middleware, handler = _middleware("60"), _Handler()
+
+        first = await middleware.handle(_Request(), handler)
+        clock.now += 5
+        second = await middleware.handle(_Request(), handler)
+
+        assert handler.calls == 1
+        assert first.header("X-Cache") == "MISS"
+        assert second.header("X-Cache") == "HIT"
+        assert second.header("Age") == "5"
+        assert second.content == first.content
+        assert second.header("Content-Type") == first.header("Content-Type")
+
+    @pytest.mark.asyncio
+    async def test_query_order_does_not_split_the_key(self, cache, clock):
+        middleware, handler = _middleware(), _Handler()
+        await middleware.handle(_Request(query=b"page=2&sort=new"), handler)
+        await middleware.handle(_Request(query=b"sort=new&page=2"), handler)
+        assert handler.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_vary_headers_identity_and_locale_split_the_key(
+        self, cache, clock, monkeypatch
+    ):
+        _config(monkeypatch, vary=["X-Client"])
+        middleware, handler = _middleware(), _Handler()
+        requests = [
+            _Request(),
+            _Request(X_Client="ios"),
+            _Request(user=SimpleNamespace(id=7)),
+            _Request(Accept_Language="tr-TR,en;q=0.8"),
+        ]
+        for request in requests * 2:
+            await middleware.handle(request, handler)
+        assert handler.calls == len(requests)
+
+    @pytest.mark.asyncio
+    async def test_unresolved_authorization_and_non_get_bypass(self, cache, clock):
+        middleware, handler = _middleware(), _Handler()
+        for request in (_Request(Authorization="Bearer x"), _Request(method="POST")):
+            await middleware.handle(request, handler)
+            await middleware.handle(request, handler)
+        assert handler.calls == 4
+        assert cache.driver().all() == {}
+
+
+class TestHandlerCacheControl:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "handler",
+        [
+            _Handler("no-store"),
+            _Handler("private, max-age=60"),
+            _Handler("max-age=0"),
+            _Handler(Set_Cookie="session=abc"),
+            _Handler(Vary="*"),
+            _Handler(Vary="X-Tenant"),
+            _Handler(Vary="Accept, Authorization"),
+            _Handler(Vary="Accept-Language"),
+            _Handler(Vary="Accept-Encoding", Content_Encoding="gzip"),
+        ],
+    )
+    async def test_uncacheable_responses_are_not_stored(self, cache, clock, handler):
+        middleware = _middleware()
+        await middleware.handle(_Request(), handler)
+        response = await middleware.handle(_Request(), handler)
+        assert handler.calls == 2
+        assert response.header("X-Cache") is None
+
+    @pytest.mark.asyncio
+    async def test_vary_within_the_key_is_stored(self, cache, clock):
+        middleware, handler = _middleware(), _Handler(Vary="Accept, Accept-Encoding")
+        await middleware.handle(_Request(), handler)
+        await middleware.handle(_Request(), handler)
+        assert handler.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_s_maxage_overrides_the_route_ttl(self, cache, clock):
+        middleware, handler = _middleware("600"), _Handler("public, s-maxage=10")
+        await middleware.handle(_Request(), handler)
+        clock.now += 11
+        await middleware.handle(_Request(), handler)
+        assert handler.calls == 2
+
+
+class TestTags:
+    @pytest.mark.asyncio
+    async def test_purging_any_tag_turns_the_entry_into_a_miss(self, cache, clock):
+        middleware, handler = _middleware("60", "products|brands"), _Handler()
+        await middleware.handle(_Request(), handler)
+
+        assert CacheResponses.purge("brands") == 1
+        response = await middleware.handle(_Request(), handler)
+        assert (handler.calls, response.header("X-Cache")) == (2, "MISS")
+
+        cache.tags("products").flush()
+        await middleware.handle(_Request(), handler)
+        assert handler.calls == 3
+
+
+class TestStaleWhileRevalidate:
+    @pytest.mark.asyncio
+    async def test_stale_copy_is_served_while_one_refresh_runs(
+        self, cache, clock, monkeypatch
+    ):
+        _config(monkeypatch, stale_while_revalidate=30)
+        middleware, handler = _middleware("10"), _Handler()
+        await middleware.handle(_Request(), handler)
+        clock.now += 15
+
+        stale = await asyncio.gather(
+            *(middleware.handle(_Request(), handler) for _ in range(3))
+        )
+        assert {response.header("X-Cache") for response in stale} == {"STALE"}
+        assert all(b'"version": 1' in response.content for response in stale)
+
+        await asyncio.gather(*module._refreshing)
+        assert handler.calls == 2
+
+        fresh = await middleware.handle(_Request(), handler)
+        assert fresh.header("X-Cache") == "HIT"
+        assert b'"version": 2' in fresh.content
+
+    @pytest.mark.asyncio
+    async def test_the_refresh_runs_in_its_own_scope(self, cache, clock, monkeypatch):
+        _config(monkeypatch, stale_while_revalidate=30)
+        container = Container()
+        middleware, handler = CacheResponses(container, "10", None), _Handler()
+        seen = []
+
+        async def scoped_handler(request):
+            seen.append(_request_state.get())
+            return await handler(request)
+
+        await middleware.handle(_Request(), scoped_handler)
+        clock.now += 15
+        with container.scope():
+            _request_state.set("request")
+            await middleware.handle(_Request(), scoped_handler)
+            await asyncio.gather(*module._refreshing)
+
+        assert seen == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_a_personal_entry_is_rendered_inline_past_its_ttl(
+        self, cache, clock, monkeypatch
+    ):
+        _config(monkeypatch, stale_while_revalidate=30)
+        middleware, handler = _middleware("10"), _Handler()
+        user = SimpleNamespace(id=7)
+        await middleware.handle(_Request(user=user), handler)
+        clock.now += 15
+
+        response = await middleware.handle(_Request(user=user), handler)
+
+        assert not module._refreshing
+        assert (handler.calls, response.header("X-Cache")) == (2, "MISS")
+        assert b'"version": 2' in response.content
+
+    @pytest.mark.asyncio
+    async def test_past_the_stale_window_the_handler_runs(
+        self, cache, clock, monkeypatch
+    ):
+        _config(monkeypatch, stale_while_revalidate=5)
+        middleware, handler = _middleware("10"), _Handler()
+        await middleware.handle(_Request(), handler)
+        clock.now += 16
+        response = await middleware.handle(_Request(), handler)
+        assert (handler.calls, response.header("X-Cache")) == (2, "MISS")
+
+
+class TestConfiguration:
+    @pytest.mark.parametrize(
+        ("key", "value", "error"),
+        [
+            ("enabled", "yes", TypeError),
+            ("ttl", 0, ValueError),
+            ("stale_while_revalidate", -1, ValueError),
+            ("vary", "Accept", TypeError),
+            ("driver", "", TypeError),
+        ],
+    )
+    def test_invalid_configuration_is_refused(self, monkeypatch, key, value, error):
+        _config(monkeypatch, **{key: value})
+        with pytest.raises(error):
+            CacheResponses._load_config()
+
+    def test_invalid_route_ttl_is_refused(self):
+        with pytest.raises(ValueError):
+            _middleware("soon")
@@ -0,0 +1,221 @@
+"""
+CompressResponses codec pins: ``Accept-Encoding`` negotiation with quality
+weights, incremental compression of streamed bodies (flushed per event for
+SSE), worker-thread offload for large bodies, and the ratio / CPU metrics.
+"""
+
+from __future__ import annotations
+
+import importlib
+import zlib
+
+import pytest
+
+from cara.http import Request, Response
+from cara.middleware.http import CompressResponses
+from cara.observability import REGISTRY, metric_name
+
+module = importlib.import_module("cara.middleware.http.CompressResponses")
+codings = importlib.import_module("cara.middleware.http._ContentCodings")
+
+_JSON = b'{"items": [' + b'{"id": 1, "name": "widget"},' * 200 + b"{}]}"
+
+
+def _text(response: Response) -> Response:
+    return response.text(_JSON.decode())
+
+
+def _config(values: dict[str, object]):
+    return lambda key, default=None: values.get(key, default)
+
+
+@pytest.fixture(autouse=True)
+def _defaults(monkeypatch) -> None:
+    monkeypatch.setattr(module, "config", _config({}))
+
+
+def _request(accept_encoding: str | None) -> Request:
+    headers = (
+        []
+        if accept_encoding is None
+        else [(b"accept-encoding", accept_encoding.encode())]
+    )
+    return Request(None).load(
+        {"type": "http", "method": "GET", "path": "/", "headers": headers}
+    )
+
+
+async def _run(middleware: CompressResponses, accept_encoding: str | None, build):
+    async def next_fn(_request):
+        return build(Response(None))
+
+    response = await middleware.handle(_request(accept_encoding), next_fn)
+    events: list[dict] = []
+
+    async def send(event: dict) -> None:
+        events.append(event)
+
+    await response({}, None, send)
+    headers = {k.decode().lower(): v.decode() for k, v in events[0]["headers"]}
+    chunks = [event.get("body", b"") for event in events[1:]]
+    return headers, chunks
+
+
+def _gunzip(data: bytes) -> bytes:
+    return zlib.decompress(data, 31)
+
+
+class TestNegotiation:
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("gzip", "gzip"),
+            ("gzip, br, zstd", "zstd"),
+            ("gzip;q=1, br;q=0.5, zstd;q=0.1", "gzip"),
+            ("br;q=0.8, gzip;q=0.8", "br"),
+            ("gzip;q=0, *", "zstd"),
+            ("gzip;q=0", None),
+            ("identity", None),
+            ("*;q=0", None),
+            ("gzip;q=abc", None),
+            ("", None),
+        ],
+    )
+    def test_weights_then_server_preference(self, header, expected):
+        assert codings._negotiate(header, ("zstd", "br", "gzip")) == expected
+
+    def test_unavailable_codings_are_never_chosen(self):
+        assert codings._negotiate("br, gzip;q=0.5", ("gzip",)) == "gzip"
+
+    def test_codec_config_is_validated_and_filtered(self, monkeypatch):
+        monkeypatch.setattr(
+            module,
+            "config",
+            _config({"compression.compression.encodings": ["gzip", "lz4"]}),
+        )
+        with pytest.raises(ValueError):
+            CompressResponses._load_codec_config()
+
+        monkeypatch.setattr(
+            module,
+            "config",
+            _config(
+                {
+                    "compression.compression.encodings": [" GZIP "],
+                    "compression.compression.offload_size": 10,
+                }
+            ),
+        )
+        assert CompressResponses._load_codec_config() == (("gzip",), 10)
+
+
+class TestBufferedBodies:
+    @pytest.mark.asyncio
+    async def test_gzip_body_and_headers(self):
+        headers, chunks = await _run(CompressResponses(None), "gzip", _text)
+        body = b"".join(chunks)
+        assert headers["content-encoding"] == "gzip"
+        assert headers["vary"] == "Accept-Encoding"
+        assert headers["content-length"] == str(len(body))
+        assert _gunzip(body) == _JSON
+
+    @pytest.mark.asyncio
+    async def test_large_bodies_compress_in_a_worker_thread(self, monkeypatch):
+        offloaded = []
+
+        async def fake_to_thread(func, *args):
+            offloaded.append(args[0])
+            return func(*args)
+
+        monkeypatch.setattr(module.asyncio, "to_thread", fake_to_thread)
+        middleware = CompressResponses(None)
+
+        middleware._offload_size = len(_JSON) + 1
+        await _run(middleware, "gzip", _text)
+        assert offloaded == []
+
+        middleware._offload_size = len(_JSON)
+        headers, chunks = await _run(middleware, "gzip", _text)
+        assert offloaded == ["gzip"]
+        assert _gunzip(b"".join(chunks)) == _JSON
+
+    @pytest.mark.asyncio
+    async def test_zstd_when_available(self):
+        zstd = pytest.importorskip("compression.zstd")
+        headers, chunks = await _run(CompressResponses(None), "zstd, gzip", _text)
+        assert headers["content-encoding"] == "zstd"
+        assert zstd.decompress(b"".join(chunks)) == _JSON
+
+    @pytest.mark.asyncio
+    async def test_metrics_record_ratio_cpu_and_bytes(self):
+        def value(name: str, labels: dict) -> float:
+            return REGISTRY.get_sample_value(metric_name(name), labels) or 0.0
+
+        ratio_count = value("http_compression_ratio_count", {"encoding": "gzip"})
+        bytes_in = value(
+            "http_compression_bytes_total", {"encoding": "gzip", "direction": "in"}
+        )
+        await _run(CompressResponses(None), "gzip", _text)
+
+        assert (
+            value("http_compression_ratio_count", {"encoding": "gzip"}) == ratio_count + 1
+        )
+        assert value(
+            "http_compression_bytes_total", {"encoding": "gzip", "direction": "in"}
+        ) == bytes_in + len(_JSON)
+        assert (
+            REGISTRY.get_sample_value(
+                metric_name("http_compression_cpu_seconds_total"),
+                {"encoding": "gzip", "mode": "buffered"},
+            )
+            is not None
+        )
+
+
+class TestStreamingBodies:
+    @pytest.mark.asyncio
+    async def test_sse_events_are_flushed_one_by_one(self):
+        async def events():
+            for index in range(3):
+                yield {"data": f"tick {index}"}
+
+        headers, chunks = await _run(
+            CompressResponses(None), "gzip", lambda r: r.stream_sse(events())
+        )
+        assert headers["content-encoding"] == "gzip"
+        assert "content-length" not in headers
+
+        # Every event is decodable as soon as its chunk arrives.
+        decoder = zlib.decompressobj(31)
+        seen = [decoder.decompress(chunk) for chunk in chunks if chunk]
+        assert all([b"tick 0" in seen[0], b"tick 1" in seen[1], b"tick 2" in seen[2]])
+        assert decoder.flush() == b"" and decoder.eof
+
+    @pytest.mark.asyncio
+    async def test_json_lines_stream_round_trips(self):
+        rows = [{"id": index, "name": "widget"} for index in range(500)]
+
+        async def source():
+            for row in rows:
+                yield row
+
+        headers, chunks = await _run(
+            CompressResponses(None), "gzip", lambda r: r.stream_json_lines(source())
+        )
+        body = _gunzip(b"".join(chunks))
+        assert headers["content-encoding"] == "gzip"
+        assert body.count(b"\n") == len(rows)
+        assert len(b"".join(chunks)) < len(body) / 4
+
+    @pytest.mark.asyncio
+    async def test_streams_without_accepted_coding_pass_through(self):
+        async def source():
+            yield b"plain"
+
+        headers, chunks = await _run(
+            CompressResponses(None),
+            None,
+            lambda r: r.stream(source(), content_type="text/plain"),
+        )
+        assert "content-encoding" not in headers
+        assert b"".join(chunks) == b"plain"
@@ -30,6 +30,7 @@ def _make_request(method: str = "GET", if_none_match: str | None = None):
     """Request stub exposing the ``method`` property + ``header`` lookup."""
     req = MagicMock()
     req.method = method
+    req.route = None
     headers = {}
     if if_none_match is not None:
         headers["If-None-Match"] = if_none_match
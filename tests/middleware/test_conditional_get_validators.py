@@ -0,0 +1,179 @@
+"""
+ConditionalGet declared-validator pins: a validator declared on the route
+(``Route.conditional``) or the handler (``@conditional``) answers
+``If-None-Match`` / ``If-Modified-Since`` before dispatch, so a 304 never
+runs the handler; undeclared routes keep the body-hash fallback.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from cara.decorators import conditional
+from cara.http import Response
+from cara.http.CacheHeaders import apply_private_cache
+from cara.middleware.http import ConditionalGet
+from cara.routing import Route
+
+
+def _request(route: Route | None, method: str = "GET", **headers: str):
+    req = MagicMock()
+    req.method = method
+    req.route = route
+    values = {name.replace("_", "-"): value for name, value in headers.items()}
+    req.header = lambda name, default=None: values.get(name, default)
+    return req
+
+
+async def _run(request) -> tuple[Response, list[str]]:
+    calls: list[str] = []
+
+    async def next_fn(_request):
+        calls.append("handler")
+        return Response(MagicMock()).json({"items": [1, 2, 3]})
+
+    return await ConditionalGet(MagicMock()).handle(request, next_fn), calls
+
+
+async def _handler(request):
+    return None
+
+
+class TestDeclaredVersion:
+    @pytest.mark.asyncio
+    async def test_matching_etag_skips_the_handler(self):
+        route = Route.get("/products", _handler).conditional(lambda request: 7)
+
+        first, calls = await _run(_request(route))
+        etag = first.header("ETag")
+        assert calls == ["handler"] and first.status_code == 200
+        assert etag.startswith('W/"')
+
+        second, calls = await _run(_request(route, If_None_Match=etag))
+        assert calls == []
+        assert second.status_code == 304
+        assert second.header("ETag") == etag
+
+    @pytest.mark.asyncio
+    async def test_new_version_runs_the_handler(self):
+        version = {"value": 1}
+        route = Route.get("/products", _handler).conditional(
+            lambda request: version["value"]
+        )
+        first, _ = await _run(_request(route))
+        version["value"] = 2
+
+        response, calls = await _run(_request(route, If_None_Match=first.header("ETag")))
+        assert calls == ["handler"] and response.status_code == 200
+        assert response.header("ETag") != first.header("ETag")
+
+    @pytest.mark.asyncio
+    async def test_async_validator_and_handler_decorator(self):
+        @conditional(lambda request: _stamp())
+        async def index(request):
+            return None
+
+        async def _stamp() -> str:
+            return "v9"
+
+        route = Route.get("/products", index)
+        first, _ = await _run(_request(route))
+        response, calls = await _run(_request(route, If_None_Match=first.header("ETag")))
+        assert (calls, response.status_code) == ([], 304)
+
+
+class _DuckRoute:
+    """Anything exposing ``get_conditional`` is treated as a route."""
+
+    def get_conditional(self):
+        return _version
+
+
+def _version(request) -> str:
+    return "v1"
+
+
+class TestCacheHeadersOnEarly304:
+    @staticmethod
+    async def _run_cached(request) -> tuple[Response, list[str]]:
+        calls: list[str] = []
+
+        async def next_fn(_request):
+            calls.append("handler")
+            response = apply_private_cache(Response(MagicMock()).json({"n": 1}), 60)
+            return response.header("Expires", "Fri, 02 Jan 2026 03:05:05 GMT")
+
+        return await ConditionalGet(MagicMock()).handle(request, next_fn), calls
+
+    @pytest.mark.asyncio
+    async def test_early_304_repeats_the_200s_cache_headers(self):
+        route = Route.get("/me", _handler).conditional(lambda request: "v1")
+        first, _ = await self._run_cached(_request(route))
+
+        response, calls = await self._run_cached(
+            _request(route, If_None_Match=first.header("ETag"))
+        )
+        assert (calls, response.status_code) == ([], 304)
+        for name in ("Cache-Control", "Vary", "Expires"):
+            assert response.header(name) == first.header(name)
+
+    @pytest.mark.asyncio
+    async def test_a_tag_not_yet_served_dispatches_and_then_answers_304(self):
+        route = _DuckRoute()
+        etag = ConditionalGet._compute_weak_etag(b"v1")
+
+        response, calls = await self._run_cached(_request(route, If_None_Match=etag))
+        assert (calls, response.status_code) == (["handler"], 304)
+        assert response.header("Cache-Control") == "private, max-age=60"
+
+        response, calls = await self._run_cached(_request(route, If_None_Match=etag))
+        assert (calls, response.status_code) == ([], 304)
+        assert response.header("Vary") == "Authorization, Accept-Encoding"
+
+
+class TestDeclaredTimestamp:
+    @pytest.mark.asyncio
+    async def test_if_modified_since_is_answered_before_dispatch(self):
+        updated_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+        route = Route.get("/products", _handler).conditional(lambda request: updated_at)
+
+        first, _ = await _run(_request(route))
+        assert first.header("Last-Modified") == "Fri, 02 Jan 2026 03:04:05 GMT"
+
+        response, calls = await _run(
+            _request(route, If_Modified_Since="Fri, 02 Jan 2026 03:04:05 GMT")
+        )
+        assert (calls, response.status_code) == ([], 304)
+
+        response, calls = await _run(
+            _request(route, If_Modified_Since="Thu, 01 Jan 2026 00:00:00 GMT")
+        )
+        assert (calls, response.status_code) == (["handler"], 200)
+
+
+class TestFallback:
+    @pytest.mark.asyncio
+    async def test_failing_or_empty_validator_falls_back_to_body_hash(self):
+        def broken(request):
+            raise RuntimeError("cache down")
+
+        for validator in (broken, lambda request: None):
+            route = Route.get("/products", _handler).conditional(validator)
+            response, calls = await _run(_request(route))
+            assert calls == ["handler"]
+            assert response.header("ETag") == ConditionalGet._compute_weak_etag(
+                response.content
+            )
+
+    @pytest.mark.asyncio
+    async def test_unsafe_methods_never_consult_the_validator(self):
+        consulted: list[int] = []
+        route = Route.post("/products", _handler).conditional(
+            lambda request: consulted.append(1) or 1
+        )
+        response, calls = await _run(_request(route, method="POST", If_None_Match="*"))
+        assert consulted == [] and calls == ["handler"]
+        assert response.status_code == 200
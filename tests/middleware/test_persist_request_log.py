@@ -1,6 +1,6 @@
 """Behaviour pins for the durable request-log middleware.
 
-The middleware owns policy only — skip rules, the fire-and-forget write, the
+The middleware owns policy only — skip rules, the buffered batch write, the
 missing-relation kill switch, the sampled retention sweep and the row shape.
 Storage lives behind the ``RequestLogStore`` port, so every test here drives a
 stub store instead of a database.
@@ -15,12 +15,15 @@ from unittest.mock import MagicMock, Mock
 
 import pytest
 
-from cara.middleware.http import PersistRequestLog, RequestLogStore
+from cara.middleware.http import PersistRequestLog, RequestLogStore, RequestLogWriter
 from cara.middleware.http import PersistRequestLog as _module_probe
 
 middleware_module = __import__(
     "cara.middleware.http.PersistRequestLog", fromlist=["PersistRequestLog"]
 )
+writer_module = __import__(
+    "cara.middleware.http.RequestLogWriter", fromlist=["RequestLogWriter"]
+)
 
 assert _module_probe is middleware_module.PersistRequestLog
 
@@ -29,31 +32,38 @@ assert _module_probe is middleware_module.PersistRequestLog
 
 
 class _Store(RequestLogStore):
-    def __init__(self) -> None:
+    def __init__(self, insert=None, prune=None) -> None:
         self.rows: list[dict] = []
+        self.batches: list[int] = []
         self.pruned: list[int] = []
+        self._insert = insert
+        self._prune = prune
 
     def insert(self, payload: dict) -> None:
+        if self._insert is not None:
+            self._insert(payload)
         self.rows.append(payload)
 
+    def insert_many(self, payloads: list[dict]) -> None:
+        self.batches.append(len(payloads))
+        super().insert_many(payloads)
+
     def prune_old(self, retention_days: int) -> None:
+        if self._prune is not None:
+            self._prune(retention_days)
         self.pruned.append(retention_days)
 
 
 def _application(store: RequestLogStore | None = None) -> MagicMock:
     app = MagicMock()
     app.make.return_value = store if store is not None else _Store()
+    app._shutdown_callbacks = []
     return app
 
 
-def _subject(insert=None, prune=None) -> PersistRequestLog:
-    """Bare instance with only the store wired — no container involved."""
-    middleware = object.__new__(PersistRequestLog)
-    middleware._request_logs = SimpleNamespace(
-        insert=insert or (lambda _payload: None),
-        prune_old=prune or (lambda _days: None),
-    )
-    return middleware
+def _subject(store: _Store | None = None, cls=PersistRequestLog) -> PersistRequestLog:
+    """Middleware on a fresh application; configure ``config`` first."""
+    return cls(_application(store or _Store()))
 
 
 def _request(path: str = "/api/products", method: str = "GET") -> SimpleNamespace:
@@ -68,49 +78,24 @@ def _stub_config(monkeypatch, values: dict) -> None:
     )
 
 
-class _SettledTask:
-    """Stand-in for a task that finished the moment it was scheduled.
-
-    ``_spawn`` registers the strong reference *before* attaching callbacks,
-    so running each callback on registration exercises the real bookkeeping
-    (add, then discard) without needing a live event loop.
-    """
-
-    def add_done_callback(self, callback) -> None:
-        callback(self)
-
-    @staticmethod
-    def cancelled() -> bool:
-        return False
+async def _rows(subject: PersistRequestLog) -> list[dict]:
+    await subject._writer.flush()
+    return subject._request_logs.rows
 
-    @staticmethod
-    def exception():
-        return None
 
-
-def _capture_dispatch(monkeypatch) -> list[tuple]:
-    """Intercept the fire-and-forget hop and record (callable, *args)."""
-    calls: list[tuple] = []
-
-    class _Context:
-        @staticmethod
-        def run_in_thread(fn, *args):
-            calls.append((fn, *args))
-            return None
-
-    monkeypatch.setattr(middleware_module, "ExecutionContext", _Context)
-    monkeypatch.setattr(
-        middleware_module,
-        "asyncio",
-        SimpleNamespace(create_task=lambda _coro: _SettledTask()),
-    )
-    return calls
+@pytest.fixture(autouse=True)
+def _reset_switches():
+    PersistRequestLog._table_missing = False
+    PersistRequestLog._request_counter = 0
+    yield
+    PersistRequestLog._table_missing = False
 
 
 # ── Container wiring ─────────────────────────────────────────────────
 
 
-def test_store_is_resolved_from_the_container_at_construction():
+def test_store_is_resolved_from_the_container_at_construction(monkeypatch):
+    _stub_config(monkeypatch, {})
     store = _Store()
     app = _application(store)
     middleware = PersistRequestLog(app)
@@ -132,6 +117,26 @@ def test_unbound_store_fails_loudly_at_construction():
     assert isinstance(excinfo.value.__cause__, RuntimeError)
 
 
+def test_one_writer_per_application_drained_on_shutdown(monkeypatch):
+    _stub_config(monkeypatch, {"logging.http_request_log_batch_size": 25})
+    app = _application()
+
+    first, second = PersistRequestLog(app), PersistRequestLog(app)
+
+    assert first._writer is second._writer
+    assert first._writer.batch_size == 25
+    assert app._shutdown_callbacks == [first._writer.close]
+
+
+def test_configuration_is_snapshotted_at_construction(monkeypatch):
+    values = {"logging.persist_http_requests": True}
+    _stub_config(monkeypatch, values)
+    subject = _subject()
+    values["logging.persist_http_requests"] = False
+
+    assert subject._enabled is True
+
+
 # ── Skip rules and kill switch ───────────────────────────────────────
 
 
@@ -159,24 +164,22 @@ def test_non_iterable_skip_prefix_config_falls_back_to_the_default(monkeypatch):
 @pytest.mark.asyncio
 async def test_skipped_path_writes_no_row(monkeypatch):
     _stub_config(monkeypatch, {})
-    calls = _capture_dispatch(monkeypatch)
     subject = _subject()
 
     response = await subject.handle(_request("/health/live"), lambda _req: _respond(200))
 
     assert response.get_status_code() == 200
-    assert calls == []
+    assert await _rows(subject) == []
 
 
 @pytest.mark.asyncio
 async def test_kill_switch_config_disables_the_write(monkeypatch):
     _stub_config(monkeypatch, {"logging.persist_http_requests": False})
-    calls = _capture_dispatch(monkeypatch)
     subject = _subject()
 
     await subject.handle(_request(), lambda _req: _respond(200))
 
-    assert calls == []
+    assert await _rows(subject) == []
 
 
 # ── Row shape ────────────────────────────────────────────────────────
@@ -189,12 +192,11 @@ async def _respond(status: int, content: bytes = b"hello"):
 @pytest.mark.asyncio
 async def test_successful_request_persists_the_canonical_row(monkeypatch):
     _stub_config(monkeypatch, {})
-    calls = _capture_dispatch(monkeypatch)
     subject = _subject()
 
     await subject.handle(_request("/api/products"), lambda _req: _respond(201))
 
-    (_fn, payload) = calls[0]
+    (payload,) = await _rows(subject)
     assert payload["method"] == "GET"
     assert payload["path"] == "/api/products"
     assert payload["status_code"] == 201
@@ -208,7 +210,6 @@ async def test_response_bytes_read_from_content_not_body(monkeypatch):
     """``BaseResponse`` stores the payload on ``content``; reading ``body``
     leaves the column permanently NULL."""
     _stub_config(monkeypatch, {})
-    calls = _capture_dispatch(monkeypatch)
     subject = _subject()
 
     async def _weird(_req):
@@ -218,32 +219,27 @@ async def test_response_bytes_read_from_content_not_body(monkeypatch):
 
     await subject.handle(_request(), _weird)
 
-    assert calls[0][1]["response_bytes"] == 10
+    assert (await _rows(subject))[0]["response_bytes"] == 10
 
 
 @pytest.mark.asyncio
 async def test_extra_columns_hook_is_merged_onto_the_row(monkeypatch):
     _stub_config(monkeypatch, {})
-    calls = _capture_dispatch(monkeypatch)
 
     class _Stamped(PersistRequestLog):
         def extra_columns(self, request):
             return {"workspace_id": 42}
 
-    subject = object.__new__(_Stamped)
-    subject._request_logs = SimpleNamespace(
-        insert=lambda _p: None, prune_old=lambda _d: None
-    )
+    subject = _subject(cls=_Stamped)
 
     await subject.handle(_request(), lambda _req: _respond(200))
 
-    assert calls[0][1]["workspace_id"] == 42
+    assert (await _rows(subject))[0]["workspace_id"] == 42
 
 
 @pytest.mark.asyncio
 async def test_exception_path_records_the_exception_status_and_reraises(monkeypatch):
     _stub_config(monkeypatch, {})
-    calls = _capture_dispatch(monkeypatch)
     subject = _subject()
 
     class _Boom(Exception):
@@ -255,7 +251,7 @@ async def test_exception_path_records_the_exception_status_and_reraises(monkeypa
     with pytest.raises(_Boom):
         await subject.handle(_request(), _raise)
 
-    payload = calls[0][1]
+    (payload,) = await _rows(subject)
     assert payload["status_code"] == 422
     assert payload["response_bytes"] is None
 
@@ -278,61 +274,64 @@ def test_client_ip_survives_a_raising_accessor(monkeypatch):
 # ── Missing-relation kill switch ─────────────────────────────────────
 
 
-def test_missing_relation_trips_the_kill_switch_once(monkeypatch):
-    PersistRequestLog._table_missing = False
+def _silence_log(monkeypatch) -> Mock:
     warning = Mock()
     monkeypatch.setattr(
         middleware_module, "Log", SimpleNamespace(warning=warning, debug=Mock())
     )
+    return warning
+
+
+@pytest.mark.asyncio
+async def test_missing_relation_trips_the_kill_switch_once(monkeypatch):
+    _stub_config(monkeypatch, {})
+    warning = _silence_log(monkeypatch)
     subject = _subject(
-        insert=Mock(
-            side_effect=RuntimeError('relation "http_request_log" does not exist')
+        _Store(
+            insert=Mock(
+                side_effect=RuntimeError('relation "http_request_log" does not exist')
+            )
         )
     )
 
-    subject._insert({})
+    await subject.handle(_request(), lambda _req: _respond(200))
+    await subject._writer.flush()
+    await subject.handle(_request(), lambda _req: _respond(200))
 
     assert PersistRequestLog._table_missing is True
+    assert warning.call_count == 1
     assert "relation is missing" in warning.call_args.args[0]
-    PersistRequestLog._table_missing = False
+    assert subject._writer.backlog == 0
 
 
 def test_missing_column_does_not_trip_the_kill_switch(monkeypatch):
     """Schema drift must stay loud — only an absent relation disables logging."""
-    PersistRequestLog._table_missing = False
-    warning = Mock()
-    monkeypatch.setattr(
-        middleware_module, "Log", SimpleNamespace(warning=warning, debug=Mock())
-    )
-    subject = _subject(
-        insert=Mock(
-            side_effect=RuntimeError(
-                'column "workspace_id" of relation "http_request_log" does not exist'
-            )
-        )
-    )
+    _stub_config(monkeypatch, {})
+    warning = _silence_log(monkeypatch)
+    subject = _subject()
 
-    subject._insert({})
+    subject._write_failed(
+        "insert",
+        RuntimeError(
+            'column "workspace_id" of relation "http_request_log" does not exist'
+        ),
+    )
 
     assert PersistRequestLog._table_missing is False
     assert "insert failed" in warning.call_args.args[0]
 
 
 def test_sqlstate_42p01_trips_the_switch_through_the_cause_chain(monkeypatch):
-    PersistRequestLog._table_missing = False
-    monkeypatch.setattr(
-        middleware_module, "Log", SimpleNamespace(warning=Mock(), debug=Mock())
-    )
+    _stub_config(monkeypatch, {})
+    _silence_log(monkeypatch)
     driver_error = RuntimeError("undefined table")
     driver_error.sqlstate = "42P01"
     wrapper = RuntimeError("ORM wrapper")
     wrapper.__cause__ = driver_error
 
-    subject = _subject(insert=Mock(side_effect=wrapper))
-    subject._insert({})
+    _subject()._write_failed("insert", wrapper)
 
     assert PersistRequestLog._table_missing is True
-    PersistRequestLog._table_missing = False
 
 
 # ── Retention sweep ──────────────────────────────────────────────────
@@ -356,123 +355,159 @@ def test_cleanup_cadence_defaults_to_one_thousand(monkeypatch):
     assert PersistRequestLog._cleanup_cadence() == 1000
 
 
-def test_cleanup_fires_every_nth_request():
-    PersistRequestLog._request_counter = 0
+def test_malformed_numeric_config_falls_back_to_the_default(monkeypatch):
+    _stub_config(monkeypatch, {"logging.http_request_log_cleanup_every": "often"})
 
+    assert PersistRequestLog._cleanup_cadence() == 1000
+
+
+def test_cleanup_fires_every_nth_request():
     fired = [PersistRequestLog._should_run_cleanup(cleanup_every=3) for _ in range(6)]
 
     assert fired == [False, False, True, False, False, True]
 
 
 def test_cleanup_disabled_when_cadence_non_positive():
-    PersistRequestLog._request_counter = 0
-
     assert PersistRequestLog._should_run_cleanup(cleanup_every=0) is False
     assert PersistRequestLog._should_run_cleanup(cleanup_every=-1) is False
 
 
-def test_cleanup_delegates_the_retention_window_to_the_store(monkeypatch):
-    monkeypatch.setattr(
-        middleware_module, "Log", SimpleNamespace(warning=Mock(), debug=Mock())
+@pytest.mark.asyncio
+async def test_cleanup_delegates_the_retention_window_to_the_store(monkeypatch):
+    _stub_config(
+        monkeypatch,
+        {
+            "logging.http_request_log_retention_days": 90,
+            "logging.http_request_log_cleanup_every": 2,
+        },
     )
-    pruned: list[int] = []
-    subject = _subject(prune=pruned.append)
+    subject = _subject()
 
-    subject._cleanup_old_rows(90)
+    for _ in range(2):
+        await subject.handle(_request(), lambda _req: _respond(200))
+    await subject._writer.flush()
 
-    assert pruned == [90]
+    assert subject._request_logs.pruned == [90]
 
 
-def test_cleanup_failure_is_warned_not_raised(monkeypatch):
-    warning = Mock()
-    monkeypatch.setattr(
-        middleware_module, "Log", SimpleNamespace(warning=warning, debug=Mock())
-    )
-    subject = _subject(prune=Mock(side_effect=RuntimeError("locked")))
+@pytest.mark.asyncio
+async def test_cleanup_failure_is_warned_not_raised(monkeypatch):
+    _stub_config(monkeypatch, {"logging.http_request_log_cleanup_every": 1})
+    warning = _silence_log(monkeypatch)
+    subject = _subject(_Store(prune=Mock(side_effect=RuntimeError("locked"))))
 
-    subject._cleanup_old_rows(30)
+    await subject.handle(_request(), lambda _req: _respond(200))
+    await subject._writer.flush()
 
     assert "cleanup failed" in warning.call_args.args[0]
+    assert len(subject._request_logs.rows) == 1
 
 
-# ── Fire-and-forget task ownership ───────────────────────────────────
+# ── Buffered writer ──────────────────────────────────────────────────
 
 
-def _thread_hop(monkeypatch, body):
-    """Replace the thread hop with ``body``, keeping real ``asyncio``."""
+@pytest.mark.asyncio
+async def test_rows_are_written_in_batches_not_per_request():
+    store = _Store()
+    writer = RequestLogWriter(store, batch_size=3, flush_interval=60)
 
-    class _Context:
-        @staticmethod
-        async def run_in_thread(fn, *args):
-            return await body(fn, *args)
+    for i in range(7):
+        writer.append({"n": i})
+    await writer.flush()
 
-    monkeypatch.setattr(middleware_module, "ExecutionContext", _Context)
+    assert store.batches == [3, 3, 1]
+    assert [row["n"] for row in store.rows] == list(range(7))
 
 
 @pytest.mark.asyncio
-async def test_pending_write_is_strongly_referenced_until_it_completes(monkeypatch):
-    """``asyncio`` tracks tasks weakly.
+async def test_a_partial_batch_is_written_once_it_ages_out():
+    store = _Store()
+    writer = RequestLogWriter(store, batch_size=100, flush_interval=0.01)
 
-    A write whose only referent was a local in ``_persist`` can be collected
-    before it runs, and the row is lost with no error anywhere — so the
-    middleware holds the task itself and releases it on completion.
-    """
-    _stub_config(monkeypatch, {})
-    PersistRequestLog._table_missing = False
-    PersistRequestLog._request_counter = 0
-    PersistRequestLog._inflight_tasks.clear()
+    writer.append({"n": 1})
+    assert store.rows == []
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if store.rows:
+            break
 
+    assert store.batches == [1]
+
+
+@pytest.mark.asyncio
+async def test_full_backlog_drops_new_rows():
     gate = asyncio.Event()
+    store = _Store()
+    writer = RequestLogWriter(store, batch_size=2, flush_interval=60, max_backlog=3)
 
     async def _blocked(fn, *args):
         await gate.wait()
         return fn(*args)
 
-    _thread_hop(monkeypatch, _blocked)
+    original = writer_module.ExecutionContext
+    writer_module.ExecutionContext = SimpleNamespace(run_in_thread=_blocked)
+    try:
+        accepted = [writer.append({"n": i}) for i in range(5)]
+        await asyncio.sleep(0)
+        assert writer.backlog == 3
+        gate.set()
+        await writer.flush()
+    finally:
+        writer_module.ExecutionContext = original
+
+    assert accepted == [True, True, True, False, False]
+    assert len(store.rows) == 3
 
-    rows: list[dict] = []
-    subject = _subject(insert=rows.append)
 
-    await subject.handle(_request(), lambda _req: _respond(200))
+@pytest.mark.asyncio
+async def test_pending_batch_is_strongly_referenced_until_it_completes(monkeypatch):
+    """``asyncio`` tracks tasks weakly.
+
+    A write whose only referent was a local could be collected before it
+    runs, and the rows would be lost with no error anywhere — so the writer
+    holds the task itself until it finishes.
+    """
+    gate = asyncio.Event()
 
-    assert len(PersistRequestLog._inflight_tasks) == 1
-    task = next(iter(PersistRequestLog._inflight_tasks))
+    async def _blocked(fn, *args):
+        await gate.wait()
+        return fn(*args)
 
-    # The handler has returned; the local that held the task is gone. Only
-    # the middleware's own reference stands between this write and the GC.
+    monkeypatch.setattr(
+        writer_module, "ExecutionContext", SimpleNamespace(run_in_thread=_blocked)
+    )
+    store = _Store()
+    writer = RequestLogWriter(store, batch_size=1, flush_interval=60)
+
+    writer.append({"path": "/api/products"})
     gc.collect()
-    assert not task.done()
+    await asyncio.sleep(0)
+    assert store.rows == [] and not writer._drain.done()
 
     gate.set()
-    await task
+    await writer.close()
 
-    assert rows and rows[0]["path"] == "/api/products"
-    assert PersistRequestLog._inflight_tasks == set()
+    assert store.rows == [{"path": "/api/products"}]
 
 
 @pytest.mark.asyncio
 async def test_undispatchable_write_is_reported_not_swallowed(monkeypatch):
-    """Nobody awaits these tasks, so a failure before ``_insert``'s own
-    handler would otherwise surface only as asyncio GC noise."""
-    warning = Mock()
-    monkeypatch.setattr(
-        middleware_module, "Log", SimpleNamespace(warning=warning, debug=Mock())
-    )
+    """Nobody awaits the drain, so a failure before the store is reached
+    would otherwise surface only as asyncio GC noise."""
     _stub_config(monkeypatch, {})
-    PersistRequestLog._table_missing = False
-    PersistRequestLog._request_counter = 0
-    PersistRequestLog._inflight_tasks.clear()
+    warning = _silence_log(monkeypatch)
 
     async def _explode(_fn, *_args):
         raise RuntimeError("thread pool exhausted")
 
-    _thread_hop(monkeypatch, _explode)
+    monkeypatch.setattr(
+        writer_module, "ExecutionContext", SimpleNamespace(run_in_thread=_explode)
+    )
+    subject = _subject()
 
-    await _subject().handle(_request(), lambda _req: _respond(200))
-    for _ in range(4):
-        await asyncio.sleep(0)
+    await subject.handle(_request(), lambda _req: _respond(200))
+    await subject._writer.flush()
 
-    assert warning.called
     assert "could not be dispatched" in warning.call_args.args[0]
     assert warning.call_args.kwargs["category"] == PersistRequestLog.LOG_CATEGORY
-    assert PersistRequestLog._inflight_tasks == set()
+    assert subject._writer.backlog == 0
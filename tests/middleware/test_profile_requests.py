@@ -0,0 +1,155 @@
+"""
+ProfileRequests pins: only a request carrying a valid signed (path-scoped,
+unexpired) or allowlisted token is profiled; its collapsed stacks and
+summary — with the SQL it ran — are stored under the id returned in
+``X-Profile-Id``; work other tasks do on the same loop never lands in the
+profile; everything else passes through untouched.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from cara.eloquent import BaseConnection
+from cara.http import Response
+
+module = importlib.import_module("cara.middleware.http.ProfileRequests")
+signed_token_module = importlib.import_module("cara.security.SignedToken")
+ProfileRequests = module.ProfileRequests
+
+_STATIC_TOKEN = "s" * 40
+
+
+class _Storage:
+    def __init__(self):
+        self.files: dict[str, bytes] = {}
+
+    def put(self, key, data, driver_name=None):
+        self.files[key] = data
+
+
+class _Request:
+    def __init__(self, path="/api/products", **headers):
+        self.method = "GET"
+        self.path = path
+        self._headers = {name.replace("_", "-").lower(): v for name, v in headers.items()}
+
+    def header(self, name, default=None):
+        return self._headers.get(name.lower(), default)
+
+
+class _Cursor:
+    def execute(self, query, bindings):
+        pass
+
+
+def _busy_profiled_handler(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _neighbour_work(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _handler(request):
+    await asyncio.sleep(0)
+    _busy_profiled_handler(0.05)
+    connection = BaseConnection()
+    connection._cursor = _Cursor()
+    connection.full_details = {}
+    connection.statement("SELECT *\n  FROM products WHERE id = %s", (7,))
+    return Response(None).json({"ok": True})
+
+
+@pytest.fixture(autouse=True)
+def _config(monkeypatch):
+    values = {"app.key": "k" * 32, "server.profiling.tokens": [_STATIC_TOKEN]}
+    lookup = lambda key, default=None: values.get(key, default)  # noqa: E731
+    monkeypatch.setattr(module, "config", lookup)
+    monkeypatch.setattr(signed_token_module, "config", lookup)
+
+
+@pytest.fixture
+def storage() -> _Storage:
+    return _Storage()
+
+
+def _middleware(storage: _Storage) -> ProfileRequests:
+    return ProfileRequests(SimpleNamespace(make=lambda name: storage))
+
+
+def _profile(storage: _Storage, response) -> tuple[str, dict]:
+    profile_id = response.header("X-Profile-Id")
+    folded = storage.files[f"profiles/{profile_id}.folded"].decode()
+    return folded, json.loads(storage.files[f"profiles/{profile_id}.json"])
+
+
+@pytest.mark.asyncio
+async def test_signed_token_profiles_the_request(storage):
+    token = ProfileRequests.issue(ttl=60, path="/api")
+    response = await _middleware(storage).handle(_Request(x_profile=token), _handler)
+
+    folded, summary = _profile(storage, response)
+    assert "_busy_profiled_handler" in folded
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded.splitlines())
+    assert summary["path"] == "/api/products"
+    assert summary["samples"] > 0
+    assert summary["queries"][0]["sql"] == "SELECT * FROM products WHERE id = %s"
+
+
+@pytest.mark.asyncio
+async def test_static_token_profiles_the_request(storage):
+    response = await _middleware(storage).handle(
+        _Request(x_profile=_STATIC_TOKEN), _handler
+    )
+    assert response.header("X-Profile-Id") is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "token",
+    [
+        None,
+        "not-a-token",
+        "t" * 40,
+        lambda: ProfileRequests.issue(ttl=60, path="/admin"),
+        lambda: ProfileRequests.issue(ttl=60, path="/api/prod"),  # not a segment
+        lambda: ProfileRequests.issue(ttl=3600),  # longer than max_ttl
+    ],
+)
+async def test_other_requests_pass_through(storage, token):
+    headers = (
+        {} if token is None else {"x_profile": token() if callable(token) else token}
+    )
+    response = await _middleware(storage).handle(_Request(**headers), _handler)
+    assert response.header("X-Profile-Id") is None
+    assert storage.files == {}
+
+
+@pytest.mark.asyncio
+async def test_other_tasks_on_the_loop_are_not_profiled(storage):
+    async def waiting_handler(request):
+        await asyncio.sleep(0.1)
+        return Response(None).json({"ok": True})
+
+    async def neighbour():
+        await asyncio.sleep(0.01)
+        _neighbour_work(0.05)
+
+    token = ProfileRequests.issue(ttl=60)
+    response, _ = await asyncio.gather(
+        _middleware(storage).handle(_Request(x_profile=token), waiting_handler),
+        neighbour(),
+    )
+    folded, _summary = _profile(storage, response)
+    assert "_neighbour_work" not in folded
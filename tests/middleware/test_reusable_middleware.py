@@ -0,0 +1,104 @@
+"""
+Reusable-middleware pins: a middleware that declares ``reusable = True`` is
+built once per application and shared by every pipeline run; anything else
+(including reusable middleware that overrides ``terminate``) still gets a
+fresh instance per run. Parameterized aliases resolve to one cached class
+per ``(middleware, parameters)``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from cara.middleware import Middleware
+from cara.middleware.MiddlewareCapsule import MiddlewareCapsule
+from cara.support import Pipeline
+
+
+class _App:
+    """Weak-referenceable stand-in for the application."""
+
+
+class _Stateless(Middleware):
+    reusable = True
+
+    async def handle(self, request: Any, next_fn: Any) -> Any:
+        return await next_fn(request)
+
+
+class _PerRequest(Middleware):
+    async def handle(self, request: Any, next_fn: Any) -> Any:
+        return await next_fn(request)
+
+
+class _ReusableWithTerminate(_Stateless):
+    async def terminate(self, request: Any, response: Any) -> None:
+        return None
+
+
+class _Limit(Middleware):
+    reusable = True
+
+    def __init__(self, application: Any, limit=None) -> None:
+        super().__init__(application)
+        self.limit = limit
+
+    async def handle(self, request: Any, next_fn: Any) -> Any:
+        return await next_fn(request)
+
+
+def _run(app: Any, pipes: list) -> list[Any]:
+    pipeline = Pipeline({}, application=app)
+
+    async def destination(payload: Any) -> Any:
+        return payload
+
+    asyncio.run(pipeline.through(pipes)(destination))
+    return pipeline.executed_instances
+
+
+class TestInstanceReuse:
+    def test_reusable_middleware_is_shared_across_runs(self):
+        app = _App()
+        (first,) = _run(app, [_Stateless])
+        (second,) = _run(app, [_Stateless])
+        assert first is second
+
+    def test_shared_instances_are_per_application(self):
+        (first,) = _run(_App(), [_Stateless])
+        (second,) = _run(_App(), [_Stateless])
+        assert first is not second
+
+    def test_plain_middleware_is_built_per_run(self):
+        app = _App()
+        (first,) = _run(app, [_PerRequest])
+        (second,) = _run(app, [_PerRequest])
+        assert first is not second
+
+    def test_terminate_state_forces_a_per_request_instance(self):
+        assert _Stateless.is_reusable()
+        assert not _ReusableWithTerminate.is_reusable()
+        app = _App()
+        (first,) = _run(app, [_ReusableWithTerminate])
+        (second,) = _run(app, [_ReusableWithTerminate])
+        assert first is not second
+
+
+class TestParameterizedClassCache:
+    def test_same_parameters_resolve_to_one_class(self):
+        capsule = MiddlewareCapsule(None)
+        capsule.add_alias("limit", _Limit)
+        first = capsule.resolve_middleware("limit:60")
+        assert capsule.resolve_middleware("limit:60") is first
+        assert capsule.resolve_middleware("limit:30") is not first
+
+    def test_reusable_parameterized_middleware_shares_its_instance(self):
+        capsule = MiddlewareCapsule(None)
+        capsule.add_alias("limit", _Limit)
+        wrapper = capsule.resolve_middleware("limit:60")
+        app = _App()
+        (first,) = _run(app, [wrapper])
+        (second,) = _run(app, [wrapper])
+        assert first is second
+        assert first.limit == "60"
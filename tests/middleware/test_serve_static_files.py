@@ -0,0 +1,198 @@
+"""
+ServeStaticFiles pins: stat-derived validators and 304s, single and
+multi-range requests, precompressed siblings, chunked / pathsend bodies,
+and the lookup LRU that spares hot assets (and application routes) their
+per-request syscalls.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+
+import pytest
+
+from cara.http import Request, Response, StaticFile
+from cara.middleware.http import ServeStaticFiles
+
+static_module = importlib.import_module("cara.middleware.http.ServeStaticFiles")
+static_file_module = importlib.import_module("cara.http.response.StaticFile")
+
+_BODY = bytes(range(256)) * 4  # 1 KiB
+
+
+@pytest.fixture
+def public(tmp_path, monkeypatch):
+    (tmp_path / "app.js").write_bytes(_BODY)
+    monkeypatch.setattr(static_module, "public_path", lambda: str(tmp_path))
+    ServeStaticFiles.clear_cache()
+    yield tmp_path
+    ServeStaticFiles.clear_cache()
+
+
+def _request(path: str, method: str = "GET", **headers: str) -> Request:
+    raw = [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()]
+    return Request(None).load(
+        {"type": "http", "method": method, "path": path, "headers": raw}
+    )
+
+
+async def _serve(request: Request, scope: dict | None = None):
+    async def next_fn(_request):
+        return Response(None).json({"routed": True})
+
+    response = await ServeStaticFiles(None).handle(request, next_fn)
+    events: list[dict] = []
+
+    async def send(event: dict) -> None:
+        events.append(event)
+
+    await response(scope if scope is not None else {}, None, send)
+    start = events[0]
+    headers = {k.decode().lower(): v.decode() for k, v in start["headers"]}
+    body = b"".join(event.get("body", b"") for event in events[1:])
+    return start["status"], headers, body, events
+
+
+class TestValidators:
+    @pytest.mark.asyncio
+    async def test_full_response_carries_stat_validators(self, public):
+        status, headers, body, _ = await _serve(_request("/app.js"))
+        assert status == 200
+        assert body == _BODY
+        assert headers["content-length"] == str(len(_BODY))
+        assert headers["etag"].startswith('"')
+        assert "last-modified" in headers
+        assert headers["content-type"] in ("text/javascript", "application/javascript")
+
+    @pytest.mark.asyncio
+    async def test_if_none_match_and_if_modified_since_yield_304(self, public):
+        _, headers, _, _ = await _serve(_request("/app.js"))
+        status, _, body, _ = await _serve(
+            _request("/app.js", If_None_Match=headers["etag"])
+        )
+        assert (status, body) == (304, b"")
+        status, _, _, _ = await _serve(
+            _request("/app.js", If_Modified_Since=headers["last-modified"])
+        )
+        assert status == 304
+
+    @pytest.mark.asyncio
+    async def test_non_files_fall_through_to_the_router(self, public):
+        status, _, body, _ = await _serve(_request("/api/users"))
+        assert status == 200 and b"routed" in body
+
+
+class TestRanges:
+    @pytest.mark.asyncio
+    async def test_single_range(self, public):
+        status, headers, body, _ = await _serve(_request("/app.js", Range="bytes=10-19"))
+        assert status == 206
+        assert body == _BODY[10:20]
+        assert headers["content-range"] == f"bytes 10-19/{len(_BODY)}"
+        assert headers["content-length"] == "10"
+
+    @pytest.mark.asyncio
+    async def test_suffix_and_open_ranges(self, public):
+        _, _, body, _ = await _serve(_request("/app.js", Range="bytes=-5"))
+        assert body == _BODY[-5:]
+        _, _, body, _ = await _serve(_request("/app.js", Range="bytes=1020-"))
+        assert body == _BODY[1020:]
+
+    @pytest.mark.asyncio
+    async def test_multi_range_is_multipart_byteranges(self, public):
+        status, headers, body, _ = await _serve(
+            _request("/app.js", Range="bytes=0-3,100-103")
+        )
+        assert status == 206
+        boundary = headers["content-type"].split("boundary=")[1]
+        assert len(body) == int(headers["content-length"])
+        assert body.endswith(f"--{boundary}--\r\n".encode())
+        assert _BODY[0:4] in body and _BODY[100:104] in body
+        assert b"Content-Range: bytes 100-103/1024" in body
+
+    @pytest.mark.asyncio
+    async def test_unsatisfiable_range_is_416(self, public):
+        status, headers, _, _ = await _serve(_request("/app.js", Range="bytes=5000-"))
+        assert status == 416
+        assert headers["content-range"] == "bytes */1024"
+
+    @pytest.mark.asyncio
+    async def test_stale_if_range_sends_the_whole_file(self, public):
+        status, _, body, _ = await _serve(
+            _request("/app.js", Range="bytes=0-3", If_Range='"stale"')
+        )
+        assert (status, body) == (200, _BODY)
+
+
+class TestPrecompressed:
+    @pytest.mark.asyncio
+    async def test_br_sibling_is_preferred_when_accepted(self, public):
+        (public / "app.js.br").write_bytes(b"brotli-bytes")
+        (public / "app.js.gz").write_bytes(b"gzip-bytes")
+
+        _, headers, body, _ = await _serve(
+            _request("/app.js", Accept_Encoding="gzip, br")
+        )
+        assert (headers["content-encoding"], body) == ("br", b"brotli-bytes")
+        assert headers["vary"] == "Accept-Encoding"
+
+        _, headers, body, _ = await _serve(
+            _request("/app.js", Accept_Encoding="gzip, br;q=0")
+        )
+        assert (headers["content-encoding"], body) == ("gzip", b"gzip-bytes")
+
+        _, headers, body, _ = await _serve(_request("/app.js"))
+        assert "content-encoding" not in headers and body == _BODY
+
+
+class TestBodyTransport:
+    @pytest.mark.asyncio
+    async def test_large_files_stream_in_chunks(self, public, monkeypatch):
+        monkeypatch.setattr(ServeStaticFiles, "cache_asset_bytes", 0)
+        monkeypatch.setattr(static_file_module, "_CHUNK_SIZE", 100)
+        _, _, body, events = await _serve(_request("/app.js"))
+        assert body == _BODY
+        assert len(events) > 10
+
+    @pytest.mark.asyncio
+    async def test_pathsend_is_used_when_the_server_offers_it(self, public, monkeypatch):
+        monkeypatch.setattr(ServeStaticFiles, "cache_asset_bytes", 0)
+        scope = {"extensions": {"http.response.pathsend": {}}}
+        _, _, _, events = await _serve(_request("/app.js"), scope)
+        assert events[1] == {
+            "type": "http.response.pathsend",
+            "path": os.path.join(str(public), "app.js"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_head_sends_headers_only(self, public):
+        status, headers, body, _ = await _serve(_request("/app.js", method="HEAD"))
+        assert (status, body) == (200, b"")
+        assert headers["content-length"] == "1024"
+
+
+class TestLookupCache:
+    @pytest.mark.asyncio
+    async def test_hot_lookups_skip_the_filesystem(self, public, monkeypatch):
+        await _serve(_request("/app.js"))
+        await _serve(_request("/api/users"))
+
+        def _no_stat(*_args, **_kwargs):
+            raise AssertionError("filesystem touched on a cached lookup")
+
+        monkeypatch.setattr(static_module.os.path, "isfile", _no_stat)
+        monkeypatch.setattr(StaticFile, "resolve", _no_stat)
+        monkeypatch.setattr("builtins.open", _no_stat)
+
+        status, _, body, _ = await _serve(_request("/app.js"))
+        assert (status, body) == (200, _BODY)
+        status, _, body, _ = await _serve(_request("/api/users"))
+        assert b"routed" in body
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, public, monkeypatch):
+        monkeypatch.setattr(ServeStaticFiles, "cache_entries", 2)
+        for index in range(5):
+            await _serve(_request(f"/missing-{index}"))
+        assert len(ServeStaticFiles._assets._entries) == 2
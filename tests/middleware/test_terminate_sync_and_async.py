@@ -48,8 +48,6 @@ import asyncio
 import importlib
 from typing import Any
 
-import pytest
-
 _conductor_mod = importlib.import_module("cara.conductors.http.HttpConductor")
 _capsule_mod = importlib.import_module("cara.middleware.MiddlewareCapsule")
 
@@ -107,18 +105,6 @@ class _FakeResponse:
     pass
 
 
-class _StubResetHttpAuth:
-    """Stand-in for the conductor's hardcoded ``ResetHttpAuth`` cleanup
-    call. The real one needs an application instance + auth cache
-    facade; we just want a no-op that doesn't blow up the test."""
-
-    def __init__(self, _app: Any) -> None:
-        pass
-
-    async def terminate(self, _req: Any, _resp: Any) -> None:
-        return None
-
-
 class _StubPipeline:
     """Mimics the parts of ``Pipeline`` the conductor's
     ``_run_terminable_middleware`` reaches into — just the
@@ -131,24 +117,20 @@ class _StubPipeline:
 # ── _run_terminable_middleware ────────────────────────────────
 
 
-def _conductor(monkeypatch: pytest.MonkeyPatch):
+def _conductor():
     """Build a minimal HttpConductor bypassing __init__ so we don't
-    need the application's full DI graph for these tests. Stub
-    ``ResetHttpAuth`` so the hardcoded auth-cache cleanup call doesn't
-    crash."""
-    monkeypatch.setattr(_conductor_mod, "ResetHttpAuth", _StubResetHttpAuth)
+    need the application's full DI graph for these tests. Auth identity
+    is reset by the request's container scope, not by this sweep, so no
+    application is needed."""
     HttpConductor = _conductor_mod.HttpConductor
     conductor = HttpConductor.__new__(HttpConductor)
-    conductor.application = None  # ResetHttpAuth stub doesn't use it
+    conductor.application = None
     return conductor
 
 
 class TestSyncTerminateRunsCleanly:
-    def test_sync_terminate_executes_without_typeerror(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        conductor = _conductor(monkeypatch)
+    def test_sync_terminate_executes_without_typeerror(self) -> None:
+        conductor = _conductor()
         sync_mw = _SyncTerminate()
         pipeline = _StubPipeline([sync_mw])
         req, resp = _FakeRequest(), _FakeResponse()
@@ -174,11 +156,8 @@ class TestAsyncTerminateStillWorks:
     """Regression guard — the existing async ``ResetAuth`` path
     must not break under the new dispatcher."""
 
-    def test_async_terminate_executes(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        conductor = _conductor(monkeypatch)
+    def test_async_terminate_executes(self) -> None:
+        conductor = _conductor()
         async_mw = _AsyncTerminate()
         pipeline = _StubPipeline([async_mw])
         req, resp = _FakeRequest(), _FakeResponse()
@@ -196,15 +175,12 @@ class TestAsyncTerminateStillWorks:
 
 
 class TestMixedStackRunsAll:
-    def test_sync_async_no_terminate_all_handled(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
+    def test_sync_async_no_terminate_all_handled(self) -> None:
         """A realistic stack has all three shapes. None of them should
         block another — pre-fix the sync one's TypeError, caught and
         logged, didn't break the loop, but it WAS silently skipped.
         After the fix all three behave correctly."""
-        conductor = _conductor(monkeypatch)
+        conductor = _conductor()
         sync_mw = _SyncTerminate()
         async_mw = _AsyncTerminate()
         no_term = _NoTerminate()
@@ -227,16 +203,13 @@ class TestMixedStackRunsAll:
         # No-terminate was just skipped (no crash, no calls to
         # assert against — the absence of the method is the signal).
 
-    def test_one_middleware_raising_does_not_block_others(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
+    def test_one_middleware_raising_does_not_block_others(self) -> None:
         """Defense-in-depth: a buggy middleware's terminate raises
         a real exception (NOT the TypeError-from-blind-await — a
         genuine bug in user code). The dispatcher must catch it
         and continue to the next middleware. Existing contract;
         pin so the fix doesn't accidentally regress it."""
-        conductor = _conductor(monkeypatch)
+        conductor = _conductor()
 
         class _RaisingTerminate:
             async def handle(self, req: Any, next_fn: Any) -> Any:
@@ -469,3 +469,75 @@ def test_retry_source_redelivery_repairs_tracker_and_acks_without_deserializing(
     assert acks == [23]
     assert model.record.status == "retrying"
     assert model.update_count == 1
+
+
+class _Unit:
+    pass
+
+
+def test_each_job_is_built_and_run_in_its_own_container_scope(monkeypatch):
+    execution = importlib.import_module("cara.commands.core._JobExecution")
+    from cara.container import Container
+
+    container = Container()
+    container.scoped("unit", _Unit)
+    seen: list[tuple[_Unit, _Unit]] = []
+
+    class ScopedJob:
+        queue = "sync"
+
+        def __init__(self, unit):
+            self.unit = unit
+
+        async def handle(self):
+            seen.append((self.unit, container.make("unit")))
+
+    payload = {"job_id": _JOB_ID, "db_job_id": 91, "queue": "sync"}
+    completed: list[str] = []
+    delivery_store = SimpleNamespace(
+        claim_execution=lambda **_kwargs: DeliveryClaim("claimed", "lease"),
+        execution_timeout_for=lambda _job_class: 30,
+        complete_with_tracker=lambda job_id, *_args, **_kwargs: completed.append(job_id),
+    )
+    tracker = SimpleNamespace(update_job_status_strict=lambda *_args: None)
+    container.bind(
+        "queue",
+        lambda: SimpleNamespace(
+            driver=lambda *_a, **_k: SimpleNamespace(delivery_store=delivery_store)
+        ),
+    )
+    container.bind("JobTracker", lambda: tracker)
+    monkeypatch.setattr(
+        execution.SignedJsonJobSerializer,
+        "inspect_envelope",
+        lambda *_args, **_kwargs: {"payload": payload},
+    )
+    monkeypatch.setattr(
+        execution.SignedJsonJobSerializer,
+        "deserialize_verified",
+        lambda *_args, **_kwargs: {
+            **payload,
+            "obj": ScopedJob,
+            "callback": "handle",
+            "timeout_seconds": 30,
+            "_tenant": 5,
+            "_tenant_mode": "tenant",
+        },
+    )
+    monkeypatch.setattr(
+        execution,
+        "instantiate_job",
+        lambda app, job_class, *_args: job_class(app.make("unit")),
+    )
+    monkeypatch.setattr(execution, "config", lambda _key, default=None: default)
+    monkeypatch.setattr(builtins, "app", lambda: container, raising=False)
+    channel = SimpleNamespace(basic_ack=lambda *, delivery_tag: None)
+
+    for tag in (1, 2):
+        JobProcessor.process_message(
+            channel, SimpleNamespace(delivery_tag=tag), b"signed-envelope"
+        )
+
+    assert completed == [_JOB_ID, _JOB_ID]
+    assert [built is called for built, called in seen] == [True, True]
+    assert seen[0][0] is not seen[1][0]
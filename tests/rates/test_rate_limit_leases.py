@@ -0,0 +1,249 @@
+"""Leased rate limits spend locally reserved tokens and refill in batches.
+
+Store-level leases are pinned on the in-memory store (the reference for the
+Redis scripts); ``RateLimitLeases`` is driven against the memory authority
+with inline executors so background refills happen deterministically.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+from cara.exceptions import RateLimitConfigurationException
+from cara.middleware.http.ThrottleRequests import ThrottleRequests
+from cara.rates import (
+    Limit,
+    MemoryRateLimitStore,
+    RateLimiter,
+    RateLimitLeases,
+    RateLimitStore,
+)
+from cara.rates import RateLimitAuthority as authority
+
+leases_module = importlib.import_module("cara.rates.RateLimitLeases")
+
+
+class _Clock:
+    def __init__(self, now: float = 1_700_000_040.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Inline:
+    """Runs submitted refills on the spot."""
+
+    def __init__(self) -> None:
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        fn(*args)
+
+
+class _Deferred:
+    """Holds submitted refills until the test runs them."""
+
+    def __init__(self) -> None:
+        self.pending: list = []
+
+    def submit(self, fn, *args):
+        self.pending.append((fn, args))
+
+    def run(self) -> None:
+        while self.pending:
+            fn, args = self.pending.pop(0)
+            fn(*args)
+
+
+@pytest.fixture(autouse=True)
+def _memory_authority(monkeypatch):
+    authority._reset_for_tests()
+    authority._use_store("memory")
+    calls: list[int] = []
+    lease = authority.lease_rate_limit
+
+    def counting(*args, **kwargs):
+        calls.append(args[3])
+        return lease(*args, **kwargs)
+
+    monkeypatch.setattr(leases_module, "lease_rate_limit", counting)
+    # Limiters and throttles build their own leases; refilling them on the
+    # shared background pool could land in a later test's counter.
+    monkeypatch.setattr(leases_module, "_refill_executor", _Inline)
+    yield calls
+    authority._reset_for_tests()
+
+
+# ── Store leases ─────────────────────────────────────────────────────
+
+
+def test_fixed_lease_grants_up_to_the_remaining_budget():
+    store = MemoryRateLimitStore(clock=_Clock())
+
+    assert store.lease("fixed", "k", 10, 60, 4) == (4, 6, 60)
+    assert store.lease("fixed", "k", 10, 60, 8) == (6, 0, 60)
+    assert store.lease("fixed", "k", 10, 60, 1)[0] == 0
+    assert store.hit("fixed", "k", 10, 60)[0] is False
+
+
+def test_leasable_algorithms_never_grant_more_than_the_limit():
+    for algorithm in RateLimitStore.LEASABLE:
+        store = MemoryRateLimitStore(clock=_Clock())
+
+        granted = [store.lease(algorithm, "k", 10, 60, 4)[0] for _ in range(4)]
+
+        assert sum(granted) == 10, algorithm
+        assert granted[-1] == 0, algorithm
+        assert store.hit(algorithm, "k", 10, 60)[0] is False, algorithm
+
+
+def test_sliding_log_cannot_be_leased():
+    store = MemoryRateLimitStore(clock=_Clock())
+
+    with pytest.raises(RateLimitConfigurationException):
+        store.lease("sliding_log", "k", 10, 60, 4)
+    with pytest.raises(RateLimitConfigurationException):
+        authority.lease_rate_limit("k", 60, 10, 4, algorithm="sliding_log")
+
+
+# ── Local spending ───────────────────────────────────────────────────
+
+
+def test_one_remote_call_covers_a_whole_batch(_memory_authority):
+    leases = RateLimitLeases(5, ttl=30, refill_below=0, executor=_Inline())
+
+    decisions = [leases.attempt("k", 60, 100) for _ in range(4)]
+
+    assert all(allowed for allowed, _, _ in decisions)
+    assert [remaining for _, remaining, _ in decisions] == [99, 98, 97, 96]
+    assert _memory_authority == [5]
+
+
+def test_low_tokens_refill_in_the_background(_memory_authority):
+    executor = _Deferred()
+    leases = RateLimitLeases(4, ttl=30, refill_below=0.5, executor=executor)
+
+    leases.attempt("k", 60, 100)
+    leases.attempt("k", 60, 100)  # down to 2 of 4: refill queued
+    assert len(executor.pending) == 1
+    leases.attempt("k", 60, 100)  # already refilling: not queued again
+    assert len(executor.pending) == 1
+
+    executor.run()
+    for _ in range(5):
+        assert leases.attempt("k", 60, 100)[0] is True
+    assert _memory_authority == [4, 4]
+
+
+def test_the_shared_budget_is_never_exceeded():
+    leases = RateLimitLeases(4, ttl=30, executor=_Inline())
+
+    allowed = [leases.attempt("k", 60, 10)[0] for _ in range(12)]
+
+    assert allowed == [True] * 10 + [False] * 2
+
+
+def test_a_denial_is_remembered_until_the_retry_time(_memory_authority):
+    leases = RateLimitLeases(2, ttl=30, refill_below=0, executor=_Inline())
+    while leases.attempt("k", 60, 2)[0]:
+        pass
+    calls = len(_memory_authority)
+
+    for _ in range(10):
+        assert leases.attempt("k", 60, 2)[0] is False
+    assert len(_memory_authority) == calls
+
+
+def test_an_empty_lease_leases_inline_while_a_refill_is_pending(_memory_authority):
+    executor = _Deferred()
+    leases = RateLimitLeases(4, ttl=30, refill_below=0.5, executor=executor)
+
+    decisions = [leases.attempt("k", 60, 1000) for _ in range(6)]
+
+    assert all(allowed for allowed, _, _ in decisions)
+    assert len(executor.pending) == 1
+    assert _memory_authority == [4, 4]
+
+
+def test_a_failed_refill_falls_back_to_inline_leases(monkeypatch, _memory_authority):
+    leases = RateLimitLeases(4, ttl=30, refill_below=0.5, executor=_Inline())
+    lease = leases._lease
+
+    def failing(*args):
+        if args[-1] == "background":
+            raise ConnectionError("store unavailable")
+        return lease(*args)
+
+    monkeypatch.setattr(leases, "_lease", failing)
+
+    assert all(leases.attempt("k", 60, 1000)[0] for _ in range(6))
+    assert _memory_authority == [4, 4]
+
+
+def test_forget_drops_the_local_lease(_memory_authority):
+    leases = RateLimitLeases(5, ttl=30, executor=_Inline())
+    leases.attempt("k", 60, 100)
+
+    leases.forget("k")
+    leases.attempt("k", 60, 100)
+
+    assert _memory_authority == [5, 5]
+
+
+def test_invalid_lease_settings_are_configuration_errors():
+    for kwargs in ({"size": 1}, {"size": 4, "ttl": 0}, {"size": 4, "refill_below": 1}):
+        with pytest.raises(RateLimitConfigurationException):
+            RateLimitLeases(**kwargs)
+    with pytest.raises(RateLimitConfigurationException):
+        RateLimitLeases(4).attempt("k", 60, 10, algorithm="sliding_log")
+
+
+# ── Limiter wiring ───────────────────────────────────────────────────
+
+
+def test_rate_limiter_leases_when_configured(_memory_authority):
+    limiter = RateLimiter(
+        application=None,
+        options={
+            "limit": 3,
+            "window_seconds": 60,
+            "cache_prefix": "rate_",
+            "algorithm": "gcra",
+            "lease_size": 2,
+        },
+    )
+
+    assert [limiter.attempt("ip")[0] for _ in range(4)] == [True, True, True, False]
+    assert _memory_authority
+    with pytest.raises(RateLimitConfigurationException):
+        RateLimiter(
+            application=None,
+            options={
+                "limit": 3,
+                "window_seconds": 60,
+                "cache_prefix": "rate_",
+                "algorithm": "sliding_log",
+                "lease_size": 2,
+            },
+        )
+
+
+def test_leased_limits_route_throttles_through_a_shared_pool(
+    monkeypatch, _memory_authority
+):
+    monkeypatch.setattr(ThrottleRequests, "_lease_pools", {})
+    limit = Limit.per_minute(100).leased(10, ttl=5)
+    assert limit.lease == (10, 5.0)
+    with pytest.raises(ValueError):
+        Limit.per_minute(100).leased(1)
+
+    middleware = ThrottleRequests.__new__(ThrottleRequests)
+    for _ in range(3):
+        assert middleware._attempt_limit("GET:/:ip", limit)[0] is True
+
+    assert list(ThrottleRequests._lease_pools) == [(10, 5.0)]
+    assert _memory_authority == [10]
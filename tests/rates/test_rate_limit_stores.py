@@ -0,0 +1,282 @@
+"""Rate-limit stores decide each hit in one atomic step, per algorithm.
+
+The in-memory store is the executable reference for the Redis scripts: the
+same arithmetic, driven here by a hand-cranked clock. The Redis store is
+pinned on its wire contract — one script call per decision, one key per
+script, the server's clock — since no Redis runs in the test suite.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from cara.exceptions import RateLimitConfigurationException
+from cara.middleware.http.ThrottleRequests import ThrottleRequests
+from cara.rates import (
+    Limit,
+    MemoryRateLimitStore,
+    RateLimiter,
+    RateLimitStore,
+    RedisRateLimitStore,
+)
+from cara.rates import RateLimitAuthority as authority
+
+
+class _Clock:
+    def __init__(self, now: float = 1_700_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _reset_authority():
+    authority._reset_for_tests()
+    yield
+    authority._reset_for_tests()
+
+
+def _store() -> tuple[MemoryRateLimitStore, _Clock]:
+    clock = _Clock()
+    return MemoryRateLimitStore(clock=clock), clock
+
+
+# ── Algorithms ───────────────────────────────────────────────────────
+
+
+def test_fixed_window_counts_until_the_window_expires():
+    store, clock = _store()
+
+    hits = [store.hit("fixed", "k", 3, 10) for _ in range(4)]
+    assert hits == [(True, 2, 10), (True, 1, 10), (True, 0, 10), (False, 0, 10)]
+
+    clock.now += 10
+    assert store.hit("fixed", "k", 3, 10) == (True, 2, 10)
+
+
+def test_gcra_allows_a_full_burst_then_spaces_hits_evenly():
+    store, clock = _store()
+
+    burst = [store.hit("gcra", "k", 4, 4) for _ in range(5)]
+    assert [allowed for allowed, _, _ in burst] == [True] * 4 + [False]
+    assert [remaining for _, remaining, _ in burst[:4]] == [3, 2, 1, 0]
+    assert burst[4][2] == 1  # one emission interval until the next slot
+
+    clock.now += 1
+    assert store.hit("gcra", "k", 4, 4)[0] is True
+    assert store.hit("gcra", "k", 4, 4)[0] is False
+
+    clock.now += 4
+    assert store.hit("gcra", "k", 4, 4) == (True, 3, 1)
+
+
+def test_sliding_log_has_no_boundary_burst():
+    store, clock = _store()
+    clock.now = 1_700_000_040.0  # window-aligned multiple of 60 s
+
+    for _ in range(5):
+        store.hit("sliding_log", "k", 5, 60)
+    clock.now += 60 - 0.5
+
+    # A window-aligned fixed counter would have reset by now and allowed
+    # another five; the log still remembers the trailing minute.
+    assert store.hit("sliding_log", "k", 5, 60) == (False, 0, 1)
+    clock.now += 1
+    assert store.hit("sliding_log", "k", 5, 60) == (True, 4, 60)
+
+
+def test_sliding_window_weights_the_previous_window():
+    store, clock = _store()
+    clock.now = 1_700_000_040.0  # window-aligned multiple of 60 s
+
+    for _ in range(10):
+        store.hit("sliding_window", "k", 10, 60)
+    assert store.hit("sliding_window", "k", 10, 60)[0] is False
+
+    # 15 s into the next window, 75% of the previous 10 hits still count.
+    clock.now += 75
+    allowed = [store.hit("sliding_window", "k", 10, 60)[0] for _ in range(4)]
+    assert allowed == [True, True, False, False]
+
+
+def test_denied_hits_report_when_the_next_hit_is_allowed():
+    for algorithm in RateLimitStore.ALGORITHMS:
+        store, clock = _store()
+        clock.now = 1_700_000_040.0
+        while store.hit(algorithm, "k", 3, 30)[0]:
+            pass
+        _, _, retry_in = store.hit(algorithm, "k", 3, 30)
+
+        clock.now += retry_in
+        assert store.hit(algorithm, "k", 3, 30)[0] is True, algorithm
+
+
+def test_keys_and_algorithms_are_isolated_and_reset_clears_all():
+    store, _ = _store()
+    store.hit("fixed", "a", 1, 60)
+    store.hit("gcra", "a", 1, 60)
+
+    assert store.hit("fixed", "b", 1, 60)[0] is True
+    assert store.hit("sliding_log", "a", 1, 60)[0] is True
+
+    store.reset("a")
+    assert store.hit("fixed", "a", 1, 60)[0] is True
+    assert store.hit("gcra", "a", 1, 60)[0] is True
+
+
+def test_unknown_algorithm_is_a_configuration_error():
+    store, _ = _store()
+
+    with pytest.raises(RateLimitConfigurationException):
+        store.hit("leaky", "k", 1, 60)
+
+
+# ── Redis store wire contract ────────────────────────────────────────
+
+
+class _Redis:
+    def __init__(self, reply=(1, 4, 59_000_001)) -> None:
+        self.calls: list[tuple[str, list, list]] = []
+        self.deleted: tuple = ()
+        self.sources: dict[str, str] = {}
+        self.reply = reply
+
+    def register_script(self, source: str):
+        def run(keys, args):
+            self.calls.append((source, keys, args))
+            return list(self.reply)
+
+        return run
+
+    def delete(self, *keys):
+        self.deleted = keys
+
+
+def test_redis_store_decides_in_one_script_call_per_hit():
+    redis = _Redis()
+    store = RedisRateLimitStore(redis)
+
+    assert store.hit("gcra", "user:1", 5, 60) == (True, 4, 60)
+
+    ((source, keys, args),) = redis.calls
+    assert keys == ["rate:gcra:user:1"]
+    assert args[:2] == [5, 60_000_000]
+    assert "redis.call('TIME')" in source
+
+
+def test_redis_sliding_log_members_are_unique_per_hit():
+    redis = _Redis()
+    store = RedisRateLimitStore(redis)
+
+    store.hit("sliding_log", "k", 5, 60)
+    store.hit("sliding_log", "k", 5, 60)
+
+    assert redis.calls[0][2][2] != redis.calls[1][2][2]
+
+
+def test_redis_reset_deletes_every_algorithm_key():
+    redis = _Redis()
+    RedisRateLimitStore(redis).reset("k")
+
+    assert set(redis.deleted) == {f"rate:{a}:k" for a in RateLimitStore.ALGORITHMS}
+
+
+# ── Authority and limiter wiring ─────────────────────────────────────
+
+
+def test_authority_uses_the_redis_store_when_the_cache_driver_has_one(monkeypatch):
+    redis = _Redis(reply=(0, 0, 2_500_000))
+    driver = SimpleNamespace(connection=lambda: redis)
+    monkeypatch.setattr(
+        authority.facades, "Cache", SimpleNamespace(driver=lambda: driver)
+    )
+
+    decision = authority.attempt_rate_limit("k", 60, 5, algorithm="sliding_window")
+
+    assert decision == (False, 0, 3)
+    assert len(redis.calls) == 1
+
+
+def test_authority_keys_live_under_the_cache_driver_prefix(monkeypatch):
+    redis = _Redis(reply=(1, 4, 60_000_000))
+    driver = SimpleNamespace(
+        connection=lambda: redis,
+        key_prefix=lambda: "app:j1:",
+        counter_key=lambda key: f"app:j1:c:{key}",
+    )
+    monkeypatch.setattr(
+        authority.facades, "Cache", SimpleNamespace(driver=lambda: driver)
+    )
+
+    authority.attempt_rate_limit("k", 60, 5, algorithm="gcra")
+    authority.attempt_rate_limit("k", 60, 5)
+
+    assert [keys for _, keys, _ in redis.calls] == [
+        ["app:j1:rate:gcra:k"],
+        ["app:j1:c:k"],
+    ]
+
+
+def test_non_fixed_algorithm_needs_a_scripting_store(monkeypatch):
+    cache = SimpleNamespace(driver=lambda: SimpleNamespace(driver_name="file"))
+    monkeypatch.setattr(authority.facades, "Cache", cache)
+
+    with pytest.raises(RateLimitConfigurationException):
+        authority.attempt_rate_limit("k", 60, 5, algorithm="gcra")
+
+
+def test_memory_store_is_selectable_and_unknown_names_are_rejected():
+    authority._use_store("memory")
+
+    assert authority.attempt_rate_limit("k", 60, 1, algorithm="gcra")[0] is True
+    assert authority.attempt_rate_limit("k", 60, 1, algorithm="gcra")[0] is False
+    with pytest.raises(RateLimitConfigurationException):
+        authority.attempt_rate_limit("k", 60, 1, algorithm="token_bucket")
+    with pytest.raises(RateLimitConfigurationException):
+        authority._use_store("postgres")
+
+
+def test_rate_limiter_applies_its_configured_algorithm():
+    authority._use_store("memory")
+    limiter = RateLimiter(
+        application=None,
+        options={
+            "limit": 2,
+            "window_seconds": 60,
+            "cache_prefix": "rate_",
+            "algorithm": "sliding_log",
+        },
+    )
+
+    assert [limiter.attempt("ip")[0] for _ in range(3)] == [True, True, False]
+    with pytest.raises(RateLimitConfigurationException):
+        RateLimiter(
+            application=None,
+            options={
+                "limit": 2,
+                "window_seconds": 60,
+                "cache_prefix": "r",
+                "algorithm": 1,
+            },
+        )
+
+
+def test_limits_and_throttle_parameters_choose_the_algorithm():
+    assert Limit.per_minute(10).algorithm == "fixed"
+    assert Limit.per_minute(10).using("gcra").algorithm == "gcra"
+    with pytest.raises(ValueError):
+        Limit.per_minute(10).using("leaky")
+
+    middleware = ThrottleRequests.__new__(ThrottleRequests)
+    middleware.custom_limit = 60
+    middleware.custom_window_minutes = 1
+    middleware.custom_algorithm = "sliding_window"
+    assert middleware._resolve_limit_config(request=object()).algorithm == (
+        "sliding_window"
+    )
+    middleware.custom_algorithm = "leaky"
+    with pytest.raises(RateLimitConfigurationException):
+        middleware._resolve_limit_config(request=object())
@@ -0,0 +1,152 @@
+"""
+DispatchPlan pins: a route's middleware chain and handler injection recipe
+are resolved once and reused, and every registration change that could
+alter them invalidates the cached plan instead of serving a stale one.
+"""
+
+from __future__ import annotations
+
+import inspect
+
+import pytest
+
+from cara.container import Container
+from cara.exceptions import MiddlewareNotFoundException, RouteRegistrationException
+from cara.http.request.Request import Request
+from cara.http.response.Response import Response
+from cara.middleware.MiddlewareCapsule import MiddlewareCapsule
+from cara.routing import InjectionPlan, Route, RouteParameterValidator, Router
+
+
+class _Auth:
+    pass
+
+
+class _Cors:
+    pass
+
+
+class _Service:
+    pass
+
+
+def _controller(_request=None, _response=None):
+    return {"ok": True}
+
+
+def _capsule() -> MiddlewareCapsule:
+    capsule = MiddlewareCapsule(None)
+    capsule.add_alias("auth", _Auth)
+    capsule.add_alias("cors", _Cors)
+    return capsule
+
+
+def _http_context(params: dict | None = None) -> tuple[Request, Response]:
+    request = Request(None)
+    request.params = params or {}
+    return request, Response(None)
+
+
+class TestPlanCaching:
+    def test_plan_is_built_once_and_reused(self):
+        capsule = _capsule()
+        route = Route.get("/a", _controller, middleware=["auth"])
+        plan = route.dispatch_plan(capsule)
+        assert plan.middleware == (_Auth,)
+        assert route.dispatch_plan(capsule) is plan
+
+    def test_capsule_changes_rebuild_the_plan(self):
+        capsule = _capsule()
+        route = Route.get("/a", _controller, middleware=["cors", "auth"])
+        plan = route.dispatch_plan(capsule)
+        assert plan.middleware == (_Cors, _Auth)
+
+        capsule.set_priority([_Auth, _Cors])
+        rebuilt = route.dispatch_plan(capsule)
+        assert rebuilt is not plan
+        assert rebuilt.middleware == (_Auth, _Cors)
+
+    def test_editing_route_middleware_drops_the_plan(self):
+        capsule = _capsule()
+        route = Route.get("/a", _controller, middleware=["auth"])
+        route.dispatch_plan(capsule)
+        route.middleware("cors")
+        assert route.dispatch_plan(capsule).middleware == (_Auth, _Cors)
+
+    def test_a_different_capsule_is_not_served_the_cached_chain(self):
+        route = Route.get("/a", _controller, middleware=["auth"])
+        route.dispatch_plan(_capsule())
+        other = MiddlewareCapsule(None)
+        other.add_alias("auth", _Cors)
+        assert route.dispatch_plan(other).middleware == (_Cors,)
+
+    def test_unknown_alias_still_raises_on_dispatch(self):
+        route = Route.get("/a", _controller, middleware=["missing"])
+        with pytest.raises(MiddlewareNotFoundException):
+            route.dispatch_plan(_capsule())
+
+    def test_router_prebuilds_http_and_ws_plans(self):
+        http, ws = _capsule(), _capsule()
+        page = Route.get("/a", _controller, middleware=["auth"])
+        socket = Route.ws("/ws", _controller, middleware=["cors"])
+        Router(None, page, socket).build_dispatch_plans(http, ws)
+        assert page._dispatch_plan.is_current(http)
+        assert socket._dispatch_plan.is_current(ws)
+
+
+class TestInjectionPlan:
+    def test_http_provider_order_and_param_conversion(self):
+        def handler(req: Request, post_id: int, response, extra=7):
+            return None
+
+        plan = InjectionPlan(inspect.signature(handler, eval_str=True))
+        request, response = _http_context({"post_id": "12"})
+        kwargs = plan.kwargs((request, response), Container())
+        assert kwargs == {
+            "req": request,
+            "post_id": 12,
+            "response": response,
+            "extra": 7,
+        }
+
+    def test_unresolvable_required_parameter_raises(self):
+        def handler(missing):
+            return None
+
+        plan = InjectionPlan(inspect.signature(handler, eval_str=True))
+        with pytest.raises(RouteRegistrationException, match="by name: missing"):
+            plan.kwargs(_http_context(), Container())
+
+    def test_typed_parameter_falls_back_to_the_container(self):
+        def handler(service: _Service):
+            return None
+
+        container = Container()
+        service = _Service()
+        container.bind(_Service, service)
+        plan = InjectionPlan(inspect.signature(handler, eval_str=True))
+        assert plan.kwargs(_http_context(), container) == {"service": service}
+
+    def test_constructor_dependencies_are_injected(self):
+        class _Controller:
+            def __init__(self, service: _Service, label: str = "x"):
+                self.service = service
+                self.label = label
+
+        container = Container()
+        service = _Service()
+        container.bind(_Service, service)
+        plan = InjectionPlan(None, _Controller)
+        controller = plan.instantiate(container)
+        assert controller.service is service
+        assert controller.label == "x"
+
+    def test_coercion_follows_compile_rule_changes(self):
+        plan = InjectionPlan(None)
+        try:
+            RouteParameterValidator.set_compile_rule("dp_count", "int")
+            assert plan.coerce("dp_count", "5") == 5
+            RouteParameterValidator.set_compile_rule("dp_count", "string")
+            assert plan.coerce("dp_count", "5") == "5"
+        finally:
+            RouteParameterValidator._compile_rules.pop("dp_count", None)
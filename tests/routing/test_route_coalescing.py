@@ -0,0 +1,108 @@
+"""
+``Route.coalesce`` pins: identical concurrent GETs run the handler once and
+every follower answers with its own copy of the leader's response, taken
+before outer middleware touches it; different users or queries never
+share; a streamed body is not shared.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from cara.http import Response
+from cara.routing import Route
+
+conductor_module = importlib.import_module("cara.conductors.http.HttpConductor")
+
+
+class _Request:
+    def __init__(self, query=b"", user=None):
+        self.method = "GET"
+        self.path = "/products"
+        self.scope = {"query_string": query}
+        self._user = user
+
+    def header(self, name, default=None):
+        return default
+
+    def user(self):
+        return self._user
+
+
+class _Controller:
+    def __init__(self, stream: bool = False):
+        self.calls = 0
+        self.stream = stream
+
+    async def dispatch_into(self, response: Response) -> Response:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.stream:
+
+            async def chunks():
+                yield b"chunk"
+
+            return response.stream(chunks())
+        response.json({"calls": self.calls}, headers={"X-Handler": "yes"})
+        return response
+
+
+async def _dispatch_many(controller: _Controller, requests: list[_Request]):
+    conductor = conductor_module.HttpConductor(MagicMock())
+
+    async def one(request: _Request) -> Response:
+        response = Response(MagicMock())
+
+        async def dispatch(_request):
+            return await controller.dispatch_into(response)
+
+        return await conductor._dispatch_coalesced(request, response, dispatch)
+
+    return await asyncio.gather(*(one(request) for request in requests))
+
+
+def test_route_flag():
+    route = Route.get("/products", lambda request: None)
+    assert not route.is_coalesced()
+    assert route.coalesce() is route and route.is_coalesced()
+
+
+@pytest.mark.asyncio
+async def test_identical_gets_share_one_dispatch():
+    controller = _Controller()
+    responses = await _dispatch_many(
+        controller, [_Request(b"a=1&b=2"), _Request(b"b=2&a=1")] * 2
+    )
+
+    assert controller.calls == 1
+    assert len({id(response) for response in responses}) == 4
+    assert {response.content for response in responses} == {b'{"calls": 1}'}
+    assert all(response.header("X-Handler") == "yes" for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_users_and_queries_do_not_share():
+    controller = _Controller()
+    await _dispatch_many(
+        controller,
+        [
+            _Request(),
+            _Request(b"page=2"),
+            _Request(user=SimpleNamespace(id=1)),
+            _Request(user=SimpleNamespace(id=2)),
+        ],
+    )
+    assert controller.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_streamed_body_is_not_shared():
+    controller = _Controller(stream=True)
+    responses = await _dispatch_many(controller, [_Request(), _Request()])
+    assert controller.calls == 2
+    assert all(response.has_deferred_body() for response in responses)
@@ -0,0 +1,177 @@
+"""
+RouteIndex pins: the compiled radix tree must pick exactly the route the
+old linear regex scan picked, for hits, 405s and 404s alike.
+
+The reference implementation below is the pre-index ``Router.find`` /
+``get_allowed_methods`` loop, kept verbatim so every case is checked
+differentially rather than against hand-written expectations.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from cara.exceptions import MethodNotAllowedException, RouteNotFoundException
+from cara.routing import Route, RouteGroup, Router
+
+
+def _controller(_request=None, _response=None):
+    return {"ok": True}
+
+
+def _linear_find(router: Router, path: str, method: str):
+    for route in router.routes_by_method.get(method.upper(), []):
+        if route.matches(path, method):
+            return route
+    return None
+
+
+def _linear_allowed(router: Router, path: str) -> list[str]:
+    allowed: list[str] = []
+    for m, bucket in router.routes_by_method.items():
+        for route in bucket:
+            if route.matches(path, m.lower()):
+                allowed.append(m)
+                break
+    return allowed
+
+
+def _routes() -> list[Route]:
+    return [
+        Route.get("/", _controller, name="home"),
+        Route.get("/users/@id", _controller, name="users.any"),
+        Route.get("/users/me", _controller, name="users.me"),
+        Route.get("/posts/@id:int", _controller, name="posts.show"),
+        Route.get("/posts/@slug:slug", _controller, name="posts.slug"),
+        Route.put("/posts/@id:int", _controller),
+        Route.delete("/posts/@id:int", _controller),
+        Route.get("/tags/@tag:alpha/items/@n:int?", _controller),
+        Route.get("/files/@path:any", _controller, name="files"),
+        Route.get("/files/readme", _controller),
+        Route.get("/flags/@on:bool", _controller),
+        Route.get("/things/@uuid:uuid", _controller),
+        Route.post("/things", _controller),
+        Route.get("/@a?/@b?/@c?/@d?/deep", _controller),
+        Route.factory("/dav/@node", _controller, ["propfind"]),
+    ]
+
+
+PATHS = [
+    "",
+    "/",
+    "/users/5",
+    "/users/me",
+    "/users/me/",
+    "/users//me",
+    "/users/caf%C3%A9",
+    "/posts/12",
+    "/posts/12/",
+    "/posts/hello-world",
+    "/posts/12x",
+    "/tags/news/items",
+    "/tags/news/items/3",
+    "/tags/news/items/x",
+    "/tags/n3ws/items",
+    "/files/",
+    "/files",
+    "/files/readme",
+    "/files/a/b/c.txt",
+    "/flags/true",
+    "/flags/yes",
+    "/things/123e4567-e89b-12d3-a456-426614174000",
+    "/things",
+    "/things/",
+    "/deep",
+    "/x/deep",
+    "/x/y/z/w/deep",
+    "/dav/root",
+    "/users/5\n",
+    "/users/\n",
+    "/posts/7\n",
+    "users/5",
+    "/nope",
+    "/posts/12/comments",
+]
+
+METHODS = ["GET", "HEAD", "POST", "PUT", "DELETE", "OPTIONS", "PROPFIND", "PATCH"]
+
+
+class TestIndexMatchesLinearScan:
+    @pytest.mark.parametrize("path", PATHS)
+    def test_find_and_allowed_methods_are_identical(self, path):
+        router = Router(None, *_routes())
+        for method in METHODS:
+            expected = _linear_find(router, path, method)
+            assert router._routing_index().match(path, method) is expected, (
+                path,
+                method,
+            )
+        assert router.get_allowed_methods(path) == _linear_allowed(router, path)
+
+    def test_earlier_parameter_route_still_shadows_later_static_route(self):
+        # ``/users/@id`` is registered before ``/users/me``; the regex scan
+        # has always answered with the parameter route, and so must the tree.
+        router = Router(None, *_routes())
+        assert router.find("/users/me", "GET").get_name() == "users.any"
+
+    def test_typed_segment_falls_through_to_next_pattern(self):
+        router = Router(None, *_routes())
+        assert router.find("/posts/12", "GET").get_name() == "posts.show"
+        assert router.find("/posts/hello-world", "GET").get_name() == "posts.slug"
+
+    def test_method_not_allowed_carries_the_same_allow_list(self):
+        router = Router(None, *_routes())
+        with pytest.raises(MethodNotAllowedException) as exc:
+            router.find("/posts/12", "POST")
+        assert exc.value.allowed == ["GET", "HEAD", "PUT", "DELETE"]
+
+    def test_unknown_path_is_not_found(self):
+        router = Router(None, *_routes())
+        with pytest.raises(RouteNotFoundException):
+            router.find("/definitely/not/here", "GET")
+
+
+class TestIndexInvalidation:
+    def test_add_after_first_lookup_is_visible(self):
+        router = Router(None, Route.get("/a", _controller))
+        router.find("/a", "GET")
+        late = Route.get("/b", _controller)
+        router.add(late)
+        assert router.find("/b", "GET") is late
+
+    def test_regrouping_a_registered_route_rebuilds_the_index(self):
+        route = Route.get("/users", _controller)
+        router = Router(None, route)
+        router.compile()
+        RouteGroup(prefix="/api").routes(route)
+        assert router.find("/api/users", "GET") is route
+        with pytest.raises(RouteNotFoundException):
+            router.find("/users", "GET")
+
+    def test_preflight_lookup_does_not_rebuild_the_index(self):
+        router = Router(None, Route.get("/a", _controller))
+        index = router.compile()
+        router.find("/a", "OPTIONS")
+        assert router._routing_index() is index
+
+
+class TestReverseRouting:
+    def test_url_fills_typed_placeholders_and_appends_extras(self):
+        router = Router(None, *_routes())
+        assert router.url("posts.show", {"id": 9, "page": 2}) == "/posts/9?page=2"
+
+    def test_missing_placeholder_is_left_in_place(self):
+        router = Router(None, *_routes())
+        assert router.url("posts.show") == "/posts/@id:int"
+
+    def test_first_registration_wins_for_duplicate_names(self):
+        first = Route.get("/one", _controller, name="dup")
+        router = Router(None, first, Route.get("/two", _controller, name="dup"))
+        assert router.url("dup") == "/one"
+
+    def test_rename_after_compile_is_still_found(self):
+        route = Route.get("/renamed", _controller)
+        router = Router(None, route)
+        router.compile()
+        route.name("later")
+        assert router.url("later") == "/renamed"
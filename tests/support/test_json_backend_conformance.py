@@ -0,0 +1,202 @@
+"""
+``json_bytes`` conformance: the native (orjson) backend emits exactly the
+bytes of the stdlib backend for every value the wire rules cover, and
+raises exactly the stdlib's error for every value they refuse. Skipped
+when orjson is not installed; the stdlib backend is pinned either way.
+"""
+
+from __future__ import annotations
+
+import enum
+import importlib
+import json
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from cara.support import json_bytes, json_dumps, use_json_backend
+
+encoding = importlib.import_module("cara.support.JsonEncoding")
+
+
+class Color(enum.Enum):
+    RED = "red"
+    PRICE = Decimal("1.50")
+    NAN = float("nan")
+
+
+class Level(enum.IntEnum):
+    HIGH = 3
+
+
+class Slug(enum.StrEnum):
+    A = "a"
+
+
+class Ratio(float):
+    pass
+
+
+class Tag(str):
+    pass
+
+
+@dataclass
+class Point:
+    x: int
+
+
+Pair = namedtuple("Pair", "a b")
+
+_OFFSET_WITH_SECONDS = timezone(timedelta(hours=5, minutes=30, seconds=15))
+
+CORPUS = [
+    None,
+    True,
+    0,
+    -1,
+    2**63 - 1,
+    2**64,
+    -(2**70),
+    0.1,
+    -0.0,
+    1e16,
+    1.5e300,
+    1e-5,
+    -4.2e-5,
+    1e-7,
+    0.0001,
+    10.00001,
+    5e-324,
+    123456789012345678.0,
+    "",
+    "plain",
+    "é ü 中文 😀",
+    '\x00\x1f\x7f "\\ /  ',
+    "1e-7, in a string",
+    {"key: with a colon": "value, with a comma"},
+    ["ends with a backslash \\", "a: b"],
+    Decimal("19.90"),
+    Decimal("-0.000001"),
+    Decimal("99999999999.999999"),
+    datetime(2026, 1, 2, 3, 4, 5),
+    datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=UTC),
+    datetime(2026, 1, 2, 3, 4, 5, tzinfo=_OFFSET_WITH_SECONDS),
+    date(2026, 1, 2),
+    time(3, 4, 5, 6),
+    time(3, 4, tzinfo=UTC),
+    UUID("12345678-1234-5678-1234-567812345678"),
+    ["deadbe5e-4f00-4000-8000-00000000000e-1,"],
+    Color.RED,
+    Color.PRICE,
+    Level.HIGH,
+    Slug.A,
+    Ratio(2.5),
+    Tag("tagged"),
+    Pair(1, 2),
+    (1, 2),
+    [],
+    {},
+    {"nested": {"list": [1, {"deep": [None, "x"]}]}, "ok": True},
+    {1: "int key", 2.5: "float key", False: "bool key", None: "none key"},
+    OrderedDict([("b", 1), ("a", 2)]),
+    [{"id": i, "price": Decimal("9.99"), "note": None} for i in range(50)],
+]
+
+REFUSED = [
+    float("nan"),
+    float("inf"),
+    [1, {"x": float("-inf")}],
+    Color.NAN,
+    Decimal("NaN"),
+    Decimal("Infinity"),
+    {"obj": object()},
+    Point(1),
+    {1, 2},
+    b"bytes",
+    {Decimal("1"): "decimal key"},
+]
+
+
+def _outcome(encode, value):
+    try:
+        return ("ok", encode(value))
+    except Exception as exc:
+        return ("error", type(exc), str(exc))
+
+
+@pytest.fixture
+def native():
+    pytest.importorskip("orjson")
+    return encoding._BACKENDS["orjson"]
+
+
+class TestStdlibBackend:
+    @pytest.mark.parametrize("value", CORPUS, ids=repr)
+    def test_matches_json_dumps(self, value):
+        expected = json_dumps(value).encode("utf-8")
+        assert encoding._stdlib_bytes(value) == expected
+
+    @pytest.mark.parametrize("value", REFUSED, ids=repr)
+    def test_refuses_what_json_dumps_refuses(self, value):
+        with pytest.raises((TypeError, ValueError)):
+            encoding._stdlib_bytes(value)
+
+
+class TestNativeConformance:
+    @pytest.mark.parametrize("value", CORPUS, ids=repr)
+    def test_byte_identical(self, native, value):
+        assert native(value) == encoding._stdlib_bytes(value)
+
+    @pytest.mark.parametrize("value", REFUSED, ids=repr)
+    def test_identical_errors(self, native, value):
+        assert _outcome(native, value) == _outcome(encoding._stdlib_bytes, value)
+
+    def test_cycles_raise_the_stdlib_error(self, native):
+        cycle: list = []
+        cycle.append(cycle)
+        assert _outcome(native, cycle) == _outcome(encoding._stdlib_bytes, cycle)
+
+    @pytest.mark.parametrize("value", [1e16, 1.5e300, 1.2345678901234568e17, 1e-7])
+    def test_exponents_fall_back_whatever_orjson_writes(self, native, monkeypatch, value):
+        # Some orjson releases drop the ``+`` that ``float.__repr__`` writes.
+        unsigned = encoding.orjson.dumps(value).replace(b"+", b"")
+        monkeypatch.setattr(encoding.orjson, "dumps", lambda *a, **k: unsigned)
+        assert native(value) == encoding._stdlib_bytes(value)
+
+    def test_deep_nesting_is_encoded(self, native):
+        deep: list = []
+        for _ in range(400):
+            deep = [deep]
+        assert native(deep) == encoding._stdlib_bytes(deep)
+
+    def test_output_is_valid_json(self, native):
+        for value in CORPUS:
+            json.loads(native(value))
+
+
+class TestBackendSelection:
+    def test_unknown_backend_is_refused(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            use_json_backend("simdjson")
+
+    def test_explicit_stdlib_backend(self, monkeypatch):
+        monkeypatch.setattr(encoding, "_encode", None)
+        use_json_backend("stdlib")
+        assert encoding._encode is encoding._stdlib_bytes
+        assert json_bytes({"p": Decimal("1.10")}) == b'{"p": "1.10"}'
+
+    def test_environment_selects_on_first_use(self, monkeypatch):
+        monkeypatch.setattr(encoding, "_encode", None)
+        monkeypatch.setenv("CARA_JSON_BACKEND", "stdlib")
+        json_bytes([])
+        assert encoding._encode is encoding._stdlib_bytes
+
+    def test_missing_native_backend_is_refused(self, monkeypatch):
+        monkeypatch.setattr(encoding, "_BACKENDS", {"stdlib": encoding._stdlib_bytes})
+        with pytest.raises(ValueError, match="not installed"):
+            use_json_backend("orjson")